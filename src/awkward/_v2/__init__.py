@@ -14,6 +14,8 @@ import awkward._v2._typetracer
 # internal
 import awkward._v2._util
 import awkward._v2._lookup
+import awkward._v2._forth
+import awkward._v2._strings
 
 # third-party connectors
 import awkward._v2._connect.numpy
@@ -24,6 +26,8 @@ import awkward._v2.numba
 from awkward._v2.highlevel import Array
 from awkward._v2.highlevel import Record
 from awkward._v2.highlevel import ArrayBuilder
+import awkward._v2.partition
+import awkward._v2.growable
 
 # behaviors
 import awkward._v2.behaviors.categorical
@@ -1,19 +1,96 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import bz2
+import collections
+import concurrent.futures
+import contextlib
 import json
+import lzma
+import os
+import re
+import zlib
 
 import numpy as np
 
 import awkward as ak
-import awkward.forth
+
+numpy = ak.nplike.Numpy.instance()
 
 
 class _ReachedEndofArrayError(Exception):
     pass
 
 
+def _import_codec(module, package):
+    try:
+        return __import__(module)
+    except ModuleNotFoundError:
+        raise ak._v2._util.error(
+            ModuleNotFoundError(
+                f"""install the '{package}' package to use this Avro codec with:
+
+    pip install {package} --upgrade
+
+or
+
+    conda install {package}"""
+            )
+        ) from None
+
+
+def _decompress_snappy(snappy, data):
+    # Avro appends the big-endian CRC32 of the uncompressed data to each block
+    out = snappy.decompress(data[:-4])
+    if zlib.crc32(out) != int.from_bytes(data[-4:], "big"):
+        raise ak._v2._util.error(
+            ValueError("invalid Avro file: snappy block fails its CRC32 check")
+        )
+    return out
+
+
+def _decompress_zstandard(zstandard, data):
+    # Avro's zstandard blocks do not necessarily record their uncompressed size
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def decompressor(codec):
+    # function from a block's bytes to its decompressed bytes, None if uncompressed
+    if codec == "null":
+        return None
+    elif codec == "deflate":
+        return lambda data: zlib.decompress(data, -15)
+    elif codec == "bzip2":
+        return bz2.decompress
+    elif codec == "xz":
+        return lzma.decompress
+    elif codec == "snappy":
+        snappy = _import_codec("snappy", "python-snappy")
+        return lambda data: _decompress_snappy(snappy, data)
+    elif codec == "zstandard":
+        zstandard = _import_codec("zstandard", "zstandard")
+        return lambda data: _decompress_zstandard(zstandard, data)
+    else:
+        raise ak._v2._util.error(ValueError(f"unsupported Avro codec: {codec!r}"))
+
+
 class ReadAvroFT:
-    def __init__(self, file, limit_entries, debug_forth=False):
+    def __init__(self, file, limit_entries, debug_forth=False, num_threads=1):
+        self.prepare(file, debug_forth, num_threads)
+
+        with ak._v2._forth.machines.machine(self.forth_code) as self.machine:
+            with self.executor() as executor:
+                first_iter = True
+                for num_items, temp_data in self.decompressed_blocks(
+                    self.raw_blocks(limit_entries), executor
+                ):
+                    first_iter = self.run_block(num_items, temp_data, first_iter)
+            if first_iter:
+                # no blocks: still needs (empty) outputs, not a previous run's
+                self.run_block(0, b"", first_iter)
+
+            self.outcontents = (self.form, self.blocks, self.outputs())
+
+    def prepare(self, file, debug_forth, num_threads):
         self.data = file
         self.blocks = 0
         self.marker = 0
@@ -53,16 +130,17 @@ class ReadAvroFT:
             self.exec_code,
             self.form_next_id,
             declarations,
-            form_keys,
+            self.form_keys,
             init_code,
-            container,
+            self.container,
         ) = self.rec_exp_json_code(
             self.metadata["avro.schema"], exec_code, ind, 0, [], [], init_code, {}
         )
 
-        first_iter = True
         init_code.append(";\n")
         self.update_pos(17)
+        self.data.seek(self.marker - 16)
+        self.sync = self.data.read(16)
         header_code = header_code + "".join(declarations)
         init_code = "".join(init_code)
         exec_code.insert(0, "0 do \n")
@@ -76,7 +154,32 @@ class ReadAvroFT:
         if debug_forth:
             print(forth_code)  # noqa: T201
 
-        machine = awkward.forth.ForthMachine64(forth_code)
+        self.forth_code = forth_code
+
+        codec = self.metadata.get("avro.codec", b"null")
+        self.decompress = decompressor(bytes(codec).decode())
+        if num_threads is None:
+            num_threads = os.cpu_count() or 1
+        self.num_threads = num_threads
+
+    @contextlib.contextmanager
+    def executor(self):
+        if self.decompress is None or self.num_threads == 1:
+            yield None
+        else:
+            with concurrent.futures.ThreadPoolExecutor(self.num_threads) as executor:
+                yield executor
+
+    def outputs(self):
+        container = dict(self.container)
+        for elem in self.form_keys:
+            if "offsets" in elem:
+                container[elem] = self.machine.output_Index64(elem)
+            else:
+                container[elem] = self.machine.output_NumpyArray(elem)
+        return container
+
+    def raw_blocks(self, limit_entries):
         break_flag = False
         while True:
             try:
@@ -97,30 +200,55 @@ class ReadAvroFT:
             else:
                 pass
 
-            if first_iter:
-                machine.begin({"stream": np.frombuffer(temp_data, dtype=np.uint8)})
-                machine.stack_push(num_items)
-                machine.call("init-out")
-                machine.resume()
-                first_iter = False
-            else:
-                machine.begin_again(
-                    {"stream": np.frombuffer(temp_data, dtype=np.uint8)}, True
-                )
-                machine.stack_push(num_items)
-                machine.resume()
-
+            self.check_sync()
             self.update_pos(16)
+            yield num_items, temp_data
             if break_flag:
                 break
 
-        for elem in form_keys:
-            if "offsets" in elem:
-                container[elem] = machine.output_Index64(elem)
-            else:
-                container[elem] = machine.output_NumpyArray(elem)
+    def check_sync(self):
+        if self.data.read(16) != self.sync:
+            raise ak._v2._util.error(
+                ValueError(
+                    "invalid Avro file: block is not followed by the sync marker"
+                )
+            )
 
-        self.outcontents = (self.form, self.blocks, container)
+    def decompressed_blocks(self, blocks, executor):
+        if self.decompress is None:
+            yield from blocks
+            return
+
+        def decompress_block(block):
+            num_items, temp_data = block
+            return num_items, self.decompress(temp_data)
+
+        if executor is None:
+            yield from map(decompress_block, blocks)
+        else:
+            # reading is sequential, but blocks are decompressed in parallel, a
+            # bounded number ahead of the (single) Forth machine that consumes them
+            pending = collections.deque()
+            for block in blocks:
+                pending.append(executor.submit(decompress_block, block))
+                if len(pending) > 2 * self.num_threads:
+                    yield pending.popleft().result()
+            while len(pending) > 0:
+                yield pending.popleft().result()
+
+    def run_block(self, num_items, temp_data, first_iter):
+        if first_iter:
+            self.machine.begin({"stream": np.frombuffer(temp_data, dtype=np.uint8)})
+            self.machine.stack_push(num_items)
+            self.machine.call("init-out")
+            self.machine.resume()
+        else:
+            self.machine.begin_again(
+                {"stream": np.frombuffer(temp_data, dtype=np.uint8)}, True
+            )
+            self.machine.stack_push(num_items)
+            self.machine.resume()
+        return False
 
     def update_pos(self, pos):
         self.marker += pos
@@ -297,6 +425,7 @@ class ReadAvroFT:
                     parameters={"__array__": "char"},
                     form_key=f"node{form_next_id+1}",
                 ),
+                parameters={"__array__": "string"},
                 form_key=f"node{form_next_id}",
             )
             declarations.append(f"output node{form_next_id+1}-data uint8 \n")
@@ -798,6 +927,7 @@ class ReadAvroFT:
                         parameters={"__array__": "char"},
                         form_key=f"node{form_next_id+2}",
                     ),
+                    parameters={"__array__": "string"},
                     form_key=f"node{form_next_id+1}",
                 ),
                 parameters={"__array__": "categorical"},
@@ -843,8 +973,10 @@ class ReadAvroFT:
             exec_code.append(
                 "\n" + "    " * ind + "if stream zigzag-> stack drop negate then"
             )
+            # one copy of the count for the offsets, one for the items, and one
+            # to decide whether a zero-length block ends the (non-empty) array
             exec_code.append(
-                "\n" + "    " * ind + f"dup node{form_next_id}-offsets +<- stack"
+                "\n" + "    " * ind + f"dup dup node{form_next_id}-offsets +<- stack"
             )
 
             if isinstance(file["items"], str):
@@ -877,7 +1009,7 @@ class ReadAvroFT:
             else:
                 exec_code.append("\n" + "    " * ind + "loop")
 
-            exec_code.append("\n" + "    " * ind + "1 stream skip")
+            exec_code.append("\n" + "    " * ind + "if 1 stream skip then")
             aform = ak._v2.forms.ListOffsetForm(
                 "i64", aformtemp, form_key=f"node{temp}"
             )
@@ -919,3 +1051,389 @@ class ReadAvroFT:
             #         exec_code = exec_code+jj
             #         exec_code = exec_code+kk
             raise ak._v2._util.error(NotImplementedError)
+
+
+class IterateAvroFT(ReadAvroFT):
+    def __init__(self, file, debug_forth=False, num_threads=1):
+        self.prepare(file, debug_forth, num_threads)
+
+    def seek_entry(self, entry_start):
+        # skip whole blocks using only their headers (no decompression or
+        # decoding) and return the number of entries to drop from the next one
+        skipped = 0
+        while True:
+            header_marker, header_blocks = self.marker, self.blocks
+            try:
+                pos, num_items, len_block = self.decode_block()
+            except _ReachedEndofArrayError:  # noqa: AK101
+                return 0
+
+            if skipped + num_items > entry_start:
+                self.marker, self.blocks = header_marker, header_blocks
+                self.data.seek(self.marker)
+                return entry_start - skipped
+
+            self.update_pos(len_block)
+            self.check_sync()
+            self.update_pos(16)
+            skipped += num_items
+
+    def chunks(self, step_size, entry_start, entry_stop):
+        # the compiled Forth program is reused for every chunk: 'begin' gives it
+        # fresh output buffers, 'begin_again' appends the next block to them
+        skip = self.seek_entry(entry_start)
+        entry = entry_start
+        length = 0
+        first_iter = True
+
+        with ak._v2._forth.machines.machine(
+            self.forth_code
+        ) as self.machine, self.executor() as executor:
+            for num_items, temp_data in self.decompressed_blocks(
+                self.raw_blocks(None), executor
+            ):
+                first_iter = self.run_block(num_items, temp_data, first_iter)
+                length += num_items
+
+                stop = length
+                if entry_stop is not None:
+                    stop = min(stop, skip + entry_stop - entry)
+                if stop - skip >= step_size or stop < length:
+                    yield self.layout(length, skip, stop)
+                    entry += stop - skip
+                    skip, length, first_iter = 0, 0, True
+                    if entry_stop is not None and entry >= entry_stop:
+                        return
+
+            if length > skip:
+                stop = length
+                if entry_stop is not None:
+                    stop = min(stop, skip + entry_stop - entry)
+                yield self.layout(length, skip, stop)
+
+    def layout(self, length, start, stop):
+        out = ak._v2.operations.from_buffers(
+            self.form, length, self.outputs(), highlevel=False
+        )
+        if start != 0 or stop != length:
+            out = out._getitem_range(slice(start, stop))
+        return out
+
+
+def _compress_snappy(snappy, data):
+    return snappy.compress(data) + zlib.crc32(data).to_bytes(4, "big")
+
+
+def _compress_zstandard(zstandard, data):
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def _compress_deflate(data):
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def compressor(codec):
+    # inverse of 'decompressor'
+    if codec == "null":
+        return None
+    elif codec == "deflate":
+        return _compress_deflate
+    elif codec == "bzip2":
+        return bz2.compress
+    elif codec == "xz":
+        return lzma.compress
+    elif codec == "snappy":
+        snappy = _import_codec("snappy", "python-snappy")
+        return lambda data: _compress_snappy(snappy, data)
+    elif codec == "zstandard":
+        zstandard = _import_codec("zstandard", "zstandard")
+        return lambda data: _compress_zstandard(zstandard, data)
+    else:
+        raise ak._v2._util.error(ValueError(f"unsupported Avro codec: {codec!r}"))
+
+
+_avro_name = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def avro_schema(form, record_names):
+    # the inverse of ReadAvroFT.rec_exp_json_code; 'form' must be packed, so
+    # that there are no IndexedForms and NumpyForms have no inner_shape
+    if form.is_OptionType:
+        content = avro_schema(form.content, record_names)
+        if isinstance(content, list):
+            return ["null"] + content
+        else:
+            return ["null", content]
+
+    elif form.is_UnionType:
+        return [avro_schema(x, record_names) for x in form.contents]
+
+    elif form.is_RecordType:
+        if form.is_tuple:
+            raise ak._v2._util.error(
+                TypeError("Avro records need field names; tuples cannot be written")
+            )
+        for field in form.fields:
+            if _avro_name.match(field) is None:
+                raise ak._v2._util.error(
+                    ValueError(f"{field!r} is not a valid Avro field name")
+                )
+
+        name = form.parameter("__record__")
+        if name is None or _avro_name.match(name) is None or name in record_names:
+            name = f"Record{len(record_names)}"
+            while name in record_names:
+                name += "_"
+        record_names.add(name)
+
+        return {
+            "type": "record",
+            "name": name,
+            "fields": [
+                {"name": field, "type": avro_schema(form.content(field), record_names)}
+                for field in form.fields
+            ],
+        }
+
+    elif form.is_ListType:
+        if form.parameter("__array__") == "string":
+            return "string"
+        elif form.parameter("__array__") == "bytestring":
+            return "bytes"
+        else:
+            return {"type": "array", "items": avro_schema(form.content, record_names)}
+
+    elif isinstance(form, ak._v2.forms.EmptyForm):
+        return "double"
+
+    elif form.is_NumpyType:
+        if form.primitive == "bool":
+            return "boolean"
+        elif form.primitive in ("int8", "uint8", "int16", "uint16", "int32"):
+            return "int"
+        elif form.primitive in ("uint32", "int64", "uint64"):
+            return "long"
+        elif form.primitive in ("float16", "float32"):
+            return "float"
+        elif form.primitive == "float64":
+            return "double"
+        else:
+            raise ak._v2._util.error(
+                TypeError(f"Avro has no type for {form.primitive!r} data")
+            )
+
+    else:
+        raise ak._v2._util.error(
+            AssertionError(f"unexpected Form in Avro writer: {type(form).__name__}")
+        )
+
+
+def _varints(values):
+    # zigzag-encoded base-128 varints, as bytes 'data' and per-value 'offsets'
+    values = values.astype(np.int64)
+    remaining = ((values << 1) ^ (values >> 63)).view(np.uint64)
+    nbytes = np.ones(len(values), dtype=np.int64)
+    shifted = remaining >> np.uint64(7)
+    while shifted.any():
+        nbytes += shifted != 0
+        shifted >>= np.uint64(7)
+
+    offsets = np.empty(len(values) + 1, dtype=np.int64)
+    offsets[0] = 0
+    np.cumsum(nbytes, out=offsets[1:])
+    data = np.empty(offsets[-1], dtype=np.uint8)
+
+    positions = offsets[:-1]
+    for i in range(int(nbytes.max()) if len(values) > 0 else 0):
+        selected = nbytes > i
+        more = (nbytes[selected] > i + 1).astype(np.uint8) << np.uint8(7)
+        low = (remaining[selected] & np.uint64(0x7F)).astype(np.uint8)
+        data[positions[selected] + i] = low | more
+        remaining >>= np.uint64(7)
+
+    return data, offsets
+
+
+def _concatenate_rows(pieces, length):
+    # each piece is (data, starts, stops) for 'length' rows; row i of the output
+    # is data[starts[i]:stops[i]] of each piece, one after the other
+    sizes = [stops - starts for data, starts, stops in pieces]
+    offsets = np.zeros(length + 1, dtype=np.int64)
+    for size in sizes:
+        offsets[1:] += size
+    np.cumsum(offsets, out=offsets)
+    out = np.empty(offsets[-1], dtype=np.uint8)
+
+    positions = offsets[:-1].copy()
+    rows = np.arange(length)
+    for (data, starts, _), size in zip(pieces, sizes):
+        total = int(size.sum())
+        if total != 0:
+            row_of_byte = np.repeat(rows, size)
+            within = np.arange(total) - np.repeat(np.cumsum(size) - size, size)
+            out[positions[row_of_byte] + within] = data[starts[row_of_byte] + within]
+        positions += size
+
+    return out, offsets
+
+
+def _fixed_width(data):
+    data = np.ascontiguousarray(data)
+    offsets = np.arange(len(data) + 1, dtype=np.int64) * data.dtype.itemsize
+    return data.view(np.uint8).reshape(-1), offsets
+
+
+def _encode_union(layout, shift):
+    tags = layout.tags.raw(numpy)
+    index = layout.index.raw(numpy)[: len(tags)]
+    tag_data, tag_offsets = _varints(tags.astype(np.int64) + shift)
+
+    datas, starts, stops = (
+        [],
+        np.zeros(len(tags), np.int64),
+        np.zeros(len(tags), np.int64),
+    )
+    base = 0
+    for tag, content in enumerate(layout.contents):
+        data, offsets = encode(content)
+        selected = tags == tag
+        starts[selected] = base + offsets[:-1][index[selected]]
+        stops[selected] = base + offsets[1:][index[selected]]
+        datas.append(data)
+        base += len(data)
+
+    data = np.concatenate(datas) if len(datas) > 0 else np.empty(0, np.uint8)
+    return _concatenate_rows(
+        [
+            (tag_data, tag_offsets[:-1], tag_offsets[1:]),
+            (data, starts, stops),
+        ],
+        len(tags),
+    )
+
+
+def encode(layout):
+    # Avro binary encoding of each element of a packed 'layout', returned as
+    # bytes 'data' and per-element 'offsets' (length + 1) into 'data'
+    length = layout.length
+
+    if layout.is_OptionType:
+        valid = np.asarray(layout.mask_as_bool(valid_when=True))[:length]
+        content = layout.project()
+
+        if content.is_UnionType:
+            data, offsets = _encode_union(content, 1)
+        else:
+            data, offsets = encode(content)
+            data, offsets = _concatenate_rows(
+                [
+                    (
+                        np.array([2], np.uint8),
+                        np.zeros(content.length, np.int64),
+                        np.ones(content.length, np.int64),
+                    ),
+                    (data, offsets[:-1], offsets[1:]),
+                ],
+                content.length,
+            )
+
+        # index 0 of the union is "null", encoded as a single zero byte
+        starts = np.zeros(length, dtype=np.int64)
+        stops = np.ones(length, dtype=np.int64)
+        starts[valid] = offsets[:-1] + 1
+        stops[valid] = offsets[1:] + 1
+        return _concatenate_rows(
+            [(np.concatenate([np.zeros(1, np.uint8), data]), starts, stops)], length
+        )
+
+    elif layout.is_UnionType:
+        return _encode_union(layout, 0)
+
+    elif layout.is_RecordType:
+        pieces = []
+        for content in layout.contents:
+            data, offsets = encode(content._getitem_range(slice(0, length)))
+            pieces.append((data, offsets[:-1], offsets[1:]))
+        return _concatenate_rows(pieces, length)
+
+    elif layout.is_ListType:
+        if layout.is_RegularType:
+            layout = layout.toListOffsetArray64(False)
+        starts = layout.starts.raw(numpy).astype(np.int64)
+        stops = layout.stops.raw(numpy)[: len(starts)].astype(np.int64)
+        count_data, count_offsets = _varints(stops - starts)
+        counts = (count_data, count_offsets[:-1], count_offsets[1:])
+
+        if layout.parameter("__array__") in ("string", "bytestring"):
+            chars = np.asarray(layout.content.data).view(np.uint8)
+            return _concatenate_rows([counts, (chars, starts, stops)], length)
+
+        else:
+            # non-empty arrays are a block of items, followed by a zero-length block
+            data, offsets = encode(layout.content)
+            items = (data, offsets[starts], offsets[stops])
+            end = (
+                np.zeros(1, np.uint8),
+                np.zeros(length, np.int64),
+                (stops > starts).astype(np.int64),
+            )
+            return _concatenate_rows([counts, items, end], length)
+
+    elif isinstance(layout, ak._v2.contents.EmptyArray):
+        return np.empty(0, np.uint8), np.zeros(1, np.int64)
+
+    elif layout.is_NumpyType:
+        data = layout.raw(numpy)
+        if data.dtype == np.dtype(np.bool_):
+            return _fixed_width(data.astype(np.uint8))
+        elif issubclass(data.dtype.type, np.integer):
+            if (
+                data.dtype == np.dtype(np.uint64)
+                and (data > np.iinfo(np.int64).max).any()
+            ):
+                raise ak._v2._util.error(
+                    ValueError("uint64 values too large for Avro's 'long' type")
+                )
+            return _varints(data)
+        elif data.dtype in (np.dtype(np.float16), np.dtype(np.float32)):
+            return _fixed_width(data.astype("<f4"))
+        else:
+            return _fixed_width(data.astype("<f8"))
+
+    else:
+        raise ak._v2._util.error(
+            AssertionError(f"unexpected layout in Avro writer: {type(layout).__name__}")
+        )
+
+
+def write_avro(file, layout, codec, block_size, sync_marker):
+    layout = layout.packed()
+    schema = avro_schema(layout.form, set())
+    compress = compressor(codec)
+
+    def string(x):
+        data, offsets = _varints(np.array([len(x)]))
+        return data.tobytes() + x
+
+    def long(x):
+        return _varints(np.array([x]))[0].tobytes()
+
+    file.write(b"Obj\x01")
+    file.write(long(2))
+    file.write(string(b"avro.schema") + string(json.dumps(schema).encode()))
+    file.write(string(b"avro.codec") + string(codec.encode()))
+    file.write(long(0))
+    file.write(sync_marker)
+
+    for start in range(0, layout.length, block_size):
+        stop = min(start + block_size, layout.length)
+        data, offsets = encode(layout._getitem_range(slice(start, stop)))
+        block = data.tobytes()
+        if compress is not None:
+            block = compress(block)
+        file.write(long(stop - start) + long(len(block)))
+        file.write(block)
+        file.write(sync_marker)
+
+    return schema
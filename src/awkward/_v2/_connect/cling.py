@@ -13,10 +13,16 @@ numpy = ak.nplike.Numpy.instance()
 cache = {}
 
 
+def cache_of(compiler):
+    # a Header keeps its own record of what has been generated; everything
+    # else (e.g. ROOT.gInterpreter.Declare) shares this module's
+    return getattr(compiler, "cache", cache)
+
+
 def generate_headers(compiler, use_cached=True):
     key = "headers"
     if use_cached:
-        out = cache.get(key)
+        out = cache_of(compiler).get(key)
     else:
         out = None
 
@@ -34,7 +40,7 @@ def generate_headers(compiler, use_cached=True):
 
 extern "C" int printf(const char*, ...);
 """.strip()
-        cache[key] = out
+        cache_of(compiler)[key] = out
         compiler(out)
 
     return out
@@ -43,11 +49,11 @@ extern "C" int printf(const char*, ...);
 def generate_ArrayView(compiler, use_cached=True):
     key = "ArrayView"
     if use_cached:
-        out = cache.get(key)
+        out = cache_of(compiler).get(key)
     else:
         out = None
 
-    if not use_cached or "headers" not in cache:
+    if not use_cached or "headers" not in cache_of(compiler):
         generate_headers(compiler, use_cached=use_cached)
 
     if out is None:
@@ -139,10 +145,12 @@ namespace awkward {
       return start_ == stop_;
     }
 
+#ifdef Py_PYTHON_H
     PyObject* lookup() {
         Py_INCREF(lookup_);
         return lookup_;
     }
+#endif
 
   protected:
     ssize_t start_;
@@ -153,7 +161,7 @@ namespace awkward {
   };
 }
 """.strip()
-        cache[key] = out
+        cache_of(compiler)[key] = out
         compiler(out)
 
     return out
@@ -162,11 +170,11 @@ namespace awkward {
 def generate_RecordView(compiler, use_cached=True):
     key = "RecordView"
     if use_cached:
-        out = cache.get(key)
+        out = cache_of(compiler).get(key)
     else:
         out = None
 
-    if not use_cached or "headers" not in cache:
+    if not use_cached or "headers" not in cache_of(compiler):
         generate_headers(compiler, use_cached=use_cached)
 
     if out is None:
@@ -186,7 +194,7 @@ namespace awkward {
   };
 }
 """.strip()
-        cache[key] = out
+        cache_of(compiler)[key] = out
         compiler(out)
 
     return out
@@ -195,11 +203,11 @@ namespace awkward {
 def generate_ArrayBuilder(compiler, use_cached=True):
     key = "ArrayBuilder"
     if use_cached:
-        out = cache.get(key)
+        out = cache_of(compiler).get(key)
     else:
         out = None
 
-    if not use_cached or "headers" not in cache:
+    if not use_cached or "headers" not in cache_of(compiler):
         generate_headers(compiler, use_cached=use_cached)
 
     if out is None:
@@ -421,12 +429,104 @@ namespace awkward {{
   }};
 }}
 """.strip()
-        cache[key] = out
+        cache_of(compiler)[key] = out
         compiler(out)
 
     return out
 
 
+class Header:
+    """
+    A `compiler` for the `generate` methods that collects the C++ code
+    instead of declaring it to ROOT, so that it can be written to a file and
+    compiled by any C++17 compiler. It does not need ROOT or Python.h.
+
+    Each Header has its own cache, so it gets every class that its
+    generators need, whatever has already been declared to ROOT.
+    """
+
+    def __init__(self):
+        self.parts = [
+            """
+#include <sys/types.h>
+#include <stdint.h>
+#include <vector>
+#include <string>
+#include <optional>  // C++17
+#include <variant>  // C++17
+#include <complex>
+#include <chrono>
+
+#ifndef Py_PYTHON_H
+struct _object;
+typedef struct _object PyObject;
+#endif
+
+extern "C" int printf(const char*, ...);
+""".strip()
+        ]
+        self.cache = {"headers": self.parts[0]}
+
+    def __call__(self, code):
+        self.parts.append(code)
+        return True
+
+    def __str__(self):
+        return "\n\n".join(self.parts) + "\n"
+
+
+def generate_header(form, entry_point=None):
+    """
+    Args:
+        form (#ak._v2.forms.Form): Form of the arrays to read in C++.
+        entry_point (None or str): If not None, the name of a C ABI function
+            to add after the classes.
+
+    Returns self-contained C++17 source code with the ArrayView and
+    RecordView classes for `form`, for compilers other than ROOT's cling.
+
+    If `entry_point` is not None, the source ends with
+
+        typedef awkward::<class> <entry_point>_array;
+
+        int64_t <entry_point>_impl(<entry_point>_array array, void* args);
+
+        extern "C" int64_t <entry_point>(ssize_t length, ssize_t* ptrs, void* args);
+
+    where `<entry_point>` calls `<entry_point>_impl`, which must be defined by
+    the code that includes the header. `ptrs` is the `arrayptrs` of an
+    #ak._v2._lookup.Lookup of an array with this Form and `args` is passed
+    through unchanged, so that a shared library can be called with ctypes:
+
+        lookup = ak._v2._lookup.Lookup(array.layout)
+        library.<entry_point>(len(array), lookup.arrayptrs.ctypes.data, args)
+
+    (keeping `lookup` and `array` alive during the call).
+    """
+    generator = togenerator(form, flatlist_as_rvec=False)
+    header = Header()
+    generator.generate(header)
+
+    if entry_point is not None:
+        if re.match("^[A-Za-z_][A-Za-z_0-9]*$", entry_point) is None:
+            raise ak._v2._util.error(
+                ValueError(f"entry_point must be a C identifier, not {entry_point!r}")
+            )
+        header(
+            f"""
+typedef awkward::{generator.class_type()} {entry_point}_array;
+
+int64_t {entry_point}_impl({entry_point}_array array, void* args);
+
+extern "C" int64_t {entry_point}(ssize_t length, ssize_t* ptrs, void* args) {{
+  return {entry_point}_impl({entry_point}_array(0, length, 0, ptrs, 0), args);
+}}
+""".strip()
+        )
+
+    return str(header)
+
+
 def togenerator(form, flatlist_as_rvec):
     if isinstance(form, ak._v2.forms.EmptyForm):
         return togenerator(form.toNumpyForm(np.dtype(np.float64)), flatlist_as_rvec)
@@ -591,7 +691,7 @@ class NumpyArrayGenerator(Generator, ak._v2._lookup.NumpyLookup):
         generate_ArrayView(compiler, use_cached=use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             out = f"""
 namespace awkward {{
   class {self.class_type()}: public ArrayView {{
@@ -610,7 +710,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -678,7 +778,7 @@ class RegularArrayGenerator(Generator, ak._v2._lookup.RegularLookup):
             self.content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             if self.is_string:
                 out = f"""
 namespace awkward {{
@@ -748,7 +848,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -847,7 +947,7 @@ class ListArrayGenerator(Generator, ak._v2._lookup.ListLookup):
             self.content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             if self.is_string:
                 out = f"""
 namespace awkward {{
@@ -917,7 +1017,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -978,7 +1078,7 @@ class IndexedArrayGenerator(Generator, ak._v2._lookup.IndexedLookup):
         self.content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             out = f"""
 namespace awkward {{
   class {self.class_type()}: public ArrayView {{
@@ -998,7 +1098,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -1057,7 +1157,7 @@ class IndexedOptionArrayGenerator(Generator, ak._v2._lookup.IndexedOptionLookup)
         self.content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             out = f"""
 namespace awkward {{
   class {self.class_type()}: public ArrayView {{
@@ -1082,7 +1182,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -1138,7 +1238,7 @@ class ByteMaskedArrayGenerator(Generator, ak._v2._lookup.ByteMaskedLookup):
         self.content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             out = f"""
 namespace awkward {{
   class {self.class_type()}: public ArrayView {{
@@ -1163,7 +1263,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -1228,7 +1328,7 @@ class BitMaskedArrayGenerator(Generator, ak._v2._lookup.BitMaskedLookup):
         self.content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             out = f"""
 namespace awkward {{
   class {self.class_type()}: public ArrayView {{
@@ -1258,7 +1358,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -1303,7 +1403,7 @@ class UnmaskedArrayGenerator(Generator, ak._v2._lookup.UnmaskedLookup):
         self.content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             out = f"""
 namespace awkward {{
   class {self.class_type()}: public ArrayView {{
@@ -1322,7 +1422,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -1369,7 +1469,7 @@ class RecordGenerator(Generator, ak._v2._lookup.RecordLookup):
             content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             params = [
                 f"if (parameter == {json.dumps(name)}) return {json.dumps(json.dumps(value))};\n      "
                 for name, value in self.parameters.items()
@@ -1407,7 +1507,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -1471,7 +1571,7 @@ class RecordArrayGenerator(Generator, ak._v2._lookup.RecordLookup):
         self.record.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             out = f"""
 namespace awkward {{
   class {self.class_type()}: public ArrayView {{
@@ -1490,7 +1590,7 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
 
 
@@ -1553,7 +1653,7 @@ class UnionArrayGenerator(Generator, ak._v2._lookup.UnionLookup):
             content.generate(compiler, use_cached)
 
         key = (self, self.flatlist_as_rvec)
-        if not use_cached or key not in cache:
+        if not use_cached or key not in cache_of(compiler):
             cases = []
             for i, content in enumerate(self.contents):
                 cases.append(
@@ -1588,5 +1688,5 @@ namespace awkward {{
   }};
 }}
 """.strip()
-            cache[key] = out
+            cache_of(compiler)[key] = out
             compiler(out)
@@ -90,23 +90,66 @@ def _replace_numpyarray_nodes(layout, buffers):
             buffers.pop(0)
             return ak._v2.contents.NumpyArray(
                 buffer,
-                layout.identifier,
-                layout.parameters,
+                node.identifier,
+                node.parameters,
                 nplike=ak.nplike.Jax.instance(),
             )
 
     return layout.recursively_apply(action=replace_numpyarray_nodes)
 
 
+def _structure(layout):
+    nodes = []
+
+    def find_nodes(node, **kwargs):
+        nodes.append((type(node).__name__, node.length))
+
+    layout.recursively_apply(action=find_nodes, return_array=False)
+
+    if isinstance(layout, ak._v2.record.Record):
+        nodes.append(("Record", layout.at))
+    return tuple(nodes)
+
+
 class AuxData:
+    """
+    The static part of a flattened Awkward Array: everything except the
+    NumpyArray buffers, including the index buffers, which therefore have to
+    be concrete arrays, rather than tracers, in a function compiled by
+    `jax.jit`. Equal AuxData (same node types, lengths, parameters, and
+    index values) reuse the same compiled function.
+    """
+
     def __init__(self, layout):
         self._layout = layout
+        self._hash = None
 
     @property
     def layout(self):
         return self._layout
 
     def __eq__(self, other):
-        return self.layout.layout_equal(
-            other.layout, index_dtype=False, numpyarray=False
+        if not isinstance(other, AuxData):
+            return False
+        if self.layout is other.layout:
+            return True
+
+        self_layout, other_layout = self.layout, other.layout
+        if isinstance(self_layout, ak._v2.record.Record) or isinstance(
+            other_layout, ak._v2.record.Record
+        ):
+            if (
+                type(self_layout) is not type(other_layout)
+                or self_layout.at != other_layout.at
+            ):
+                return False
+            self_layout, other_layout = self_layout.array, other_layout.array
+
+        return self_layout.layout_equal(
+            other_layout, index_dtype=False, numpyarray=False
         )
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(_structure(self.layout))
+        return self._hash
@@ -34,6 +34,75 @@ class Reducer:
         return type
 
 
+def _segment_positions(array, parents, outlength, segment_best):
+    # position of the first element equal to the best value of its segment, or
+    # -1 for empty segments, as in the awkward_reduce_argmin/argmax kernels
+    jax = Reducer.jax
+    data = array.data
+    if data.dtype == np.bool_:
+        data = data.astype(np.int8)
+    length = data.shape[0]
+    best = segment_best(data, parents.data, num_segments=outlength)[parents.data]
+    matches = data == best
+    if data.dtype.kind == "f":
+        # NaN is not equal to itself: a segment whose best is NaN has its
+        # first NaN as position, as in NumPy
+        matches = matches | (jax.numpy.isnan(data) & jax.numpy.isnan(best))
+    index = jax.numpy.arange(length, dtype=np.int64)
+    candidates = jax.numpy.where(matches, index, length)
+    first = jax.ops.segment_min(candidates, parents.data, num_segments=outlength)
+    return jax.numpy.where(first < length, first, -1)
+
+
+def _exclusive_cumprod(values, starts):
+    # product of the values before each one in its segment (1 for the first),
+    # where segments begin at each True in starts
+    jax = Reducer.jax
+
+    def combine(one, two):
+        return jax.numpy.where(two[1], two[0], one[0] * two[0]), one[1] | two[1]
+
+    inclusive, _ = jax.lax.associative_scan(combine, (values, starts))
+    return jax.numpy.where(starts, 1, jax.numpy.roll(inclusive, 1))
+
+
+def _segment_prod(data, parents, outlength):
+    return Reducer.jax.ops.segment_prod(data, parents, num_segments=outlength)
+
+
+def _segment_prod_fwd(data, parents, outlength):
+    return _segment_prod(data, parents, outlength), (data, parents)
+
+
+def _segment_prod_bwd(outlength, residuals, cotangent):
+    # jax.ops.segment_prod can't be differentiated unless its indices are
+    # unique (https://github.com/google/jax/issues/9296); the derivative with
+    # respect to each value is the product of the others in its segment, from
+    # scans in both directions over the values sorted by segment
+    jax = Reducer.jax
+    data, parents = residuals
+    length = data.shape[0]
+    if length == 0:
+        return jax.numpy.zeros_like(data), None
+
+    parents, order = jax.lax.sort(
+        (jax.numpy.asarray(parents), jax.numpy.arange(length)), num_keys=1
+    )
+    values = data[order]
+    changes = parents[1:] != parents[:-1]
+    starts = jax.numpy.concatenate([jax.numpy.array([True]), changes])
+    stops = jax.numpy.concatenate([changes, jax.numpy.array([True])])
+    before = _exclusive_cumprod(values, starts)
+    after = _exclusive_cumprod(values[::-1], stops[::-1])[::-1]
+
+    grad = jax.numpy.zeros_like(data).at[order].set(cotangent[parents] * before * after)
+    return grad, None
+
+
+_segment_prod = Reducer.jax.custom_vjp(_segment_prod, nondiff_argnums=(2,))
+_segment_prod.defvjp(_segment_prod_fwd, _segment_prod_bwd)
+
+
 class ArgMin(Reducer):
     name = "argmin"
     needs_position = True
@@ -45,21 +114,44 @@ class ArgMin(Reducer):
 
     @classmethod
     def apply(cls, array, parents, outlength):
-        raise ak._v2._util.error("Cannot differentiate through argmin")
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        if array.dtype.type in (np.complex128, np.complex64):
+            raise ak._v2._util.error(
+                NotImplementedError("ak.argmin of complex numbers with JAX")
+            )
+        result = _segment_positions(array, parents, outlength, cls.jax.ops.segment_min)
+        return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
 
+    @classmethod
+    def adjust_starts(cls, out, parents, starts, shifts):
+        # the awkward_NumpyArray_reduce_adjust_starts(_shifts)_64 kernels, for
+        # positions that may be traced
+        if parents.length == 0:
+            return out
+        jax = cls.jax
+        positions = out.data
+        found = positions >= 0
+        clipped = jax.numpy.where(found, positions, 0)
+        adjusted = positions - jax.numpy.asarray(starts.data)[parents.data][clipped]
+        if shifts is not None:
+            adjusted = adjusted + jax.numpy.asarray(shifts.data)[clipped]
+        return ak._v2.contents.NumpyArray(
+            jax.numpy.where(found, adjusted, positions), nplike=out.nplike
+        )
 
-class ArgMax(Reducer):
-    name = "argmax"
-    needs_position = True
-    preferred_dtype = np.int64
 
-    @classmethod
-    def return_dtype(cls, given_dtype):
-        return np.int64
+class ArgMax(ArgMin):
+    name = "argmax"
 
     @classmethod
     def apply(cls, array, parents, outlength):
-        raise ak._v2._util.error("Cannot differentiate through argmax")
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        if array.dtype.type in (np.complex128, np.complex64):
+            raise ak._v2._util.error(
+                NotImplementedError("ak.argmax of complex numbers with JAX")
+            )
+        result = _segment_positions(array, parents, outlength, cls.jax.ops.segment_max)
+        return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
 
 
 class Count(Reducer):
@@ -72,7 +164,13 @@ class Count(Reducer):
 
     @classmethod
     def apply(cls, array, parents, outlength):
-        raise ak._v2._util.error("Cannot differentiate through count_zero")
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        result = cls.jax.ops.segment_sum(
+            cls.jax.numpy.ones(parents.length, dtype=np.int64),
+            parents.data,
+            num_segments=outlength,
+        )
+        return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
 
 
 class CountNonzero(Reducer):
@@ -85,7 +183,13 @@ class CountNonzero(Reducer):
 
     @classmethod
     def apply(cls, array, parents, outlength):
-        raise ak._v2._util.error("Cannot differentiate through count_nonzero")
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        result = cls.jax.ops.segment_sum(
+            (array.data != 0).astype(np.int64),
+            parents.data,
+            num_segments=outlength,
+        )
+        return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
 
 
 class Sum(Reducer):
@@ -101,12 +205,18 @@ class Sum(Reducer):
                 ValueError(f"cannot compute the sum (ak.sum) of {array.dtype!r}")
             )
 
-        result = cls.jax.ops.segment_sum(array.data, parents.data)
+        result = cls.jax.ops.segment_sum(
+            array.data, parents.data, num_segments=outlength
+        )
 
         if array.dtype.kind == "m":
-            return ak._v2.contents.NumpyArray(array.nplike.asarray(result, array.dtype))
+            return ak._v2.contents.NumpyArray(
+                array.nplike.asarray(result, array.dtype), nplike=array.nplike
+            )
         elif array.dtype.type in (np.complex128, np.complex64):
-            return ak._v2.contents.NumpyArray(result.view(array.dtype))
+            return ak._v2.contents.NumpyArray(
+                result.view(array.dtype), nplike=array.nplike
+            )
         else:
             return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
 
@@ -118,17 +228,19 @@ class Prod(Reducer):
     @classmethod
     def apply(cls, array, parents, outlength):
         assert isinstance(array, ak._v2.contents.NumpyArray)
-        # See issue https://github.com/google/jax/issues/9296
-        result = cls.jax.numpy.exp(
-            cls.jax.ops.segment_sum(cls.jax.numpy.log(array.data), parents.data)
-        )
-
-        if array.dtype.type in (np.complex128, np.complex64):
-            return ak._v2.contents.NumpyArray(
-                result.view(array.dtype), nplike=array.nplike
+        if array.dtype.kind.upper() == "M":
+            raise ak._v2._util.error(
+                ValueError(f"cannot compute the product (ak.prod) of {array.dtype!r}")
             )
-        else:
-            return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
+
+        data = array.data
+        if data.dtype == np.bool_:
+            data = data.astype(np.int8)
+        result = _segment_prod(data, parents.data, outlength)
+        if array.dtype == np.bool_:
+            result = result.astype(np.bool_)
+
+        return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
 
 
 class Any(Reducer):
@@ -142,8 +254,9 @@ class Any(Reducer):
     @classmethod
     def apply(cls, array, parents, outlength):
         assert isinstance(array, ak._v2.contents.NumpyArray)
-        result = cls.jax.ops.segment_max(array.data, parents.data)
-        result = cls.jax.numpy.asarray(result, dtype=bool)
+        result = cls.jax.ops.segment_max(
+            array.data != 0, parents.data, num_segments=outlength
+        )
 
         return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
 
@@ -159,8 +272,9 @@ class All(Reducer):
     @classmethod
     def apply(cls, array, parents, outlength):
         assert isinstance(array, ak._v2.contents.NumpyArray)
-        result = cls.jax.ops.segment_min(array.data, parents.data)
-        result = cls.jax.numpy.asarray(result, dtype=bool)
+        result = cls.jax.ops.segment_min(
+            array.data != 0, parents.data, num_segments=outlength
+        )
 
         return ak._v2.contents.NumpyArray(result, nplike=array.nplike)
 
@@ -199,7 +313,9 @@ class Min(Reducer):
     def apply(cls, array, parents, outlength):
         assert isinstance(array, ak._v2.contents.NumpyArray)
 
-        result = cls.jax.ops.segment_min(array.data, parents.data)
+        result = cls.jax.ops.segment_min(
+            array.data, parents.data, num_segments=outlength
+        )
         result = cls.jax.numpy.minimum(
             result, cls._min_initial(cls.initial, array.dtype)
         )
@@ -247,7 +363,9 @@ class Max(Reducer):
     def apply(cls, array, parents, outlength):
         assert isinstance(array, ak._v2.contents.NumpyArray)
 
-        result = cls.jax.ops.segment_max(array.data, parents.data)
+        result = cls.jax.ops.segment_max(
+            array.data, parents.data, num_segments=outlength
+        )
 
         result = cls.jax.numpy.maximum(
             result, cls._max_initial(cls.initial, array.dtype)
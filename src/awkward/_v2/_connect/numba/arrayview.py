@@ -1,6 +1,7 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
 import operator
+import weakref
 
 import numba
 import numba.core.typing
@@ -61,6 +62,36 @@ def tonumbatype(form):
         raise AssertionError(f"unrecognized Form: {type(form)}")
 
 
+def projection(type, lowered):
+    # the fields of each RecordArray that have been read by compiled code, in
+    # the form of ak._v2._lookup.Lookup's projection argument; records with
+    # custom lowering (names in 'lowered') can read fields without typing them
+    if isinstance(type, ak._v2._connect.numba.layout.RecordArrayType):
+        if type.parameters.get("__record__") in lowered:
+            return None
+        return tuple(
+            (index, projection(type.contenttypes[index], lowered))
+            for index in sorted(type.fields_read)
+        )
+    elif isinstance(type, ak._v2._connect.numba.layout.UnionArrayType):
+        return None
+    elif hasattr(type, "contenttype"):
+        return projection(type.contenttype, lowered)
+    else:
+        return None
+
+
+def lowered_names(behavior):
+    behavior = ak._v2._util.Behavior(ak._v2.behavior, behavior)
+    return {
+        name
+        for key, _ in behavior.items()
+        if isinstance(key, tuple) and key[0] == "__numba_lower__"
+        for name in key[1:]
+        if isinstance(name, str)
+    }
+
+
 ########## Lookup
 
 
@@ -101,35 +132,69 @@ def unbox_Lookup(lookuptype, lookupobj, c):
 ########## ArrayView
 
 
+_numbatypes = weakref.WeakKeyDictionary()
+
+
 class ArrayView:
     @classmethod
     def fromarray(cls, array):
         behavior = ak._v2._util.behavior_of(array)
-        layout = ak._v2.operations.to_layout(
-            array,
-            allow_record=False,
-            allow_other=False,
-            numpytype=(np.number, np.bool_, np.datetime64, np.timedelta64),
-        )
+        if isinstance(array, ak._v2.highlevel.Array):
+            layout = array.layout
+        else:
+            layout = ak._v2.operations.to_layout(
+                array,
+                allow_record=False,
+                allow_other=False,
+                numpytype=(np.number, np.bool_, np.datetime64, np.timedelta64),
+            )
+        return cls.fromlayout(layout, behavior)
+
+    @classmethod
+    def fromlayout(cls, layout, behavior):
+        # like the Lookups, the types of layouts are kept until they're deleted
+        type = _numbatypes.get(layout)
+        if type is None:
+            type = _numbatypes[layout] = tonumbatype(layout.form)
         return ArrayView(
-            tonumbatype(layout.form),
+            type,
             behavior,
-            ak._v2._lookup.Lookup(layout),
+            None,
             0,
             0,
             len(layout),
             (),
+            layout,
         )
 
-    def __init__(self, type, behavior, lookup, pos, start, stop, fields):
+    def __init__(self, type, behavior, lookup, pos, start, stop, fields, layout=None):
         self.type = type
         self.behavior = behavior
-        self.lookup = lookup
+        self._lookup = lookup
+        self._layout = layout
+        self._reads = None
         self.pos = pos
         self.start = start
         self.stop = stop
         self.fields = fields
 
+    @property
+    def lookup(self):
+        # made when the view is first unboxed, rather than when it is typed, so
+        # that a projection includes the fields read by the function being called
+        if ak._v2.numba.projection:
+            reads = ak._v2._connect.numba.layout.RecordArrayType.reads
+        else:
+            reads = None
+        if self._lookup is None or (self._layout is not None and self._reads != reads):
+            if reads is None:
+                projected = None
+            else:
+                projected = projection(self.type, lowered_names(self.behavior))
+            self._lookup = ak._v2._lookup.Lookup.cached(self._layout, projected)
+            self._reads = reads
+        return self._lookup
+
     def toarray(self):
         layout = self.type.tolayout(self.lookup, self.pos, self.fields)
         sliced = layout._getitem_range(slice(self.start, self.stop))
@@ -503,19 +568,7 @@ class RecordView:
             numpytype=(np.number, np.bool_, np.datetime64, np.timedelta64),
         )
         assert isinstance(layout, ak._v2.record.Record)
-        arraylayout = layout.array
-        return RecordView(
-            ArrayView(
-                tonumbatype(arraylayout.form),
-                behavior,
-                ak._v2._lookup.Lookup(arraylayout),
-                0,
-                0,
-                len(arraylayout),
-                (),
-            ),
-            layout.at,
-        )
+        return RecordView(ArrayView.fromlayout(layout.array, behavior), layout.at)
 
     def __init__(self, arrayview, at):
         self.arrayview = arrayview
@@ -1078,6 +1078,9 @@ class UnmaskedArrayType(ContentType, ak._v2._lookup.UnmaskedLookup):
 
 
 class RecordArrayType(ContentType, ak._v2._lookup.RecordLookup):
+    # incremented whenever compiled code reads a field that it hadn't before
+    reads = 0
+
     @classmethod
     def from_form(cls, form):
         return RecordArrayType(
@@ -1101,6 +1104,14 @@ class RecordArrayType(ContentType, ak._v2._lookup.RecordLookup):
         self.fields = fields
         self.identifiertype = identifiertype
         self.parameters = parameters
+        self.fields_read = set()
+
+    def read_field(self, index):
+        # Numba types are interned by name, so this is the union of the fields
+        # read through this type by all compiled functions (see projection)
+        if index not in self.fields_read:
+            self.fields_read.add(index)
+            RecordArrayType.reads += 1
 
     def fieldindex(self, key):
         out = -1
@@ -1150,6 +1161,7 @@ class RecordArrayType(ContentType, ak._v2._lookup.RecordLookup):
                             repr(key), ", ".join(repr(x) for x in self.fields)
                         )
                     )
+            self.read_field(index)
             contenttype = self.contenttypes[index]
             subviewtype = ak._v2._connect.numba.arrayview.wrap(
                 contenttype, viewtype, viewtype.fields[1:]
@@ -1171,6 +1183,7 @@ class RecordArrayType(ContentType, ak._v2._lookup.RecordLookup):
                         repr(key), ", ".join(repr(x) for x in self.fields)
                     )
                 )
+        self.read_field(index)
         contenttype = self.contenttypes[index]
         subviewtype = ak._v2._connect.numba.arrayview.wrap(contenttype, viewtype, None)
         return contenttype.getitem_range(subviewtype)
@@ -1190,6 +1203,7 @@ class RecordArrayType(ContentType, ak._v2._lookup.RecordLookup):
                         repr(key), ", ".join(repr(x) for x in self.fields)
                     )
                 )
+        self.read_field(index)
         contenttype = self.contenttypes[index]
         subviewtype = ak._v2._connect.numba.arrayview.wrap(
             contenttype, recordviewtype, None
@@ -0,0 +1,1019 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import ctypes
+import weakref
+
+import numba
+import numpy as np
+
+import awkward as ak
+
+numpy = ak.nplike.Numpy.instance()
+
+# The whole state of a LayoutBuilder is one int64 array (and the buffers that it
+# points to), owned by the Python object: a header, a table of the Form's nodes
+# in depth-first order (node 0 is the root), the nodes' children, a stack of
+# open lists, and a table of buffers. Compiled code reads and writes all of it
+# through raw addresses, so that no call touches a reference count, and calls
+# back into Python only to grow a full buffer.
+
+# header
+NNODES, NCHILDREN, NBUFFERS, DEPTH, GROW = range(5)
+HEADER = 5
+
+# columns of the nodes table: the Form, then what has been built so far
+(
+    KIND,
+    PARENT,
+    FIRST,
+    NCONTENTS,
+    CODE,
+    SIZE,
+    VALID_WHEN,
+    LSB_ORDER,
+    BUFFER0,
+    BUFFER1,
+    END,
+    LENGTH,
+    FIELD,
+    TAG_NEXT,
+    START,
+    BITS,
+    MULTIPLICITY,
+) = range(17)
+NODE_COLUMNS = 17
+
+# columns of the buffers table
+USED, CAPACITY, ADDRESS, DTYPE, ITEMSIZE = range(5)
+BUFFER_COLUMNS = 5
+
+# node kinds
+EMPTY = 0
+NUMPY = 1
+LISTOFFSET = 2
+LIST = 3
+REGULAR = 4
+INDEXEDOPTION = 5
+BYTEMASKED = 6
+BITMASKED = 7
+UNMASKED = 8
+RECORD = 9
+UNION = 10
+
+# what a call is looking for when it walks down from the current position
+VALUE = 0
+BEGIN_LIST = 1
+NULL = 2
+TAG = 3
+
+primitives = (
+    "bool",
+    "int8",
+    "uint8",
+    "int16",
+    "uint16",
+    "int32",
+    "uint32",
+    "int64",
+    "uint64",
+    "float32",
+    "float64",
+    "complex64",
+    "complex128",
+)
+(
+    BOOL,
+    INT8,
+    UINT8,
+    INT16,
+    UINT16,
+    INT32,
+    UINT32,
+    INT64,
+    UINT64,
+    FLOAT32,
+    FLOAT64,
+    COMPLEX64,
+    COMPLEX128,
+) = range(len(primitives))
+
+_index_to_dtype = {
+    "i8": np.dtype(np.int8),
+    "u8": np.dtype(np.uint8),
+    "i32": np.dtype(np.int32),
+    "u32": np.dtype(np.uint32),
+    "i64": np.dtype(np.int64),
+}
+
+GrowFunction = ctypes.CFUNCTYPE(ctypes.c_uint8, ctypes.c_int64, ctypes.c_int64)
+
+
+@numba.extending.intrinsic
+def pointer(typingctx, address):
+    def codegen(context, builder, sig, args):
+        return builder.inttoptr(args[0], context.get_value_type(sig.return_type))
+
+    return numba.types.CPointer(numba.int64)(address), codegen
+
+
+@numba.extending.intrinsic
+def store(typingctx, address, index, value, dtype):
+    to = dtype.dtype
+
+    def codegen(context, builder, sig, args):
+        address, index, value, _ = args
+        ptr = builder.inttoptr(address, context.get_data_type(to).as_pointer())
+        value = context.cast(builder, value, sig.args[2], to)
+        value = context.get_value_as_data(builder, to, value)
+        builder.store(value, builder.gep(ptr, [index]))
+        return context.get_dummy_value()
+
+    return numba.types.void(address, index, value, dtype), codegen
+
+
+@numba.extending.intrinsic
+def call_grow(typingctx, address, buffer, n):
+    def codegen(context, builder, sig, args):
+        int64 = context.get_value_type(numba.int64)
+        fcntype = numba.core.cgutils.ir.FunctionType(
+            context.get_value_type(numba.uint8), [int64, int64]
+        )
+        fcn = builder.inttoptr(args[0], fcntype.as_pointer())
+        return builder.call(fcn, [args[1], args[2]])
+
+    return numba.uint8(numba.int64, numba.int64, numba.int64), codegen
+
+
+@numba.njit(inline="always")
+def views(address):
+    header = numba.carray(pointer(address), HEADER)
+    nnodes, nchildren, nbuffers = header[NNODES], header[NCHILDREN], header[NBUFFERS]
+    at = address + 8 * HEADER
+    nodes = numba.carray(pointer(at), (nnodes, NODE_COLUMNS))
+    at += 8 * nnodes * NODE_COLUMNS
+    children = numba.carray(pointer(at), nchildren)
+    at += 8 * nchildren
+    stack = numba.carray(pointer(at), nnodes)
+    at += 8 * nnodes
+    buffers = numba.carray(pointer(at), (nbuffers, BUFFER_COLUMNS))
+    return header, nodes, children, stack, buffers
+
+
+@numba.njit
+def append(header, buffers, buffer, x):
+    at = buffers[buffer, USED]
+    if at == buffers[buffer, CAPACITY]:
+        if call_grow(header[GROW], buffer, 1) != 0:
+            raise MemoryError("a LayoutBuilder's buffer couldn't be resized")
+    address = buffers[buffer, ADDRESS]
+    dtype = buffers[buffer, DTYPE]
+    if dtype == INT64:
+        store(address, at, x, np.int64)
+    elif dtype == FLOAT64:
+        store(address, at, x, np.float64)
+    elif dtype == INT8:
+        store(address, at, x, np.int8)
+    elif dtype == UINT8:
+        store(address, at, x, np.uint8)
+    elif dtype == BOOL:
+        store(address, at, x, np.bool_)
+    elif dtype == INT16:
+        store(address, at, x, np.int16)
+    elif dtype == UINT16:
+        store(address, at, x, np.uint16)
+    elif dtype == INT32:
+        store(address, at, x, np.int32)
+    elif dtype == UINT32:
+        store(address, at, x, np.uint32)
+    elif dtype == UINT64:
+        store(address, at, x, np.uint64)
+    elif dtype == FLOAT32:
+        store(address, at, x, np.float32)
+    elif dtype == COMPLEX64:
+        store(address, at, x, np.complex64)
+    else:
+        store(address, at, x, np.complex128)
+    buffers[buffer, USED] = at + 1
+
+
+@numba.njit
+def append_complex(header, buffers, buffer, x):
+    at = buffers[buffer, USED]
+    if at == buffers[buffer, CAPACITY]:
+        if call_grow(header[GROW], buffer, 1) != 0:
+            raise MemoryError("a LayoutBuilder's buffer couldn't be resized")
+    if buffers[buffer, DTYPE] == COMPLEX64:
+        store(buffers[buffer, ADDRESS], at, x, np.complex64)
+    else:
+        store(buffers[buffer, ADDRESS], at, x, np.complex128)
+    buffers[buffer, USED] = at + 1
+
+
+@numba.njit(inline="always")
+def content(nodes, children, node):
+    return children[nodes[node, FIRST]]
+
+
+@numba.njit
+def target(address, action):
+    # walks down from the innermost open list (or the root) to the node that
+    # takes the next item, following each record's current field and each
+    # union's tag
+    header, nodes, children, stack, buffers = views(address)
+    if header[DEPTH] == 0:
+        node = 0
+    else:
+        node = content(nodes, children, stack[header[DEPTH] - 1])
+
+    while True:
+        kind = nodes[node, KIND]
+        if kind == RECORD:
+            if nodes[node, NCONTENTS] == 0:
+                raise ValueError("records without fields can't be built")
+            node = children[nodes[node, FIRST] + nodes[node, FIELD]]
+        elif kind == UNION:
+            tag = nodes[node, TAG_NEXT]
+            if tag < 0:
+                if action == TAG:
+                    return node
+                raise ValueError("each item of a union must start with tag(i)")
+            node = children[nodes[node, FIRST] + tag]
+        elif kind == INDEXEDOPTION or kind == BYTEMASKED or kind == BITMASKED:
+            if action == NULL:
+                return node
+            node = content(nodes, children, node)
+        elif kind == UNMASKED:
+            node = content(nodes, children, node)
+        else:
+            return node
+
+
+@numba.njit
+def bit(address, node, valid):
+    header, nodes, children, stack, buffers = views(address)
+    buffer = nodes[node, BUFFER0]
+    at = nodes[node, LENGTH] % 8
+    if at == 0:
+        nodes[node, BITS] = 0
+        append(header, buffers, buffer, 0)
+    if valid == (nodes[node, VALID_WHEN] != 0):
+        if nodes[node, LSB_ORDER] != 0:
+            nodes[node, BITS] |= 1 << at
+        else:
+            nodes[node, BITS] |= 128 >> at
+        last = buffers[buffer, USED] - 1
+        store(buffers[buffer, ADDRESS], last, nodes[node, BITS], np.uint8)
+
+
+@numba.njit
+def complete(address, node):
+    # node has a new item: so do its ancestors, up to the innermost open list
+    # or the first record that has more fields to fill
+    header, nodes, children, stack, buffers = views(address)
+    nodes[node, LENGTH] += 1
+    while True:
+        parent = nodes[node, PARENT]
+        if parent < 0:
+            return
+        kind = nodes[parent, KIND]
+        if kind == LISTOFFSET or kind == LIST or kind == REGULAR:
+            return
+        elif kind == RECORD:
+            nodes[parent, FIELD] += 1
+            if nodes[parent, FIELD] < nodes[parent, NCONTENTS]:
+                return
+            nodes[parent, FIELD] = 0
+        elif kind == INDEXEDOPTION:
+            append(header, buffers, nodes[parent, BUFFER0], nodes[node, LENGTH] - 1)
+        elif kind == BYTEMASKED:
+            append(header, buffers, nodes[parent, BUFFER0], nodes[parent, VALID_WHEN])
+        elif kind == BITMASKED:
+            bit(address, parent, True)
+        elif kind == UNION:
+            append(header, buffers, nodes[parent, BUFFER0], nodes[parent, TAG_NEXT])
+            append(header, buffers, nodes[parent, BUFFER1], nodes[node, LENGTH] - 1)
+            nodes[parent, TAG_NEXT] = -1
+        nodes[parent, LENGTH] += 1
+        node = parent
+
+
+@numba.njit
+def fill(address, start):
+    # placeholders under a missing value of a masked array: the subtree of
+    # start is nodes start until nodes[start, END], and each of them gets as
+    # many items as its MULTIPLICITY (none under a list, an IndexedOptionForm,
+    # or a union's contents other than the first)
+    header, nodes, children, stack, buffers = views(address)
+    for node in range(start, nodes[start, END]):
+        if node == start:
+            n = 1
+        else:
+            parent = nodes[node, PARENT]
+            n = nodes[parent, MULTIPLICITY]
+            kind = nodes[parent, KIND]
+            if kind == REGULAR:
+                n *= nodes[parent, SIZE]
+            elif kind == LISTOFFSET or kind == LIST or kind == INDEXEDOPTION:
+                n = 0
+            elif kind == UNION and node != content(nodes, children, parent):
+                n = 0
+        nodes[node, MULTIPLICITY] = n
+        if n == 0:
+            continue
+
+        kind = nodes[node, KIND]
+        if kind == EMPTY:
+            raise ValueError("an EmptyArray can't have placeholder values")
+        inner = content(nodes, children, node) if nodes[node, NCONTENTS] > 0 else -1
+        for i in range(n):
+            if kind == NUMPY:
+                append(header, buffers, nodes[node, BUFFER0], 0)
+            elif kind == LISTOFFSET:
+                append(header, buffers, nodes[node, BUFFER0], nodes[inner, LENGTH])
+            elif kind == LIST:
+                append(header, buffers, nodes[node, BUFFER0], nodes[inner, LENGTH])
+                append(header, buffers, nodes[node, BUFFER1], nodes[inner, LENGTH])
+            elif kind == INDEXEDOPTION:
+                append(header, buffers, nodes[node, BUFFER0], -1)
+            elif kind == BYTEMASKED:
+                invalid = 1 - nodes[node, VALID_WHEN]
+                append(header, buffers, nodes[node, BUFFER0], invalid)
+            elif kind == BITMASKED:
+                bit(address, node, False)
+            elif kind == UNION:
+                append(header, buffers, nodes[node, BUFFER0], 0)
+                append(header, buffers, nodes[node, BUFFER1], nodes[inner, LENGTH] + i)
+            nodes[node, LENGTH] += 1
+
+
+@numba.njit
+def null(address):
+    header, nodes, children, stack, buffers = views(address)
+    node = target(address, NULL)
+    kind = nodes[node, KIND]
+    if kind == INDEXEDOPTION:
+        append(header, buffers, nodes[node, BUFFER0], -1)
+    elif kind == BYTEMASKED:
+        append(header, buffers, nodes[node, BUFFER0], 1 - nodes[node, VALID_WHEN])
+        fill(address, content(nodes, children, node))
+    elif kind == BITMASKED:
+        bit(address, node, False)
+        fill(address, content(nodes, children, node))
+    else:
+        raise ValueError("null() was called where the Form has no option-type")
+    complete(address, node)
+
+
+@numba.njit
+def number(address, x):
+    header, nodes, children, stack, buffers = views(address)
+    node = target(address, VALUE)
+    if nodes[node, KIND] != NUMPY:
+        raise ValueError("a number was given where the Form has no number")
+    append(header, buffers, nodes[node, BUFFER0], x)
+    complete(address, node)
+
+
+@numba.njit
+def complex_number(address, x):
+    header, nodes, children, stack, buffers = views(address)
+    node = target(address, VALUE)
+    if nodes[node, KIND] != NUMPY or (
+        nodes[node, CODE] != COMPLEX64 and nodes[node, CODE] != COMPLEX128
+    ):
+        raise ValueError("a complex number was given where the Form has none")
+    append_complex(header, buffers, nodes[node, BUFFER0], x)
+    complete(address, node)
+
+
+@numba.njit
+def begin_list(address):
+    header, nodes, children, stack, buffers = views(address)
+    node = target(address, BEGIN_LIST)
+    kind = nodes[node, KIND]
+    if kind != LISTOFFSET and kind != LIST and kind != REGULAR:
+        raise ValueError("begin_list() was called where the Form has no list")
+    nodes[node, START] = nodes[content(nodes, children, node), LENGTH]
+    if kind == LIST:
+        append(header, buffers, nodes[node, BUFFER0], nodes[node, START])
+    stack[header[DEPTH]] = node
+    header[DEPTH] += 1
+
+
+@numba.njit
+def end_list(address):
+    header, nodes, children, stack, buffers = views(address)
+    if header[DEPTH] == 0:
+        raise ValueError("end_list() was called without begin_list()")
+    node = stack[header[DEPTH] - 1]
+    inner = content(nodes, children, node)
+    if nodes[inner, KIND] == RECORD and nodes[inner, FIELD] != 0:
+        raise ValueError("end_list() was called in the middle of a record")
+    if nodes[inner, KIND] == UNION and nodes[inner, TAG_NEXT] >= 0:
+        raise ValueError("end_list() was called after tag(i)")
+    kind = nodes[node, KIND]
+    if kind == LISTOFFSET:
+        append(header, buffers, nodes[node, BUFFER0], nodes[inner, LENGTH])
+    elif kind == LIST:
+        append(header, buffers, nodes[node, BUFFER1], nodes[inner, LENGTH])
+    elif nodes[inner, LENGTH] - nodes[node, START] != nodes[node, SIZE]:
+        raise ValueError("a list of a RegularForm doesn't have the Form's size")
+    header[DEPTH] -= 1
+    complete(address, node)
+
+
+@numba.njit
+def begin_characters(address):
+    header, nodes, children, stack, buffers = views(address)
+    node = target(address, BEGIN_LIST)
+    kind = nodes[node, KIND]
+    if kind != LISTOFFSET and kind != LIST:
+        raise ValueError("a string was given where the Form has no list")
+    inner = content(nodes, children, node)
+    if nodes[inner, KIND] != NUMPY or nodes[inner, CODE] != UINT8:
+        raise ValueError("a string was given where the Form has no uint8 list")
+    if kind == LIST:
+        append(header, buffers, nodes[node, BUFFER0], nodes[inner, LENGTH])
+    return node
+
+
+@numba.njit
+def end_characters(address, node, count):
+    header, nodes, children, stack, buffers = views(address)
+    inner = content(nodes, children, node)
+    nodes[inner, LENGTH] += count
+    if nodes[node, KIND] == LISTOFFSET:
+        append(header, buffers, nodes[node, BUFFER0], nodes[inner, LENGTH])
+    else:
+        append(header, buffers, nodes[node, BUFFER1], nodes[inner, LENGTH])
+    complete(address, node)
+
+
+@numba.njit
+def string(address, x):
+    header, nodes, children, stack, buffers = views(address)
+    node = begin_characters(address)
+    buffer = nodes[content(nodes, children, node), BUFFER0]
+    count = 0
+    for character in x:
+        c = ord(character)
+        if c < 0x80:
+            append(header, buffers, buffer, c)
+            count += 1
+        elif c < 0x800:
+            append(header, buffers, buffer, 0xC0 | (c >> 6))
+            append(header, buffers, buffer, 0x80 | (c & 0x3F))
+            count += 2
+        elif c < 0x10000:
+            append(header, buffers, buffer, 0xE0 | (c >> 12))
+            append(header, buffers, buffer, 0x80 | ((c >> 6) & 0x3F))
+            append(header, buffers, buffer, 0x80 | (c & 0x3F))
+            count += 3
+        else:
+            append(header, buffers, buffer, 0xF0 | (c >> 18))
+            append(header, buffers, buffer, 0x80 | ((c >> 12) & 0x3F))
+            append(header, buffers, buffer, 0x80 | ((c >> 6) & 0x3F))
+            append(header, buffers, buffer, 0x80 | (c & 0x3F))
+            count += 4
+    end_characters(address, node, count)
+
+
+@numba.njit
+def bytestring(address, x):
+    header, nodes, children, stack, buffers = views(address)
+    node = begin_characters(address)
+    buffer = nodes[content(nodes, children, node), BUFFER0]
+    for i in range(len(x)):
+        append(header, buffers, buffer, x[i])
+    end_characters(address, node, len(x))
+
+
+@numba.njit
+def tag(address, x):
+    header, nodes, children, stack, buffers = views(address)
+    node = target(address, TAG)
+    if nodes[node, KIND] != UNION:
+        raise ValueError("tag(i) was called where the Form has no union")
+    if not 0 <= x < nodes[node, NCONTENTS]:
+        raise ValueError("tag(i) is out of range for the union's contents")
+    nodes[node, TAG_NEXT] = x
+
+
+# columns of the nodes table that come from the Form
+_columns = {
+    KIND: "kind",
+    PARENT: "parent",
+    FIRST: "first",
+    NCONTENTS: "ncontents",
+    CODE: "code",
+    SIZE: "size",
+    VALID_WHEN: "valid_when",
+    LSB_ORDER: "lsb_order",
+    BUFFER0: "buffer0",
+    BUFFER1: "buffer1",
+    END: "end",
+}
+
+# method name: (implementation, number of arguments)
+methods = {
+    "null": (null, 0),
+    "boolean": (number, 1),
+    "int64": (number, 1),
+    "float64": (number, 1),
+    "complex": (complex_number, 1),
+    "string": (string, 1),
+    "bytestring": (bytestring, 1),
+    "begin_list": (begin_list, 0),
+    "end_list": (end_list, 0),
+    "tag": (tag, 1),
+}
+
+
+class LayoutBuilder:
+    """
+    Args:
+        form (#ak.forms.Form, dict, or JSON str): The type of the array to build,
+            as a Form.
+        initial (int): Initial size (in items) of the buffers.
+        resize (float): Resize multiplier for the buffers; should be strictly
+            greater than 1.
+
+    Builds an array of a given type from a sequence of calls, both in Python
+    and in Numba-compiled functions (in nopython mode). Unlike #ak.ArrayBuilder,
+    the type is fixed from the start, so the values are written directly into
+    growable buffers, without type discovery, and an error is raised if a call
+    doesn't fit the Form.
+
+    The calls are the same as in the C++ `LayoutBuilder`:
+
+       * #null: a missing value (for an option-type).
+       * #boolean, #int64, #float64, #complex: a number, which is cast to the
+         dtype of the NumpyForm that it fills.
+       * #string, #bytestring: a whole string (a list of uint8).
+       * #begin_list and #end_list: a variable-length or regular list.
+       * #tag: chooses the content of a union for the next item.
+
+    Records don't have calls of their own: the fields of a RecordForm are
+    filled in order, one item at a time, so that
+
+        builder.float64(1.1)   # "x"
+        builder.int64(2)       # "y"
+
+    makes `{"x": 1.1, "y": 2}` for a record with fields "x" and "y".
+
+    A LayoutBuilder can be passed into and returned from Numba-compiled
+    functions; #snapshot turns the complete items into an array with
+    #ak.from_buffers (it can't be called in a compiled function).
+
+    IndexedForm (categorical) and forms with identifiers are not supported.
+    """
+
+    def __init__(self, form, initial=1024, resize=1.5):
+        if ak._v2._util.isstr(form):
+            form = ak._v2.forms.from_json(form)
+        elif isinstance(form, dict):
+            form = ak._v2.forms.from_iter(form)
+        if not isinstance(form, ak._v2.forms.Form):
+            raise ak._v2._util.error(
+                TypeError(f"form must be a Form, dict, or JSON str, not {form!r}")
+            )
+        if not resize > 1:
+            raise ak._v2._util.error(
+                ValueError(f"resize must be strictly greater than 1, not {resize}")
+            )
+        initial = max(int(initial), 1)
+        self._resize = float(resize)
+
+        self._nodes = []
+        self._dtypes = []
+        self._form = self._flatten(form, -1)
+
+        nodes = self._nodes
+        children = []
+        for node in nodes:
+            node["first"] = len(children)
+            node["ncontents"] = len(node["children"])
+            children.extend(node["children"])
+
+        nnodes, nchildren, nbuffers = len(nodes), len(children), len(self._dtypes)
+        self._state = numpy.zeros(
+            HEADER
+            + nnodes * NODE_COLUMNS
+            + nchildren
+            + nnodes
+            + nbuffers * BUFFER_COLUMNS,
+            np.int64,
+        )
+        self._address = self._state.ctypes.data
+        self._state[NNODES] = nnodes
+        self._state[NCHILDREN] = nchildren
+        self._state[NBUFFERS] = nbuffers
+        at = HEADER
+        self._nodes_table = self._state[at : at + nnodes * NODE_COLUMNS].reshape(
+            nnodes, NODE_COLUMNS
+        )
+        at += nnodes * NODE_COLUMNS
+        self._state[at : at + nchildren] = children
+        at += nchildren + nnodes
+        self._buffers_table = self._state[at:].reshape(nbuffers, BUFFER_COLUMNS)
+
+        for i, node in enumerate(nodes):
+            for column, name in _columns.items():
+                self._nodes_table[i, column] = node[name]
+            self._nodes_table[i, TAG_NEXT] = -1
+
+        self._buffers = []
+        for i, dtype in enumerate(self._dtypes):
+            self._buffers.append(numpy.empty(initial * dtype.itemsize, np.uint8))
+            self._buffers_table[i, CAPACITY] = initial
+            self._buffers_table[i, ADDRESS] = self._buffers[i].ctypes.data
+            self._buffers_table[i, DTYPE] = primitives.index(
+                "bool" if dtype == np.dtype(np.bool_) else dtype.name
+            )
+            self._buffers_table[i, ITEMSIZE] = dtype.itemsize
+
+        # the callback can't keep the LayoutBuilder alive
+        ref = weakref.ref(self)
+
+        def grow(buffer, n):
+            try:
+                ref()._grow(buffer, n)
+            except Exception:
+                return 1
+            else:
+                return 0
+
+        self._grow_function = GrowFunction(grow)
+        self._state[GROW] = ctypes.cast(self._grow_function, ctypes.c_void_p).value
+
+        for node in nodes:
+            if node["kind"] == LISTOFFSET:
+                self._buffers_table[node["buffer0"], USED] = 1
+                self._buffers[node["buffer0"]][:8] = 0
+
+    def _grow(self, buffer, n):
+        used, capacity, itemsize = (
+            int(x) for x in self._buffers_table[buffer, [USED, CAPACITY, ITEMSIZE]]
+        )
+        capacity = max(int(numpy.ceil(capacity * self._resize)), used + n)
+        data = numpy.empty(capacity * itemsize, np.uint8)
+        data[: used * itemsize] = self._buffers[buffer][: used * itemsize]
+        self._buffers[buffer] = data
+        self._buffers_table[buffer, ADDRESS] = data.ctypes.data
+        self._buffers_table[buffer, CAPACITY] = capacity
+
+    def _buffer(self, node, slot, attribute, dtype, index=None):
+        # index buffers are filled as int64 and converted by #snapshot
+        node[slot] = len(self._dtypes)
+        node["attributes"].append((attribute, len(self._dtypes), index))
+        self._dtypes.append(np.dtype(dtype))
+
+    def _flatten(self, form, parent):
+        # appends form's nodes to self._nodes and returns an equivalent Form
+        # whose form_keys are "node{index}"
+        if form.has_identifier:
+            raise ak._v2._util.error(
+                NotImplementedError("LayoutBuilder of a Form with identifiers")
+            )
+        if isinstance(form, ak._v2.forms.NumpyForm) and form.inner_shape != ():
+            form = form.toRegularForm()
+
+        index = len(self._nodes)
+        node = {
+            "kind": None,
+            "parent": parent,
+            "children": [],
+            "code": -1,
+            "size": 0,
+            "valid_when": 0,
+            "lsb_order": 0,
+            "buffer0": -1,
+            "buffer1": -1,
+            "attributes": [],
+        }
+        self._nodes.append(node)
+        key = f"node{index}"
+
+        def content(x):
+            node["children"].append(len(self._nodes))
+            return self._flatten(x, index)
+
+        if isinstance(form, ak._v2.forms.EmptyForm):
+            node["kind"] = EMPTY
+            out = ak._v2.forms.EmptyForm(False, form.parameters, key)
+
+        elif isinstance(form, ak._v2.forms.NumpyForm):
+            if form.primitive not in primitives:
+                raise ak._v2._util.error(
+                    NotImplementedError(
+                        f"LayoutBuilder of a NumpyForm of {form.primitive}"
+                    )
+                )
+            node["kind"] = NUMPY
+            node["code"] = primitives.index(form.primitive)
+            self._buffer(node, "buffer0", "data", form.primitive)
+            out = ak._v2.forms.NumpyForm(
+                form.primitive, (), False, form.parameters, key
+            )
+
+        elif isinstance(form, ak._v2.forms.ListOffsetForm):
+            node["kind"] = LISTOFFSET
+            self._buffer(node, "buffer0", "offsets", np.int64, form.offsets)
+            out = ak._v2.forms.ListOffsetForm(
+                form.offsets, content(form.content), False, form.parameters, key
+            )
+
+        elif isinstance(form, ak._v2.forms.ListForm):
+            node["kind"] = LIST
+            self._buffer(node, "buffer0", "starts", np.int64, form.starts)
+            self._buffer(node, "buffer1", "stops", np.int64, form.stops)
+            out = ak._v2.forms.ListForm(
+                form.starts,
+                form.stops,
+                content(form.content),
+                False,
+                form.parameters,
+                key,
+            )
+
+        elif isinstance(form, ak._v2.forms.RegularForm):
+            node["kind"] = REGULAR
+            node["size"] = form.size
+            out = ak._v2.forms.RegularForm(
+                content(form.content), form.size, False, form.parameters, key
+            )
+
+        elif isinstance(form, ak._v2.forms.IndexedOptionForm):
+            node["kind"] = INDEXEDOPTION
+            self._buffer(node, "buffer0", "index", np.int64, form.index)
+            out = ak._v2.forms.IndexedOptionForm(
+                form.index, content(form.content), False, form.parameters, key
+            )
+
+        elif isinstance(form, ak._v2.forms.ByteMaskedForm):
+            node["kind"] = BYTEMASKED
+            node["valid_when"] = int(form.valid_when)
+            self._buffer(node, "buffer0", "mask", np.int8)
+            out = ak._v2.forms.ByteMaskedForm(
+                form.mask,
+                content(form.content),
+                form.valid_when,
+                False,
+                form.parameters,
+                key,
+            )
+
+        elif isinstance(form, ak._v2.forms.BitMaskedForm):
+            node["kind"] = BITMASKED
+            node["valid_when"] = int(form.valid_when)
+            node["lsb_order"] = int(form.lsb_order)
+            self._buffer(node, "buffer0", "mask", np.uint8)
+            out = ak._v2.forms.BitMaskedForm(
+                form.mask,
+                content(form.content),
+                form.valid_when,
+                form.lsb_order,
+                False,
+                form.parameters,
+                key,
+            )
+
+        elif isinstance(form, ak._v2.forms.UnmaskedForm):
+            node["kind"] = UNMASKED
+            out = ak._v2.forms.UnmaskedForm(
+                content(form.content), False, form.parameters, key
+            )
+
+        elif isinstance(form, ak._v2.forms.RecordForm):
+            node["kind"] = RECORD
+            out = ak._v2.forms.RecordForm(
+                [content(x) for x in form.contents],
+                None if form.is_tuple else form.fields,
+                False,
+                form.parameters,
+                key,
+            )
+
+        elif isinstance(form, ak._v2.forms.UnionForm):
+            node["kind"] = UNION
+            self._buffer(node, "buffer0", "tags", np.int8)
+            self._buffer(node, "buffer1", "index", np.int64, form.index)
+            out = ak._v2.forms.UnionForm(
+                form.tags,
+                form.index,
+                [content(x) for x in form.contents],
+                False,
+                form.parameters,
+                key,
+            )
+
+        else:
+            raise ak._v2._util.error(
+                NotImplementedError(f"LayoutBuilder of a {type(form).__name__}")
+            )
+
+        node["end"] = len(self._nodes)
+        return out
+
+    @property
+    def form(self):
+        """
+        The Form of the arrays made by #snapshot; it is equivalent to the Form
+        that this LayoutBuilder was made with, but its form_keys name the
+        builder's buffers.
+        """
+        return self._form
+
+    def __len__(self):
+        return int(self._nodes_table[0, LENGTH])
+
+    def __repr__(self):
+        return f"<LayoutBuilder of {len(self)} items with Form {self._form.to_json()}>"
+
+    def null(self):
+        """
+        Adds a missing value; the Form must have an IndexedOptionForm,
+        ByteMaskedForm, or BitMaskedForm here.
+        """
+        _calls["null"](self)
+
+    def boolean(self, x):
+        """
+        Adds a boolean value.
+        """
+        _calls["boolean"](self, bool(x))
+
+    def int64(self, x):
+        """
+        Adds an integer value.
+        """
+        _calls["int64"](self, int(x))
+
+    def float64(self, x):
+        """
+        Adds a real value.
+        """
+        _calls["float64"](self, float(x))
+
+    def complex(self, x):
+        """
+        Adds a complex value; the Form must have a complex NumpyForm here.
+        """
+        _calls["complex"](self, complex(x))
+
+    def string(self, x):
+        """
+        Adds a UTF-8 encoded string; the Form must have a list of uint8 here.
+        """
+        _calls["string"](self, str(x))
+
+    def bytestring(self, x):
+        """
+        Adds a bytestring; the Form must have a list of uint8 here.
+        """
+        _calls["bytestring"](self, bytes(x))
+
+    def begin_list(self):
+        """
+        Begins a list; the items until #end_list fill its content.
+        """
+        _calls["begin_list"](self)
+
+    def end_list(self):
+        """
+        Ends the list that was begun by the last unmatched #begin_list.
+        """
+        _calls["end_list"](self)
+
+    def tag(self, tag):
+        """
+        Chooses the content of a UnionForm that the next item fills.
+        """
+        _calls["tag"](self, int(tag))
+
+    def snapshot(self, highlevel=True, behavior=None):
+        """
+        Args:
+            highlevel (bool): If True, return an #ak.Array; otherwise, return
+                a low-level #ak.contents.Content subclass.
+            behavior (None or dict): Custom #ak.behavior for the output array, if
+                high-level.
+
+        Returns an array of the items that have been completed so far, copying
+        the buffers, so the builder can continue to be filled.
+        """
+        container = {}
+        for i, node in enumerate(self._nodes):
+            for attribute, buffer, index in node["attributes"]:
+                dtype = self._dtypes[buffer]
+                used = self._buffers_table[buffer, USED]
+                raw = self._buffers[buffer][: used * dtype.itemsize].view(dtype)
+                if index is None:
+                    raw = raw.copy()
+                else:
+                    raw = raw.astype(_index_to_dtype[index])
+                container[f"node{i}-{attribute}"] = raw
+
+        return ak._v2.operations.from_buffers(
+            self._form,
+            len(self),
+            container,
+            highlevel=highlevel,
+            behavior=behavior,
+        )
+
+    @property
+    def numba_type(self):
+        """
+        The type of this LayoutBuilder when it is used in Numba (the same for
+        all Forms).
+        """
+        return LayoutBuilderType()
+
+
+class LayoutBuilderType(numba.types.Type):
+    def __init__(self):
+        super().__init__(name="ak2.LayoutBuilderType()")
+
+
+@numba.extending.typeof_impl.register(LayoutBuilder)
+def typeof_LayoutBuilder(obj, c):
+    return obj.numba_type
+
+
+@numba.extending.register_model(LayoutBuilderType)
+class LayoutBuilderModel(numba.core.datamodel.models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [("address", numba.int64), ("pyptr", numba.types.pyobject)]
+        super().__init__(dmm, fe_type, members)
+
+
+numba.extending.make_attribute_wrapper(LayoutBuilderType, "address", "address")
+
+
+@numba.extending.unbox(LayoutBuilderType)
+def unbox_LayoutBuilder(buildertype, builderobj, c):
+    address_obj = c.pyapi.object_getattr_string(builderobj, "_address")
+
+    proxyout = c.context.make_helper(c.builder, buildertype)
+    proxyout.address = c.pyapi.long_as_longlong(address_obj)
+    proxyout.pyptr = builderobj
+
+    c.pyapi.decref(address_obj)
+
+    is_error = numba.core.cgutils.is_not_null(c.builder, c.pyapi.err_occurred())
+    return numba.extending.NativeValue(proxyout._getvalue(), is_error)
+
+
+@numba.extending.box(LayoutBuilderType)
+def box_LayoutBuilder(buildertype, builderval, c):
+    proxyin = c.context.make_helper(c.builder, buildertype, builderval)
+    c.pyapi.incref(proxyin.pyptr)
+    return proxyin.pyptr
+
+
+@numba.extending.overload(len)
+def overload_len(builder):
+    if isinstance(builder, LayoutBuilderType):
+
+        def impl(builder):
+            return views(builder.address)[1][0, LENGTH]
+
+        return impl
+
+
+def register_method(name, implementation, nargs):
+    if nargs == 0:
+
+        def method(builder):
+            def impl(builder):
+                implementation(builder.address)
+
+            return impl
+
+    else:
+
+        def method(builder, x):
+            def impl(builder, x):
+                implementation(builder.address, x)
+
+            return impl
+
+    numba.extending.overload_method(LayoutBuilderType, name)(method)
+
+
+# the methods of a LayoutBuilder in Python call the same compiled code
+_calls = {}
+
+for name, (implementation, nargs) in methods.items():
+    register_method(name, implementation, nargs)
+    arguments = "builder" if nargs == 0 else "builder, x"
+    _calls[name] = numba.njit(
+        ak._v2._connect.numba.arrayview.code_to_function(
+            f"""
+def {name}({arguments}):
+    builder.{name}({arguments[9:]})
+""",
+            name,
+        )
+    )
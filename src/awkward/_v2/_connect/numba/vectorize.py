@@ -0,0 +1,288 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import re
+
+import numba
+import numba.np.numpy_support
+
+import awkward as ak
+
+numpy = ak.nplike.Numpy.instance()
+np = ak.nplike.NumpyMetadata.instance()
+
+
+class Vectorized:
+    def __init__(self, function, signatures, options):
+        self._dufunc = numba.vectorize(signatures, **options)(function)
+        self.__name__ = self._dufunc.__name__
+        self.__doc__ = function.__doc__
+
+    @property
+    def ufunc(self):
+        return self._dufunc
+
+    def __repr__(self):
+        return f"<ak._v2.numba.vectorize {self.__name__}>"
+
+    def __call__(self, *args):
+        if any(
+            isinstance(
+                x,
+                (
+                    ak._v2.highlevel.Array,
+                    ak._v2.highlevel.Record,
+                    ak._v2.contents.Content,
+                    ak._v2.record.Record,
+                ),
+            )
+            for x in args
+        ):
+            # compiled lazily for each combination of dtypes at the leaves
+            return ak._v2._connect.numpy.array_ufunc(self._dufunc, "__call__", args, {})
+        else:
+            return self._dufunc(*args)
+
+
+_signature = re.compile(
+    r"^\s*(\(\s*\w*\s*\)(\s*,\s*\(\s*\w*\s*\))*)\s*->\s*(\(\s*\w*\s*\))\s*$"
+)
+
+
+def _dimensions(signature):
+    match = _signature.match(signature)
+    if match is None:
+        raise ak._v2._util.error(
+            ValueError(
+                f"signature must be like '(n),()->()' or '(n)->(n)', not {signature!r}"
+            )
+        )
+    inputs = [x.strip("() ") or None for x in re.findall(r"\([^)]*\)", match.group(1))]
+    output = match.group(3).strip("() ") or None
+    if all(x is None for x in inputs):
+        raise ak._v2._util.error(
+            ValueError(
+                "at least one argument must be a list, such as '(n)'; "
+                "use ak._v2.numba.vectorize for functions of numbers"
+            )
+        )
+    if output is not None and output not in inputs:
+        raise ak._v2._util.error(
+            ValueError(
+                f"the output's dimension, {output!r}, must be one of the arguments'"
+            )
+        )
+    return inputs, output
+
+
+# generated loops over lists, by (argument kinds, output kind)
+_drivers = {}
+
+
+def _driver(kinds, output):
+    key = (kinds, output)
+    if key not in _drivers:
+        parameters, arguments = [], []
+        for i, kind in enumerate(kinds):
+            if kind == "list":
+                parameters.extend([f"offsets{i}", f"data{i}"])
+                arguments.append(f"data{i}[offsets{i}[i] : offsets{i}[i + 1]]")
+            elif kind == "array":
+                parameters.append(f"data{i}")
+                arguments.append(f"data{i}[i]")
+            else:
+                parameters.append(f"data{i}")
+                arguments.append(f"data{i}")
+
+        code = f"""
+def driver(function, length, output, offsets, {", ".join(parameters)}):
+    for i in range(length):
+        result = function({", ".join(arguments)})"""
+
+        if output is None:
+            code += """
+        output[i] = result
+"""
+        else:
+            code += """
+        start, stop = offsets[i], offsets[i + 1]
+        if len(result) != stop - start:
+            raise ValueError("the function's output list doesn't have its argument's length")
+        output[start:stop] = result
+"""
+        _drivers[key] = numba.njit(
+            ak._v2._connect.numba.arrayview.code_to_function(code, "driver")
+        )
+
+    return _drivers[key]
+
+
+class GuVectorized:
+    def __init__(self, function, signature, options):
+        self._function = numba.njit(**options)(function)
+        self._signature = signature
+        self._inputs, self._output = _dimensions(signature)
+        self.__name__ = function.__name__
+        self.__doc__ = function.__doc__
+
+    @property
+    def signature(self):
+        return self._signature
+
+    def __repr__(self):
+        return f"<ak._v2.numba.guvectorize {self.__name__} {self._signature!r}>"
+
+    def __call__(self, *args, highlevel=True, behavior=None):
+        if len(args) != len(self._inputs):
+            raise ak._v2._util.error(
+                TypeError(
+                    f"{self.__name__} takes {len(self._inputs)} arguments "
+                    f"({self._signature!r}), not {len(args)}"
+                )
+            )
+        behavior = ak._v2._util.behavior_of(*args, behavior=behavior)
+        inputs = [
+            ak._v2.operations.to_layout(x, allow_record=False, allow_other=True)
+            for x in args
+        ]
+        for x, dimension in zip(inputs, self._inputs):
+            if dimension is not None and not isinstance(x, ak._v2.contents.Content):
+                raise ak._v2._util.error(
+                    TypeError(
+                        f"the '({dimension})' arguments of {self.__name__} must be "
+                        f"arrays, not {type(x).__name__}"
+                    )
+                )
+
+        def action(inputs, depth, **ignore):
+            lists = [
+                x for x, dimension in zip(inputs, self._inputs) if dimension is not None
+            ]
+            if depth == 0:
+                # broadcast_and_apply wraps the arrays in a length-1 list
+                return None
+            elif all(_is_innermost_list(x) for x in lists):
+                return (self._apply(inputs),)
+            elif any(
+                isinstance(x, (ak._v2.contents.NumpyArray, ak._v2.contents.EmptyArray))
+                for x in lists
+            ):
+                raise ak._v2._util.error(
+                    ValueError(
+                        f"the '(n)' arguments of {self.__name__} must be lists of "
+                        "numbers at the same depth"
+                    )
+                )
+            else:
+                return None
+
+        out = ak._v2._broadcasting.broadcast_and_apply(
+            inputs,
+            action,
+            behavior,
+            allow_records=False,
+            right_broadcast=False,
+            numpy_to_regular=True,
+            function_name=self.__name__,
+        )
+        assert isinstance(out, tuple) and len(out) == 1
+        return ak._v2._util.wrap(out[0], behavior, highlevel)
+
+    def _apply(self, inputs):
+        length = None
+        kinds, arguments, argtypes = [], [], []
+        offsets = {}
+        for x, dimension in zip(inputs, self._inputs):
+            if dimension is not None:
+                x = x.toListOffsetArray64(True)
+                length = x.length
+                starts = numpy.asarray(x.offsets)
+                content = x.content
+                if isinstance(content, ak._v2.contents.EmptyArray):
+                    content = content.toNumpyArray(np.float64)
+                data = numpy.ascontiguousarray(content.data)
+                if dimension in offsets:
+                    if not numpy.array_equal(offsets[dimension], starts):
+                        raise ak._v2._util.error(
+                            ValueError(
+                                f"the '({dimension})' arguments of {self.__name__} "
+                                "have lists of different lengths"
+                            )
+                        )
+                else:
+                    offsets[dimension] = starts
+                kinds.append("list")
+                arguments.extend([starts, data])
+                argtypes.append(numba.typeof(data[:0]))
+
+            elif isinstance(x, ak._v2.contents.NumpyArray) and x.data.ndim == 1:
+                length = x.length
+                kinds.append("array")
+                arguments.append(numpy.ascontiguousarray(x.data))
+                argtypes.append(numba.from_dtype(x.dtype))
+
+            elif isinstance(x, ak._v2.contents.Content):
+                raise ak._v2._util.error(
+                    ValueError(
+                        f"the '()' arguments of {self.__name__} must be numbers at "
+                        "the depth of the '(n)' arguments' lists"
+                    )
+                )
+
+            else:
+                kinds.append("scalar")
+                arguments.append(x)
+                argtypes.append(numba.typeof(x))
+
+        argtypes = tuple(argtypes)
+        self._function.compile(argtypes)
+        restype = self._function.overloads[argtypes].signature.return_type
+        if self._output is None:
+            if not isinstance(restype, (numba.types.Number, numba.types.Boolean)):
+                raise ak._v2._util.error(
+                    TypeError(
+                        f"{self.__name__} must return a number for '()', not {restype}"
+                    )
+                )
+            starts = numpy.empty(0, np.int64)
+            output = numpy.empty(length, numba.np.numpy_support.as_dtype(restype))
+        else:
+            if not isinstance(restype, numba.types.Array) or restype.ndim != 1:
+                raise ak._v2._util.error(
+                    TypeError(
+                        f"{self.__name__} must return a one-dimensional array for "
+                        f"'({self._output})', not {restype}"
+                    )
+                )
+            starts = offsets[self._output]
+            output = numpy.empty(
+                starts[-1], numba.np.numpy_support.as_dtype(restype.dtype)
+            )
+
+        _driver(tuple(kinds), self._output)(
+            self._function, length, output, starts, *arguments
+        )
+
+        out = ak._v2.contents.NumpyArray(output)
+        if self._output is None:
+            return out
+        else:
+            return ak._v2.contents.ListOffsetArray(ak._v2.index.Index64(starts), out)
+
+
+def _is_innermost_list(layout):
+    return (
+        isinstance(
+            layout,
+            (
+                ak._v2.contents.ListOffsetArray,
+                ak._v2.contents.ListArray,
+                ak._v2.contents.RegularArray,
+            ),
+        )
+        and layout.parameter("__array__") not in ("string", "bytestring")
+        and (
+            isinstance(layout.content, ak._v2.contents.EmptyArray)
+            or isinstance(layout.content, ak._v2.contents.NumpyArray)
+            and layout.content.data.ndim == 1
+        )
+    )
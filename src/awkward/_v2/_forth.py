@@ -0,0 +1,145 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import collections
+import contextlib
+import threading
+
+import awkward as ak
+
+
+class MachineCache:
+    """
+    Size-bounded pool of compiled AwkwardForth machines, keyed by their source
+    code and constructor options.
+
+    Readers that generate Forth from a schema (Avro, JSONSchema) ask for a
+    machine with #acquire and give it back with #release when they have taken
+    its outputs. A released machine is handed to the next reader with the same
+    source, which starts it with `begin` (resetting its stack, variables, and
+    outputs; arrays taken from the previous outputs stay valid), so the source
+    is only compiled once. A machine is never shared: if all of the machines for
+    a source are in use, a new one is compiled.
+
+    At most `maxsize` idle machines are kept, discarding the least recently
+    used; machines with a string buffer larger than `max_string_buffer_size`
+    bytes are not kept at all.
+    """
+
+    def __init__(self, maxsize=64, max_string_buffer_size=2**24):
+        self._maxsize = maxsize
+        self._max_string_buffer_size = max_string_buffer_size
+        self._idle = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return "<MachineCache hits={} misses={} size={} maxsize={}>".format(
+            self.hits, self.misses, self._size, self._maxsize
+        )
+
+    def acquire(
+        self,
+        source,
+        bits=64,
+        string_buffer_size=1024,
+        output_initial_size=1024,
+        output_resize_factor=1.5,
+    ):
+        """
+        Returns an idle machine compiled from `source` or compiles a new one;
+        either way, the caller has exclusive use of it until #release.
+        """
+        import awkward.forth
+
+        if bits == 64:
+            cls = awkward.forth.ForthMachine64
+        elif bits == 32:
+            cls = awkward.forth.ForthMachine32
+        else:
+            raise ak._v2._util.error(ValueError(f"bits must be 32 or 64, not {bits}"))
+
+        key = (
+            cls,
+            source,
+            string_buffer_size,
+            output_initial_size,
+            output_resize_factor,
+        )
+        with self._lock:
+            machines = self._idle.get(key)
+            if machines:
+                self._idle.move_to_end(key)
+                self._size -= 1
+                self.hits += 1
+                out = machines.pop()
+                if len(machines) == 0:
+                    del self._idle[key]
+                return out
+            self.misses += 1
+
+        return cls(
+            source,
+            string_buffer_size=string_buffer_size,
+            output_initial_size=output_initial_size,
+            output_resize_factor=output_resize_factor,
+        )
+
+    def release(self, machine):
+        """
+        Returns a machine from #acquire to the pool; the caller must not use it
+        (or outputs that it hasn't taken yet) afterward.
+        """
+        if machine.string_buffer_size > self._max_string_buffer_size:
+            return
+
+        key = (
+            type(machine),
+            machine.source,
+            machine.string_buffer_size,
+            machine.output_initial_size,
+            machine.output_resize_factor,
+        )
+        with self._lock:
+            self._idle.setdefault(key, []).append(machine)
+            self._idle.move_to_end(key)
+            self._size += 1
+            while self._size > self._maxsize:
+                oldest = next(iter(self._idle))
+                self._idle[oldest].pop()
+                if len(self._idle[oldest]) == 0:
+                    del self._idle[oldest]
+                self._size -= 1
+
+    @contextlib.contextmanager
+    def machine(self, source, **options):
+        """
+        Context manager that #acquire's a machine and #release's it on exit.
+        """
+        out = self.acquire(source, **options)
+        try:
+            yield out
+        finally:
+            self.release(out)
+
+    def clear(self, counters=True):
+        """
+        Discards all idle machines and, if `counters`, resets #hits and #misses.
+        """
+        with self._lock:
+            self._idle.clear()
+            self._size = 0
+            if counters:
+                self.hits = 0
+                self.misses = 0
+
+
+machines = MachineCache()
@@ -1,67 +1,131 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import weakref
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
 
 
 class Lookup:
-    def __init__(self, layout, generator=None):
+    """
+    Flattened view of a layout's buffers for compiled code: `positions` holds
+    each node's buffers (and the positions of its children) in depth-first
+    order and `arrayptrs` holds their addresses.
+
+    If `projection` is not None, only some fields of RecordArrays are included:
+    it is a tuple of `(index, subprojection)` pairs for the first RecordArray
+    below this node, where each `subprojection` applies to that field's
+    content in the same way (None means all fields, all the way down). The
+    position of a field that is left out is the field's Content itself, with
+    an address of -1, so it can't be read by compiled code but can still be
+    turned back into a layout.
+    """
+
+    def __init__(self, layout, generator=None, projection=None):
         positions = []
-        tolookup(layout, positions)
+        tolookup(layout, positions, projection)
 
         def arrayptr(x):
             if isinstance(x, int):
                 return x
+            elif isinstance(x, ak._v2.contents.Content):
+                return -1
             else:
                 return x.ctypes.data
 
         self.nplike = layout.nplike
         self.generator = generator
+        self.projection = projection
         self.positions = positions
         self.arrayptrs = self.nplike.array(
             [arrayptr(x) for x in positions], dtype=np.intp
         )
 
+    @classmethod
+    def cached(cls, layout, projection=None):
+        """
+        Returns the Lookup of `layout` (with `projection`) that was made the
+        last time this was called with the same layout object, or makes one.
+
+        The cache is keyed by weak references to the layouts, so a Lookup is
+        dropped when its layout is. Layouts can't replace their buffers, so a
+        Lookup is valid for as long as its layout exists: a layout with new
+        buffers is a new layout object, which gets a new Lookup.
+
+        Layouts with non-contiguous buffers are not cached: their Lookups hold
+        contiguous copies, which would not see changes to the original buffers.
+        """
+        try:
+            lookups = _lookups[layout]
+        except KeyError:
+            lookups = _lookups[layout] = None if _copies_buffers(layout) else {}
+        if lookups is None:
+            return cls(layout, projection=projection)
+
+        out = lookups.get(projection)
+        if out is None:
+            out = lookups[projection] = cls(layout, projection=projection)
+        return out
+
+
+def _copies_buffers(layout):
+    # True if tolookup would copy any of the layout's buffers
+    if isinstance(layout, ak._v2.record.Record):
+        return _copies_buffers(layout.array)
+    elif isinstance(layout, ak._v2.contents.NumpyArray):
+        return not layout.is_contiguous
+    elif isinstance(layout, (ak._v2.contents.RecordArray, ak._v2.contents.UnionArray)):
+        return any(_copies_buffers(x) for x in layout.contents)
+    elif isinstance(layout, ak._v2.contents.EmptyArray):
+        return False
+    else:
+        return _copies_buffers(layout.content)
+
+
+_lookups = weakref.WeakKeyDictionary()
+
 
-def tolookup(layout, positions):
+def tolookup(layout, positions, projection=None):
     if isinstance(layout, ak._v2.contents.EmptyArray):
-        return tolookup(layout.toNumpyArray(np.dtype(np.float64)), positions)
+        return tolookup(
+            layout.toNumpyArray(np.dtype(np.float64)), positions, projection
+        )
 
     elif isinstance(layout, ak._v2.contents.NumpyArray):
         if len(layout.shape) == 1:
-            return NumpyLookup.tolookup(layout, positions)
+            return NumpyLookup.tolookup(layout, positions, projection)
         else:
-            return tolookup(layout.toRegularArray(), positions)
+            return tolookup(layout.toRegularArray(), positions, projection)
 
     elif isinstance(layout, ak._v2.contents.RegularArray):
-        return RegularLookup.tolookup(layout, positions)
+        return RegularLookup.tolookup(layout, positions, projection)
 
     elif isinstance(
         layout, (ak._v2.contents.ListArray, ak._v2.contents.ListOffsetArray)
     ):
-        return ListLookup.tolookup(layout, positions)
+        return ListLookup.tolookup(layout, positions, projection)
 
     elif isinstance(layout, ak._v2.contents.IndexedArray):
-        return IndexedLookup.tolookup(layout, positions)
+        return IndexedLookup.tolookup(layout, positions, projection)
 
     elif isinstance(layout, ak._v2.contents.IndexedOptionArray):
-        return IndexedOptionLookup.tolookup(layout, positions)
+        return IndexedOptionLookup.tolookup(layout, positions, projection)
 
     elif isinstance(layout, ak._v2.contents.ByteMaskedArray):
-        return ByteMaskedLookup.tolookup(layout, positions)
+        return ByteMaskedLookup.tolookup(layout, positions, projection)
 
     elif isinstance(layout, ak._v2.contents.BitMaskedArray):
-        return BitMaskedLookup.tolookup(layout, positions)
+        return BitMaskedLookup.tolookup(layout, positions, projection)
 
     elif isinstance(layout, ak._v2.contents.UnmaskedArray):
-        return UnmaskedLookup.tolookup(layout, positions)
+        return UnmaskedLookup.tolookup(layout, positions, projection)
 
     elif isinstance(layout, ak._v2.contents.RecordArray):
-        return RecordLookup.tolookup(layout, positions)
+        return RecordLookup.tolookup(layout, positions, projection)
 
     elif isinstance(layout, ak._v2.record.Record):
-        return RecordLookup.tolookup(layout, positions)
+        return RecordLookup.tolookup(layout, positions, projection)
 
     elif isinstance(layout, ak._v2.contents.UnionArray):
         return UnionLookup.tolookup(layout, positions)
@@ -102,7 +166,7 @@ class NumpyLookup(ContentLookup):
     ARRAY = 1
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(layout.contiguous().data)
@@ -122,12 +186,12 @@ class RegularLookup(ContentLookup):
     CONTENT = 2
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(len(layout))
         positions.append(None)
-        positions[pos + cls.CONTENT] = tolookup(layout.content, positions)
+        positions[pos + cls.CONTENT] = tolookup(layout.content, positions, projection)
         return pos
 
     def tolayout(self, lookup, pos, fields):
@@ -150,13 +214,13 @@ class ListLookup(ContentLookup):
     CONTENT = 3
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(layout.starts.data)
         positions.append(layout.stops.data)
         positions.append(None)
-        positions[pos + cls.CONTENT] = tolookup(layout.content, positions)
+        positions[pos + cls.CONTENT] = tolookup(layout.content, positions, projection)
         return pos
 
     def tolayout(self, lookup, pos, fields):
@@ -177,12 +241,12 @@ class IndexedLookup(ContentLookup):
     CONTENT = 2
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(layout.index.data)
         positions.append(None)
-        positions[pos + cls.CONTENT] = tolookup(layout.content, positions)
+        positions[pos + cls.CONTENT] = tolookup(layout.content, positions, projection)
         return pos
 
     def tolayout(self, lookup, pos, fields):
@@ -200,12 +264,12 @@ class IndexedOptionLookup(ContentLookup):
     CONTENT = 2
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(layout.index.data)
         positions.append(None)
-        positions[pos + cls.CONTENT] = tolookup(layout.content, positions)
+        positions[pos + cls.CONTENT] = tolookup(layout.content, positions, projection)
         return pos
 
     def tolayout(self, lookup, pos, fields):
@@ -225,12 +289,12 @@ class ByteMaskedLookup(ContentLookup):
     CONTENT = 2
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(layout.mask.data)
         positions.append(None)
-        positions[pos + cls.CONTENT] = tolookup(layout.content, positions)
+        positions[pos + cls.CONTENT] = tolookup(layout.content, positions, projection)
         return pos
 
     def tolayout(self, lookup, pos, fields):
@@ -251,13 +315,13 @@ class BitMaskedLookup(ContentLookup):
     CONTENT = 3
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(len(layout))
         positions.append(layout.mask.data)
         positions.append(None)
-        positions[pos + cls.CONTENT] = tolookup(layout.content, positions)
+        positions[pos + cls.CONTENT] = tolookup(layout.content, positions, projection)
         return pos
 
     def tolayout(self, lookup, pos, fields):
@@ -281,11 +345,11 @@ class UnmaskedLookup(ContentLookup):
     CONTENT = 1
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(None)
-        positions[pos + cls.CONTENT] = tolookup(layout.content, positions)
+        positions[pos + cls.CONTENT] = tolookup(layout.content, positions, projection)
         return pos
 
     def tolayout(self, lookup, pos, fields):
@@ -302,29 +366,44 @@ class RecordLookup(ContentLookup):
     CONTENTS = 2
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(len(layout))
         positions.extend([None] * len(layout.contents))
-        for i, content in enumerate(layout.contents):
-            positions[pos + cls.CONTENTS + i] = tolookup(content, positions)
+        if projection is None:
+            for i, content in enumerate(layout.contents):
+                positions[pos + cls.CONTENTS + i] = tolookup(content, positions)
+        else:
+            projection = dict(projection)
+            for i, content in enumerate(layout.contents):
+                if i in projection:
+                    positions[pos + cls.CONTENTS + i] = tolookup(
+                        content, positions, projection[i]
+                    )
+                else:
+                    positions[pos + cls.CONTENTS + i] = content
         return pos
 
+    def tolayout_content(self, lookup, pos, index, fields):
+        which = lookup.positions[pos + self.CONTENTS + index]
+        if isinstance(which, ak._v2.contents.Content):
+            for field in fields:
+                which = which._getitem_field(field)
+            return which
+        else:
+            return self.contenttypes[index].tolayout(lookup, which, fields)
+
     def tolayout(self, lookup, pos, fields):
         assert lookup.positions[pos + self.IDENTIFIER] == -1
         if len(fields) > 0:
             index = self.fieldindex(fields[0])
             assert index is not None
-            return self.contenttypes[index].tolayout(
-                lookup, lookup.positions[pos + self.CONTENTS + index], fields[1:]
-            )
+            return self.tolayout_content(lookup, pos, index, fields[1:])
         else:
             contents = []
-            for i, contenttype in enumerate(self.contenttypes):
-                layout = contenttype.tolayout(
-                    lookup, lookup.positions[pos + self.CONTENTS + i], fields
-                )
+            for i in range(len(self.contenttypes)):
+                layout = self.tolayout_content(lookup, pos, i, fields)
                 contents.append(layout)
 
             return ak._v2.contents.RecordArray(
@@ -342,7 +421,7 @@ class UnionLookup(ContentLookup):
     CONTENTS = 3
 
     @classmethod
-    def tolookup(cls, layout, positions):
+    def tolookup(cls, layout, positions, projection=None):
         pos = len(positions)
         cls.tolookup_identifier(layout, positions)
         positions.append(layout.tags.data)
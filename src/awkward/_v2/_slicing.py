@@ -308,16 +308,16 @@ def prepare_tuple_bool_to_int(item):
         and issubclass(item.content.dtype.type, (bool, np.bool_))
     ):
         if item.nplike.known_data or item.nplike.known_shape:
+            # the booleans must line up with the local index, which starts at 0
+            # and stops at the last offset
+            item = item.toListOffsetArray64(True)
+            booleans = item.content.data[: item.offsets[-1]]
             localindex = item.local_index(axis=1)
-            nextcontent = localindex.content.data[item.content.data]
+            nextcontent = localindex.content.data[booleans]
 
-            cumsum = item.nplike.index_nplike.empty(
-                item.content.data.shape[0] + 1, np.int64
-            )
+            cumsum = item.nplike.index_nplike.empty(booleans.shape[0] + 1, np.int64)
             cumsum[0] = 0
-            cumsum[1:] = item.nplike.index_nplike.asarray(
-                item.nplike.cumsum(item.content.data)
-            )
+            cumsum[1:] = item.nplike.index_nplike.asarray(item.nplike.cumsum(booleans))
             nextoffsets = cumsum[item.offsets]
 
         else:
@@ -0,0 +1,575 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Vectorized kernels for strings and bytestrings, which work on the `starts`,
+# `stops` (int64) and `data` (uint8) of a list of characters, rather than on
+# Python objects or padded arrays. They process at most `chunk_bytes` bytes at
+# a time, so their temporary arrays are bounded.
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+
+chunk_bytes = 2**24
+
+_multiplier = numpy.asarray(0x100000001B3, dtype=np.uint64)
+_length_multiplier = numpy.asarray(0x9E3779B97F4A7C15, dtype=np.uint64)
+_word_rounds = 4
+
+
+def is_string(layout):
+    return (
+        isinstance(
+            layout,
+            (
+                ak._v2.contents.ListOffsetArray,
+                ak._v2.contents.ListArray,
+                ak._v2.contents.RegularArray,
+            ),
+        )
+        and layout.parameter("__array__") in ("string", "bytestring")
+        and isinstance(layout.content, ak._v2.contents.NumpyArray)
+        and isinstance(layout.nplike, ak.nplike.Numpy)
+    )
+
+
+def views(layout):
+    """
+    Returns `(starts, stops, data)` of a string or bytestring `layout` (see
+    #is_string), without copying the characters.
+    """
+    if isinstance(layout, ak._v2.contents.RegularArray):
+        layout = layout.toListOffsetArray64(False)
+    if isinstance(layout, ak._v2.contents.ListOffsetArray):
+        offsets = numpy.asarray(layout.offsets).astype(np.int64, copy=False)
+        starts, stops = offsets[:-1], offsets[1:]
+    else:
+        starts = numpy.asarray(layout.starts).astype(np.int64, copy=False)
+        stops = numpy.asarray(layout.stops).astype(np.int64, copy=False)
+    data = numpy.asarray(layout.content.data).view(np.uint8)
+    return starts, stops, data
+
+
+def chunks(lengths):
+    """
+    Yields `(start, stop)` ranges of strings with at most `chunk_bytes` in
+    total (or one string, if it is bigger).
+    """
+    offsets = numpy.empty(len(lengths) + 1, dtype=np.int64)
+    offsets[0] = 0
+    numpy.cumsum(lengths, out=offsets[1:])
+    start = 0
+    while start < len(lengths):
+        stop = int(
+            numpy.searchsorted(offsets, offsets[start] + chunk_bytes, side="right")
+        )
+        stop = min(max(stop - 1, start + 1), len(lengths))
+        yield start, stop
+        start = stop
+
+
+def positions(starts, lengths):
+    """
+    Returns the indexes of all the bytes from `starts` to `starts + lengths`,
+    as a cumsum of steps that are 1 within a string and jump at the beginning
+    of each.
+    """
+    nonempty = lengths > 0
+    starts, lengths = starts[nonempty], lengths[nonempty]
+    stops = numpy.cumsum(lengths)
+    steps = numpy.ones(int(stops[-1]) if len(stops) > 0 else 0, dtype=np.int64)
+    if len(steps) > 0:
+        steps[0] = starts[0]
+        steps[stops[:-1]] = starts[1:] - (starts[:-1] + lengths[:-1] - 1)
+    return numpy.cumsum(steps, out=steps)
+
+
+def _segments(lengths, flags):
+    # number of true `flags` in each segment of `lengths` (they're concatenated)
+    offsets = numpy.zeros(len(lengths) + 1, dtype=np.int64)
+    numpy.cumsum(lengths, out=offsets[1:])
+    summed = numpy.zeros(len(flags) + 1, dtype=np.int64)
+    numpy.cumsum(flags, out=summed[1:])
+    return summed[offsets[1:]] - summed[offsets[:-1]]
+
+
+def hashes(starts, stops, data):
+    """
+    Returns a 64-bit hash of each string: a polynomial in its bytes (modulo
+    2**64), mixed with its length. Equal strings have equal hashes, but not
+    necessarily the other way around.
+    """
+    lengths = stops - starts
+    out = numpy.empty(len(lengths), dtype=np.uint64)
+    if len(lengths) == 0:
+        return out
+
+    powers = numpy.cumprod(
+        numpy.full(int(lengths.max()) + 1, _multiplier, dtype=np.uint64)
+    )
+    contiguous = bool(numpy.all(starts[1:] == stops[:-1]))
+    for start, stop in chunks(lengths):
+        local = positions(numpy.zeros(stop - start, np.int64), lengths[start:stop])
+        if contiguous:
+            terms = data[starts[start] : stops[stop - 1]].astype(np.uint64)
+        else:
+            terms = data[positions(starts[start:stop], lengths[start:stop])]
+            terms = terms.astype(np.uint64)
+        terms += np.uint64(1)
+        terms *= powers[local]
+        summed = numpy.zeros(len(terms) + 1, dtype=np.uint64)
+        numpy.cumsum(terms, out=summed[1:])
+        local_offsets = numpy.zeros(stop - start + 1, dtype=np.int64)
+        numpy.cumsum(lengths[start:stop], out=local_offsets[1:])
+        out[start:stop] = summed[local_offsets[1:]] - summed[local_offsets[:-1]]
+
+    out *= _length_multiplier
+    out += lengths.astype(np.uint64)
+    return out
+
+
+def equal(starts1, stops1, data1, starts2, stops2, data2):
+    """
+    Returns True where the strings of 1 and 2 (pairwise) have the same bytes.
+    """
+    lengths = stops1 - starts1
+    out = lengths == stops2 - starts2
+    candidates = numpy.nonzero(out & (lengths > 0))[0]
+    for start, stop in chunks(lengths[candidates]):
+        which = candidates[start:stop]
+        left = data1[positions(starts1[which], lengths[which])]
+        right = data2[positions(starts2[which], lengths[which])]
+        out[which] = _segments(lengths[which], left != right) == 0
+    return out
+
+
+def compare(starts1, stops1, data1, starts2, stops2, data2):
+    """
+    Returns -1, 0, or 1 (int8) where the strings of 1 are lexicographically
+    less than, equal to, or greater than those of 2 (pairwise), comparing
+    bytes as unsigned numbers (which is code point order for UTF-8).
+
+    The first `8 * _word_rounds` bytes are compared as big-endian 64-bit words,
+    so that most pairs are decided in a round or two; pairs that are still
+    equal after that are compared byte by byte.
+    """
+    lengths1, lengths2 = stops1 - starts1, stops2 - starts2
+    common = numpy.minimum(lengths1, lengths2)
+    out = (lengths1 > lengths2).astype(np.int8) - (lengths1 < lengths2)
+
+    which = numpy.nonzero(common > 0)[0]
+    columns = numpy.arange(8, dtype=np.int64)
+    for offset in range(0, 8 * _word_rounds, 8):
+        if len(which) == 0:
+            return out
+        size = common[which] - offset
+        mask = columns < size.reshape(-1, 1)
+        index = numpy.minimum(columns, size.reshape(-1, 1) - 1) + offset
+        left = data1[starts1[which].reshape(-1, 1) + index]
+        right = data2[starts2[which].reshape(-1, 1) + index]
+        left[~mask] = 0
+        right[~mask] = 0
+        left = left.view(">u8").reshape(-1)
+        right = right.view(">u8").reshape(-1)
+        out[which] = numpy.where(left == right, out[which], 0)
+        out[which] += (left > right).astype(np.int8) - (left < right)
+        which = which[(left == right) & (size > 8)]
+
+    offset = 8 * _word_rounds
+    lengths = common[which] - offset
+    for start, stop in chunks(lengths):
+        rows, sizes = which[start:stop], lengths[start:stop]
+        left = data1[positions(starts1[rows] + offset, sizes)]
+        right = data2[positions(starts2[rows] + offset, sizes)]
+        different = numpy.nonzero(left != right)[0]
+        if len(different) > 0:
+            offsets = numpy.empty(len(sizes) + 1, dtype=np.int64)
+            offsets[0] = 0
+            numpy.cumsum(sizes, out=offsets[1:])
+            index = numpy.searchsorted(offsets, different, side="right") - 1
+            first = numpy.ones(len(index), dtype=np.bool_)
+            first[1:] = index[1:] != index[:-1]
+            index, different = index[first], different[first]
+            out[rows[index]] = numpy.where(left[different] < right[different], -1, 1)
+    return out
+
+
+def _fixed(starts, stops, data, pattern, at_end):
+    pattern = numpy.frombuffer(pattern, dtype=np.uint8)
+    size = len(pattern)
+    lengths = stops - starts
+    out = lengths >= size
+    if size == 0:
+        return out
+    candidates = numpy.nonzero(out)[0]
+    step = max(1, chunk_bytes // size)
+    for start in range(0, len(candidates), step):
+        which = candidates[start : start + step]
+        first = stops[which] - size if at_end else starts[which]
+        block = data[first.reshape(-1, 1) + numpy.arange(size, dtype=np.int64)]
+        out[which] = numpy.all(block == pattern, axis=1)
+    return out
+
+
+def startswith(starts, stops, data, prefix):
+    """
+    Returns True where the strings begin with the bytes `prefix`.
+    """
+    return _fixed(starts, stops, data, prefix, False)
+
+
+def endswith(starts, stops, data, suffix):
+    """
+    Returns True where the strings end with the bytes `suffix`.
+    """
+    return _fixed(starts, stops, data, suffix, True)
+
+
+def contains(starts, stops, data, pattern):
+    """
+    Returns True where the strings contain the bytes `pattern`.
+
+    Candidates are positions where the first byte matches, which are filtered
+    by each subsequent byte, so this scans the bytes about once for patterns
+    that don't match often.
+    """
+    pattern = numpy.frombuffer(pattern, dtype=np.uint8)
+    size = len(pattern)
+    lengths = stops - starts
+    out = lengths >= size
+    if size == 0 or len(lengths) == 0:
+        return out
+
+    # strings in order and not overlapping (e.g. not after a carry), so that a
+    # position belongs to at most one string
+    if not bool(numpy.all(starts[1:] >= stops[:-1])):
+        data = data[positions(starts, lengths)]
+        starts = numpy.zeros(len(lengths), dtype=np.int64)
+        numpy.cumsum(lengths[:-1], out=starts[1:])
+        stops = starts + lengths
+
+    out[:] = False
+    begin, end = int(starts[0]), int(stops[-1])
+    for low in range(begin, end, chunk_bytes):
+        high = min(low + chunk_bytes, end - size + 1)
+        if high <= low:
+            break
+        found = numpy.nonzero(data[low:high] == pattern[0])[0] + low
+        for i in range(1, size):
+            found = found[data[found + i] == pattern[i]]
+        which = numpy.searchsorted(starts, found, side="right") - 1
+        found, which = found[which >= 0], which[which >= 0]
+        out[which[found + size <= stops[which]]] = True
+    return out
+
+
+# byte classes for parsing numbers, and the longest number (in bytes) with
+# at most 19 digits in the mantissa and 4 in the exponent
+_other, _digit, _sign, _dot, _e, _space, _end = range(7)
+_integer_classes = numpy.zeros(256, dtype=np.uint8)
+_integer_classes[ord("0") : ord("9") + 1] = _digit
+_integer_classes[[ord("+"), ord("-")]] = _sign
+_integer_classes[[ord(x) for x in " \t\n\v\f\r"]] = _space
+_float_classes = _integer_classes.copy()
+_float_classes[ord(".")] = _dot
+_float_classes[[ord("e"), ord("E")]] = _e
+_longest_decimal = 1 + 19 + 1 + 1 + 1 + 4
+_digit_values = numpy.zeros(256, dtype=np.uint64)
+_digit_values[ord("0") : ord("9") + 1] = numpy.arange(10, dtype=np.uint64)
+
+# states of parsing a number, and the transitions by byte class: _end (past
+# the end of the string) keeps the state, and the accepting states are
+# _integer, _fraction, and _exponent
+(
+    _start,
+    _signed,
+    _integer,
+    _point,
+    _fraction,
+    _e_seen,
+    _e_signed,
+    _exponent,
+    _error,
+) = range(9)
+_transitions = numpy.full((9, 7), _error, dtype=np.uint8)
+_transitions[:, _end] = numpy.arange(9, dtype=np.uint8)
+_transitions[[_start, _signed, _integer], _digit] = _integer
+_transitions[_start, _sign] = _signed
+_transitions[[_start, _signed], _dot] = _point
+_transitions[_integer, _dot] = _fraction
+_transitions[[_point, _fraction], _digit] = _fraction
+_transitions[[_integer, _fraction], _e] = _e_seen
+_transitions[_e_seen, _sign] = _e_signed
+_transitions[[_e_seen, _e_signed, _exponent], _digit] = _exponent
+_transitions = _transitions.reshape(-1)
+
+_powers_of_ten = numpy.asarray([10**i for i in range(20)], dtype=np.uint64)
+
+
+def _powers_of_five():
+    # 128-bit approximations of 5**q for q in [-342, 308], normalized so that
+    # the highest bit is set, as (high, low) 64-bit words (see Lemire, "Number
+    # Parsing at a Gigabyte per Second", 2021)
+    out = []
+    for q in range(-342, 309):
+        if q < 0:
+            power = 5**-q
+            z = power.bit_length()
+            if q >= -27:
+                value = 2 ** (z + 127) // power + 1
+            else:
+                value = 2 ** (2 * z + 128) // power + 1
+            while value >= 2**128:
+                value //= 2
+        else:
+            value = 5**q
+            while value < 2**127:
+                value *= 2
+            while value >= 2**128:
+                value //= 2
+        out.append((value >> 64, value & 0xFFFFFFFFFFFFFFFF))
+    return numpy.asarray(out, dtype=np.uint64)
+
+
+_powers_of_five_128 = _powers_of_five()
+
+
+def _multiply(a, b):
+    # full 128-bit product of uint64 arrays, as (high, low)
+    mask, shift = numpy.asarray(0xFFFFFFFF, np.uint64), numpy.asarray(32, np.uint64)
+    a_low, a_high = a & mask, a >> shift
+    b_low, b_high = b & mask, b >> shift
+    low_low = a_low * b_low
+    low_high = a_low * b_high
+    high_low = a_high * b_low
+    middle = (low_low >> shift) + (low_high & mask) + (high_low & mask)
+    low = (low_low & mask) | (middle << shift)
+    high = a_high * b_high + (low_high >> shift) + (high_low >> shift)
+    return high + (middle >> shift), low
+
+
+def _leading_zeros(x):
+    out = numpy.zeros(len(x), dtype=np.int64)
+    for bits in (32, 16, 8, 4, 2, 1):
+        fits = x < numpy.asarray(1 << (64 - bits), np.uint64)
+        out += numpy.where(fits, bits, 0)
+        x = numpy.where(fits, x << numpy.asarray(bits, np.uint64), x)
+    return out
+
+
+def _to_float64(mantissa, exponent):
+    """
+    Returns `(values, exact)` for `mantissa * 10**exponent` (mantissa < 10**19),
+    correctly rounded by the Eisel-Lemire algorithm, where `exact`; the rest
+    (subnormal results and a few ambiguous cases) need to be parsed otherwise.
+    """
+    uint64 = np.uint64
+    zero = (mantissa == 0) | (exponent < -342)
+    infinite = ~zero & (exponent > 308)
+    q = numpy.minimum(numpy.maximum(exponent, -342), 308)
+
+    lz = _leading_zeros(numpy.maximum(mantissa, numpy.asarray(1, uint64)))
+    w = mantissa << lz.astype(uint64)
+    high, low = _multiply(w, _powers_of_five_128[q + 342, 0])
+    precision = numpy.asarray(0x1FF, uint64)
+    refine = (high & precision) == precision
+    if numpy.any(refine):
+        second, _ = _multiply(w, _powers_of_five_128[q + 342, 1])
+        refined = low + second
+        high = numpy.where(refine & (refined < second), high + uint64(1), high)
+        low = numpy.where(refine, refined, low)
+    everything = numpy.asarray(0xFFFFFFFFFFFFFFFF, uint64)
+    exact = ~((low == everything) & ((q < -27) | (q > 55)))
+
+    upperbit = (high >> uint64(63)).astype(np.int64)
+    bits = high >> (upperbit + 9).astype(uint64)
+    power2 = ((217706 * q) >> 16) + 63 + upperbit - lz + 1023
+    exact &= power2 > 0
+
+    tie = (low <= uint64(1)) & (q >= -4) & (q <= 23) & ((bits & uint64(3)) == 1)
+    tie &= (bits << (upperbit + 9).astype(uint64)) == high
+    bits = numpy.where(tie, bits & ~uint64(1), bits)
+    bits = (bits + (bits & uint64(1))) >> uint64(1)
+    overflow = bits >= uint64(2**53)
+    bits = numpy.where(overflow, uint64(2**52), bits)
+    power2 = numpy.where(overflow, power2 + 1, power2)
+    bits &= ~uint64(2**52)
+    infinite |= power2 >= 0x7FF
+
+    bits |= numpy.maximum(power2, 0).astype(uint64) << uint64(52)
+    bits = numpy.where(zero, uint64(0), bits)
+    bits = numpy.where(infinite, uint64(0x7FF << 52), bits)
+    return bits.view(np.float64), exact | zero | infinite
+
+
+def _tokens(starts, stops, data):
+    # first and last non-space bytes of each string (last < first if blank)
+    first, last = starts.copy(), stops - 1
+    lengths = stops - starts
+    nonempty = numpy.nonzero(lengths > 0)[0]
+    spaced = _integer_classes[data[starts[nonempty]]] == _space
+    spaced |= _integer_classes[data[last[nonempty]]] == _space
+    which = nonempty[spaced]
+    for start, stop in chunks(lengths[which]):
+        strings = which[start:stop]
+        index = positions(starts[strings], lengths[strings])
+        solid = index[_integer_classes[data[index]] != _space]
+        low = numpy.searchsorted(solid, starts[strings], side="left")
+        high = numpy.searchsorted(solid, stops[strings], side="left")
+        padded = numpy.append(solid, -1)
+        first[strings] = numpy.where(high > low, padded[low], stops[strings])
+        last[strings] = numpy.where(high > low, padded[high - 1], starts[strings])
+    return first, last
+
+
+def _decimals(starts, stops, data, is_float):
+    """
+    Parses strings as decimal numbers with optional surrounding ASCII
+    whitespace, a sign, and (if `is_float`) a decimal point and an exponent.
+
+    Returns `(decided, negative, mantissa, exponent)`, where the number is
+    `mantissa * 10**exponent` (mantissa as uint64). Strings that are not
+    `decided` either aren't numbers or have too many digits to parse this way
+    (more than 19 in the mantissa or 4 in the exponent), or use Python syntax
+    beyond the above (such as underscores or "inf"), and need to be checked
+    individually.
+
+    Each step looks at the next byte of all the strings, so the number of
+    steps is the length of the longest number, up to `_longest_decimal`.
+    """
+    n = len(starts)
+    classes = _float_classes if is_float else _integer_classes
+    first, last = _tokens(starts, stops, data)
+    length = last - first + 1
+    decided = length > 0
+    steps = int(length.max()) if n > 0 else 0
+    if steps > _longest_decimal:
+        decided &= length <= _longest_decimal
+        steps = _longest_decimal
+
+    state = numpy.full(n, _start, dtype=np.uint8)
+    mantissa = numpy.zeros(n, dtype=np.uint64)
+    mantissa_digits = numpy.zeros(n, dtype=np.int64)
+    negative = numpy.zeros(n, dtype=np.bool_)
+    dot_step = numpy.full(n, -1, dtype=np.int64)
+    e_step = length.copy()
+    ten = numpy.asarray(10, dtype=np.uint64)
+    if len(data) == 0:
+        # all strings are empty, but bytes are still taken (and ignored)
+        data = numpy.zeros(1, dtype=np.uint8)
+
+    cursor = first.copy()
+    for step in range(steps):
+        char = data.take(cursor, mode="clip")
+        cursor += 1
+        kind = numpy.where(step < length, classes[char], _end)
+        state = _transitions[state * 7 + kind]
+        if step == 0:
+            negative = char == ord("-")
+
+        is_digit = kind == _digit
+        in_mantissa = is_digit & (state <= _fraction)
+        mantissa = numpy.where(
+            in_mantissa, mantissa * ten + _digit_values[char], mantissa
+        )
+        mantissa_digits += in_mantissa
+        if is_float:
+            dot_step = numpy.where(kind == _dot, step, dot_step)
+            e_step = numpy.where(kind == _e, step, e_step)
+
+    decided &= (state == _integer) | (state == _fraction) | (state == _exponent)
+    decided &= mantissa_digits <= 19
+    if not is_float:
+        return decided, negative, mantissa, numpy.zeros(n, dtype=np.int64)
+
+    # the exponent is the digits after the "e" and its sign, if any
+    after_e = data.take(first + e_step + 1, mode="clip")
+    signed = (e_step + 1 < length) & (classes[after_e] == _sign)
+    exponent_digits = numpy.maximum(length - e_step - 1 - signed, 0)
+    decided &= exponent_digits <= 4
+    exponent = numpy.zeros(n, dtype=np.int64)
+    for place in range(4):
+        digit = _digit_values[data.take(last - place, mode="clip")].astype(np.int64)
+        exponent += numpy.where(place < exponent_digits, digit * 10**place, 0)
+    minus = signed & (after_e == ord("-"))
+    exponent = numpy.where(minus, -exponent, exponent)
+    fraction = numpy.where(dot_step >= 0, e_step - dot_step - 1, 0)
+    return decided, negative, mantissa, exponent - fraction
+
+
+def to_numbers(starts, stops, data, dtype):
+    """
+    Parses each string as an integer or floating-point number of `dtype`,
+    following Python's `int` and `float` syntax, without padding the strings
+    to a common length.
+
+    Returns `(values, valid)`, where `valid` is False for strings that aren't
+    numbers or are out of the range of `dtype` (and the value is zero).
+
+    Strings of up to 19 digits are parsed in vectorized passes over the bytes
+    (floats are correctly rounded, as by `float`); others are parsed one by one
+    by Python. Floats are parsed as float64 and then cast to `dtype`.
+    """
+    dtype = np.dtype(dtype)
+    is_float = dtype.kind == "f"
+    lengths = stops - starts
+    values = numpy.zeros(len(lengths), dtype=dtype)
+    valid = numpy.zeros(len(lengths), dtype=np.bool_)
+    if not is_float:
+        info = np.iinfo(dtype)
+        largest = numpy.asarray(int(info.max), dtype=np.uint64)
+        smallest = numpy.asarray(-int(info.min), dtype=np.uint64)
+
+    decided, negative, mantissa, exponent = _decimals(starts, stops, data, is_float)
+    if is_float:
+        magnitude, exact = _to_float64(mantissa, exponent)
+        decided &= exact
+        out = numpy.where(negative, -magnitude, magnitude)
+        valid[:] = decided
+    else:
+        valid[:] = decided & numpy.where(
+            negative, mantissa <= smallest, mantissa <= largest
+        )
+        if dtype.kind == "i":
+            # -(mantissa - 1) - 1 doesn't overflow for the most negative int
+            one = numpy.asarray(1, dtype=np.uint64)
+            signed = (mantissa - one).astype(np.int64)
+            out = numpy.where(negative, -signed - 1, mantissa.astype(np.int64))
+        else:
+            out = mantissa
+    values[:] = numpy.where(valid, out, 0).astype(dtype)
+
+    for i in numpy.nonzero(~decided)[0]:
+        try:
+            string = bytes(data[starts[i] : stops[i]])
+            value = float(string) if is_float else int(string)
+        except ValueError:
+            continue
+        if is_float or int(info.min) <= value <= int(info.max):
+            values[i] = value
+            valid[i] = True
+
+    return values, valid
+
+
+def apply(layout, kernel, function_name):
+    """
+    Replaces each string or bytestring in `layout` with the result of
+    `kernel(starts, stops, data)`, which has one item per string.
+    """
+
+    def action(layout, **kwargs):
+        if layout.is_ListType and layout.parameter("__array__") in (
+            "string",
+            "bytestring",
+        ):
+            if not is_string(layout):
+                raise ak._v2._util.error(
+                    NotImplementedError(
+                        f"{function_name} is only implemented for NumPy arrays"
+                    )
+                )
+            return ak._v2.contents.NumpyArray(kernel(*views(layout)))
+
+    return layout.recursively_apply(action, function_name=function_name)
@@ -3,6 +3,8 @@
 # First, transition all the _v2 code to start using implementations in this file.
 # Then build up the high-level replacements.
 
+import contextlib
+import gc
 import itertools
 import numbers
 import os
@@ -94,6 +96,67 @@ def little_endian(array):
     return array.astype(array.dtype.newbyteorder("<"), copy=False)
 
 
+@contextlib.contextmanager
+def gc_paused():
+    # gc.disable is process-wide: it also stops collection in other threads,
+    # so only wrap loops that run no user code (behaviors, callbacks) and end
+    # quickly, such as slicing built-in lists into millions of new lists,
+    # each of which would otherwise count toward triggering the collector
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def tolist_sublists(items, starts, stops):
+    # 'starts' and 'stops' are NumPy arrays; Python ints are much faster to slice with
+    starts, stops = starts.tolist(), stops.tolist()
+    with gc_paused():
+        return [items[start:stop] for start, stop in zip(starts, stops)]
+
+
+def tolist_bytestrings(data, starts, stops, convert_bytes=None):
+    raw = tobytes(data)
+    out = tolist_sublists(raw, starts, stops)
+    if convert_bytes is not None:
+        out = [convert_bytes(x) for x in out]
+    return out
+
+
+def tolist_strings(data, starts, stops):
+    raw = tobytes(data)
+
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        text = None
+
+    if text is not None and len(text) == len(raw):
+        # all ASCII: byte positions are character positions
+        return tolist_sublists(text, starts, stops)
+
+    elif text is not None:
+        # convert byte positions into character positions by counting the
+        # bytes that start a UTF-8 character, if all strings start on one
+        codes = ak.nplike.numpy.frombuffer(raw, dtype=np.uint8)
+        is_first = (codes & 0xC0) != 0x80
+        positions = ak.nplike.numpy.empty(len(codes) + 1, dtype=np.int64)
+        positions[0] = 0
+        ak.nplike.numpy.cumsum(is_first, out=positions[1:])
+        is_first = ak.nplike.numpy.append(is_first, True)
+        if is_first[starts].all() and is_first[stops].all():
+            return tolist_sublists(text, positions[starts], positions[stops])
+
+    # invalid UTF-8 in some strings: decode them one by one
+    return [
+        raw[start:stop].decode(errors="surrogateescape")
+        for start, stop in zip(starts.tolist(), stops.tolist())
+    ]
+
+
 def identifier_hash(str):
     import base64
     import struct
@@ -157,7 +220,11 @@ class ErrorContext:
 
         elif value is None or isinstance(value, (bool, int, str, bytes)):
             try:
-                valuestr = repr(value)
+                if isinstance(value, (str, bytes)) and len(value) > width:
+                    # such as a whole JSON file: only its beginning would be shown
+                    valuestr = repr(value[:width])[: width - 3] + "..."
+                else:
+                    valuestr = repr(value)
             except Exception as err:
                 valuestr = f"repr-raised-{type(err).__name__}"
 
@@ -187,18 +254,48 @@ class ErrorContext:
                     valuestr = valuestr[: width - 3] + "..."
 
         elif isinstance(value, (Sequence, Mapping)) and len(value) < 10000:
-            valuestr = repr(value)
-            if len(valuestr) > width:
-                valuestr = valuestr[: width - 3] + "..."
+            valuestr = self.format_collection(width, value)
 
         if valuestr is None:
             return f"{type(value).__name__}-instance"
         else:
             return valuestr
 
+    def format_collection(self, width, value):
+        # like repr(value), but without formatting more items than fit in width
+        if isinstance(value, (list, tuple, dict)):
+            if isinstance(value, dict):
+                items = (f"{k!r}: {v!r}" for k, v in value.items())
+                left, right = "{", "}"
+            else:
+                items = (repr(x) for x in value)
+                left, right = ("[", "]") if isinstance(value, list) else ("(", ")")
+                if isinstance(value, tuple) and len(value) == 1:
+                    right = ",)"
+
+            valuestr = left
+            for i, item in enumerate(items):
+                valuestr += (", " if i != 0 else "") + item
+                if len(valuestr) > width:
+                    break
+            else:
+                valuestr += right
+        else:
+            valuestr = repr(value)
+
+        if len(valuestr) > width:
+            valuestr = valuestr[: width - 3] + "..."
+        return valuestr
+
 
 class OperationErrorContext(ErrorContext):
     def __init__(self, name, arguments):
+        if self.primary() is not None:
+            # only the outermost context is reported, so don't format arguments
+            # (such as each array in a loop) for the nested ones
+            super().__init__()
+            return
+
         string_arguments = {}
         for key, value in arguments.items():
             if isstr(key):
@@ -250,6 +347,10 @@ Error details: {str(exception)}"""
 
 class SlicingErrorContext(ErrorContext):
     def __init__(self, array, where):
+        if self.primary() is not None:
+            super().__init__()
+            return
+
         super().__init__(
             array=self.format_argument(self._width - 4, array),
             where=self.format_slice(where),
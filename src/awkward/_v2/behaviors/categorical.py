@@ -5,6 +5,7 @@ import awkward as ak
 from awkward._v2.highlevel import Array
 
 np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
 
 
 class CategoricalBehavior(Array):
@@ -15,7 +16,7 @@ class _HashableDict:
     def __init__(self, obj):
         self.keys = tuple(sorted(obj))
         self.values = tuple(_hashable(obj[k]) for k in self.keys)
-        self.hash = hash((_HashableDict,) + self.keys, self.values)
+        self.hash = hash((_HashableDict,) + self.keys + self.values)
 
     def __hash__(self):
         return self.hash
@@ -51,6 +52,152 @@ def _hashable(obj):
         return obj
 
 
+def _factorize_hashable(content):
+    # any type of data, one Python object at a time
+    content_list = ak._v2.operations.to_list(content)
+    hashable = [_hashable(x) for x in content_list]
+
+    lookup = {}
+    is_first = numpy.empty(len(hashable), dtype=np.bool_)
+    mapping = numpy.empty(len(hashable), dtype=np.int64)
+    for i, x in enumerate(hashable):
+        if x in lookup:
+            is_first[i] = False
+            mapping[i] = lookup[x]
+        else:
+            is_first[i] = True
+            lookup[x] = j = len(lookup)
+            mapping[i] = j
+
+    return mapping, is_first
+
+
+def _unique(values):
+    # like numpy.unique(values, return_index=True, return_inverse=True), but
+    # the groups are numbered in order of their first appearance
+    length = len(values)
+    is_first = numpy.zeros(length, dtype=np.bool_)
+    if length == 0:
+        return numpy.zeros(0, dtype=np.int64), is_first
+
+    order = numpy.argsort(values, kind="stable")
+    ordered = values[order]
+    is_new = numpy.empty(length, dtype=np.bool_)
+    is_new[0] = True
+    is_new[1:] = ordered[1:] != ordered[:-1]
+    if ordered.dtype.kind in ("f", "c", "m", "M"):
+        # all NaNs (and NaTs) are one group
+        is_nan = ordered != ordered
+        is_new[1:] &= ~(is_nan[1:] & is_nan[:-1])
+
+    starts = numpy.nonzero(is_new)[0]
+    first = order[starts]
+    rank = numpy.empty(len(first), dtype=np.int64)
+    rank[numpy.argsort(first)] = numpy.arange(len(first), dtype=np.int64)
+    group = numpy.cumsum(is_new) - 1
+
+    mapping = numpy.empty(length, dtype=np.int64)
+    mapping[order] = rank[group]
+    is_first[first] = True
+    return mapping, is_first
+
+
+def _factorize(content):
+    """
+    Returns `(mapping, is_first)` for a one-dimensional `content`: `mapping`
+    numbers the distinct values in order of first appearance and `is_first`
+    selects the first appearance of each one.
+
+    Numbers are sorted (and all NaNs are one category) and strings are hashed
+    by their bytes and checked, without making Python objects. Other types are
+    compared as Python objects.
+    """
+    if isinstance(content, ak._v2.contents.NumpyArray) and content.data.ndim == 1:
+        return _unique(numpy.asarray(content.data))
+
+    elif ak._v2._strings.is_string(content):
+        starts, stops, data = ak._v2._strings.views(content)
+        mapping, is_first = _unique(ak._v2._strings.hashes(starts, stops, data))
+        others = numpy.nonzero(~is_first)[0]
+        firsts = numpy.nonzero(is_first)[0][mapping[others]]
+        if numpy.all(
+            ak._v2._strings.equal(
+                starts[others],
+                stops[others],
+                data,
+                starts[firsts],
+                stops[firsts],
+                data,
+            )
+        ):
+            return mapping, is_first
+
+    # records, nested lists, or a hash collision
+    return _factorize_hashable(content)
+
+
+def _merge_categories(categories):
+    """
+    Returns `(merged, mappings)` for a list of category Contents: `merged`
+    has each distinct category of all of them once, in order of first
+    appearance, and `mappings[i]` maps indexes of `categories[i]` to indexes
+    of `merged` (apply it with _remap, which keeps missing values missing).
+    """
+    if len(categories) > 1 and all(x is categories[0] for x in categories):
+        # already merged, such as by merge_categories
+        mapping = numpy.arange(categories[0].length, dtype=np.int64)
+        return categories[0], [mapping] * len(categories)
+
+    concatenated = categories[0].mergemany(categories[1:])
+    mapping, is_first = _factorize(concatenated)
+    merged = concatenated[is_first]
+
+    mappings = []
+    start = 0
+    for category in categories:
+        stop = start + category.length
+        mappings.append(mapping[start:stop])
+        start = stop
+
+    return merged, mappings
+
+
+def _remap(mapping, index):
+    # any negative index is a missing value (not only -1), which stays missing
+    index = numpy.asarray(index)
+    return numpy.where(index < 0, -1, mapping[numpy.maximum(index, 0)])
+
+
+def _mergemany(layouts):
+    # concatenates categorical IndexedArrays and IndexedOptionArrays into one
+    # with the union of their categories (see IndexedArray.mergemany)
+    merged, mappings = _merge_categories([x.content for x in layouts])
+    index = numpy.concatenate(
+        [_remap(mapping, x.index) for mapping, x in zip(mappings, layouts)]
+    )
+
+    parameters = layouts[0].parameters
+    for layout in layouts[1:]:
+        parameters = ak._v2._util.merge_parameters(parameters, layout.parameters, True)
+
+    if any(x.is_OptionType for x in layouts):
+        cls = ak._v2.contents.IndexedOptionArray
+    else:
+        cls = ak._v2.contents.IndexedArray
+    return cls(ak._v2.index.Index64(index), merged, None, parameters, numpy)
+
+
+def _is_mergeable_categorical(layouts):
+    return all(
+        x.parameter("__array__") == "categorical"
+        and isinstance(
+            x, (ak._v2.contents.IndexedArray, ak._v2.contents.IndexedOptionArray)
+        )
+        and isinstance(x.nplike, ak.nplike.Numpy)
+        for x in layouts
+    )
+
+
 def _categorical_equal(one, two):
     behavior = ak._v2._util.behavior_of(one, two)
 
@@ -66,26 +213,21 @@ def _categorical_equal(one, two):
     one_content = ak._v2._util.wrap(one.content, behavior)
     two_content = ak._v2._util.wrap(two.content, behavior)
 
-    if len(one_content) == len(two_content) and ak._v2.operations.all(
-        one_content == two_content, axis=None
+    if one.content is two.content or (
+        len(one_content) == len(two_content)
+        and ak._v2.operations.all(one_content == two_content, axis=None)
     ):
-        one_mapped = one_index
+        one_mapped = numpy.where(one_index < 0, -1, one_index)
+        two_mapped = numpy.where(two_index < 0, -1, two_index)
 
     else:
-        one_list = ak._v2.operations.to_list(one_content)
-        two_list = ak._v2.operations.to_list(two_content)
-        one_hashable = [_hashable(x) for x in one_list]
-        two_hashable = [_hashable(x) for x in two_list]
-        two_lookup = {x: i for i, x in enumerate(two_hashable)}
-
-        one_to_two = ak.nplike.numpy.empty(len(one_hashable) + 1, dtype=np.int64)
-        for i, x in enumerate(one_hashable):
-            one_to_two[i] = two_lookup.get(x, len(two_hashable))
-        one_to_two[-1] = -1
-
-        one_mapped = one_to_two[one_index]
+        _, (one_to_merged, two_to_merged) = _merge_categories(
+            [one.content, two.content]
+        )
+        one_mapped = _remap(one_to_merged, one_index)
+        two_mapped = _remap(two_to_merged, two_index)
 
-    out = one_mapped == two_index
+    out = one_mapped == two_mapped
     out = ak._v2._util.wrap(
         ak._v2.contents.NumpyArray(out), ak._v2._util.behavior_of(one, two)
     )
@@ -219,9 +361,10 @@ def to_categorical(array, highlevel=True):
         >>> ak.to_list(categorical_records) == ak.to_list(records)
         True
 
-    The check for uniqueness is currently implemented in a Python loop, so
-    conversion to categorical should be regarded as expensive. (This can
-    change, but it would always be an _n log(n)_ operation.)
+    The check for uniqueness is vectorized for numbers and strings (sorting
+    numbers and hashing the bytes of strings); other categories, such as
+    records, are checked in a Python loop, which is expensive. Either way, it
+    is an _n log(n)_ operation.
 
     See also #ak.is_categorical, #ak.categories, #ak.from_categorical.
     """
@@ -243,20 +386,7 @@ def to_categorical(array, highlevel=True):
                 content = layout
                 cls = ak._v2.contents.IndexedArray
 
-            content_list = ak._v2.operations.to_list(content)
-            hashable = [_hashable(x) for x in content_list]
-
-            lookup = {}
-            is_first = ak.nplike.numpy.empty(len(hashable), dtype=np.bool_)
-            mapping = ak.nplike.numpy.empty(len(hashable), dtype=np.int64)
-            for i, x in enumerate(hashable):
-                if x in lookup:
-                    is_first[i] = False
-                    mapping[i] = lookup[x]
-                else:
-                    is_first[i] = True
-                    lookup[x] = j = len(lookup)
-                    mapping[i] = j
+            mapping, is_first = _factorize(content)
 
             if layout.is_IndexedType and layout.is_OptionType:
                 original_index = ak.nplike.numpy.asarray(layout.index)
@@ -327,6 +457,89 @@ def from_categorical(array, highlevel=True):
         return out
 
 
+def merge_categories(arrays, highlevel=True):
+    """
+    Args:
+        arrays (iterable of arrays): Categorical Awkward Arrays, such as
+            chunks of a dataset read from different files.
+        highlevel (bool): If True, return #ak.Array; otherwise, return
+            low-level #ak.layout.Content subclasses.
+
+    Returns a list of categorical arrays with the same values as `arrays`,
+    which all share the same categories: each distinct category of any of
+    the `arrays`, once, in order of first appearance. Only the integer
+    indexes are remapped; the data are not converted from categorical.
+
+    Arrays with the same categories can be compared and concatenated without
+    looking at the categories.
+
+        >>> one = ak.to_categorical(ak.Array(["a", "b", "a"]))
+        >>> two = ak.to_categorical(ak.Array(["c", "a"]))
+        >>> one, two = ak.merge_categories([one, two])
+        >>> ak.categories(one)
+        <Array ['a', 'b', 'c'] type='3 * string'>
+        >>> ak.categories(two) is ak.categories(one)
+        True
+
+    Each of the `arrays` must have exactly one categorical node, which may be
+    nested in lists.
+
+    See also #ak.is_categorical, #ak.categories, #ak.to_categorical.
+    """
+
+    arrays = list(arrays)
+    layouts = [
+        ak._v2.operations.to_layout(x, allow_record=False, allow_other=False)
+        for x in arrays
+    ]
+    if len(layouts) == 0:
+        return []
+
+    nodes = []
+    for layout in layouts:
+        found = []
+
+        def find(layout, **kwargs):
+            if layout.parameter("__array__") == "categorical":
+                found.append(layout)
+                return layout
+
+        layout.recursively_apply(find, return_array=False)
+        if len(found) != 1:
+            raise ak._v2._util.error(
+                ValueError(
+                    "each array must have exactly one categorical node, not {}".format(
+                        len(found)
+                    )
+                )
+            )
+        nodes.append(found[0])
+
+    merged, mappings = _merge_categories([x.content for x in nodes])
+
+    out = []
+    for layout, node, mapping in zip(layouts, nodes, mappings):
+        if node.is_OptionType:
+            cls = ak._v2.contents.IndexedOptionArray
+        else:
+            cls = ak._v2.contents.IndexedArray
+        index = ak._v2.index.Index64(_remap(mapping, node.index))
+
+        def replace(layout, **kwargs):
+            if layout.parameter("__array__") == "categorical":
+                return cls(index, merged, None, layout.parameters, numpy)
+
+        out.append(
+            ak._v2._util.wrap(
+                layout.recursively_apply(replace),
+                ak._v2._util.behavior_of(*arrays),
+                highlevel,
+            )
+        )
+
+    return out
+
+
 def register(behavior):
     behavior["categorical"] = CategoricalBehavior
     behavior[ak.nplike.numpy.equal, "categorical", "categorical"] = _categorical_equal
@@ -108,6 +108,12 @@ def _string_equal(one, two):
     nplike = ak.nplike.of(one, two)
     behavior = ak._v2._util.behavior_of(one, two)
 
+    if ak._v2._strings.is_string(one.layout) and ak._v2._strings.is_string(two.layout):
+        out = ak._v2._strings.equal(
+            *ak._v2._strings.views(one.layout), *ak._v2._strings.views(two.layout)
+        )
+        return ak._v2._util.wrap(ak._v2.contents.NumpyArray(out), behavior)
+
     one, two = (
         ak._v2.operations.without_parameters(one).layout,
         ak._v2.operations.without_parameters(two).layout,
@@ -140,6 +146,30 @@ def _string_notequal(one, two):
     return ~_string_equal(one, two)
 
 
+def _string_order(ufunc):
+    def order(one, two):
+        if not (
+            ak._v2._strings.is_string(one.layout)
+            and ak._v2._strings.is_string(two.layout)
+        ):
+            raise ak._v2._util.error(
+                NotImplementedError(
+                    f"{ufunc.__name__} of strings is only implemented for the CPU"
+                )
+            )
+        out = ufunc(
+            ak._v2._strings.compare(
+                *ak._v2._strings.views(one.layout), *ak._v2._strings.views(two.layout)
+            ),
+            0,
+        )
+        return ak._v2._util.wrap(
+            ak._v2.contents.NumpyArray(out), ak._v2._util.behavior_of(one, two)
+        )
+
+    return order
+
+
 def _string_broadcast(layout, offsets):
     nplike = ak.nplike.of(offsets)
     offsets = nplike.asarray(offsets)
@@ -252,6 +282,15 @@ def register(behavior):
     behavior[ak.nplike.numpy.not_equal, "bytestring", "bytestring"] = _string_notequal
     behavior[ak.nplike.numpy.not_equal, "string", "string"] = _string_notequal
 
+    for ufunc in (
+        ak.nplike.numpy.less,
+        ak.nplike.numpy.less_equal,
+        ak.nplike.numpy.greater,
+        ak.nplike.numpy.greater_equal,
+    ):
+        behavior[ufunc, "bytestring", "bytestring"] = _string_order(ufunc)
+        behavior[ufunc, "string", "string"] = _string_order(ufunc)
+
     behavior["__broadcast__", "bytestring"] = _string_broadcast
     behavior["__broadcast__", "string"] = _string_broadcast
 
@@ -1023,12 +1023,7 @@ class ByteMaskedArray(Content):
         out = self._content._getitem_range(slice(0, len(mask)))._to_list(
             behavior, json_conversions
         )
-
-        for i, isvalid in enumerate(mask):
-            if not isvalid:
-                out[i] = None
-
-        return out
+        return [x if isvalid else None for x, isvalid in zip(out, mask.tolist())]
 
     def _to_nplike(self, nplike):
         content = self._content._to_nplike(nplike)
@@ -551,6 +551,10 @@ class IndexedArray(Content):
         if len(others) == 0:
             return self
 
+        if ak._v2.behaviors.categorical._is_mergeable_categorical([self] + others):
+            # one set of categories, rather than a concatenation with duplicates
+            return ak._v2.behaviors.categorical._mergemany([self] + others)
+
         head, tail = self._merging_strategy(others)
 
         total_length = 0
@@ -1133,9 +1137,13 @@ class IndexedArray(Content):
         index = self._index.raw(numpy)
 
         if self.parameter("__array__") == "categorical":
-            dictionary = self._content._to_arrow(
-                pyarrow, None, None, self._content.length, options
+            # Arrow (and pandas) expect the dictionary to be unique
+            merged = ak._v2.behaviors.categorical._merge_categories([self._content])
+            content, (mapping,) = merged
+            index = ak._v2.behaviors.categorical._remap(mapping, index).astype(
+                index.dtype
             )
+            dictionary = content._to_arrow(pyarrow, None, None, content.length, options)
             out = pyarrow.DictionaryArray.from_arrays(
                 index,
                 dictionary,
@@ -655,6 +655,10 @@ class IndexedOptionArray(Content):
         if len(others) == 0:
             return self
 
+        if ak._v2.behaviors.categorical._is_mergeable_categorical([self] + others):
+            # one set of categories, rather than a concatenation with duplicates
+            return ak._v2.behaviors.categorical._mergemany([self] + others)
+
         head, tail = self._merging_strategy(others)
 
         total_length = 0
@@ -667,12 +671,35 @@ class IndexedOptionArray(Content):
         nextindex = ak._v2.index.Index64.empty(total_length, self._nplike)
         parameters = self._parameters
 
+        # with known data, each chunk's index is only collected here and the
+        # output index is filled in one pass below, not with a kernel per chunk
+        vectorized = self._nplike.known_data
+        index_nplike = self._nplike.index_nplike
+        indexes, lengths, shifts = [], [], []
+
         for array in head:
             parameters = ak._v2._util.merge_parameters(
                 self._parameters, array._parameters, True
             )
 
-            if isinstance(
+            if vectorized and isinstance(
+                array, ak._v2.contents.bytemaskedarray.ByteMaskedArray
+            ):
+                # same as toIndexedOptionArray64, without a kernel call
+                array_index = index_nplike.where(
+                    array.mask_as_bool(True, index_nplike),
+                    index_nplike.arange(array.length, dtype=np.int64),
+                    -1,
+                )
+                array = ak._v2.contents.indexedoptionarray.IndexedOptionArray(
+                    ak._v2.index.Index64(array_index, nplike=self._nplike),
+                    array.content,
+                    None,
+                    array._parameters,
+                    self._nplike,
+                )
+
+            elif isinstance(
                 array,
                 (
                     ak._v2.contents.bytemaskedarray.ByteMaskedArray,
@@ -685,23 +712,28 @@ class IndexedOptionArray(Content):
             if isinstance(array, ak._v2.contents.indexedoptionarray.IndexedOptionArray):
                 contents.append(array.content)
                 array_index = array.index
-                assert (
-                    nextindex.nplike is self._nplike
-                    and array_index.nplike is self._nplike
-                )
-                self._handle_error(
-                    self._nplike[
-                        "awkward_IndexedArray_fill",
-                        nextindex.dtype.type,
-                        array_index.dtype.type,
-                    ](
-                        nextindex.data,
-                        length_so_far,
-                        array_index.data,
-                        array.length,
-                        contentlength_so_far,
+                if vectorized:
+                    indexes.append(array_index.data[: array.length])
+                    lengths.append(array.length)
+                    shifts.append(contentlength_so_far)
+                else:
+                    assert (
+                        nextindex.nplike is self._nplike
+                        and array_index.nplike is self._nplike
+                    )
+                    self._handle_error(
+                        self._nplike[
+                            "awkward_IndexedArray_fill",
+                            nextindex.dtype.type,
+                            array_index.dtype.type,
+                        ](
+                            nextindex.data,
+                            length_so_far,
+                            array_index.data,
+                            array.length,
+                            contentlength_so_far,
+                        )
                     )
-                )
                 contentlength_so_far += array.content.length
                 length_so_far += array.length
 
@@ -709,21 +741,35 @@ class IndexedOptionArray(Content):
                 pass
             else:
                 contents.append(array)
-                assert nextindex.nplike is self._nplike
-                self._handle_error(
-                    self._nplike[
-                        "awkward_IndexedArray_fill_count",
-                        nextindex.dtype.type,
-                    ](
-                        nextindex.data,
-                        length_so_far,
-                        array.length,
-                        contentlength_so_far,
+                if vectorized:
+                    indexes.append(index_nplike.arange(array.length, dtype=np.int64))
+                    lengths.append(array.length)
+                    shifts.append(contentlength_so_far)
+                else:
+                    assert nextindex.nplike is self._nplike
+                    self._handle_error(
+                        self._nplike[
+                            "awkward_IndexedArray_fill_count",
+                            nextindex.dtype.type,
+                        ](
+                            nextindex.data,
+                            length_so_far,
+                            array.length,
+                            contentlength_so_far,
+                        )
                     )
-                )
                 contentlength_so_far += array.length
                 length_so_far += array.length
 
+        if vectorized:
+            data = nextindex.data
+            index_nplike.concatenate(indexes, out=data)
+            missing = data < 0
+            data += index_nplike.repeat(
+                index_nplike.asarray(shifts, dtype=np.int64), lengths
+            )
+            data[missing] = -1
+
         tail_contents = contents[1:]
         nextcontent = contents[0].mergemany(tail_contents)
         next = ak._v2.contents.indexedoptionarray.IndexedOptionArray(
@@ -1667,13 +1713,8 @@ class IndexedOptionArray(Content):
         nextcontent = self._content._carry(
             ak._v2.index.Index(index[not_missing]), False
         )
-        out = nextcontent._to_list(behavior, json_conversions)
-
-        for i, isvalid in enumerate(not_missing):
-            if not isvalid:
-                out.insert(i, None)
-
-        return out
+        content = iter(nextcontent._to_list(behavior, json_conversions))
+        return [next(content) if x else None for x in not_missing.tolist()]
 
     def _to_nplike(self, nplike):
         index = self._index._to_nplike(nplike)
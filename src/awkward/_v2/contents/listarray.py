@@ -942,6 +942,90 @@ class ListArray(Content):
 
         head, tail = self._merging_strategy(others)
 
+        if self._nplike.known_data:
+            next = self._mergemany_vectorized(head)
+        else:
+            next = self._mergemany_kernels(head)
+
+        if len(tail) == 0:
+            return next
+
+        reversed = tail[0]._reverse_merge(next)
+        if len(tail) == 1:
+            return reversed
+        else:
+            return reversed.mergemany(tail[1:])
+
+    def _mergemany_vectorized(self, head):
+        # one pass over the chunks to collect their starts and stops, then the
+        # output index is filled with a single concatenate and a single
+        # (repeated) shift, instead of a kernel call for each chunk
+        index_nplike = self._nplike.index_nplike
+        parameters = self._parameters
+
+        contents, starts, stops, lengths, shifts = [], [], [], [], []
+        contentlength_so_far = 0
+        for array in head:
+            parameters = ak._v2._util.merge_parameters(
+                self._parameters, array._parameters, True
+            )
+            if isinstance(array, ak._v2.contents.listoffsetarray.ListOffsetArray):
+                array_offsets = array.offsets.data
+                starts.append(array_offsets[:-1])
+                stops.append(array_offsets[1:])
+
+            elif isinstance(array, ak._v2.contents.listarray.ListArray):
+                starts.append(array.starts.data[: array.length])
+                stops.append(array.stops.data[: array.length])
+
+            elif isinstance(array, ak._v2.contents.regulararray.RegularArray):
+                array_starts = (
+                    index_nplike.arange(array.length, dtype=np.int64) * array.size
+                )
+                starts.append(array_starts)
+                stops.append(array_starts + array.size)
+
+            elif isinstance(array, ak._v2.contents.emptyarray.EmptyArray):
+                continue
+
+            else:
+                raise ak._v2._util.error(
+                    ValueError(
+                        "cannot merge "
+                        + type(self).__name__
+                        + " with "
+                        + type(array).__name__
+                        + "."
+                    )
+                )
+
+            contents.append(array.content)
+            lengths.append(array.length)
+            shifts.append(contentlength_so_far)
+            contentlength_so_far += array.content.length
+
+        nextcontent = contents[0].mergemany(contents[1:])
+
+        shift = index_nplike.repeat(
+            index_nplike.asarray(shifts, dtype=np.int64), lengths
+        )
+        nextstarts = index_nplike.empty(len(shift), dtype=np.int64)
+        nextstops = index_nplike.empty(len(shift), dtype=np.int64)
+        index_nplike.concatenate(starts, out=nextstarts)
+        index_nplike.concatenate(stops, out=nextstops)
+        nextstarts += shift
+        nextstops += shift
+
+        return ak._v2.contents.listarray.ListArray(
+            ak._v2.index.Index64(nextstarts, nplike=self._nplike),
+            ak._v2.index.Index64(nextstops, nplike=self._nplike),
+            nextcontent,
+            None,
+            parameters,
+            self._nplike,
+        )
+
+    def _mergemany_kernels(self, head):
         total_length = 0
         for array in head:
             total_length += array.length
@@ -1059,19 +1143,10 @@ class ListArray(Content):
             elif isinstance(array, ak._v2.contents.emptyarray.EmptyArray):
                 pass
 
-        next = ak._v2.contents.listarray.ListArray(
+        return ak._v2.contents.listarray.ListArray(
             nextstarts, nextstops, nextcontent, None, parameters, self._nplike
         )
 
-        if len(tail) == 0:
-            return next
-
-        reversed = tail[0]._reverse_merge(next)
-        if len(tail) == 1:
-            return reversed
-        else:
-            return reversed.mergemany(tail[1:])
-
     def fill_none(self, value):
         return ListArray(
             self._starts,
@@ -2112,32 +2112,14 @@ class ListOffsetArray(Content):
             convert_bytes = (
                 None if json_conversions is None else json_conversions["convert_bytes"]
             )
-            content = ak._v2._util.tobytes(nextcontent.data)
-            out = [None] * starts.length
-            if convert_bytes is None:
-                for i in range(starts.length):
-                    out[i] = content[starts_data[i] : stops_data[i]]
-            else:
-                for i in range(starts.length):
-                    out[i] = convert_bytes(content[starts_data[i] : stops_data[i]])
-            return out
+            return ak._v2._util.tolist_bytestrings(
+                nextcontent.data, starts_data, stops_data, convert_bytes
+            )
 
         elif self.parameter("__array__") == "string":
-            data = nextcontent.data
-            if hasattr(data, "tobytes"):
-
-                def tostring(x):
-                    return x.tobytes().decode(errors="surrogateescape")
-
-            else:
-
-                def tostring(x):
-                    return x.tostring().decode(errors="surrogateescape")
-
-            out = [None] * starts.length
-            for i in range(starts.length):
-                out[i] = tostring(data[starts_data[i] : stops_data[i]])
-            return out
+            return ak._v2._util.tolist_strings(
+                nextcontent.data, starts_data, stops_data
+            )
 
         else:
             out = self._to_list_custom(behavior, json_conversions)
@@ -2145,11 +2127,7 @@ class ListOffsetArray(Content):
                 return out
 
             content = nextcontent._to_list(behavior, json_conversions)
-            out = [None] * starts.length
-
-            for i in range(starts.length):
-                out[i] = content[starts_data[i] : stops_data[i]]
-            return out
+            return ak._v2._util.tolist_sublists(content, starts_data, stops_data)
 
     def _to_nplike(self, nplike):
         offsets = self._offsets._to_nplike(nplike)
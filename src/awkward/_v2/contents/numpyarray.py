@@ -1130,7 +1130,9 @@ class NumpyArray(Content):
         out = reducer.apply(self, parents, outlength)
 
         if reducer.needs_position:
-            if shifts is None:
+            if isinstance(self.nplike, ak.nplike.Jax):
+                out = reducer.adjust_starts(out, parents, starts, shifts)
+            elif shifts is None:
                 assert (
                     out.nplike is self._nplike
                     and parents.nplike is self._nplike
@@ -18,6 +18,12 @@ numpy = ak.nplike.Numpy.instance()
 class RecordArray(Content):
     is_RecordType = True
 
+    # Policy for eager carries (e.g. projecting an IndexedArray of records):
+    # records with at least this many fields do not copy every field, but
+    # share one IndexedArray view per field, which is only carried when that
+    # field is used. If None, eager carries always copy all fields.
+    lazy_carry_min_fields = 8
+
     def __init__(
         self,
         contents,
@@ -343,23 +349,32 @@ class RecordArray(Content):
             self._nplike,
         )
 
-    def _carry(self, carry, allow_lazy):
-        assert isinstance(carry, ak._v2.index.Index)
+    def _carry_nextindex(self, carry, allow_lazy):
+        where = carry.data
 
-        if allow_lazy:
-            where = carry.data
+        if allow_lazy != "copied":
+            where = where.copy()
+
+        negative = where < 0
+        if self._nplike.index_nplike.any(negative, prefer=False):
+            where[negative] += self._length
 
-            if allow_lazy != "copied":
-                where = where.copy()
+        if self._nplike.index_nplike.any(where >= self._length, prefer=False):
+            raise ak._v2._util.indexerror(self, where)
 
-            negative = where < 0
-            if self._nplike.index_nplike.any(negative, prefer=False):
-                where[negative] += self._length
+        return ak._v2.index.Index64(where, nplike=self.nplike)
 
-            if self._nplike.index_nplike.any(where >= self._length, prefer=False):
-                raise ak._v2._util.indexerror(self, where)
+    def _carry_lazily_per_field(self):
+        return (
+            self.lazy_carry_min_fields is not None
+            and len(self._contents) >= self.lazy_carry_min_fields
+        )
+
+    def _carry(self, carry, allow_lazy):
+        assert isinstance(carry, ak._v2.index.Index)
 
-            nextindex = ak._v2.index.Index64(where, nplike=self.nplike)
+        if allow_lazy:
+            nextindex = self._carry_nextindex(carry, allow_lazy)
             return ak._v2.contents.indexedarray.IndexedArray(
                 nextindex,
                 self,
@@ -368,6 +383,37 @@ class RecordArray(Content):
                 self._nplike,
             )
 
+        elif self._carry_lazily_per_field():
+            nextindex = self._carry_nextindex(carry, allow_lazy)
+            contents = []
+            for content in self._contents:
+                if isinstance(
+                    content,
+                    (
+                        ak._v2.contents.NumpyArray,
+                        ak._v2.contents.ListArray,
+                        ak._v2.contents.ListOffsetArray,
+                        ak._v2.contents.RegularArray,
+                    ),
+                ):
+                    contents.append(
+                        ak._v2.contents.indexedarray.IndexedArray(
+                            nextindex, content, None, None, self._nplike
+                        )
+                    )
+                else:
+                    # indexed, option, record, and union types carry cheaply
+                    contents.append(content._carry(nextindex, True))
+
+            return RecordArray(
+                contents,
+                self._fields,
+                nextindex.length,
+                self._carry_identifier(carry),
+                self._parameters,
+                self._nplike,
+            )
+
         else:
             contents = [
                 self.content(i)._carry(carry, allow_lazy)
@@ -565,9 +611,8 @@ class RecordArray(Content):
         headless = head[1:]
 
         for_each_field = []
-        for field in self.contents:
-            trimmed = field[0 : self.length]
-            for_each_field.append([field])
+        for i in range(len(self._contents)):
+            for_each_field.append([self.content(i)])
 
         if self.is_tuple:
             for array in headless:
@@ -579,8 +624,8 @@ class RecordArray(Content):
                     if self.is_tuple:
                         if len(self.contents) == len(array.contents):
                             for i in range(len(self.contents)):
-                                field = array[self.index_to_field(i)]
-                                for_each_field[i].append(field[0 : array.length])
+                                field = array.content(self.index_to_field(i))
+                                for_each_field[i].append(field)
                         else:
                             raise ak._v2._util.error(
                                 ValueError(
@@ -615,10 +660,8 @@ class RecordArray(Content):
 
                         if these_fields == those_fields:
                             for i in range(len(self.contents)):
-                                field = array[self.index_to_field(i)]
-
-                                trimmed = field[0 : array.length]
-                                for_each_field[i].append(trimmed)
+                                field = array.content(self.index_to_field(i))
+                                for_each_field[i].append(field)
                         else:
                             raise ak._v2._util.error(
                                 AssertionError(
@@ -1021,24 +1064,25 @@ class RecordArray(Content):
         if out is not None:
             return out
 
+        contents = [
+            x._getitem_range(slice(0, self._length))._to_list(
+                behavior, json_conversions
+            )
+            for x in self._contents
+        ]
+
         if self.is_tuple and json_conversions is None:
-            contents = [x._to_list(behavior, json_conversions) for x in self._contents]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = tuple(x[i] for x in contents)
-            return out
+            if len(contents) == 0:
+                return [()] * self._length
+            return list(zip(*contents))
 
         else:
             fields = self._fields
             if fields is None:
                 fields = [str(i) for i in range(len(self._contents))]
-            contents = [x._to_list(behavior, json_conversions) for x in self._contents]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = dict(zip(fields, [x[i] for x in contents]))
-            return out
+            if len(contents) == 0:
+                return [{} for _ in range(self._length)]
+            return [dict(zip(fields, x)) for x in zip(*contents)]
 
     def _to_nplike(self, nplike):
         contents = [content._to_nplike(nplike) for content in self._contents]
@@ -1219,38 +1219,19 @@ class RegularArray(Content):
         )
 
     def _to_list(self, behavior, json_conversions):
+        starts = numpy.arange(self._length, dtype=np.int64) * self._size
+        stops = starts + self._size
+
         if self.parameter("__array__") == "bytestring":
             convert_bytes = (
                 None if json_conversions is None else json_conversions["convert_bytes"]
             )
-            content = ak._v2._util.tobytes(self._content.data)
-            length, size = self._length, self._size
-            out = [None] * length
-            if convert_bytes is None:
-                for i in range(length):
-                    out[i] = content[(i) * size : (i + 1) * size]
-            else:
-                for i in range(length):
-                    out[i] = convert_bytes(content[(i) * size : (i + 1) * size])
-            return out
+            return ak._v2._util.tolist_bytestrings(
+                self._content.data, starts, stops, convert_bytes
+            )
 
         elif self.parameter("__array__") == "string":
-            data = self._content.data
-            if hasattr(data, "tobytes"):
-
-                def tostring(x):
-                    return x.tobytes().decode(errors="surrogateescape")
-
-            else:
-
-                def tostring(x):
-                    return x.tostring().decode(errors="surrogateescape")
-
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = tostring(data[(i) * size : (i + 1) * size])
-            return out
+            return ak._v2._util.tolist_strings(self._content.data, starts, stops)
 
         else:
             out = self._to_list_custom(behavior, json_conversions)
@@ -1258,11 +1239,7 @@ class RegularArray(Content):
                 return out
 
             content = self._content._to_list(behavior, json_conversions)
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size]
-            return out
+            return ak._v2._util.tolist_sublists(content, starts, stops)
 
     def _to_nplike(self, nplike):
         content = self._content._to_nplike(nplike)
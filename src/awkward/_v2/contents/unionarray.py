@@ -1407,10 +1407,10 @@ class UnionArray(Content):
         index = self._index.raw(numpy)
         contents = [x._to_list(behavior, json_conversions) for x in self._contents]
 
-        out = [None] * tags.shape[0]
-        for i, tag in enumerate(tags):
-            out[i] = contents[tag][index[i]]
-        return out
+        return [
+            contents[tag][i]
+            for tag, i in zip(tags.tolist(), index[: len(tags)].tolist())
+        ]
 
     def _to_nplike(self, nplike):
         index = self._index._to_nplike(nplike)
@@ -0,0 +1,800 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import math
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+_index_to_dtype = {
+    "i8": np.dtype(np.int8),
+    "u8": np.dtype(np.uint8),
+    "i32": np.dtype(np.int32),
+    "u32": np.dtype(np.uint32),
+    "i64": np.dtype(np.int64),
+}
+
+
+class GrowableArray:
+    """
+    Args:
+        form (#ak.forms.Form, dict, JSON str, or array): The type of the array
+            to grow, as a Form, or an array whose Form is used (but whose data
+            are not appended; pass it to #extend for that).
+        initial (int): Initial size (in items) of the buffers.
+        resize (float): Resize multiplier for the buffers; should be strictly
+            greater than 1.
+
+    An array of a fixed type that can be grown in place by #append and
+    #extend. Each node of the Form has its own buffers, which are
+    over-allocated by a factor of `resize` whenever they fill up, so appending
+    an array costs time proportional to its length (amortized), rather than to
+    the length of everything appended so far, as #ak.concatenate would.
+
+    #snapshot returns a normal array that views the filled part of the buffers
+    without copying them. Later appends only write beyond that part (or into
+    new buffers, when they have to grow), so a snapshot never changes.
+
+    The appended arrays don't need to have exactly the same Form: any list
+    type fits a ListOffsetForm or ListForm (and a RegularForm, if its lists
+    have the right size), any option type fits an option type, numbers are
+    cast if their kind is preserved (NumPy's "same_kind" casting) and integers
+    fit in the Form's type, and records need the same fields, in any order. If
+    an array doesn't fit, an error is raised and nothing is appended.
+
+    Categorical forms (see #ak.to_categorical) keep each category once:
+    appended values are matched against the categories so far and only new
+    ones are added.
+
+    UnionForm, BitMaskedForm, EmptyForm, and forms with identifiers are not
+    supported.
+    """
+
+    def __init__(self, form, initial=1024, resize=2.0):
+        if isinstance(form, (ak._v2.highlevel.Array, ak._v2.contents.Content)):
+            form = ak._v2.operations.to_layout(form, allow_record=False).form
+        elif ak._v2._util.isstr(form):
+            form = ak._v2.forms.from_json(form)
+        elif isinstance(form, dict):
+            form = ak._v2.forms.from_iter(form)
+        if not isinstance(form, ak._v2.forms.Form):
+            raise ak._v2._util.error(
+                TypeError(
+                    f"form must be a Form, dict, JSON str, or array, not {form!r}"
+                )
+            )
+        if not resize > 1:
+            raise ak._v2._util.error(
+                ValueError(f"resize must be strictly greater than 1, not {resize}")
+            )
+
+        self._form = form
+        self._root = _node(form, max(int(initial), 1), float(resize))
+
+    @property
+    def form(self):
+        """
+        The Form of the arrays made by #snapshot.
+        """
+        return self._form
+
+    def __len__(self):
+        return self._root.length
+
+    def __repr__(self):
+        return f"<GrowableArray of {len(self)} items with Form {self._form.to_json()}>"
+
+    def append(self, item):
+        """
+        Adds one item: a record (#ak.Record), a list (an array, which is
+        appended as a single list), or a Python value.
+        """
+        if isinstance(item, (ak._v2.highlevel.Record, ak._v2.record.Record)):
+            record = ak._v2.operations.to_layout(item, allow_record=True)
+            layout = record.array[record.at : record.at + 1]
+        elif isinstance(
+            item,
+            (ak._v2.highlevel.Array, ak._v2.contents.Content, numpy.ndarray),
+        ):
+            content = _to_layout(item)
+            layout = ak._v2.contents.RegularArray(content, content.length, 1)
+        else:
+            layout = ak._v2.operations.from_iter([item], highlevel=False)
+        self._extend(layout)
+
+    def extend(self, array):
+        """
+        Adds all of the items of an array (or anything that can be converted
+        into one with #ak.to_layout).
+        """
+        self._extend(_to_layout(array))
+
+    def _extend(self, layout):
+        if not isinstance(layout.nplike, ak.nplike.Numpy):
+            raise ak._v2._util.error(
+                ValueError("only arrays in main memory can be appended")
+            )
+        # all of the checks (and conversions) are done before anything is
+        # appended to any of the buffers
+        self._root.prepare(layout)()
+
+    def snapshot(self, highlevel=True, behavior=None):
+        """
+        Args:
+            highlevel (bool): If True, return an #ak.Array; otherwise, return
+                a low-level #ak.contents.Content subclass.
+            behavior (None or dict): Custom #ak.behavior for the output array, if
+                high-level.
+
+        Returns an array of the items that have been appended so far, as a view
+        of the buffers (no data are copied).
+        """
+        return ak._v2._util.wrap(self._root.snapshot(), behavior, highlevel)
+
+
+def _to_layout(array):
+    # skips the operation (and its error context) for what is already an array
+    if isinstance(array, ak._v2.highlevel.Array):
+        return array.layout
+    elif isinstance(array, ak._v2.contents.Content):
+        return array
+    else:
+        return ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+
+
+class _Buffer:
+    # only the first `length` items of `data` are filled, and they are never
+    # written again, so that views of them (snapshots) don't change
+
+    def __init__(self, dtype, initial, resize, inner_shape=()):
+        self._data = numpy.empty((initial,) + inner_shape, dtype=dtype)
+        self._length = 0
+        self._resize = resize
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    @property
+    def inner_shape(self):
+        return self._data.shape[1:]
+
+    def extend(self, values):
+        stop = self._length + len(values)
+        if stop > len(self._data):
+            capacity = max(math.ceil(len(self._data) * self._resize), stop)
+            data = numpy.empty((capacity,) + self.inner_shape, dtype=self.dtype)
+            data[: self._length] = self._data[: self._length]
+            self._data = data
+        self._data[self._length : stop] = values
+        self._length = stop
+
+    def view(self):
+        return self._data[: self._length]
+
+
+def _node(form, initial, resize):
+    if form.has_identifier:
+        raise ak._v2._util.error(
+            NotImplementedError("GrowableArray of a Form with identifiers")
+        )
+    if isinstance(form, ak._v2.forms.NumpyForm):
+        return _NumpyNode(form, initial, resize)
+    elif isinstance(form, ak._v2.forms.ListOffsetForm):
+        return _ListOffsetNode(form, initial, resize)
+    elif isinstance(form, ak._v2.forms.ListForm):
+        return _ListNode(form, initial, resize)
+    elif isinstance(form, ak._v2.forms.RegularForm):
+        return _RegularNode(form, initial, resize)
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        return _RecordNode(form, initial, resize)
+    elif (
+        isinstance(form, (ak._v2.forms.IndexedForm, ak._v2.forms.IndexedOptionForm))
+        and form.parameter("__array__") == "categorical"
+    ):
+        return _CategoricalNode(form, initial, resize)
+    elif isinstance(form, ak._v2.forms.IndexedForm):
+        return _IndexedNode(form, initial, resize)
+    elif isinstance(form, ak._v2.forms.IndexedOptionForm):
+        return _IndexedOptionNode(form, initial, resize)
+    elif isinstance(form, ak._v2.forms.ByteMaskedForm):
+        return _ByteMaskedNode(form, initial, resize)
+    elif isinstance(form, ak._v2.forms.UnmaskedForm):
+        return _UnmaskedNode(form, initial, resize)
+    else:
+        raise ak._v2._util.error(
+            NotImplementedError(f"GrowableArray of a {type(form).__name__}")
+        )
+
+
+def _to_offsets(layout):
+    # any list type, as offsets that start at zero and the content they cover
+    if isinstance(layout, ak._v2.contents.NumpyArray) and layout.data.ndim > 1:
+        layout = layout.toRegularArray()
+    if isinstance(layout, (ak._v2.contents.ListArray, ak._v2.contents.RegularArray)):
+        layout = layout.toListOffsetArray64(True)
+    if not isinstance(layout, ak._v2.contents.ListOffsetArray):
+        return None, None
+
+    offsets = numpy.asarray(layout.offsets.data, dtype=np.int64)
+    start, stop = int(offsets[0]), int(offsets[-1])
+    return offsets - start, layout.content._getitem_range(slice(start, stop))
+
+
+def _check_fits(values, dtype):
+    if len(values) != 0 and values[-1] > np.iinfo(dtype).max:
+        raise ak._v2._util.error(
+            ValueError(f"too many items for the Form's {dtype} index")
+        )
+
+
+class _Node:
+    # prepare(layout) checks and converts layout without changing anything and
+    # returns a function that appends it; placeholder(n) does the same for n
+    # items that will be masked by an option-type parent
+
+    def __init__(self, form, initial, resize):
+        self._form = form
+
+    def _incompatible(self, layout):
+        return "cannot append a {} where the Form has a {}".format(
+            type(layout).__name__, type(self._form).__name__
+        )
+
+    def _project(self, layout):
+        # removes indirection that the Form doesn't have
+        if isinstance(layout, ak._v2.contents.IndexedArray):
+            layout = layout.project()
+        elif layout.is_OptionType:
+            projected = layout.project()
+            if projected.length != layout.length:
+                raise ak._v2._util.error(
+                    ValueError(
+                        "cannot append missing values where the Form has a {}".format(
+                            type(self._form).__name__
+                        )
+                    )
+                )
+            layout = projected
+        return layout
+
+
+class _NumpyNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        dtype = ak._v2.types.numpytype.primitive_to_dtype(form.primitive)
+        self._data = _Buffer(dtype, initial, resize, tuple(form.inner_shape))
+
+    @property
+    def length(self):
+        return len(self._data)
+
+    def prepare(self, layout):
+        layout = self._project(layout)
+        if isinstance(layout, ak._v2.contents.EmptyArray):
+            return self.placeholder(0)
+        if self._data.inner_shape != () and isinstance(
+            layout,
+            (
+                ak._v2.contents.ListOffsetArray,
+                ak._v2.contents.ListArray,
+                ak._v2.contents.RegularArray,
+            ),
+        ):
+            regular = layout.toRegularArray()
+            regular = ak._v2.contents.RegularArray(
+                regular.content._getitem_range(slice(0, regular.length * regular.size)),
+                regular.size,
+                regular.length,
+            )
+            layout = regular.maybe_toNumpyArray() or layout
+        if not isinstance(layout, ak._v2.contents.NumpyArray):
+            raise ak._v2._util.error(ValueError(self._incompatible(layout)))
+
+        data = layout.data
+        if data.shape[1:] != self._data.inner_shape:
+            raise ak._v2._util.error(
+                ValueError(
+                    f"cannot append an array of inner shape {data.shape[1:]} "
+                    f"where the Form has inner shape {self._data.inner_shape}"
+                )
+            )
+        if not ak.nplike.numpy.can_cast(data.dtype, self._data.dtype, "same_kind"):
+            raise ak._v2._util.error(
+                ValueError(
+                    f"cannot append {data.dtype} values where the Form has "
+                    f"{self._data.dtype}"
+                )
+            )
+        if (
+            data.dtype.kind in ("i", "u")
+            and self._data.dtype.kind in ("i", "u")
+            and not ak.nplike.numpy.can_cast(data.dtype, self._data.dtype, "safe")
+            and data.size != 0
+        ):
+            # integers are only narrowed if they fit, rather than wrapping around
+            info = np.iinfo(self._data.dtype)
+            if data.min() < info.min or data.max() > info.max:
+                raise ak._v2._util.error(
+                    ValueError(
+                        f"cannot append {data.dtype} values outside the range of "
+                        f"the Form's {self._data.dtype}"
+                    )
+                )
+        return lambda: self._data.extend(data)
+
+    def placeholder(self, n):
+        data = numpy.zeros((n,) + self._data.inner_shape, dtype=self._data.dtype)
+        return lambda: self._data.extend(data)
+
+    def snapshot(self):
+        return ak._v2.contents.NumpyArray(
+            self._data.view(), None, self._form.parameters
+        )
+
+
+class _ListOffsetNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._offsets = _Buffer(_index_to_dtype[form.offsets], initial + 1, resize)
+        self._offsets.extend([0])
+        self._content = _node(form.content, initial, resize)
+
+    @property
+    def length(self):
+        return len(self._offsets) - 1
+
+    def prepare(self, layout):
+        layout = self._project(layout)
+        if isinstance(layout, ak._v2.contents.EmptyArray):
+            return self.placeholder(0)
+        offsets, content = _to_offsets(layout)
+        if offsets is None:
+            raise ak._v2._util.error(ValueError(self._incompatible(layout)))
+
+        fill = self._content.prepare(content)
+        offsets = offsets[1:] + self._content.length
+        _check_fits(offsets, self._offsets.dtype)
+
+        def append():
+            fill()
+            self._offsets.extend(offsets)
+
+        return append
+
+    def placeholder(self, n):
+        offsets = numpy.full(n, self._content.length, dtype=np.int64)
+        return lambda: self._offsets.extend(offsets)
+
+    def snapshot(self):
+        return ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index(self._offsets.view()),
+            self._content.snapshot(),
+            None,
+            self._form.parameters,
+        )
+
+
+class _ListNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._starts = _Buffer(_index_to_dtype[form.starts], initial, resize)
+        self._stops = _Buffer(_index_to_dtype[form.stops], initial, resize)
+        self._content = _node(form.content, initial, resize)
+
+    @property
+    def length(self):
+        return len(self._starts)
+
+    def prepare(self, layout):
+        layout = self._project(layout)
+        if isinstance(layout, ak._v2.contents.EmptyArray):
+            return self.placeholder(0)
+        offsets, content = _to_offsets(layout)
+        if offsets is None:
+            raise ak._v2._util.error(ValueError(self._incompatible(layout)))
+
+        fill = self._content.prepare(content)
+        offsets = offsets + self._content.length
+        _check_fits(offsets, self._starts.dtype)
+        _check_fits(offsets, self._stops.dtype)
+
+        def append():
+            fill()
+            self._starts.extend(offsets[:-1])
+            self._stops.extend(offsets[1:])
+
+        return append
+
+    def placeholder(self, n):
+        starts = numpy.full(n, self._content.length, dtype=np.int64)
+
+        def append():
+            self._starts.extend(starts)
+            self._stops.extend(starts)
+
+        return append
+
+    def snapshot(self):
+        return ak._v2.contents.ListArray(
+            ak._v2.index.Index(self._starts.view()),
+            ak._v2.index.Index(self._stops.view()),
+            self._content.snapshot(),
+            None,
+            self._form.parameters,
+        )
+
+
+class _RegularNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._length = 0
+        self._content = _node(form.content, initial, resize)
+
+    @property
+    def length(self):
+        return self._length
+
+    def prepare(self, layout):
+        layout = self._project(layout)
+        if isinstance(layout, ak._v2.contents.EmptyArray):
+            return self.placeholder(0)
+        if isinstance(
+            layout, (ak._v2.contents.ListOffsetArray, ak._v2.contents.ListArray)
+        ) or (isinstance(layout, ak._v2.contents.NumpyArray) and layout.data.ndim > 1):
+            layout = layout.toRegularArray()
+        if not isinstance(layout, ak._v2.contents.RegularArray):
+            raise ak._v2._util.error(ValueError(self._incompatible(layout)))
+        if layout.size != self._form.size:
+            raise ak._v2._util.error(
+                ValueError(
+                    f"cannot append lists of size {layout.size} where the Form "
+                    f"has size {self._form.size}"
+                )
+            )
+
+        n = layout.length
+        fill = self._content.prepare(
+            layout.content._getitem_range(slice(0, n * layout.size))
+        )
+
+        def append():
+            fill()
+            self._length += n
+
+        return append
+
+    def placeholder(self, n):
+        fill = self._content.placeholder(n * self._form.size)
+
+        def append():
+            fill()
+            self._length += n
+
+        return append
+
+    def snapshot(self):
+        return ak._v2.contents.RegularArray(
+            self._content.snapshot(),
+            self._form.size,
+            self._length,
+            None,
+            self._form.parameters,
+        )
+
+
+class _RecordNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._length = 0
+        self._contents = [_node(x, initial, resize) for x in form.contents]
+
+    @property
+    def length(self):
+        return self._length
+
+    def prepare(self, layout):
+        layout = self._project(layout)
+        if isinstance(layout, ak._v2.contents.EmptyArray):
+            return self.placeholder(0)
+        if not isinstance(layout, ak._v2.contents.RecordArray):
+            raise ak._v2._util.error(ValueError(self._incompatible(layout)))
+        if layout.is_tuple != self._form.is_tuple or sorted(layout.fields) != sorted(
+            self._form.fields
+        ):
+            raise ak._v2._util.error(
+                ValueError(
+                    f"cannot append records with fields {layout.fields} where "
+                    f"the Form has fields {self._form.fields}"
+                )
+            )
+
+        n = layout.length
+        fills = [
+            node.prepare(layout.content(field))
+            for node, field in zip(self._contents, self._form.fields)
+        ]
+
+        def append():
+            for fill in fills:
+                fill()
+            self._length += n
+
+        return append
+
+    def placeholder(self, n):
+        fills = [node.placeholder(n) for node in self._contents]
+
+        def append():
+            for fill in fills:
+                fill()
+            self._length += n
+
+        return append
+
+    def snapshot(self):
+        return ak._v2.contents.RecordArray(
+            [node.snapshot() for node in self._contents],
+            None if self._form.is_tuple else self._form.fields,
+            self._length,
+            None,
+            self._form.parameters,
+        )
+
+
+class _IndexedNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._index = _Buffer(_index_to_dtype[form.index], initial, resize)
+        self._content = _node(form.content, initial, resize)
+
+    @property
+    def length(self):
+        return len(self._index)
+
+    def prepare(self, layout):
+        layout = self._project(layout)
+        if isinstance(layout, ak._v2.contents.EmptyArray):
+            return self.placeholder(0)
+        return self._append(layout.length, self._content.prepare(layout))
+
+    def placeholder(self, n):
+        return self._append(n, self._content.placeholder(n))
+
+    def _append(self, n, fill):
+        index = numpy.arange(n, dtype=np.int64) + self._content.length
+        _check_fits(index, self._index.dtype)
+
+        def append():
+            fill()
+            self._index.extend(index)
+
+        return append
+
+    def snapshot(self):
+        return ak._v2.contents.IndexedArray(
+            ak._v2.index.Index(self._index.view()),
+            self._content.snapshot(),
+            None,
+            self._form.parameters,
+        )
+
+
+class _IndexedOptionNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._index = _Buffer(_index_to_dtype[form.index], initial, resize)
+        self._content = _node(form.content, initial, resize)
+
+    @property
+    def length(self):
+        return len(self._index)
+
+    def prepare(self, layout):
+        if isinstance(layout, ak._v2.contents.IndexedArray):
+            layout = layout.project()
+
+        if layout.is_OptionType:
+            valid = layout.mask_as_bool(valid_when=True)[: layout.length]
+            fill = self._content.prepare(layout.project())
+            index = numpy.cumsum(valid) - 1 + self._content.length
+            index = numpy.where(valid, index, -1)
+        else:
+            fill = self._content.prepare(layout)
+            index = numpy.arange(layout.length, dtype=np.int64) + self._content.length
+        _check_fits(index, self._index.dtype)
+
+        def append():
+            fill()
+            self._index.extend(index)
+
+        return append
+
+    def placeholder(self, n):
+        index = numpy.full(n, -1, dtype=np.int64)
+        return lambda: self._index.extend(index)
+
+    def snapshot(self):
+        return ak._v2.contents.IndexedOptionArray(
+            ak._v2.index.Index(self._index.view()),
+            self._content.snapshot(),
+            None,
+            self._form.parameters,
+        )
+
+
+class _CategoricalNode(_Node):
+    # the content has each category once: appended values are matched against
+    # the categories so far and only new ones are added to the content
+
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._index = _Buffer(_index_to_dtype[form.index], initial, resize)
+        self._content = _node(form.content, initial, resize)
+
+    @property
+    def length(self):
+        return len(self._index)
+
+    def prepare(self, layout):
+        if isinstance(layout, ak._v2.contents.EmptyArray):
+            return self.placeholder(0)
+
+        if isinstance(
+            layout, (ak._v2.contents.IndexedArray, ak._v2.contents.IndexedOptionArray)
+        ):
+            categories = layout.content
+            index = numpy.asarray(layout.index.data[: layout.length], dtype=np.int64)
+        elif layout.is_OptionType:
+            valid = layout.mask_as_bool(valid_when=True)[: layout.length]
+            categories = layout.project()
+            index = numpy.where(valid, numpy.cumsum(valid) - 1, -1)
+        else:
+            categories = layout
+            index = numpy.arange(layout.length, dtype=np.int64)
+
+        if not self._form.is_OptionType and numpy.any(index < 0):
+            raise ak._v2._util.error(
+                ValueError(
+                    "cannot append missing values where the Form has a {}".format(
+                        type(self._form).__name__
+                    )
+                )
+            )
+
+        existing = self._content.snapshot()
+        merged, (_, mapping) = ak._v2.behaviors.categorical._merge_categories(
+            [existing, categories]
+        )
+        fill = self._content.prepare(
+            merged._getitem_range(slice(existing.length, merged.length))
+        )
+        index = ak._v2.behaviors.categorical._remap(mapping, index)
+        _check_fits(index, self._index.dtype)
+
+        def append():
+            fill()
+            self._index.extend(index)
+
+        return append
+
+    def placeholder(self, n):
+        if self._form.is_OptionType:
+            index = numpy.full(n, -1, dtype=np.int64)
+            return lambda: self._index.extend(index)
+
+        # masked by an option-type parent, so any category will do
+        index = numpy.zeros(n, dtype=np.int64)
+        if n == 0 or self._content.length != 0:
+            return lambda: self._index.extend(index)
+        fill = self._content.placeholder(1)
+
+        def append():
+            fill()
+            self._index.extend(index)
+
+        return append
+
+    def snapshot(self):
+        if self._form.is_OptionType:
+            cls = ak._v2.contents.IndexedOptionArray
+        else:
+            cls = ak._v2.contents.IndexedArray
+        return cls(
+            ak._v2.index.Index(self._index.view()),
+            self._content.snapshot(),
+            None,
+            self._form.parameters,
+        )
+
+
+class _ByteMaskedNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._mask = _Buffer(np.int8, initial, resize)
+        self._content = _node(form.content, initial, resize)
+
+    @property
+    def length(self):
+        return len(self._mask)
+
+    def prepare(self, layout):
+        if isinstance(layout, ak._v2.contents.IndexedArray):
+            layout = layout.project()
+
+        n = layout.length
+        if isinstance(
+            layout,
+            (
+                ak._v2.contents.ByteMaskedArray,
+                ak._v2.contents.BitMaskedArray,
+                ak._v2.contents.UnmaskedArray,
+            ),
+        ):
+            valid = layout.mask_as_bool(valid_when=True)[:n]
+            fill = self._content.prepare(layout.content._getitem_range(slice(0, n)))
+        elif isinstance(layout, ak._v2.contents.IndexedOptionArray):
+            valid = layout.mask_as_bool(valid_when=True)[:n]
+            if layout.content.length == 0:
+                fill = self._content.placeholder(n)
+            else:
+                # missing values are filled with the content's first item
+                carry = numpy.where(valid, layout.index.data[:n], 0)
+                fill = self._content.prepare(
+                    layout.content._carry(ak._v2.index.Index64(carry), False)
+                )
+        else:
+            valid = numpy.ones(n, dtype=np.bool_)
+            fill = self._content.prepare(layout)
+
+        mask = valid if self._form.valid_when else ~valid
+
+        def append():
+            fill()
+            self._mask.extend(mask)
+
+        return append
+
+    def placeholder(self, n):
+        mask = numpy.full(n, not self._form.valid_when, dtype=np.int8)
+        fill = self._content.placeholder(n)
+
+        def append():
+            fill()
+            self._mask.extend(mask)
+
+        return append
+
+    def snapshot(self):
+        return ak._v2.contents.ByteMaskedArray(
+            ak._v2.index.Index8(self._mask.view()),
+            self._content.snapshot(),
+            self._form.valid_when,
+            None,
+            self._form.parameters,
+        )
+
+
+class _UnmaskedNode(_Node):
+    def __init__(self, form, initial, resize):
+        super().__init__(form, initial, resize)
+        self._content = _node(form.content, initial, resize)
+
+    @property
+    def length(self):
+        return self._content.length
+
+    def prepare(self, layout):
+        return self._content.prepare(self._project(layout))
+
+    def placeholder(self, n):
+        return self._content.placeholder(n)
+
+    def snapshot(self):
+        return ak._v2.contents.UnmaskedArray(
+            self._content.snapshot(), None, self._form.parameters
+        )
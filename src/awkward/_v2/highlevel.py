@@ -305,6 +305,7 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
         if isinstance(layout, ak._v2.contents.Content):
             self._layout = layout
             self._numbaview = None
+            self._field_projections = {}
         else:
             raise ak._v2._util.error(
                 TypeError("layout must be a subclass of ak._v2.contents.Content")
@@ -541,6 +542,28 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
                 else:
                     yield x
 
+    def iter_batches(self, size, to_list=False):
+        """
+        Args:
+            size (int): Maximum number of elements in each batch; the last
+                batch has the remainder.
+            to_list (bool): If True, yield each batch as Python objects
+                through #ak.to_list; otherwise, yield Arrays.
+
+        Iterates over this Array in contiguous batches of `size` elements.
+        Unlike #ak.Array.__iter__, which makes a Python object for every
+        element, this makes one view per batch, so that loops like
+
+            >>> for batch in array.iter_batches(10000, to_list=True):
+            ...     for event in batch:
+            ...         do_something(event)
+
+        pay the Python overhead of the conversion once per batch.
+
+        See also #ak.iter_chunks.
+        """
+        return ak._v2.operations.iter_chunks(self, size, to_list=to_list)
+
     def __getitem__(self, where):
         """
         Args:
@@ -952,21 +975,33 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
         the sub-list at entry 0,0 is extended as the masked entries are
         acting at the last level, while the higher levels of the indexer all
         have the same dimension as the array being indexed.
+
+        Projections by a single field name, `array["x"]` or `array.x`, are
+        cached on the Array, so repeatedly accessing the same field does not
+        repeat the slicing. The cache is cleared whenever the #layout is
+        replaced, including by #__setitem__ and #__delitem__.
         """
-        with ak._v2._util.SlicingErrorContext(self, where):
-            out = self._layout[where]
-            if isinstance(out, ak._v2.contents.NumpyArray):
-                array_param = out.parameter("__array__")
-                if array_param == "byte":
-                    return ak._v2._util.tobytes(out.raw(numpy))
-                elif array_param == "char":
-                    return ak._v2._util.tobytes(out.raw(numpy)).decode(
-                        errors="surrogateescape"
-                    )
-            if isinstance(out, (ak._v2.contents.Content, ak._v2.record.Record)):
-                return ak._v2._util.wrap(out, self._behavior)
-            else:
-                return out
+        is_field = ak._v2._util.isstr(where)
+        if is_field and where in self._field_projections:
+            out = self._field_projections[where]
+        else:
+            with ak._v2._util.SlicingErrorContext(self, where):
+                out = self._layout[where]
+            if is_field:
+                self._field_projections[where] = out
+
+        if isinstance(out, ak._v2.contents.NumpyArray):
+            array_param = out.parameter("__array__")
+            if array_param == "byte":
+                return ak._v2._util.tobytes(out.raw(numpy))
+            elif array_param == "char":
+                return ak._v2._util.tobytes(out.raw(numpy)).decode(
+                    errors="surrogateescape"
+                )
+        if isinstance(out, (ak._v2.contents.Content, ak._v2.record.Record)):
+            return ak._v2._util.wrap(out, self._behavior)
+        else:
+            return out
 
     def __setitem__(self, where, what):
         """
@@ -1038,6 +1073,7 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
                 self._layout, what, where, highlevel=False
             )
             self._numbaview = None
+            self._field_projections = {}
 
     def __delitem__(self, where):
         """
@@ -1057,6 +1093,7 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
                 )
             self._layout = self._layout[[x for x in names if x != where]]
             self._numbaview = None
+            self._field_projections = {}
 
     def __getattr__(self, where):
         """
@@ -1097,7 +1134,10 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
 
         to add a field.
         """
-        if where in dir(type(self)):
+        # fields that have already been projected passed the checks below
+        if where in self.__dict__.get("_field_projections", ()):
+            return self[where]
+        elif where in dir(type(self)):
             return super().__getattribute__(where)
         else:
             if where in self._layout.fields:
@@ -4,6 +4,12 @@ import awkward as ak
 
 checked_version = False
 
+# If True, arrays passed into Numba-compiled functions only expose the record
+# fields that compiled functions have been typed to read, which makes passing
+# arrays of records with many fields cheaper. This can't be used with functions
+# loaded from Numba's cache (cache=True), since they aren't typed again.
+projection = False
+
 
 def register_and_check():
     global checked_version
@@ -34,6 +40,95 @@ or
     register()
 
 
+def vectorize(function=None, signatures=(), **options):
+    """
+    Args:
+        function (callable): Function of numbers that returns a number.
+        signatures (list of str or Numba signatures): If given (here or as
+            the first argument, as in `numba.vectorize`), the function is
+            compiled eagerly for these types; otherwise, it is compiled for
+            each combination of dtypes that it is applied to.
+        options: Passed to `numba.vectorize`, such as `target` or `cache`.
+
+    Decorator that compiles `function` into a ufunc that can be applied to
+    Awkward Arrays, broadcasting their structure like any other NumPy ufunc
+    and applying the compiled loop to the contents of their NumpyArrays, without
+    Python objects for each item. For instance,
+
+        >>> @ak._v2.numba.vectorize
+        ... def f(x, y):
+        ...     return x * 10 + y
+        ...
+        >>> f(ak._v2.Array([[1, 2, 3], [], [4, 5]]), 1)
+        <Array [[11, 21, 31], [], [41, 51]] type='3 * var * int64'>
+
+    The `numba.DUFunc` is the decorated function's `ufunc` attribute.
+
+    See also #ak._v2.numba.guvectorize for functions of whole lists.
+    """
+    register_and_check()
+    import awkward._v2._connect.numba.vectorize
+
+    def decorator(function):
+        return awkward._v2._connect.numba.vectorize.Vectorized(
+            function, signatures, options
+        )
+
+    if function is None:
+        return decorator
+    elif isinstance(function, (str, list, tuple)):
+        # as in numba.vectorize, signatures may be the first argument
+        signatures = function
+        return decorator
+    else:
+        return decorator(function)
+
+
+def guvectorize(signature, **options):
+    """
+    Args:
+        signature (str): Dimensions of the function's arguments and output,
+            as in a generalized ufunc: `"(n)"` is a one-dimensional array and
+            `"()"` is a number, so `"(n),()->()"` is a function of an array and
+            a number that returns a number and `"(n)->(n)"` is a function of an
+            array that returns an array of the same length.
+        options: Passed to `numba.njit`, such as `fastmath` or `cache`.
+
+    Decorator that compiles `function` (with `numba.njit`) and applies it to
+    each of the innermost lists of its Awkward Array arguments, passing the
+    contents of each list as a NumPy array. The arrays are broadcast like any
+    other Awkward Arrays until their `"(n)"` arguments are lists of numbers,
+    and the function's outputs replace these lists, so `"(n)->()"` reduces the
+    innermost dimension and `"(n)->(n)"` preserves the structure. For instance,
+
+        >>> @ak._v2.numba.guvectorize("(n)->(n)")
+        ... def cumsum(x):
+        ...     return np.cumsum(x)
+        ...
+        >>> cumsum(ak._v2.Array([[[1, 2, 3], []], [[4, 5]]]))
+        <Array [[[1, 3, 6], []], [[4, 9]]] type='2 * var * var * int64'>
+
+    Unlike `numba.guvectorize`, the function returns its output (a number or
+    an array), rather than filling an output argument, and an output dimension
+    must be one of the arguments'. All of the lists are passed to one compiled
+    loop, without Python objects for each list.
+
+    The decorated function takes `highlevel` and `behavior` arguments, as
+    other Awkward Array functions do.
+    """
+    register_and_check()
+    import awkward._v2._connect.numba.vectorize
+
+    awkward._v2._connect.numba.vectorize._dimensions(signature)
+
+    def decorator(function):
+        return awkward._v2._connect.numba.vectorize.GuVectorized(
+            function, signature, options
+        )
+
+    return decorator
+
+
 def register():
     if hasattr(ak._v2.numba, "ArrayViewType"):
         return
@@ -42,6 +137,7 @@ def register():
     import awkward._v2._connect.numba.arrayview
     import awkward._v2._connect.numba.layout
     import awkward._v2._connect.numba.builder
+    import awkward._v2._connect.numba.layoutbuilder
 
     n = ak._v2.numba
     n.ArrayViewType = awkward._v2._connect.numba.arrayview.ArrayViewType
@@ -61,6 +157,9 @@ def register():
     n.UnionArrayType = awkward._v2._connect.numba.layout.UnionArrayType
     n.ArrayBuilderType = awkward._v2._connect.numba.builder.ArrayBuilderType
     n.ArrayBuilderModel = awkward._v2._connect.numba.builder.ArrayBuilderModel
+    n.LayoutBuilder = awkward._v2._connect.numba.layoutbuilder.LayoutBuilder
+    n.LayoutBuilderType = awkward._v2._connect.numba.layoutbuilder.LayoutBuilderType
+    n.LayoutBuilderModel = awkward._v2._connect.numba.layoutbuilder.LayoutBuilderModel
 
     @numba.extending.typeof_impl.register(ak._v2.highlevel.Array)
     def typeof_Array(obj, c):
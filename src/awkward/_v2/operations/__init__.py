@@ -40,6 +40,8 @@ from awkward._v2.operations.ak_isclose import isclose
 from awkward._v2.operations.ak_is_none import is_none
 from awkward._v2.operations.ak_is_tuple import is_tuple
 from awkward._v2.operations.ak_is_valid import is_valid
+from awkward._v2.operations.ak_iter_chunks import iter_chunks
+from awkward._v2.operations.ak_iterate_avro_file import iterate_avro_file
 from awkward._v2.operations.ak_linear_fit import linear_fit
 from awkward._v2.operations.ak_local_index import local_index
 from awkward._v2.operations.ak_mask import mask
@@ -64,9 +66,14 @@ from awkward._v2.operations.ak_softmax import softmax
 from awkward._v2.operations.ak_sort import sort
 from awkward._v2.operations.ak_std import std, nanstd
 from awkward._v2.operations.ak_strings_astype import strings_astype
+from awkward._v2.operations.ak_strings_contains import strings_contains
+from awkward._v2.operations.ak_strings_endswith import strings_endswith
+from awkward._v2.operations.ak_strings_hash import strings_hash
+from awkward._v2.operations.ak_strings_startswith import strings_startswith
 from awkward._v2.operations.ak_sum import sum, nansum
 from awkward._v2.operations.ak_to_arrow import to_arrow
 from awkward._v2.operations.ak_to_arrow_table import to_arrow_table
+from awkward._v2.operations.ak_to_avro_file import to_avro_file
 from awkward._v2.operations.ak_to_backend import to_backend
 from awkward._v2.operations.ak_to_buffers import to_buffers
 from awkward._v2.operations.ak_to_cupy import to_cupy
@@ -8,7 +8,12 @@ np = ak.nplike.NumpyMetadata.instance()
 
 
 def from_avro_file(
-    file, debug_forth=False, limit_entries=None, highlevel=True, behavior=None
+    file,
+    debug_forth=False,
+    limit_entries=None,
+    highlevel=True,
+    behavior=None,
+    num_threads=1,
 ):
     """
     Args:
@@ -19,10 +24,18 @@ def from_avro_file(
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        num_threads (None or int): Number of threads that decompress blocks of a
+            compressed Avro file ahead of the decoder; if None, use one per
+            core. Ignored for uncompressed files.
     Reads Avro files as Awkward Arrays.
 
     Internally this function uses AwkwardForth DSL. The function recursively parses the Avro schema, generates
     Awkward form and Forth code for that specific Avro file and then reads it.
+
+    Files written with any of the standard `avro.codec` values can be read:
+    `"null"`, `"deflate"`, `"bzip2"`, and `"xz"` need only the Python standard
+    library, `"snappy"` needs the `python-snappy` package, and `"zstandard"`
+    needs the `zstandard` package.
     """
     import awkward._v2._connect.avro
 
@@ -34,6 +47,7 @@ def from_avro_file(
             behavior=behavior,
             debug_forth=debug_forth,
             limit_entries=limit_entries,
+            num_threads=num_threads,
         ),
     ):
 
@@ -44,13 +58,15 @@ def from_avro_file(
             try:
                 with open(file, "rb") as opened_file:
                     form, length, container = awkward._v2._connect.avro.ReadAvroFT(
-                        opened_file, limit_entries, debug_forth
+                        opened_file, limit_entries, debug_forth, num_threads
                     ).outcontents
                     return _impl(form, length, container, highlevel, behavior)
-            except ImportError:
+            except FileNotFoundError:
                 raise ak._v2._util.error(
-                    "the filename is incorrect or the file does not exist"
-                )
+                    FileNotFoundError(
+                        "the filename is incorrect or the file does not exist"
+                    )
+                ) from None
 
         else:
             if not hasattr(file, "read"):
@@ -59,8 +75,8 @@ def from_avro_file(
                 )
             else:
                 form, length, container = awkward._v2._connect.avro.ReadAvroFT(
-                    file, limit_entries, debug_forth
-                ).outarr
+                    file, limit_entries, debug_forth, num_threads
+                ).outcontents
                 return _impl(form, length, container, highlevel, behavior)
 
 
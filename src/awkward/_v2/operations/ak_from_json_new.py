@@ -37,8 +37,8 @@ def from_json(
             delimiter is not actually checked, so it may be `"\n"`, `"\r\n"`
             or anything else.
         schema (None, JSON str or equivalent lists/dicts): If None, the data type
-            is discovered while parsing. If a JSONSchema, that schema is used to
-            parse the JSON more quickly by skipping type-discovery.
+            is discovered while parsing. If a JSONSchema, that schema determines
+            the data type and the JSON is parsed by #ak.from_json_schema.
         nan_string (None or str): If not None, strings with this value will be
             interpreted as floating-point NaN values.
         infinity_string (None or str): If not None, strings with this value will
@@ -50,11 +50,10 @@ def from_json(
         buffersize (int): Number of bytes in each read from source: larger
             values use more memory but read less frequently. (Python GIL is released
             between read events.)
-        initial (int): Initial size (in bytes) of buffers used by
-            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions).
-        resize (float): Resize multiplier for buffers used by
-            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
-            should be strictly greater than 1.
+        initial (int): Initial size (in bytes) of output buffers (see
+            #ak.layout.ArrayBuilderOptions).
+        resize (float): Resize multiplier for output buffers (see
+            #ak.layout.ArrayBuilderOptions); should be strictly greater than 1.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -62,7 +61,10 @@ def from_json(
 
     Converts a JSON string into an Awkward Array.
 
-    FIXME: needs documentation.
+    Without a `schema`, the JSON is parsed by #ak.layout.ArrayBuilder, which
+    discovers the type while parsing. With a `schema`, it is parsed by a typed
+    AwkwardForth program, which uses less memory (line-delimited sources are
+    parsed one buffer at a time), but takes about 1.5 to 2 times longer.
 
     See also #ak.to_json.
     """
@@ -99,7 +101,29 @@ def from_json(
             )
 
         else:
-            raise ak._v2._util.error(NotImplementedError)
+            if (
+                nan_string is not None
+                or infinity_string is not None
+                or minus_infinity_string is not None
+            ):
+                raise ak._v2._util.error(
+                    NotImplementedError(
+                        "nan_string, infinity_string, and minus_infinity_string "
+                        "are not supported with a schema"
+                    )
+                )
+
+            layout = ak._v2.operations.from_json_schema(
+                source,
+                schema,
+                line_delimited=line_delimited,
+                buffersize=buffersize,
+                highlevel=False,
+                output_initial_size=initial,
+                output_resize_factor=resize,
+            )
+            layout = _record_to_complex(layout, complex_record_fields)
+            return ak._v2._util.wrap(layout, behavior, highlevel)
 
 
 class _BytesReader:
@@ -2,6 +2,7 @@
 
 import json
 import os
+import re
 
 import awkward as ak
 
@@ -16,10 +17,18 @@ def from_json_schema(
     behavior=None,
     output_initial_size=1024,
     output_resize_factor=1.5,
+    line_delimited=False,
+    buffersize=65536,
 ):
     """
     Args:
-        source (str or bytes): JSON-formatted string to convert into an array.
+        source (bytes/str, pathlib.Path, or file-like object): Data source of the
+            JSON-formatted string(s). If bytes/str, the string is parsed. If a
+            `pathlib.Path`, a file with that name is opened, parsed, and closed.
+            If that path has a URI protocol (like "https://" or "s3://"), this
+            function attempts to open the file with the fsspec library. If a
+            file-like object with a `read` method, this function reads from the
+            object, but does not close it.
         schema (str, bytes, or nested dicts): JSONSchema to assume in the parsing.
             The JSON data are *not* validated against the schema; the schema is
             only used to accelerate parsing.
@@ -31,14 +40,26 @@ def from_json_schema(
             grow as needed to accommodate the size of the dataset.
         output_resize_factor (float): Resize multiplier for output buffers, which
             determines how quickly they grow; should be strictly greater than 1.
-
-    Converts a JSON string into an Awkward Array, using a JSONSchema to accelerate
+        line_delimited (bool): If False, a single JSON document is read as an
+            entire array or record. If True, this function reads line-delimited
+            JSON into an array, and `schema` describes each line.
+        buffersize (int): Number of bytes in each read from source. Line-delimited
+            data are parsed one buffer (of whole lines) at a time, so a large
+            file is never entirely in memory; a single document is read in full
+            before parsing.
+
+    Converts JSON into an Awkward Array, using a JSONSchema to accelerate
     the parsing of the source and building of the output. The JSON data are not
     *validated* against the schema; the schema is *assumed* to be correct.
 
+    The schema is translated into an AwkwardForth program that parses the text
+    and fills the output buffers directly, without discovering the type of each
+    value (as #ak.layout.ArrayBuilder does).
+
     Supported JSONSchema elements:
 
-      * The root of the schema must be `"type": "array"` or `"type": "object"`.
+      * The root of the schema must be `"type": "array"` or `"type": "object"`,
+        unless `line_delimited=True`, in which case it describes each line.
       * Every level must have a `"type"`, which can only name one type (as a string
         or length-1 list) or one type and `"null"` (as a length-2 list).
       * `"type": "boolean"` \u2192 1-byte boolean values.
@@ -47,16 +68,22 @@ def from_json_schema(
         but this function ignores any fractional part.
       * `"type": "number"` \u2192 8-byte floating-point values.
       * `"type": "string"` \u2192 UTF-8 encoded strings. All JSON escape sequences are
-        supported. Remember that the `source` data are ASCII; Unicode is derived from
-        "`\\uXXXX`" escape sequences. If an `"enum"` is given, strings are represented
-        as categorical values (#ak.layout.IndexedArray or #ak.layout.IndexedOptionArray).
+        supported, including UTF-16 surrogate pairs for characters outside the Basic
+        Multilingual Plane (an unpaired surrogate is an error). Remember that the
+        `source` data are ASCII; Unicode is derived from "`\\uXXXX`" escape sequences.
+        If an `"enum"` is given, strings are represented as categorical values
+        (#ak.layout.IndexedArray or #ak.layout.IndexedOptionArray).
       * `"type": "array"` \u2192 nested lists. The `"items"` must be specified. If
         `"minItems"` and `"maxItems"` are specified and equal to each other, the
         list has regular-type (#ak.types.RegularType); otherwise, it has variable-length
         type (#ak.types.ListType).
       * `"type": "object"` \u2192 nested records. The `"properties"` must be specified,
         and any properties in the data not described by `"properties"` will not
-        appear in the output.
+        appear in the output. Properties that are missing from an object are
+        None if their type includes `"null"`; otherwise, they are an error.
+
+    Property names and `"enum"` strings are matched as they appear in the
+    JSON text, so they can't contain characters that JSON would escape.
 
     See also #ak.from_json and #ak.to_json.
     """
@@ -69,6 +96,8 @@ def from_json_schema(
             behavior=behavior,
             output_initial_size=output_initial_size,
             output_resize_factor=output_resize_factor,
+            line_delimited=line_delimited,
+            buffersize=buffersize,
         ),
     ):
         return _impl(
@@ -78,6 +107,8 @@ def from_json_schema(
             behavior,
             output_initial_size,
             output_resize_factor,
+            line_delimited,
+            buffersize,
         )
 
 
@@ -88,11 +119,10 @@ def _impl(
     behavior,
     output_initial_size,
     output_resize_factor,
+    line_delimited,
+    buffersize,
 ):
-    if not isinstance(source, bytes) and not ak._v2._util.isstr(source):
-        raise ak._v2._util.error(
-            NotImplementedError("for now, 'source' must be bytes or str")
-        )
+    import awkward._v2.operations.ak_from_json_new
 
     if isinstance(schema, bytes) or ak._v2._util.isstr(schema):
         schema = json.loads(schema)
@@ -102,81 +132,266 @@ def _impl(
             TypeError(f"malformed JSONSchema: expected dict, got {schema!r}")
         )
 
+    if not line_delimited and schema.get("type") not in ("array", "object"):
+        raise ak._v2._util.error(
+            TypeError(
+                "only 'array' and 'object' types supported at the JSONSchema root"
+            )
+        )
+
+    reader = awkward._v2.operations.ak_from_json_new._get_reader(source)
+    with reader() as obj:
+        layout = read_chunks(
+            chunks_of(obj, line_delimited, buffersize),
+            schema,
+            line_delimited,
+            max(buffersize, 1024),
+            output_initial_size,
+            output_resize_factor,
+        )
+
+    return ak._v2._util.wrap(layout, behavior, highlevel)
+
+
+def chunks_of(obj, line_delimited, buffersize):
+    """
+    Yields bytes from a file-like `obj` in pieces that the Forth program can
+    parse independently: whole lines of about `buffersize` bytes if
+    `line_delimited`, otherwise the entire document.
+    """
+    if not ak._v2._util.isint(buffersize) or buffersize <= 0:
+        raise ak._v2._util.error(
+            ValueError(f"buffersize must be a positive integer, not {buffersize!r}")
+        )
+
+    import awkward._v2.operations.ak_from_json_new
+
+    if isinstance(obj, awkward._v2.operations.ak_from_json_new._BytesReader):
+        # the data are already in memory
+        yield obj.data
+        return
+
+    pieces = []
+    while True:
+        data = obj.read(buffersize)
+        if isinstance(data, str):
+            data = data.encode("utf-8", errors="surrogateescape")
+        if len(data) == 0:
+            break
+        if line_delimited:
+            last = data.rfind(b"\n")
+            if last != -1:
+                pieces.append(data[: last + 1])
+                yield b"".join(pieces)
+                pieces = [data[last + 1 :]]
+                continue
+        pieces.append(data)
+
+    yield b"".join(pieces)
+
+
+_forth_words = r"""
+: peekc json skipws 0 json peek ;
+: expect peekc <> if halt then 1 json skip ;
+: isfrac json end if false else 0 json peek dup 46 = swap 32 or 101 = or then ;
+: skipfrac isfrac if begin json end if false else 0 json peek dup 46 = over 101 = or
+  over 69 = or over 43 = or over 45 = or swap dup 48 >= swap 57 <= and or then
+  while 1 json skip repeat then ;
+: skipstr begin 0 json peek dup 92 = if drop 2 json skip 0 else 1 json skip 34 = then until ;
+: skipscalar begin json end if true else 0 json peek dup 44 = over 93 = or over 125 = or
+  swap 33 < or then 0= while 1 json skip repeat ;
+: skipvalue peekc case
+  34 of 1 json skip skipstr endof
+  91 of 1 json skip peekc 93 = if 1 json skip else
+    begin recurse peekc 44 = while 1 json skip repeat 93 expect then endof
+  123 of 1 json skip peekc 125 = if 1 json skip else
+    begin 34 expect skipstr 58 expect recurse peekc 44 = while 1 json skip repeat
+    125 expect then endof
+  skipscalar endcase ;
+"""
+
+
+def forth_program(schema, line_delimited):
+    """
+    Returns the #ak.forms.Form, AwkwardForth source, and buffers that are known
+    before parsing (enum strings) for data described by a JSONSchema.
+
+    The program leaves the number of array elements it read on the stack; each
+    run can be continued with `begin_again` on the next chunk of input.
+    """
     container = {}
-    instructions = []
+    declarations = ["input json", _forth_words]
+    init = []
 
-    if schema.get("type") == "array":
+    if line_delimited:
+        form, code, _ = build_forth(schema, container, declarations, init)
+        main = f"0 begin json skipws json end 0= while {code} 1+ repeat"
+
+    elif schema.get("type") == "array":
         if "items" not in schema:
             raise ak._v2._util.error(
                 TypeError("JSONSchema type is not concrete: array without items")
             )
+        form, code, _ = build_forth(schema["items"], container, declarations, init)
+        main = (
+            f"91 expect 0 peekc 93 = if 1 json skip else begin {code} 1+ "
+            "peekc 44 = while 1 json skip repeat 93 expect then "
+            "json skipws json end 0= if halt then"
+        )
+
+    else:
+        form, code, _ = build_forth(schema, container, declarations, init)
+        main = f"{code} 1 json skipws json end 0= if halt then"
 
-        instructions.append(["TopLevelArray"])
-        form = build_assembly(schema["items"], container, instructions)
+    source = "\n".join(declarations + [": init-out " + " ".join(init) + " ;", main])
+    return form, source, container
 
-    elif schema.get("type") == "object":
-        form = build_assembly(schema, container, instructions)
 
+def read_chunks(
+    chunks,
+    schema,
+    line_delimited,
+    string_buffer_size,
+    output_initial_size,
+    output_resize_factor,
+):
+    """
+    Parses an iterable of bytes (see #chunks_of) with the AwkwardForth program
+    for `schema` and returns a low-level layout.
+    """
+    form, source, container = forth_program(schema, line_delimited)
+
+    machine = None
+    length = 0
+    offset = 0
+    try:
+        for chunk in chunks:
+            chunk = _decode_surrogate_pairs(chunk)
+            data = numpy.frombuffer(chunk, np.uint8)
+            if machine is None:
+                # round up so that machines for similar inputs can be reused
+                size = max(string_buffer_size, len(chunk), 1)
+                machine = ak._v2._forth.machines.acquire(
+                    source,
+                    string_buffer_size=1 << (size - 1).bit_length(),
+                    output_initial_size=output_initial_size,
+                    output_resize_factor=output_resize_factor,
+                )
+                machine.begin({"json": data})
+                machine.call("init-out")
+            else:
+                machine.begin_again({"json": data}, True)
+
+            try:
+                machine.resume()
+            except ValueError as err:
+                message = str(err).split("\n")[0]
+                if _surrogate.search(chunk) is not None:
+                    message += (
+                        "\n\n(the JSON has an unpaired UTF-16 surrogate escape, "
+                        "\\uD800 through \\uDFFF, which is not a character)"
+                    )
+                raise ak._v2._util.error(
+                    ValueError(
+                        _position_message(chunk, machine.input_position("json"), offset)
+                        + "\n\n"
+                        + message
+                    )
+                ) from err
+
+            length += machine.stack_pop()
+            offset += len(chunk)
+
+        for key, value in container.items():
+            if value is None:
+                container[key] = numpy.asarray(machine[key])
+
+    finally:
+        if machine is not None:
+            ak._v2._forth.machines.release(machine)
+
+    out = ak._v2.operations.from_buffers(form, length, container, highlevel=False)
+
+    if line_delimited or schema.get("type") == "array":
+        return out
     else:
+        return out[0]
+
+
+_surrogate = re.compile(rb"\\u[dD][89a-fA-F]")
+_surrogate_pair = re.compile(
+    rb"(?<!\\)((?:\\\\)*)\\u([dD][89abAB][0-9a-fA-F]{2})\\u([dD][c-fC-F][0-9a-fA-F]{2})"
+)
+
+
+def _decode_surrogate_pairs(chunk):
+    # quotedstr-> decodes each "\uXXXX" escape by itself, so characters outside
+    # the Basic Multilingual Plane, escaped as UTF-16 surrogate pairs, are
+    # replaced by their UTF-8 bytes first (error positions in a chunk that had
+    # any are positions in the replaced text)
+    if _surrogate.search(chunk) is None:
+        return chunk
+
+    def replace(match):
+        high = int(match.group(2), 16) - 0xD800
+        low = int(match.group(3), 16) - 0xDC00
+        return match.group(1) + chr(0x10000 + (high << 10) + low).encode("utf-8")
+
+    return _surrogate_pair.sub(replace, chunk)
+
+
+def _position_message(source, position, offset):
+    before = source[max(0, position - 30) : position]
+    before = before.decode("ascii", errors="surrogateescape")
+    before = before.replace(os.linesep, repr(os.linesep).strip("'\""))
+    if position - 30 > 0:
+        before = "..." + before
+    after = source[position : position + 30]
+    after = after.decode("ascii", errors="surrogateescape")
+    if position + 30 < len(source):
+        after = after + "..."
+    return "JSON is invalid or does not fit schema at position {}:\n\n    {}\n    {}".format(
+        offset + position, before + after, "-" * len(before) + "^"
+    )
+
+
+def _match_string(string, suffix=""):
+    # AwkwardForth "enum" strings are compared with the raw JSON text, including
+    # both quotation marks: the closing one so that no string is a prefix of
+    # another, and the opening one so that no string is tokenized as an s" or ."
+    # word (property names "s" and "." would otherwise be)
+    if not ak._v2._util.isstr(string):
         raise ak._v2._util.error(
             TypeError(
-                "only 'array' and 'object' types supported at the JSONSchema root"
+                f"JSONSchema property names and enums must be str, not {string!r}"
             )
         )
-
-    specializedjson = ak._ext.SpecializedJSON(
-        json.dumps(instructions),
-        output_initial_size=output_initial_size,
-        output_resize_factor=output_resize_factor,
-    )
-
-    if not specializedjson.parse_string(source):
-        position = specializedjson.json_position
-        before = source[max(0, position - 30) : position]
-        if isinstance(before, bytes):
-            before = before.decode("ascii", errors="surrogateescape")
-        before = before.replace(os.linesep, repr(os.linesep).strip("'\""))
-        if position - 30 > 0:
-            before = "..." + before
-        after = source[position : position + 30]
-        if isinstance(after, bytes):
-            after = after.decode("ascii", errors="surrogateescape")
-        if position + 30 < len(source):
-            after = after + "..."
+    if json.dumps(string, ensure_ascii=False)[1:-1] != string:
         raise ak._v2._util.error(
-            ValueError(
-                "JSON is invalid or does not fit schema at position {}:\n\n    {}\n    {}".format(
-                    position, before + after, "-" * len(before) + "^"
-                )
+            NotImplementedError(
+                "JSONSchema property names and enums with characters that must be "
+                f"escaped in JSON are not supported: {string!r}"
             )
         )
+    return 's" \\"' + string + '\\"' + suffix + '"'
 
-    for key, value in container.items():
-        if value is None:
-            container[key] = specializedjson[key]
-
-    if schema.get("type") == "array":
-        length = len(specializedjson)
-    else:
-        length = 1
-
-    out = ak._v2.operations.from_buffers(
-        form, length, container, highlevel=highlevel, behavior=behavior
-    )
-
-    if schema.get("type") == "array":
-        return out
-    else:
-        return out[0]
 
+def build_forth(schema, container, declarations, init):
+    """
+    Returns the #ak.forms.Form, the AwkwardForth code that parses one value of
+    this `schema`, and the code that fills in a missing value (None if the
+    schema is not nullable).
 
-def build_assembly(schema, container, instructions):
+    Output buffers are added to `container` (as None, to be filled after
+    parsing) and declared in `declarations`; `init` collects code to run before
+    the first value.
+    """
     if not isinstance(schema, dict):
         raise ak._v2._util.error(
             TypeError(f"unrecognized JSONSchema: expected dict, got {schema!r}")
         )
 
-    if "type" not in schema is None:
+    if "type" not in schema:
         raise ak._v2._util.error(
             TypeError(f"unrecognized JSONSchema: no 'type' in {schema!r}")
         )
@@ -191,115 +406,142 @@ def build_assembly(schema, container, instructions):
         if len(tpe) == 1:
             tpe = tpe[0]
 
+    def output(key, dtype):
+        container[key] = None
+        declarations.append(f"output {key} {dtype}")
+
+    def byte_masked(form, code, fill):
+        if not is_optional:
+            return form, code, None
+        mask = f"node{len(container)}"
+        output(mask + "-mask", "int8")
+        missing = f"0 {mask}-mask <- stack {fill}"
+        return (
+            ak._v2.forms.ByteMaskedForm("i8", form, valid_when=True, form_key=mask),
+            f'peekc 110 = if json enumonly s" null" drop {missing} '
+            f"else 1 {mask}-mask <- stack {code} then",
+            missing,
+        )
+
+    def indexed_option(form, code):
+        if not is_optional:
+            return form, code, None
+        mask = f"node{len(container)}"
+        output(mask + "-index", "int64")
+        declarations.append(f"variable {mask}-count")
+        missing = f"-1 {mask}-index <- stack"
+        return (
+            ak._v2.forms.IndexedOptionForm("i64", form, form_key=mask),
+            f'peekc 110 = if json enumonly s" null" drop {missing} else '
+            f"{mask}-count @ {mask}-index <- stack 1 {mask}-count +! {code} then",
+            missing,
+        )
+
     if tpe in {"boolean", "integer", "number"}:
         # https://json-schema.org/understanding-json-schema/reference/boolean.html
         # https://json-schema.org/understanding-json-schema/reference/numeric.html
 
+        node = f"node{len(container)}"
         if tpe == "boolean":
-            instruction = "FillBoolean"
-            dtype = "uint8"
             primitive = "bool"
+            output(node + "-data", "bool")
+            code = f'json skipws json enumonly s" false" s" true" {node}-data <- stack'
         elif tpe == "integer":
-            instruction = "FillInteger"
-            primitive = dtype = "int64"
-        elif tpe == "number":
-            instruction = "FillNumber"
-            primitive = dtype = "float64"
-
-        if is_optional:
-            mask = f"node{len(container)}"
-            container[mask + "-mask"] = None
-            node = f"node{len(container)}"
-            container[node + "-data"] = None
-            instructions.append(["FillByteMaskedArray", mask + "-mask", "int8"])
-            instructions.append([instruction, node + "-data", dtype])
-            return ak._v2.forms.ByteMaskedForm(
-                "i8",
-                ak._v2.forms.NumpyForm(primitive, form_key=node),
-                valid_when=True,
-                form_key=mask,
-            )
-
+            primitive = "int64"
+            output(node + "-data", "int64")
+            code = f"json skipws json textint-> {node}-data skipfrac"
         else:
-            node = f"node{len(container)}"
-            container[node + "-data"] = None
-            instructions.append([instruction, node + "-data", dtype])
-            return ak._v2.forms.NumpyForm(primitive, form_key=node)
+            primitive = "float64"
+            output(node + "-data", "float64")
+            code = f"json skipws json textfloat-> {node}-data"
+
+        return byte_masked(
+            ak._v2.forms.NumpyForm(primitive, form_key=node),
+            code,
+            f"0 {node}-data <- stack",
+        )
 
     elif tpe == "string":
         # https://json-schema.org/understanding-json-schema/reference/string.html#string
         if "enum" in schema:
             strings = schema["enum"]
-            assert isinstance(strings, list)
-            assert len(strings) >= 1
-            assert all(ak._v2._util.isstr(x) for x in strings)
+            if not isinstance(strings, list) or len(strings) == 0:
+                raise ak._v2._util.error(
+                    TypeError(f"JSONSchema enum must be a non-empty list: {schema!r}")
+                )
+            matches = " ".join(_match_string(x) for x in strings)
             bytestrings = [x.encode("utf-8", errors="surrogateescape") for x in strings]
 
             index = f"node{len(container)}"
-            container[index + "-index"] = None
+            output(index + "-index", "int64")
             offsets = f"node{len(container)}"
             container[offsets + "-offsets"] = numpy.empty(len(strings) + 1, np.int64)
             container[offsets + "-offsets"][0] = 0
             container[offsets + "-offsets"][1:] = numpy.cumsum(
                 [len(x) for x in bytestrings]
             )
-            node = f"container{len(container)}"
-            container[node + "-data"] = b"".join(bytestrings)
+            node = f"node{len(container)}"
+            container[node + "-data"] = numpy.frombuffer(
+                b"".join(bytestrings), np.uint8
+            )
+
+            content = ak._v2.forms.ListOffsetForm(
+                "i64",
+                ak._v2.forms.NumpyForm(
+                    "uint8", parameters={"__array__": "char"}, form_key=node
+                ),
+                parameters={"__array__": "string"},
+                form_key=offsets,
+            )
+            code = f"json skipws json enumonly {matches} {index}-index <- stack"
+            missing = f"-1 {index}-index <- stack"
 
             if is_optional:
-                instruction = "FillNullEnumString"
-                formtype = ak._v2.forms.IndexedOptionForm
+                return (
+                    ak._v2.forms.IndexedOptionForm(
+                        "i64",
+                        content,
+                        parameters={"__array__": "categorical"},
+                        form_key=index,
+                    ),
+                    f'peekc 110 = if json enumonly s" null" drop {missing} '
+                    f"else {code} then",
+                    missing,
+                )
             else:
-                instruction = "FillEnumString"
-                formtype = ak._v2.forms.IndexedForm
+                return (
+                    ak._v2.forms.IndexedForm(
+                        "i64",
+                        content,
+                        parameters={"__array__": "categorical"},
+                        form_key=index,
+                    ),
+                    code,
+                    None,
+                )
 
-            instructions.append([instruction, index + "-index", "int64", strings])
+        else:
+            offsets = f"node{len(container)}"
+            output(offsets + "-offsets", "int64")
+            init.append(f"0 {offsets}-offsets <- stack")
+            node = f"node{len(container)}"
+            output(node + "-data", "uint8")
 
-            return formtype(
-                "i64",
+            return byte_masked(
                 ak._v2.forms.ListOffsetForm(
                     "i64",
                     ak._v2.forms.NumpyForm(
-                        "uint8", parameters={"__array__": "char"}, form_key=node
+                        "uint8",
+                        parameters={"__array__": "char"},
+                        form_key=node,
                     ),
                     parameters={"__array__": "string"},
                     form_key=offsets,
                 ),
-                parameters={"__array__": "categorical"},
-                form_key=index,
-            )
-
-        else:
-            if is_optional:
-                mask = f"node{container}"
-                container[mask + "-mask"] = None
-                instructions.append(["FillByteMaskedArray", mask + "-mask", "int8"])
-
-            offsets = f"node{len(container)}"
-            container[offsets + "-offsets"] = None
-            node = f"node{len(container)}"
-            container[node + "-data"] = None
-            instructions.append(
-                ["FillString", offsets + "-offsets", "int64", node + "-data", "uint8"]
+                f"json skipws json quotedstr-> {node}-data {offsets}-offsets +<- stack",
+                f"0 {offsets}-offsets +<- stack",
             )
 
-            out = ak._v2.forms.ListOffsetForm(
-                "i64",
-                ak._v2.forms.NumpyForm(
-                    "uint8",
-                    parameters={"__array__": "char"},
-                    form_key=node,
-                ),
-                parameters={"__array__": "string"},
-                form_key=offsets,
-            )
-            if is_optional:
-                return ak._v2.forms.ByteMaskedForm(
-                    "i8", out, valid_when=True, form_key=mask
-                )
-            else:
-                return out
-
     elif tpe == "array":
         # https://json-schema.org/understanding-json-schema/reference/array.html
 
@@ -309,44 +551,35 @@ def build_assembly(schema, container, instructions):
             )
 
         if schema.get("minItems") == schema.get("maxItems") != None:  # noqa: E711
-            assert ak._v2._util.isint(schema.get("minItems"))
-
-            if is_optional:
-                mask = f"node{len(container)}"
-                container[mask + "-index"] = None
-                instructions.append(
-                    ["FillIndexedOptionArray", mask + "-index", "int64"]
+            size = schema.get("minItems")
+            if not ak._v2._util.isint(size) or size < 0:
+                raise ak._v2._util.error(
+                    TypeError(f"JSONSchema minItems must be an integer: {schema!r}")
                 )
 
-            instructions.append(["FixedLengthList", schema.get("minItems")])
-
-            content = build_assembly(schema["items"], container, instructions)
-
-            out = ak._v2.forms.RegularForm(content, size=schema.get("minItems"))
-            if is_optional:
-                return ak._v2.forms.IndexedOptionForm("i64", out, form_key=mask)
-            else:
-                return out
+            content, code, _ = build_forth(
+                schema["items"], container, declarations, init
+            )
+            return indexed_option(
+                ak._v2.forms.RegularForm(content, size=size),
+                f"91 expect {size} 0 do i if 44 expect then {code} loop 93 expect",
+            )
 
         else:
-            if is_optional:
-                mask = f"node{len(container)}"
-                container[mask + "-mask"] = None
-                instructions.append(["FillByteMaskedArray", mask + "-mask", "int8"])
-
             offsets = f"node{len(container)}"
-            container[offsets + "-offsets"] = None
-            instructions.append(["VarLengthList", offsets + "-offsets", "int64"])
-
-            content = build_assembly(schema["items"], container, instructions)
+            output(offsets + "-offsets", "int64")
+            init.append(f"0 {offsets}-offsets <- stack")
 
-            out = ak._v2.forms.ListOffsetForm("i64", content, form_key=offsets)
-            if is_optional:
-                return ak._v2.forms.ByteMaskedForm(
-                    "i8", out, valid_when=True, form_key=mask
-                )
-            else:
-                return out
+            content, code, _ = build_forth(
+                schema["items"], container, declarations, init
+            )
+            return byte_masked(
+                ak._v2.forms.ListOffsetForm("i64", content, form_key=offsets),
+                f"91 expect peekc 93 = if 1 json skip 0 {offsets}-offsets +<- stack "
+                f"else 0 begin {code} 1+ peekc 44 = while 1 json skip repeat "
+                f"93 expect {offsets}-offsets +<- stack then",
+                f"0 {offsets}-offsets +<- stack",
+            )
 
     elif tpe == "object":
         # https://json-schema.org/understanding-json-schema/reference/object.html
@@ -358,34 +591,103 @@ def build_assembly(schema, container, instructions):
                 )
             )
 
-        names = []
-        subschemas = []
-        for name, subschema in schema["properties"].items():
-            names.append(name)
-            subschemas.append(subschema)
-
-        if is_optional:
-            mask = f"node{len(container)}"
-            container[mask + "-index"] = None
-            instructions.append(["FillIndexedOptionArray", mask + "-index", "int64"])
+        record = f"node{len(container)}"
+        names = list(schema["properties"])
+        # names are matched with the colon that usually follows them, and only
+        # if none of those match, without it (then index + len(names))
+        matches = " ".join(
+            [_match_string(x, ":") for x in names] + [_match_string(x) for x in names]
+        )
 
-        instructions.append(["KeyTableHeader", len(names)])
-        startkeys = len(instructions)
+        # which properties have been seen in this object, as bits of variables
+        # (30 per variable, because AwkwardForth literals are 32-bit)
+        seen = {}
+        contents = []
+        contents_code = []
+        cases = []
+        for i, name in enumerate(names):
+            variable, bit = f"{record}-seen{i // 30}", 1 << (i % 30)
+            content, code, missing = build_forth(
+                schema["properties"][name], container, declarations, init
+            )
+            contents.append(content)
+            contents_code.append(code)
+            cases.append(
+                f"{i} of {variable} @ {bit} and if halt then {bit} {variable} +! "
+                f"{code} endof"
+            )
+            if missing is None:
+                missing = "halt"
+            seen.setdefault(variable, []).append((bit, missing))
+
+        checks = []
+        for variable, bits in seen.items():
+            declarations.append(f"variable {variable}")
+            checks.append(
+                f"{variable} @ {sum(bit for bit, _ in bits)} <> if "
+                + " ".join(
+                    f"{variable} @ {bit} and 0= if {missing} then"
+                    for bit, missing in bits
+                )
+                + " then"
+            )
 
-        for name in names:
-            instructions.append(["KeyTableItem", name, None])
+        unknown = "drop 34 expect skipstr 58 expect skipvalue"
+        if len(names) == 0:
+            key = "-1"
+        else:
+            key = f"json enum {matches}"
+
+        # properties in any order, after the first i in schema order, which are
+        # marked as seen (then the object's remaining properties, if any)
+        declarations.append(
+            f": {record}-unordered begin json skipws {key} "
+            f"dup 0 < if {unknown} else dup {len(names)} >= if {len(names)} - "
+            "58 expect then case "
+            + " ".join(cases)
+            + " endcase then peekc 44 = while 1 json skip repeat 125 expect "
+            + " ".join(checks)
+            + " ;"
+        )
 
-        contents = []
-        for keyindex, subschema in enumerate(subschemas):
-            # set the "jump_to" instruction position in the KeyTable
-            instructions[startkeys + keyindex][2] = len(instructions)
-            contents.append(build_assembly(subschema, container, instructions))
-
-        out = ak._v2.forms.RecordForm(contents, names)
-        if is_optional:
-            return ak._v2.forms.IndexedOptionForm("i64", out, form_key=mask)
+        def unordered(i):
+            masks = dict.fromkeys(seen, 0)
+            for j in range(i):
+                masks[f"{record}-seen{j // 30}"] += 1 << (j % 30)
+            return " ".join(f"{mask} {variable} !" for variable, mask in masks.items())
+
+        # objects usually have the properties in schema order, which only needs
+        # one string comparison each
+        ordered = ["123 expect"]
+        for i, name in enumerate(names):
+            if i == 0:
+                ordered.append(
+                    f"json skipws json enum {_match_string(name, ':')} if "
+                    f"{unordered(0)} peekc 125 = if 1 json skip "
+                    + " ".join(checks)
+                    + f" else {record}-unordered then exit then"
+                )
+            else:
+                ordered.append(
+                    f"peekc 44 = if 1 json skip else 125 expect {unordered(i)} "
+                    + " ".join(checks)
+                    + " exit then "
+                    f"json skipws json enum {_match_string(name, ':')} if "
+                    f"{unordered(i)} {record}-unordered exit then"
+                )
+            ordered.append(contents_code[i])
+        if len(names) == 0:
+            ordered.append(f"peekc 125 = if 1 json skip else {record}-unordered then")
         else:
-            return out
+            ordered.append(
+                f"peekc 44 = if 1 json skip {unordered(len(names))} "
+                f"{record}-unordered else 125 expect then"
+            )
+        declarations.append(f": {record}-object " + " ".join(ordered) + " ;")
+
+        return indexed_option(
+            ak._v2.forms.RecordForm(contents, names), f"{record}-object"
+        )
 
     elif isinstance(tpe, list):
         raise ak._v2._util.error(
@@ -0,0 +1,83 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def iter_chunks(array, size, to_list=False, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes) to iterate over.
+        size (int): Maximum number of elements in each chunk; the last chunk
+            has the remainder.
+        to_list (bool): If True, yield each chunk as Python objects (lists,
+            dicts, etc.) through #ak.to_list; otherwise, yield arrays.
+        highlevel (bool): If True, yield #ak.Array chunks; otherwise, yield
+            low-level #ak.layout.Content subclasses. Ignored if `to_list`.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Returns a generator of contiguous, non-overlapping chunks of `array` along
+    its first dimension, each `size` elements long except perhaps the last.
+
+        >>> array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6], [7.7, 8.8, 9.9]])
+        >>> for chunk in ak.iter_chunks(array, 2):
+        ...     print(chunk)
+        ...
+        [[1.1, 2.2, 3.3], []]
+        [[4.4, 5.5], [6.6]]
+        [[7.7, 8.8, 9.9]]
+
+    The chunks are views of `array`, not copies, so getting a chunk costs the
+    same, regardless of how large it is. Iterating over chunks of a few thousand
+    elements, rather than over individual elements, amortizes Python's
+    per-object overhead; with `to_list=True`, each chunk is converted to
+    Python objects in one pass:
+
+        >>> for chunk in ak.iter_chunks(array, 2, to_list=True):
+        ...     for row in chunk:
+        ...         print(row)
+        ...
+        [1.1, 2.2, 3.3]
+        []
+        [4.4, 5.5]
+        [6.6]
+        [7.7, 8.8, 9.9]
+
+    See also #ak.Array.iter_batches and #ak.to_list.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.iter_chunks",
+        dict(
+            array=array,
+            size=size,
+            to_list=to_list,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        # validate before the first chunk is requested, not when it is
+        return _impl(array, size, to_list, highlevel, behavior)
+
+
+def _impl(array, size, to_list, highlevel, behavior):
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+
+    if not ak._v2._util.isint(size) or size <= 0:
+        raise ak._v2._util.error(
+            ValueError(f"chunk size must be a positive integer, not {size!r}")
+        )
+
+    return _chunks(layout, int(size), to_list, highlevel, behavior)
+
+
+def _chunks(layout, size, to_list, highlevel, behavior):
+    length = layout.length
+    for start in range(0, length, size):
+        chunk = layout._getitem_range(slice(start, min(start + size, length)))
+        if to_list:
+            yield chunk.to_list(behavior)
+        else:
+            yield ak._v2._util.wrap(chunk, behavior, highlevel)
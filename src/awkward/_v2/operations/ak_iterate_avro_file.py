@@ -0,0 +1,158 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pathlib
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def iterate_avro_file(
+    file,
+    step_size=100000,
+    entry_start=None,
+    entry_stop=None,
+    num_threads=1,
+    debug_forth=False,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        file (string or fileobject): Avro file to be read as Awkward Arrays.
+        step_size (int): Minimum number of entries in each array; all but the
+            last array end at a block boundary, so they can be longer.
+        entry_start (None or int): First entry to read; if None, start at the
+            beginning of the file.
+        entry_stop (None or int): Entry after the last entry to read; if None,
+            read to the end of the file.
+        num_threads (None or int): Number of threads that decompress blocks of a
+            compressed Avro file ahead of the decoder; if None, use one per
+            core. Ignored for uncompressed files.
+        debug_forth (bool): If True, prints the generated Forth code for debugging.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Returns a generator of arrays that together hold entries `entry_start`
+    through `entry_stop` of an Avro file, reading only as many blocks as each
+    array needs, so that files larger than memory can be processed.
+
+        >>> for array in ak.iterate_avro_file("events.avro", step_size=1000000):
+        ...     do_something(array)
+
+    The schema is parsed and the AwkwardForth program is compiled once, then
+    reused for every array. Getting to `entry_start` only reads the header of
+    each block that is skipped (and checks its sync marker), without
+    decompressing or decoding it, so workers can split a large file by entry
+    ranges cheaply.
+
+    See also #ak.from_avro_file.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.iterate_avro_file",
+        dict(
+            file=file,
+            step_size=step_size,
+            entry_start=entry_start,
+            entry_stop=entry_stop,
+            num_threads=num_threads,
+            debug_forth=debug_forth,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(
+            file,
+            step_size,
+            entry_start,
+            entry_stop,
+            num_threads,
+            debug_forth,
+            highlevel,
+            behavior,
+        )
+
+
+def _impl(
+    file,
+    step_size,
+    entry_start,
+    entry_stop,
+    num_threads,
+    debug_forth,
+    highlevel,
+    behavior,
+):
+    if isinstance(file, pathlib.Path):
+        file = str(file)
+
+    if isinstance(file, str):
+        if not ak._v2._util.is_file_path(file):
+            raise ak._v2._util.error(
+                FileNotFoundError(
+                    "the filename is incorrect or the file does not exist"
+                )
+            )
+    elif not hasattr(file, "read"):
+        raise ak._v2._util.error(
+            TypeError("the fileobject provided is not of the correct type.")
+        )
+
+    if not ak._v2._util.isint(step_size) or step_size <= 0:
+        raise ak._v2._util.error(
+            ValueError(f"step_size must be a positive integer, not {step_size!r}")
+        )
+    if entry_start is None:
+        entry_start = 0
+    for name, value in [("entry_start", entry_start), ("entry_stop", entry_stop)]:
+        if value is not None and (not ak._v2._util.isint(value) or value < 0):
+            raise ak._v2._util.error(
+                ValueError(f"{name} must be None or a non-negative integer")
+            )
+
+    return _arrays(
+        file,
+        int(step_size),
+        int(entry_start),
+        None if entry_stop is None else int(entry_stop),
+        num_threads,
+        debug_forth,
+        highlevel,
+        behavior,
+    )
+
+
+def _arrays(
+    file,
+    step_size,
+    entry_start,
+    entry_stop,
+    num_threads,
+    debug_forth,
+    highlevel,
+    behavior,
+):
+    import awkward._v2._connect.avro
+
+    if entry_stop is not None and entry_stop <= entry_start:
+        return
+
+    if isinstance(file, str):
+        with open(file, "rb") as opened_file:
+            yield from _arrays(
+                opened_file,
+                step_size,
+                entry_start,
+                entry_stop,
+                num_threads,
+                debug_forth,
+                highlevel,
+                behavior,
+            )
+
+    else:
+        reader = awkward._v2._connect.avro.IterateAvroFT(file, debug_forth, num_threads)
+        for layout in reader.chunks(step_size, entry_start, entry_stop):
+            yield ak._v2._util.wrap(layout, behavior, highlevel)
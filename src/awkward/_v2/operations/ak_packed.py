@@ -1,11 +1,15 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import bisect
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
 
 
-def packed(array, highlevel=True, behavior=None):
+def packed(
+    array, highlevel=True, behavior=None, columns=None, return_nbytes_copied=False
+):
     """
     Args:
         array: Array whose internal structure will be packed.
@@ -13,6 +17,14 @@ def packed(array, highlevel=True, behavior=None):
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        columns (None, str, or iterable of str): If not None, only the named
+            columns are kept and packed, using the same syntax as
+            #ak.forms.Form.select_columns (dot-separated field paths with
+            glob wildcards and brace expansion). Unselected fields are
+            dropped without being visited.
+        return_nbytes_copied (bool): If True, return a 2-tuple of the packed
+            array and the number of bytes in its buffers that had to be
+            newly allocated, rather than reused from `array`.
 
     Returns an array with the same type and values as the input, but with packed inner structures:
 
@@ -53,16 +65,207 @@ def packed(array, highlevel=True, behavior=None):
     #ak.to_buffers (though conversions through Arrow, #ak.to_arrow and
     #ak.to_parquet, do not need this because packing is part of that conversion).
 
+    Buffers that are already packed are passed through without copying, so
+    packing a selection of columns from a wide record only costs as much as
+    the selected columns that actually need compaction:
+
+        >>> events = ak.Array({"x": [1, 2, 3], "y": [[1], [2, 2], [3, 3, 3]]})
+        >>> out, nbytes = ak.packed(events[1:], columns=["y"], return_nbytes_copied=True)
+        >>> out.fields
+        ['y']
+        >>> nbytes  # only the rebased offsets of "y"
+        24
+
     See also #ak.to_buffers.
     """
     with ak._v2._util.OperationErrorContext(
         "ak._v2.packed",
-        dict(array=array, highlevel=highlevel, behavior=behavior),
+        dict(
+            array=array,
+            highlevel=highlevel,
+            behavior=behavior,
+            columns=columns,
+            return_nbytes_copied=return_nbytes_copied,
+        ),
     ):
-        return _impl(array, highlevel, behavior)
+        return _impl(array, highlevel, behavior, columns, return_nbytes_copied)
 
 
-def _impl(array, highlevel, behavior):
+def _impl(array, highlevel, behavior, columns, return_nbytes_copied):
     layout = ak._v2.operations.to_layout(array, allow_record=True, allow_other=False)
-    out = layout.packed()
-    return ak._v2._util.wrap(out, behavior, highlevel)
+
+    if columns is None:
+        selected = layout
+    elif isinstance(layout, ak._v2.record.Record):
+        form = layout.array.form.select_columns(columns)
+        selected = ak._v2.record.Record(_select_columns(layout.array, form), layout.at)
+    else:
+        form = layout.form.select_columns(columns)
+        selected = _select_columns(layout, form)
+
+    out = selected.packed()
+    wrapped = ak._v2._util.wrap(out, behavior, highlevel)
+
+    if return_nbytes_copied:
+        return wrapped, _nbytes_copied(layout, out)
+    else:
+        return wrapped
+
+
+def _select_columns(layout, form):
+    # 'form' is 'layout.form.select_columns(...)', which has the same structure
+    # as 'layout' except for fields removed from records (and from unions)
+    if layout.is_RecordType:
+        return ak._v2.contents.RecordArray(
+            [
+                _select_columns(layout.content(field), form.content(field))
+                for field in form.fields
+            ],
+            form.fields,
+            layout.length,
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    elif layout.is_UnionType:
+        if isinstance(form, ak._v2.forms.UnionForm) and len(form.contents) == len(
+            layout.contents
+        ):
+            return ak._v2.contents.UnionArray(
+                layout.tags,
+                layout.index,
+                [_select_columns(x, y) for x, y in zip(layout.contents, form.contents)],
+                layout.identifier,
+                layout.parameters,
+                layout.nplike,
+            )
+        else:
+            # the selection removed whole union members, whose entries can't
+            # be dropped without changing the length of the array
+            raise ak._v2._util.error(
+                ValueError(
+                    "columns select only {} of the {} members of a union; select "
+                    "at least one column from each member".format(
+                        len(form.contents)
+                        if isinstance(form, ak._v2.forms.UnionForm)
+                        else int(not isinstance(form, ak._v2.forms.EmptyForm)),
+                        len(layout.contents),
+                    )
+                )
+            )
+
+    elif isinstance(form, ak._v2.forms.EmptyForm):
+        return layout
+
+    elif isinstance(layout, ak._v2.contents.ListOffsetArray):
+        return ak._v2.contents.ListOffsetArray(
+            layout.offsets,
+            _select_columns(layout.content, form.content),
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    elif isinstance(layout, ak._v2.contents.ListArray):
+        return ak._v2.contents.ListArray(
+            layout.starts,
+            layout.stops,
+            _select_columns(layout.content, form.content),
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    elif isinstance(layout, ak._v2.contents.RegularArray):
+        return ak._v2.contents.RegularArray(
+            _select_columns(layout.content, form.content),
+            layout.size,
+            layout.length,
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    elif isinstance(layout, ak._v2.contents.IndexedOptionArray):
+        return ak._v2.contents.IndexedOptionArray(
+            layout.index,
+            _select_columns(layout.content, form.content),
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    elif isinstance(layout, ak._v2.contents.IndexedArray):
+        return ak._v2.contents.IndexedArray(
+            layout.index,
+            _select_columns(layout.content, form.content),
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    elif isinstance(layout, ak._v2.contents.ByteMaskedArray):
+        return ak._v2.contents.ByteMaskedArray(
+            layout.mask,
+            _select_columns(layout.content, form.content),
+            layout.valid_when,
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    elif isinstance(layout, ak._v2.contents.BitMaskedArray):
+        return ak._v2.contents.BitMaskedArray(
+            layout.mask,
+            _select_columns(layout.content, form.content),
+            layout.valid_when,
+            layout.length,
+            layout.lsb_order,
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    elif isinstance(layout, ak._v2.contents.UnmaskedArray):
+        return ak._v2.contents.UnmaskedArray(
+            _select_columns(layout.content, form.content),
+            layout.identifier,
+            layout.parameters,
+            layout.nplike,
+        )
+
+    else:
+        return layout
+
+
+def _buffers(layout):
+    if isinstance(layout, ak._v2.record.Record):
+        layout = layout.array
+    if not layout.nplike.known_data:
+        return []
+    _, _, container = layout.to_buffers()
+    return list(container.values())
+
+
+def _address(buffer):
+    if hasattr(buffer, "ctypes"):
+        return buffer.ctypes.data
+    else:
+        return buffer.data.ptr
+
+
+def _nbytes_copied(original, packed):
+    spans = sorted((_address(x), _address(x) + x.nbytes) for x in _buffers(original))
+    starts = [start for start, _ in spans]
+    max_stops = []
+    for _, stop in spans:
+        max_stops.append(stop if len(max_stops) == 0 else max(max_stops[-1], stop))
+
+    out = 0
+    for buffer in _buffers(packed):
+        start = _address(buffer)
+        i = bisect.bisect_right(starts, start) - 1
+        if i < 0 or max_stops[i] < start + buffer.nbytes:
+            out += buffer.nbytes
+    return out
@@ -3,9 +3,10 @@
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
 
 
-def strings_astype(array, to, highlevel=True, behavior=None):
+def strings_astype(array, to, highlevel=True, behavior=None, errors="raise"):
     """
     Args:
         array: Array whose strings should be converted to a new numeric type.
@@ -14,6 +15,11 @@ def strings_astype(array, to, highlevel=True, behavior=None):
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        errors ("raise" or "none"): If "raise", strings that can't be
+            converted raise a ValueError naming the first of them; if
+            "none", they are replaced by None (and the numbers become an
+            option type). Only integer and floating-point types can use
+            "none".
 
     Converts all strings in the array to a new type, leaving the structure
     untouched.
@@ -36,23 +42,117 @@ def strings_astype(array, to, highlevel=True, behavior=None):
         >>> ak.strings_astype(array, np.float64)
         <Array [[1.1, 2.2, 3.3], [], [4.4, -5.5]] type='3 * var * float64'>
 
+    Strings that can't be converted can be replaced by None:
+
+        >>> array = ak.Array(["1", "two", "3"])
+        >>> ak.strings_astype(array, np.int64, errors="none")
+        <Array [1, None, 3] type='3 * ?int64'>
+
+    Integers and floating-point numbers are parsed directly from the bytes of
+    the strings, following Python's `int` and `float` syntax, so the strings
+    are not padded to a common length. Integers that don't fit in `to` can't
+    be converted. Other types are converted by NumPy, from strings padded to
+    the longest one.
+
     See also #ak.numbers_astype.
     """
     with ak._v2._util.OperationErrorContext(
         "ak._v2.strings_astype",
-        dict(array=array, to=to, highlevel=highlevel, behavior=behavior),
+        dict(
+            array=array,
+            to=to,
+            highlevel=highlevel,
+            behavior=behavior,
+            errors=errors,
+        ),
     ):
-        return _impl(array, to, highlevel, behavior)
+        return _impl(array, to, highlevel, behavior, errors)
 
 
-def _impl(array, to, highlevel, behavior):
+def _impl(array, to, highlevel, behavior, errors):
     to_dtype = np.dtype(to)
+    if errors not in ("raise", "none"):
+        raise ak._v2._util.error(
+            ValueError(f"errors must be 'raise' or 'none', not {errors!r}")
+        )
+    parse = to_dtype.kind in ("i", "u", "f")
+    if errors == "none" and not parse:
+        raise ak._v2._util.error(
+            ValueError(
+                f"errors='none' is only supported for integer and floating-point "
+                f"types, not {to_dtype}"
+            )
+        )
+
+    def convert(layout, index=None):
+        # strings that aren't reached through `index` (if given) aren't checked
+        starts, stops, data = ak._v2._strings.views(layout)
+        numbers, valid = ak._v2._strings.to_numbers(starts, stops, data, to_dtype)
+        out = ak._v2.contents.NumpyArray(numbers)
+        if errors == "none":
+            return ak._v2.contents.ByteMaskedArray(
+                ak._v2.index.Index8(valid), out, valid_when=True
+            )
+
+        if index is None:
+            checked = valid
+        else:
+            checked = numpy.where(index >= 0, valid[numpy.maximum(index, 0)], True)
+        if not numpy.all(checked):
+            bad = numpy.nonzero(~checked)[0]
+            i = int(bad[0])
+            j = i if index is None else int(index[i])
+            raise ak._v2._util.error(
+                ValueError(
+                    "cannot convert {} strings to {}, such as {!r} at index {}".format(
+                        len(bad), to_dtype, bytes(data[starts[j] : stops[j]]), i
+                    )
+                )
+            )
+        return out
 
     def action(layout, **kwargs):
-        if layout.is_ListType and (
+        if (
+            parse
+            and layout.is_IndexedType
+            and ak._v2._strings.is_string(layout.content)
+        ):
+            index = layout.toIndexedOptionArray64().index
+            content = convert(layout.content, numpy.asarray(index))
+            if layout.is_OptionType or errors == "none":
+                # option of option isn't allowed, so merge the masks
+                return ak._v2.contents.IndexedOptionArray(
+                    index, content, parameters=layout.parameters
+                ).simplify_optiontype()
+            else:
+                return ak._v2.contents.IndexedArray(
+                    layout.index, content, parameters=layout.parameters
+                )
+
+        elif (
+            parse
+            and errors == "none"
+            and layout.is_OptionType
+            and ak._v2._strings.is_string(layout.content)
+        ):
+            index = layout.toIndexedOptionArray64().index
+            return ak._v2.contents.IndexedOptionArray(
+                index, convert(layout.content), parameters=layout.parameters
+            ).simplify_optiontype()
+
+        elif parse and ak._v2._strings.is_string(layout):
+            return convert(layout)
+
+        elif layout.is_ListType and (
             layout.parameter("__array__") == "string"
             or layout.parameter("__array__") == "bytestring"
         ):
+            if errors == "none":
+                raise ak._v2._util.error(
+                    NotImplementedError(
+                        "errors='none' is only implemented for NumPy arrays"
+                    )
+                )
             layout = ak._v2.operations.without_parameters(
                 layout, highlevel=False, behavior=behavior
             )
@@ -0,0 +1,55 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def strings_contains(array, pattern, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested in lists.
+        pattern (str or bytes): Bytes to look for anywhere in each string;
+            str is encoded as UTF-8.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Replaces each string with True if it contains the given bytes and False
+    otherwise, leaving the structure untouched. The bytes are compared
+    directly, without making Python objects.
+
+    For example,
+
+        >>> array = ak.Array([["one", "two"], [], ["three"]])
+        >>> ak.strings_contains(array, "o")
+        <Array [[True, True], [], [False]] type='3 * var * bool'>
+
+    See also #ak.strings_startswith, #ak.strings_endswith.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.strings_contains",
+        dict(array=array, pattern=pattern, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, pattern, highlevel, behavior)
+
+
+def _impl(array, pattern, highlevel, behavior):
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    elif not isinstance(pattern, bytes):
+        raise ak._v2._util.error(
+            TypeError(f"pattern must be str or bytes, not {type(pattern).__name__}")
+        )
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = ak._v2._strings.apply(
+        layout,
+        lambda starts, stops, data: ak._v2._strings.contains(
+            starts, stops, data, pattern
+        ),
+        "strings_contains",
+    )
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,46 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def strings_hash(array, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested in lists.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Replaces each string with a 64-bit hash of its bytes (uint64), leaving the
+    structure untouched.
+
+    Equal strings have equal hashes, so hashes can be used to group or join
+    strings as numbers, but different strings can (rarely) have the same
+    hash, so matches should be checked with `==`. The hash does not depend on
+    the layout of the strings, but it may change between versions of Awkward
+    Array, so don't store it.
+
+    For example,
+
+        >>> array = ak.Array([["one", "two"], [], ["one"]])
+        >>> hashes = ak.strings_hash(array)
+        >>> hashes[0, 0] == hashes[2, 0]
+        True
+
+    See also #ak.to_categorical.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.strings_hash",
+        dict(array=array, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, highlevel, behavior)
+
+
+def _impl(array, highlevel, behavior):
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = ak._v2._strings.apply(layout, ak._v2._strings.hashes, "strings_hash")
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,82 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+import pathlib
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def to_avro_file(array, file, codec="null", block_size=65536):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        file (string or fileobject): Avro file to write; a filename is
+            created or overwritten.
+        codec (str): Compression for each block: `"null"` (none),
+            `"deflate"`, `"bzip2"`, `"xz"`, `"snappy"` (needs the
+            `python-snappy` package), or `"zstandard"` (needs the
+            `zstandard` package).
+        block_size (int): Number of entries in each Avro block.
+
+    Writes an array as an Avro object container file, one Avro datum per
+    element, and returns the Avro schema (as JSON-like Python objects).
+
+    The schema is derived from the array's #ak.forms.Form:
+
+       * booleans, integers, and floating-point numbers become `"boolean"`,
+         `"int"` (32 bits or less) or `"long"`, and `"float"` or `"double"`;
+       * strings and bytestrings become `"string"` and `"bytes"`;
+       * other lists (variable or fixed-length) become `"array"`;
+       * records become `"record"`, named by their `"__record__"` parameter if
+         it is a valid and unique Avro name;
+       * option types become a union with `"null"` and unions become unions.
+
+    Tuples (records without field names) and types without an Avro equivalent
+    (complex numbers, dates) cannot be written.
+
+    The data are encoded directly from the array's buffers, in bulk, without
+    making Python objects for each element. Any Avro reader can read the
+    file, but #ak.from_avro_file can't read unions (other than those with
+    `"null"` for option types) or missing lists (option types of lists other
+    than strings), so arrays with those types have to be read back with
+    another Avro library, such as fastavro.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.to_avro_file",
+        dict(array=array, file=file, codec=codec, block_size=block_size),
+    ):
+        return _impl(array, file, codec, block_size)
+
+
+def _impl(array, file, codec, block_size):
+    import awkward._v2._connect.avro
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+
+    if not ak._v2._util.isint(block_size) or block_size <= 0:
+        raise ak._v2._util.error(
+            ValueError(f"block_size must be a positive integer, not {block_size!r}")
+        )
+
+    sync_marker = os.urandom(16)
+
+    if isinstance(file, pathlib.Path):
+        file = str(file)
+
+    if isinstance(file, str):
+        with open(file, "wb") as opened_file:
+            return awkward._v2._connect.avro.write_avro(
+                opened_file, layout, codec, int(block_size), sync_marker
+            )
+
+    elif hasattr(file, "write"):
+        return awkward._v2._connect.avro.write_avro(
+            file, layout, codec, int(block_size), sync_marker
+        )
+
+    else:
+        raise ak._v2._util.error(
+            TypeError("the fileobject provided is not of the correct type.")
+        )
@@ -8,7 +8,11 @@ np = ak.nplike.NumpyMetadata.instance()
 
 
 def to_pandas(
-    array, how="inner", levelname=lambda i: "sub" * i + "entry", anonymous="values"
+    array,
+    how="inner",
+    levelname=lambda i: "sub" * i + "entry",
+    anonymous="values",
+    arrow_strings=False,
 ):
     """
     Args:
@@ -16,11 +20,16 @@ def to_pandas(
         how (None or str): Passed to
             [pd.merge](https://pandas.pydata.org/pandas-docs/version/1.0.3/reference/api/pandas.merge.html)
             to combine DataFrames for each multiplicity into one DataFrame. If
-            None, a list of Pandas DataFrames is returned.
+            None, a list of Pandas DataFrames is returned. With `"outer"`,
+            rows that have no deeper rows are kept (see below).
         levelname (int -> str): Computes a name for each level of the row index
             from the number of levels deep.
         anonymous (str): Column name to use if the `array` does not contain
             records; otherwise, column names are derived from record fields.
+        arrow_strings (bool): If True, columns of strings and bytestrings are
+            Arrow-backed Pandas arrays, made from the Awkward buffers without
+            Python objects (requires pyarrow and Pandas 1.5 or later);
+            otherwise, they have object dtype.
 
     Converts Awkward data structures into Pandas
     [MultiIndex](https://pandas.pydata.org/pandas-docs/stable/user_guide/advanced.html)
@@ -34,6 +43,18 @@ def to_pandas(
     if it contains only one DataFrame); otherwise `how` is passed to
     [pd.merge](https://pandas.pydata.org/pandas-docs/version/1.0.3/reference/api/pandas.merge.html)
     to merge them into a single DataFrame with the associated loss of data.
+    For `how="inner"` and `how="outer"`, the merged row index is computed
+    directly from the row numbers of the DataFrames, which are joined on the
+    index levels that they have in common, and each column is built once
+    (without a copy, if no rows need to be removed or repeated).
+
+    This makes `how="outer"` a complete outer join, which differs from
+    successive `pd.merge` calls (and from earlier versions of this function):
+    rows of a field that has no deeper rows for them, such as a number next to
+    an empty list, are kept with missing values (NaN) in the index levels that
+    they don't have and in the other fields' columns, which become
+    floating-point if they were integers. Successive `pd.merge` calls dropped
+    these rows.
 
     In the following example, nested lists are converted into MultiIndex rows.
     The index level names `"entry"`, `"subentry"` and `"subsubentry"` can be
@@ -121,18 +142,19 @@ def to_pandas(
               3         4.0  NaN
     """
     with ak._v2._util.OperationErrorContext(
-        "ak._v2.to_layout",
+        "ak._v2.to_pandas",
         dict(
             array=array,
             how=how,
             levelname=levelname,
             anonymous=anonymous,
+            arrow_strings=arrow_strings,
         ),
     ):
-        return _impl(array, how, levelname, anonymous)
+        return _impl(array, how, levelname, anonymous, arrow_strings)
 
 
-def _impl(array, how, levelname, anonymous):
+def _impl(array, how, levelname, anonymous, arrow_strings):
     try:
         import pandas
     except ImportError:
@@ -148,21 +170,29 @@ or
             )
         )
 
-    if how is not None:
-        out = None
-        for df in to_pandas(array, how=None, levelname=levelname, anonymous=anonymous):
-            if out is None:
-                out = df
-            else:
-                out = pandas.merge(out, df, how=how, left_index=True, right_index=True)
-        return out
+    if arrow_strings and not hasattr(pandas.arrays, "ArrowExtensionArray"):
+        raise ak._v2._util.error(
+            ImportError("arrow_strings=True requires Pandas 1.5 or later")
+        )
+
+    def to_column(layout):
+        if arrow_strings and (
+            layout.parameter("__array__") in ("string", "bytestring")
+            or layout.is_OptionType
+            and layout.content.parameter("__array__") in ("string", "bytestring")
+        ):
+            return pandas.arrays.ArrowExtensionArray(
+                ak._v2.operations.to_arrow(layout, extensionarray=False)
+            )
+        else:
+            return ak._v2.operations.to_numpy(layout)
 
     def recurse(layout, row_arrays, col_names):
         if layout.is_IndexedType and not layout.is_OptionType:
             return recurse(layout.project(), row_arrays, col_names)
 
         elif layout.parameter("__array__") in ("string", "bytestring"):
-            return [(ak._v2.operations.to_numpy(layout), row_arrays, col_names)]
+            return [(to_column(layout), row_arrays, col_names)]
 
         elif layout.purelist_depth > 1:
             offsets, flattened = layout._offsets_and_flattened(axis=1, depth=0)
@@ -206,7 +236,7 @@ or
             )
 
         else:
-            return [(ak._v2.operations.to_numpy(layout), row_arrays, col_names)]
+            return [(to_column(layout), row_arrays, col_names)]
 
     layout = ak._v2.operations.to_layout(array, allow_record=True, allow_other=False)
     if isinstance(layout, ak._v2.record.Record):
@@ -214,11 +244,35 @@ or
     else:
         layout2 = layout
 
-    tables = []
-    last_row_arrays = None
+    columns = []
     for column, row_arrays, col_names in recurse(layout2, [], ()):
         if isinstance(layout, ak._v2.record.Record):
             row_arrays = row_arrays[1:]  # Record --> one-element RecordArray
+        columns.append((column, row_arrays, col_names))
+
+    if how in ("inner", "outer") and not isinstance(layout, ak._v2.record.Record):
+        out = _joined(pandas, columns, how, levelname, anonymous)
+        if out is not None:
+            return out
+
+    tables = _tables(pandas, columns, levelname, anonymous)
+    if how is None:
+        return tables
+    else:
+        out = None
+        for df in tables:
+            if out is None:
+                out = df
+            else:
+                out = pandas.merge(out, df, how=how, left_index=True, right_index=True)
+        return out
+
+
+def _tables(pandas, columns, levelname, anonymous):
+    # one DataFrame for each run of columns with the same rows
+    tables = []
+    last_row_arrays = None
+    for column, row_arrays, col_names in columns:
         if len(col_names) == 0:
             columns = [anonymous]
         else:
@@ -269,3 +323,160 @@ or
             table.columns = table.columns.get_level_values(0)
 
     return tables
+
+
+def _same_rows(row_arrays1, row_arrays2):
+    return len(row_arrays1) == len(row_arrays2) and all(
+        x is y or numpy.array_equal(x, y) for x, y in zip(row_arrays1, row_arrays2)
+    )
+
+
+def _encode(levels, depth, radices):
+    # one int64 key per row for its first `depth` levels, in the same order as
+    # the tuples; missing values (-1) are before all others
+    key = numpy.zeros(len(levels[0]) if len(levels) > 0 else 0, dtype=np.int64)
+    for level, radix in zip(levels[:depth], radices):
+        key = key * radix + (level.astype(np.int64) + 1)
+    return key
+
+
+def _join(levels1, levels2, how, radices):
+    """
+    Joins two sets of rows, each a list of `levels` that are sorted and unique
+    as tuples, on the levels they have in common (as pd.merge does with
+    MultiIndexes with left_index and right_index), so that the rows of the
+    shallower set are repeated for each row of the deeper set that starts
+    with it.
+
+    Returns the levels of the joined rows (sorted) and the row numbers in
+    `levels1` and `levels2` for each of them, which are -1 where missing.
+    """
+    common = min(len(levels1), len(levels2))
+    if len(levels1) >= len(levels2):
+        deep, shallow = levels1, levels2
+    else:
+        deep, shallow = levels2, levels1
+
+    deep_keys = _encode(deep, common, radices)
+    shallow_keys = _encode(shallow, common, radices)
+    match = numpy.searchsorted(shallow_keys, deep_keys)
+    clipped = numpy.minimum(match, max(len(shallow_keys) - 1, 0))
+    matched = match < len(shallow_keys)
+    if len(shallow_keys) != 0:
+        matched &= shallow_keys[clipped] == deep_keys
+    match = numpy.where(matched, match, -1)
+
+    deep_rows = numpy.arange(len(deep_keys), dtype=np.int64)
+    if how == "inner":
+        deep_rows = deep_rows[matched]
+    deep_index, shallow_index = deep_rows, match[deep_rows]
+    levels = [x[deep_rows] for x in deep]
+
+    if how == "outer":
+        used = numpy.zeros(len(shallow_keys), dtype=np.bool_)
+        used[match[matched]] = True
+        extra = numpy.nonzero(~used)[0]
+        if len(extra) != 0:
+            missing = numpy.full(len(extra), -1, dtype=np.int64)
+            deep_index = numpy.concatenate([deep_index, missing])
+            shallow_index = numpy.concatenate([shallow_index, extra])
+            levels = [
+                numpy.concatenate(
+                    [x, shallow[i][extra] if i < len(shallow) else missing]
+                )
+                for i, x in enumerate(levels)
+            ]
+            order = numpy.argsort(_encode(levels, len(levels), radices), kind="stable")
+            deep_index, shallow_index = deep_index[order], shallow_index[order]
+            levels = [x[order] for x in levels]
+
+    if len(levels1) >= len(levels2):
+        return levels, deep_index, shallow_index
+    else:
+        return levels, shallow_index, deep_index
+
+
+def _compose(take, rows):
+    # take[rows], where -1 in rows stays -1
+    out = numpy.full(len(rows), -1, dtype=np.int64)
+    found = rows >= 0
+    out[found] = take[rows[found]]
+    return out
+
+
+def _joined(pandas, columns, how, levelname, anonymous):
+    """
+    Computes the DataFrame that merging the DataFrames of `_tables` would,
+    directly from their row numbers, or returns None if the rows are too deep
+    to encode as int64 keys (and the DataFrames have to be merged).
+    """
+    # runs of columns with the same rows, as in _tables
+    groups = []
+    for column, row_arrays, col_names in columns:
+        if len(row_arrays) == 0:
+            row_arrays = [numpy.arange(len(column), dtype=np.int64)]
+        if len(groups) != 0 and _same_rows(groups[-1][0], row_arrays):
+            groups[-1][1].append((column, col_names))
+        else:
+            groups.append((row_arrays, [(column, col_names)]))
+    if len(groups) == 0:
+        return None
+
+    depth = max(len(row_arrays) for row_arrays, _ in groups)
+    radices = [2] * depth
+    for row_arrays, _ in groups:
+        for i, x in enumerate(row_arrays):
+            if len(x) != 0:
+                radices[i] = max(radices[i], int(x.max()) + 2)
+    total = 1
+    for radix in radices:
+        total *= radix
+    if total >= 2**63:
+        return None
+
+    # row numbers in each group for each output row, or None if they're the same
+    levels = list(groups[0][0])
+    takes = [None]
+    for row_arrays, _ in groups[1:]:
+        if _same_rows(levels, row_arrays):
+            takes.append(None)
+            continue
+        levels, left, right = _join(levels, list(row_arrays), how, radices)
+        takes = [left if x is None else _compose(x, left) for x in takes]
+        takes.append(right)
+
+    data, names = {}, []
+    for take, (_, group) in zip(takes, groups):
+        for column, col_names in group:
+            if take is not None:
+                if isinstance(column, numpy.ma.MaskedArray):
+                    column = pandas.Series(column).to_numpy()
+                column = pandas.api.extensions.take(column, take, allow_fill=True)
+            data[len(data)] = column
+            names.append((anonymous,) if len(col_names) == 0 else col_names)
+
+    if len(groups) == 1 and len(columns[0][1]) == 0:
+        index = pandas.RangeIndex(len(levels[0]), name=levelname(0))
+    elif all(x is None for x in takes):
+        index = pandas.MultiIndex.from_arrays(
+            levels, names=[levelname(i) for i in range(len(levels))]
+        )
+    else:
+        index = pandas.MultiIndex(
+            levels=[
+                numpy.arange(radix - 1, dtype=x.dtype)
+                for x, radix in zip(levels, radices)
+            ],
+            codes=levels,
+            names=[levelname(i) for i in range(len(levels))],
+        )
+
+    out = pandas.DataFrame(data, index=index, copy=False)
+    width = max(len(x) for x in names)
+    if width == 1:
+        out.columns = [x[0] for x in names]
+    else:
+        out.columns = pandas.MultiIndex.from_tuples(
+            [x + ("",) * (width - len(x)) for x in names]
+        )
+    return out
@@ -0,0 +1,662 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import bisect
+import numbers
+
+from collections.abc import Iterable
+
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+
+def partition_as(sample, arrays):
+    """
+    Args:
+        sample (#ak._v2.partition.PartitionedArray): Array whose partitioning
+            is to be copied.
+        arrays (list or dict): Arrays to partition like `sample`.
+
+    Returns the `arrays` with the same partitions as `sample`: PartitionedArrays
+    are repartitioned, array-like data with the same length as `sample` are
+    sliced at its stops, and anything else (such as scalars) is passed through.
+    """
+    if isinstance(arrays, dict):
+        return {n: _partition_as(sample, x) for n, x in arrays.items()}
+    else:
+        return [_partition_as(sample, x) for x in arrays]
+
+
+def _partition_as(sample, x):
+    if isinstance(x, PartitionedArray):
+        return x.repartition(sample.stops)
+
+    if isinstance(x, (ak._v2.highlevel.Array, ak._v2.contents.Content)) or (
+        isinstance(x, numpy.ndarray) and x.ndim != 0
+    ):
+        layout = ak._v2.operations.to_layout(x, allow_record=False, allow_other=False)
+        if layout.length == len(sample):
+            return PartitionedArray.from_layout(layout, sample.stops, sample.behavior)
+
+    return x
+
+
+def iterate(numpartitions, arrays):
+    """
+    Yields the `arrays` (list or dict) for each of `numpartitions` partitions:
+    PartitionedArrays are replaced by their partitions (as #ak.Array) and
+    anything else is passed through.
+    """
+    if isinstance(arrays, dict):
+        for partitionid in range(numpartitions):
+            yield {
+                n: x.partition(partitionid) if isinstance(x, PartitionedArray) else x
+                for n, x in arrays.items()
+            }
+    else:
+        for partitionid in range(numpartitions):
+            yield [
+                x.partition(partitionid) if isinstance(x, PartitionedArray) else x
+                for x in arrays
+            ]
+
+
+def apply(function, *arrays, executor=None):
+    """
+    Args:
+        function (callable): Function to apply to each partition; it is called
+            with one #ak.Array (or non-partitioned argument) per array.
+        arrays: Arguments of the function, at least one of which must be a
+            #ak._v2.partition.PartitionedArray. The others are partitioned
+            like the first one with #ak._v2.partition.partition_as.
+        executor (None or `concurrent.futures.Executor`-like): Object whose
+            `map(function, *iterables)` method runs the partitions, possibly
+            in parallel. If None, the executor of the first PartitionedArray
+            is used, and if that is None, the partitions are run in order.
+
+    Applies `function` to each set of aligned partitions and returns a
+    PartitionedArray of the results with the same stops, or a tuple of
+    PartitionedArrays if `function` returns tuples. If the results are not
+    arrays (e.g. scalars), they are returned as a list.
+    """
+    sample = None
+    for x in arrays:
+        if isinstance(x, PartitionedArray):
+            sample = x
+            break
+    if sample is None:
+        raise ak._v2._util.error(
+            TypeError("at least one argument must be a PartitionedArray")
+        )
+
+    arguments = [
+        [x.partition(i) for i in range(x.numpartitions)]
+        if isinstance(x, PartitionedArray)
+        else [x] * sample.numpartitions
+        for x in partition_as(sample, arrays)
+    ]
+    results = list(_map(executor or sample.executor, function, *arguments))
+    return _collect(results, sample.behavior, sample.executor)
+
+
+def reduce(reducer, array, axis=None, executor=None, **kwargs):
+    """
+    Args:
+        reducer (callable): A reducer, such as #ak.sum, #ak.prod, #ak.min,
+            #ak.max, #ak.any, #ak.all, #ak.count, #ak.count_nonzero,
+            #ak.argmin, or #ak.argmax.
+        array (#ak._v2.partition.PartitionedArray): Data to reduce.
+        axis (None or int): As in the reducer.
+        executor (None or `concurrent.futures.Executor`-like): As in
+            #ak._v2.partition.apply.
+        kwargs: Passed to the reducer, such as `keepdims` and
+            `mask_identity`.
+
+    Reduces each partition with `reducer` on the `executor` and combines the
+    results. If `axis` is 0 or None, the partitions' results are reduced
+    again (counts are summed), so that the result is the same as reducing
+    the concatenated array. Otherwise, the lists of each partition are
+    independent and the result is a PartitionedArray with the same stops.
+
+    The #ak.argmin and #ak.argmax reducers can't be combined along `axis=0`.
+    """
+    if axis is not None and axis < 0:
+        depth = array.partitions[0].purelist_depth
+        if depth + axis == 0:
+            axis = 0
+
+    if axis is not None and axis != 0:
+        return apply(_Reduce(reducer, axis, kwargs), array, executor=executor)
+
+    name = getattr(reducer, "__name__", None)
+    if name in ("argmin", "argmax"):
+        if axis == 0:
+            raise ak._v2._util.error(
+                ValueError(
+                    f"ak.{name} of a PartitionedArray can't be combined along axis=0"
+                )
+            )
+        return _reduce_position(reducer, array, executor, kwargs)
+
+    try:
+        combiner = _combiners[name]
+    except KeyError:
+        raise ak._v2._util.error(
+            ValueError(f"don't know how to combine the partitions of {reducer!r}")
+        ) from None
+
+    inner = dict(kwargs)
+    if axis is not None:
+        inner["keepdims"] = False
+    mapped = _map(
+        executor or array.executor,
+        _Reduce(reducer, axis, inner),
+        [array.partition(i) for i in range(array.numpartitions)],
+    )
+
+    mapped = list(mapped)
+    outer = {n: x for n, x in kwargs.items() if n in ("keepdims", "mask_identity")}
+    combiner = getattr(ak._v2.operations, combiner)
+
+    if all(
+        isinstance(x, (ak._v2.highlevel.Array, ak._v2.contents.Content)) for x in mapped
+    ):
+        # the partitions' results are the entries of a new outermost dimension,
+        # which is reduced (with the same alignment of nested lists as axis=0)
+        results = [ak._v2.operations.to_layout(x) for x in mapped]
+        offsets = numpy.zeros(len(results) + 1, dtype=np.int64)
+        offsets[1:] = numpy.cumsum(
+            numpy.asarray([x.length for x in results], dtype=np.int64)
+        )
+        stacked = ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(offsets),
+            ak._v2.operations.concatenate(results, axis=0, highlevel=False),
+        )
+        return combiner(ak._v2._util.wrap(stacked, array.behavior), axis=0, **outer)
+
+    else:
+        results = [x for x in mapped if x is not None]
+        if len(results) == 0:
+            return None
+        return combiner(numpy.asarray(results))
+
+
+_combiners = {
+    "sum": "sum",
+    "prod": "prod",
+    "min": "min",
+    "max": "max",
+    "any": "any",
+    "all": "all",
+    "count": "sum",
+    "count_nonzero": "sum",
+}
+
+
+def _reduce_position(reducer, array, executor, kwargs):
+    # argmin/argmax with axis=None: position of the best partition's result
+    # in the flattened array
+    values = (
+        ak._v2.operations.min if reducer.__name__ == "argmin" else ak._v2.operations.max
+    )
+    partitions = [array.partition(i) for i in range(array.numpartitions)]
+    mapped = _map(executor or array.executor, _Positions(reducer, values), partitions)
+
+    best, out, start = None, None, 0
+    for value, position, count in mapped:
+        if position is not None and (
+            best is None
+            or (value < best if reducer.__name__ == "argmin" else value > best)
+        ):
+            best, out = value, start + position
+        start += count
+    return out
+
+
+def _map(executor, function, *iterables):
+    if executor is None:
+        return map(function, *iterables)
+    else:
+        return executor.map(function, *iterables)
+
+
+def _collect(results, behavior, executor):
+    if all(isinstance(x, tuple) for x in results) and len(results) != 0:
+        return tuple(_collect(list(x), behavior, executor) for x in zip(*results))
+    elif all(
+        isinstance(x, (ak._v2.highlevel.Array, ak._v2.contents.Content))
+        for x in results
+    ):
+        return PartitionedArray(
+            [ak._v2.operations.to_layout(x) for x in results],
+            behavior=behavior,
+            executor=executor,
+        )
+    else:
+        return results
+
+
+class _Reduce:
+    # picklable, so that the reducer can run in a process pool
+    def __init__(self, reducer, axis, kwargs):
+        self.reducer = reducer
+        self.axis = axis
+        self.kwargs = kwargs
+
+    def __call__(self, array):
+        return self.reducer(array, axis=self.axis, **self.kwargs)
+
+
+class _Positions:
+    def __init__(self, reducer, values):
+        self.reducer = reducer
+        self.values = values
+
+    def __call__(self, array):
+        return (
+            self.values(array, axis=None),
+            self.reducer(array, axis=None),
+            ak._v2.operations.count(array, axis=None),
+        )
+
+
+class _Ufunc:
+    def __init__(self, ufunc, method, kwargs):
+        self.ufunc = ufunc
+        self.method = method
+        self.kwargs = kwargs
+
+    def __call__(self, *inputs):
+        return getattr(self.ufunc, self.method)(*inputs, **self.kwargs)
+
+
+class PartitionedArray(NDArrayOperatorsMixin):
+    """
+    Args:
+        partitions (list of #ak._v2.contents.Content or #ak.Array): The
+            partitions, in order.
+        stops (None or list of int): The index just after the last element
+            of each partition; computed from the partitions' lengths if None.
+        behavior (None or dict): Custom #ak.behavior for the partitions.
+        executor (None or `concurrent.futures.Executor`-like): Default
+            executor for #ak._v2.partition.apply and
+            #ak._v2.partition.reduce, including NumPy ufuncs and operators on
+            this array.
+
+    An array that is split into contiguous ranges of entries, each of which is
+    a separate layout, such as the chunks of an Arrow ChunkedArray or the
+    files of a dataset. Nothing is concatenated unless #to_content is called
+    or a selection needs entries from several partitions at once.
+
+    Integers, slices, and field names are resolved by binary search over the
+    stops and applied to the partitions that they cover. Ufuncs and operators
+    are applied partition by partition, with #ak._v2.partition.apply, and
+    reductions with #ak._v2.partition.reduce.
+
+    Empty partitions are dropped, unless all of them are empty.
+    """
+
+    def __init__(self, partitions, stops=None, behavior=None, executor=None):
+        layouts = [
+            ak._v2.operations.to_layout(x, allow_record=False, allow_other=False)
+            for x in partitions
+        ]
+        if len(layouts) == 0:
+            raise ak._v2._util.error(
+                ValueError("a PartitionedArray must have at least one partition")
+            )
+
+        if stops is None:
+            stops = []
+            for x in layouts:
+                stops.append((stops[-1] if len(stops) != 0 else 0) + x.length)
+        else:
+            stops = [int(x) for x in stops]
+            if len(stops) != len(layouts):
+                raise ak._v2._util.error(
+                    ValueError("there must be one stop for each partition")
+                )
+            start = 0
+            for x, stop in zip(layouts, stops):
+                if stop - start != x.length:
+                    raise ak._v2._util.error(
+                        ValueError(
+                            "PartitionedArray stops do not match partition lengths"
+                        )
+                    )
+                start = stop
+
+        nonempty = [
+            i
+            for i in range(len(layouts))
+            if stops[i] != (stops[i - 1] if i != 0 else 0)
+        ]
+        if len(nonempty) == 0:
+            nonempty = [0]
+        self._partitions = [layouts[i] for i in nonempty]
+        self._stops = [stops[i] for i in nonempty]
+        self._behavior = behavior
+        self._executor = executor
+
+    @classmethod
+    def from_layout(cls, layout, stops, behavior=None, executor=None):
+        """
+        Slices `layout` at `stops` (views, not copies).
+        """
+        partitions = []
+        start = 0
+        for stop in stops:
+            partitions.append(layout[start:stop])
+            start = stop
+        return cls(partitions, stops, behavior, executor)
+
+    @property
+    def partitions(self):
+        """
+        The partitions, as layouts.
+        """
+        return self._partitions
+
+    @property
+    def numpartitions(self):
+        return len(self._partitions)
+
+    @property
+    def stops(self):
+        return self._stops
+
+    @property
+    def lengths(self):
+        return [x.length for x in self._partitions]
+
+    @property
+    def behavior(self):
+        return self._behavior
+
+    @property
+    def executor(self):
+        return self._executor
+
+    def start(self, partitionid):
+        return 0 if partitionid == 0 else self._stops[partitionid - 1]
+
+    def stop(self, partitionid):
+        return self._stops[partitionid]
+
+    def partition(self, partitionid):
+        """
+        The partition, as an #ak.Array.
+        """
+        return ak._v2._util.wrap(self._partitions[partitionid], self._behavior)
+
+    def partitionid_index_at(self, at):
+        """
+        Returns the partition that contains entry `at` and the index of that
+        entry in the partition.
+        """
+        partitionid = bisect.bisect_right(self._stops, at)
+        return partitionid, at - self.start(partitionid)
+
+    def replace_partitions(self, partitions):
+        return PartitionedArray(partitions, None, self._behavior, self._executor)
+
+    def repartition(self, stops):
+        """
+        Returns the same data with different `stops`. Partitions whose
+        boundaries don't change are not copied.
+        """
+        stops = [int(x) for x in stops]
+        if stops == self._stops:
+            return self
+        if len(stops) == 0 or stops[-1] != len(self):
+            raise ak._v2._util.error(
+                ValueError("the last stop must be the length of the array")
+            )
+
+        partitions = []
+        start = 0
+        for stop in stops:
+            pieces = self._range(start, stop)
+            if len(pieces) == 1:
+                partitions.append(pieces[0])
+            else:
+                partitions.append(
+                    ak._v2.operations.concatenate(pieces, axis=0, highlevel=False)
+                )
+            start = stop
+        return PartitionedArray(partitions, stops, self._behavior, self._executor)
+
+    def _range(self, start, stop):
+        # views of the partitions that are (partly) in [start, stop)
+        first, _ = self.partitionid_index_at(start)
+        pieces = []
+        for i in range(first, self.numpartitions):
+            partstart = self.start(i)
+            if partstart >= stop and len(pieces) != 0:
+                break
+            pieces.append(
+                self._partitions[i][
+                    max(start - partstart, 0) : min(stop, self._stops[i]) - partstart
+                ]
+            )
+        return pieces
+
+    def to_content(self):
+        """
+        Concatenates the partitions into a single layout.
+        """
+        if self.numpartitions == 1:
+            return self._partitions[0]
+        else:
+            return ak._v2.operations.concatenate(
+                self._partitions, axis=0, highlevel=False
+            )
+
+    def to_list(self):
+        out = []
+        for i in range(self.numpartitions):
+            out.extend(self._partitions[i].to_list(self._behavior))
+        return out
+
+    def tolist(self):
+        return self.to_list()
+
+    @property
+    def type(self):
+        out = None
+        for x in self._partitions:
+            if out is None:
+                out = x.form.type_from_behavior(self._behavior)
+            elif out != x.form.type_from_behavior(self._behavior):
+                raise ak._v2._util.error(
+                    ValueError("inconsistent types in PartitionedArray")
+                )
+        return ak._v2.types.ArrayType(out, len(self))
+
+    @property
+    def nbytes(self):
+        return sum(x.nbytes for x in self._partitions)
+
+    def __len__(self):
+        return self._stops[-1]
+
+    def __repr__(self):
+        return "<PartitionedArray of {} partitions, type={}>".format(
+            self.numpartitions, repr(str(self.type))
+        )
+
+    def __iter__(self):
+        for i in range(self.numpartitions):
+            yield from self.partition(i)
+
+    def __getitem__(self, where):
+        if not isinstance(where, (bool, np.bool_)) and isinstance(
+            where, (numbers.Integral, np.integer)
+        ):
+            at = int(where)
+            if at < 0:
+                at += len(self)
+            if not 0 <= at < len(self):
+                raise ak._v2._util.error(
+                    IndexError(f"{type(self).__name__} index out of range")
+                )
+            partitionid, index = self.partitionid_index_at(at)
+            return self.partition(partitionid)[index]
+
+        elif isinstance(where, slice):
+            return self._getitem_range(where)
+
+        elif isinstance(where, str) or (
+            isinstance(where, Iterable)
+            and not isinstance(where, tuple)
+            and len(where) > 0
+            and all(isinstance(x, str) for x in where)
+        ):
+            if not isinstance(where, str):
+                where = list(where)
+            return self.replace_partitions([x[where] for x in self._partitions])
+
+        elif isinstance(where, tuple) and len(where) == 0:
+            return self
+
+        elif isinstance(where, tuple):
+            head, tail = where[0], where[1:]
+            if not isinstance(head, (bool, np.bool_)) and isinstance(
+                head, (numbers.Integral, np.integer)
+            ):
+                out = self[head]
+                return out if len(tail) == 0 else out[tail]
+            elif isinstance(head, slice):
+                return self[head].apply_tail(tail)
+            elif head is Ellipsis or head is np.newaxis:
+                return ak._v2._util.wrap(self.to_content(), self._behavior)[where]
+
+            out = self[head]
+            if isinstance(out, PartitionedArray):
+                return out.apply_tail(tail)
+            elif len(tail) == 0:
+                return out
+            else:
+                return out[(slice(None),) + tail]
+
+        else:
+            return self._getitem_array(where)
+
+    def apply_tail(self, tail):
+        """
+        Applies a slice of the inner dimensions (everything except the first
+        dimension) to each partition.
+        """
+        if len(tail) == 0:
+            return self
+        where = (slice(None),) + tuple(tail)
+        return PartitionedArray(
+            [x[where] for x in self._partitions],
+            self._stops,
+            self._behavior,
+            self._executor,
+        )
+
+    def _getitem_range(self, where):
+        start, stop, step = where.indices(len(self))
+        partitions, stops = [], []
+        total = 0
+        if step > 0:
+            order = range(self.numpartitions)
+        else:
+            order = range(self.numpartitions - 1, -1, -1)
+
+        for i in order:
+            partstart, partstop = self.start(i), self._stops[i]
+            if step > 0:
+                low, high = max(start, partstart), min(stop, partstop)
+                if low >= high:
+                    continue
+                first = start + -(-(low - start) // step) * step
+                if first >= high:
+                    continue
+                local = slice(first - partstart, high - partstart, step)
+            else:
+                high, low = min(start, partstop - 1), max(stop, partstart - 1)
+                if high <= low:
+                    continue
+                first = start - -(-(start - high) // -step) * -step
+                if first <= low:
+                    continue
+                local = slice(
+                    first - partstart,
+                    None if low < partstart else low - partstart,
+                    step,
+                )
+            partition = self._partitions[i][local]
+            total += partition.length
+            partitions.append(partition)
+            stops.append(total)
+
+        if len(partitions) == 0:
+            partitions, stops = [self._partitions[0][0:0]], [0]
+        return PartitionedArray(partitions, stops, self._behavior, self._executor)
+
+    def _getitem_array(self, where):
+        if isinstance(where, PartitionedArray):
+            layout = where
+        else:
+            layout = ak._v2.operations.to_layout(
+                where, allow_record=False, allow_other=False
+            )
+
+        if isinstance(layout, PartitionedArray):
+            length = len(layout)
+        else:
+            length = layout.length
+
+        if _is_integer_array(layout) or length != len(self):
+            # global positions: entries may come from any partition
+            if isinstance(layout, PartitionedArray):
+                layout = layout.to_content()
+            return ak._v2._util.wrap(self.to_content(), self._behavior)[layout]
+
+        # booleans or nested lists are aligned with the entries, so they can
+        # be applied partition by partition
+        return apply(_Getitem(), self, layout)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or "out" in kwargs:
+            return NotImplemented
+        return apply(_Ufunc(ufunc, method, kwargs), *inputs)
+
+    def __array__(self, *args, **kwargs):
+        return numpy.asarray(
+            ak._v2.operations.to_numpy(self.to_content()), *args, **kwargs
+        )
+
+
+class _Getitem:
+    def __call__(self, array, where):
+        return array[where]
+
+
+def _is_integer_array(layout):
+    if isinstance(layout, PartitionedArray):
+        layout = layout.partitions[0]
+    while isinstance(
+        layout,
+        (
+            ak._v2.contents.IndexedArray,
+            ak._v2.contents.IndexedOptionArray,
+            ak._v2.contents.ByteMaskedArray,
+            ak._v2.contents.BitMaskedArray,
+            ak._v2.contents.UnmaskedArray,
+        ),
+    ):
+        layout = layout.content
+    if isinstance(layout, ak._v2.contents.EmptyArray):
+        return True
+    return (
+        isinstance(layout, ak._v2.contents.NumpyArray)
+        and len(layout.shape) == 1
+        and layout.dtype.kind in ("i", "u")
+    )
@@ -18,13 +18,18 @@ def of(*arrays):
         if nplike is not None:
             nplikes.add(nplike)
         else:
-            from awkward._v2._util import is_numpy_buffer, is_cupy_buffer, is_jax_buffer
+            from awkward._v2._util import (
+                is_numpy_buffer,
+                is_cupy_buffer,
+                is_jax_buffer,
+                is_jax_tracer,
+            )
 
             if is_numpy_buffer(array):
                 nplikes.add(ak.nplike.Numpy.instance())
             elif is_cupy_buffer(array):
                 nplikes.add(ak.nplike.Cupy.instance())
-            elif is_jax_buffer(array):
+            elif is_jax_buffer(array) or is_jax_tracer(array):
                 nplikes.add(ak.nplike.Jax.instance())
 
     if any(isinstance(x, ak._v2._typetracer.TypeTracer) for x in nplikes):
@@ -0,0 +1,34 @@
+# Time ak._v2.concatenate on many small chunks, which is dominated by the
+# per-chunk overhead (not the amount of data) of mergemany at each node.
+
+import time
+
+import numpy as np
+import awkward as ak
+
+rng = np.random.default_rng(12345)
+
+
+def chunk(length):
+    counts = rng.poisson(3, length)
+    jagged = ak._v2.unflatten(rng.normal(size=counts.sum()), counts)
+    flat = ak._v2.Array(rng.integers(0, 10, length))
+    option = ak._v2.mask(flat, flat > 2)
+    strings = ak._v2.Array([str(x) for x in range(length)])
+    return ak._v2.zip(
+        {"jagged": jagged, "option": option, "strings": strings, "flat": flat},
+        depth_limit=1,
+    )
+
+
+for numchunks, length in [(100, 1000), (1000, 100), (10000, 10)]:
+    chunks = [chunk(length) for _ in range(numchunks)]
+    inputs = {"records": chunks}
+    for field in chunks[0].fields:
+        inputs[field] = [x[field] for x in chunks]
+
+    for label, arrays in inputs.items():
+        start = time.perf_counter()
+        ak._v2.concatenate(arrays)
+        elapsed = time.perf_counter() - start
+        print(f"{numchunks:6d} chunks of {length:5d} {label:8s} {elapsed:8.4f} s")
@@ -0,0 +1,53 @@
+# Time the JAX reducers (ak._v2._connect.jax._reducers), eagerly and inside
+# jax.jit, against the NumPy backend on the same jagged array (CPU only).
+
+import time
+
+import numpy as np
+import awkward as ak
+import jax
+
+jax.config.update("jax_platform_name", "cpu")
+jax.config.update("jax_enable_x64", True)
+
+num = 1000000
+
+counts = np.random.poisson(5, num)
+content = np.random.normal(0, 1, counts.sum())
+layout = ak._v2.contents.ListOffsetArray(
+    ak._v2.index.Index64(np.concatenate([[0], np.cumsum(counts)])),
+    ak._v2.contents.NumpyArray(content),
+)
+numpy_array = ak._v2.Array(layout)
+jax_array = ak._v2.to_backend(numpy_array, "jax")
+
+
+def run(label, function, repeat=5):
+    function()  # compile or warm up
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = function()
+        if isinstance(out, ak._v2.Array) and isinstance(
+            out.layout.nplike, ak.nplike.Jax
+        ):
+            jax.block_until_ready(ak._v2.to_layout(out).data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:40s} {best:8.4f} s")
+
+
+reducers = {
+    "sum": lambda x: ak._v2.sum(x, axis=1),
+    "prod": lambda x: ak._v2.prod(x, axis=1),
+    "min": lambda x: ak._v2.min(x, axis=1, mask_identity=False),
+    "max": lambda x: ak._v2.max(x, axis=1, mask_identity=False),
+    "argmin": lambda x: ak._v2.argmin(x, axis=1, mask_identity=False),
+    "argmax": lambda x: ak._v2.argmax(x, axis=1, mask_identity=False),
+}
+
+for name, reducer in reducers.items():
+    run(f"{name} (NumPy)", lambda: reducer(numpy_array))
+    run(f"{name} (JAX)", lambda: reducer(jax_array))
+    jitted = jax.jit(reducer)
+    run(f"{name} (JAX, jit)", lambda: jitted(jax_array))
@@ -0,0 +1,67 @@
+# Per-event kernels on ak._v2 arrays in Numba, with numba.prange over events,
+# for increasing numbers of threads. ArrayViews and RecordViews are read-only
+# and don't touch reference counts, so the events are independent and the
+# kernels should scale with the number of cores.
+#
+# Note that Numba doesn't propagate exceptions out of a prange body: an index
+# out of bounds stops that thread's chunk of events without an error, so check
+# kernels serially (parallel=False) first.
+
+import time
+
+import numba
+import numpy as np
+import awkward as ak
+
+ak._v2.numba.register()
+
+num_events = 1000000
+
+counts = np.random.poisson(5, num_events)
+jets = ak._v2.zip(
+    {
+        "pt": ak._v2.unflatten(np.random.exponential(20, counts.sum()), counts),
+        "eta": ak._v2.unflatten(np.random.normal(0, 2, counts.sum()), counts),
+        "phi": ak._v2.unflatten(np.random.uniform(-3, 3, counts.sum()), counts),
+    }
+)
+events = ak._v2.zip(
+    {"met": np.random.exponential(30, num_events), "jets": jets}, depth_limit=1
+)
+
+
+def kernel(events):
+    # mass of the closest pair of jets in each event
+    out = np.zeros(len(events))
+    for i in numba.prange(len(events)):
+        jets = events[i].jets
+        best = np.inf
+        for j in range(len(jets)):
+            for k in range(j + 1, len(jets)):
+                deta = jets[j].eta - jets[k].eta
+                dphi = jets[j].phi - jets[k].phi
+                dr2 = deta**2 + dphi**2
+                if dr2 < best:
+                    best = dr2
+                    out[i] = np.sqrt(
+                        2 * jets[j].pt * jets[k].pt * (np.cosh(deta) - np.cos(dphi))
+                    )
+    return out
+
+
+serial = numba.njit(kernel)
+parallel = numba.njit(parallel=True)(kernel)
+
+expected = serial(events)
+start = time.perf_counter()
+serial(events)
+print(f"{'serial':20s} {time.perf_counter() - start:10.3f} s")
+
+threads = 1
+while threads <= numba.config.NUMBA_NUM_THREADS:
+    numba.set_num_threads(threads)
+    assert np.array_equal(parallel(events), expected)
+    start = time.perf_counter()
+    parallel(events)
+    print(f"{threads:3d} threads{'':9s} {time.perf_counter() - start:10.3f} s")
+    threads *= 2
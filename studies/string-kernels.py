@@ -0,0 +1,57 @@
+# Time the vectorized string kernels (ak._v2._strings) against a Python loop
+# and, if it is installed, Arrow compute on the same buffers.
+
+import time
+
+import numpy as np
+import awkward as ak
+
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:
+    pyarrow = None
+
+num = 1000000
+
+words = np.array(["apple", "banana", "cherry", "", "dragonfruit", "elderberry"])
+python_one = [f"{words[i % 6]}-{i % 1000}" for i in range(num)]
+python_two = [f"{words[i % 5]}-{i % 1000}" for i in range(num)]
+one = ak._v2.Array(python_one)
+two = ak._v2.Array(python_two)
+
+
+def run(label, function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:40s} {best:8.4f} s")
+
+
+run("== (awkward)", lambda: one == two)
+run("< (awkward)", lambda: one < two)
+run("strings_hash (awkward)", lambda: ak._v2.strings_hash(one))
+run("strings_startswith (awkward)", lambda: ak._v2.strings_startswith(one, "ban"))
+run("strings_endswith (awkward)", lambda: ak._v2.strings_endswith(one, "-99"))
+run("strings_contains (awkward)", lambda: ak._v2.strings_contains(one, "rry-1"))
+run("argsort (awkward)", lambda: ak._v2.argsort(one), repeat=1)
+
+run("== (Python)", lambda: [x == y for x, y in zip(python_one, python_two)])
+run("< (Python)", lambda: [x < y for x, y in zip(python_one, python_two)])
+run("hash (Python)", lambda: [hash(x) for x in python_one])
+run("startswith (Python)", lambda: [x.startswith("ban") for x in python_one])
+run("contains (Python)", lambda: ["rry-1" in x for x in python_one])
+
+if pyarrow is not None:
+    arrow_one = ak._v2.to_arrow(one, extensionarray=False)
+    arrow_two = ak._v2.to_arrow(two, extensionarray=False)
+    compute = pyarrow.compute
+    run("equal (Arrow)", lambda: compute.equal(arrow_one, arrow_two))
+    run("less (Arrow)", lambda: compute.less(arrow_one, arrow_two))
+    run("starts_with (Arrow)", lambda: compute.starts_with(arrow_one, "ban"))
+    run("ends_with (Arrow)", lambda: compute.ends_with(arrow_one, "-99"))
+    run("match_substring (Arrow)", lambda: compute.match_substring(arrow_one, "rry-1"))
+    run("sort_indices (Arrow)", lambda: compute.sort_indices(arrow_one), repeat=1)
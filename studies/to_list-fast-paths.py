@@ -0,0 +1,65 @@
+# Time ak._v2.to_list on the layouts that dominate exports to Python.
+
+import time
+
+import numpy as np
+import awkward as ak
+
+num = 1000000
+
+counts = np.random.poisson(3, num)
+numbers = ak._v2.unflatten(np.random.normal(0, 1, np.sum(counts)), counts)
+ascii_strings = ak._v2.Array([str(x) for x in range(num)])
+utf8_strings = ak._v2.Array([f"α{x}é" for x in range(num)])
+records = ak._v2.zip(
+    {"x": np.arange(num), "y": np.random.normal(0, 1, num), "s": ascii_strings},
+    depth_limit=1,
+)
+tuples = ak._v2.zip((np.arange(num), np.random.normal(0, 1, num)))
+options = ak._v2.Array(
+    ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(np.where(np.arange(num) % 3 == 0, -1, np.arange(num))),
+        ak._v2.contents.NumpyArray(np.arange(num)),
+    )
+)
+masked = ak._v2.mask(np.arange(num), np.arange(num) % 3 != 0)
+regular = ak._v2.to_regular(ak._v2.Array(np.arange(3 * num).reshape(num, 3)))
+
+
+def run(label, array, repeat=3):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        ak._v2.to_list(array)
+    per_call = (time.perf_counter() - start) / repeat
+    print(f"{label:30s} {per_call:8.3f} s")
+
+
+run("var * float64", numbers)
+run("string (ASCII)", ascii_strings)
+run("string (UTF-8)", utf8_strings)
+run("records", records)
+run("tuples", tuples)
+run("?int64 (IndexedOptionArray)", options)
+run("?int64 (ByteMaskedArray)", masked)
+run("3 * int64", regular)
+
+# Before (per-element loops, IndexedOptionArray with list.insert):
+#
+# var * float64                     1.680 s
+# string (ASCII)                    0.910 s
+# string (UTF-8)                    1.046 s
+# records                           2.634 s
+# tuples                            1.080 s
+# ?int64 (IndexedOptionArray)     (quadratic list.insert; stopped before it finished)
+#
+# After (Python-int slicing with the cyclic gc paused only while the sublists
+# are sliced, whole-buffer string decoding, zip):
+#
+# var * float64                     0.758 s
+# string (ASCII)                    0.321 s
+# string (UTF-8)                    0.515 s
+# records                           1.532 s
+# tuples                            0.286 s
+# ?int64 (IndexedOptionArray)       0.095 s
+# ?int64 (ByteMaskedArray)          0.100 s
+# 3 * int64                         0.726 s
@@ -42,10 +42,11 @@ def test_Array():
         return 3.14
 
     f1()
+    # the Lookup is also referenced by the cache in ak._v2._lookup
     assert (
         sys.getrefcount(array._numbaview),
         sys.getrefcount(array._numbaview.lookup),
-    ) == (2, 2)
+    ) == (2, 3)
 
     @numba.njit
     def f2():
@@ -56,7 +57,7 @@ def test_Array():
     assert (
         sys.getrefcount(array._numbaview),
         sys.getrefcount(array._numbaview.lookup),
-    ) == (2, 2)
+    ) == (2, 3)
 
     @numba.njit
     def f3():
@@ -68,25 +69,25 @@ def test_Array():
     assert (
         sys.getrefcount(array._numbaview),
         sys.getrefcount(array._numbaview.lookup),
-    ) == (2, 2)
+    ) == (2, 3)
 
     del a
     assert (
         sys.getrefcount(array._numbaview),
         sys.getrefcount(array._numbaview.lookup),
-    ) == (2, 2)
+    ) == (2, 3)
 
     del b
     assert (
         sys.getrefcount(array._numbaview),
         sys.getrefcount(array._numbaview.lookup),
-    ) == (2, 2)
+    ) == (2, 3)
 
     del c
     assert (
         sys.getrefcount(array._numbaview),
         sys.getrefcount(array._numbaview.lookup),
-    ) == (2, 2)
+    ) == (2, 3)
 
     @numba.njit
     def f4():
@@ -96,7 +97,7 @@ def test_Array():
     assert (
         sys.getrefcount(array._numbaview),
         sys.getrefcount(array._numbaview.lookup),
-    ) == (2, 2)
+    ) == (2, 3)
 
 
 def test_Record():
@@ -0,0 +1,61 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_projection_is_cached():
+    array = ak._v2.Array(
+        [[{"x": 1.1, "y": [1]}, {"x": 2.2, "y": [1, 2]}], [], [{"x": 3.3, "y": []}]]
+    )
+    assert array._field_projections == {}
+
+    first = array.x
+    assert set(array._field_projections) == {"x"}
+    assert array.x.layout is first.layout
+    assert array["x"].layout is first.layout
+    assert array.x.tolist() == [[1.1, 2.2], [], [3.3]]
+    assert array.y.tolist() == [[[1], [1, 2]], [], [[]]]
+    assert set(array._field_projections) == {"x", "y"}
+
+
+def test_cache_invalidation():
+    array = ak._v2.Array([{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}])
+    assert array.x.tolist() == [1, 2]
+
+    array["x"] = np.array([10, 20])
+    assert array._field_projections == {}
+    assert array.x.tolist() == [10, 20]
+
+    del array["x"]
+    assert array._field_projections == {}
+    with pytest.raises(AttributeError):
+        array.x
+
+    assert array.y.tolist() == [1.1, 2.2]
+    array.layout = ak._v2.Array([{"y": 3.3}]).layout
+    assert array._field_projections == {}
+    assert array.y.tolist() == [3.3]
+
+
+def test_child_mutation_does_not_leak():
+    array = ak._v2.Array([{"x": {"a": 1}}, {"x": {"a": 2}}])
+    child = array.x
+    child["b"] = np.array([5, 6])
+    assert child.fields == ["a", "b"]
+    assert array.x.fields == ["a"]
+
+
+def test_recordarray_fast_path():
+    layout = ak._v2.contents.RecordArray(
+        [
+            ak._v2.contents.NumpyArray(np.array([1, 2, 3, 4])),
+            ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 3.3])),
+        ],
+        ["x", "y"],
+    )
+    assert ak._v2.to_list(layout["x"]) == [1, 2, 3]
+    assert ak._v2.to_list(layout["y"]) == [1.1, 2.2, 3.3]
+    with pytest.raises(IndexError):
+        layout["z"]
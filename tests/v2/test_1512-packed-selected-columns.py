@@ -0,0 +1,101 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_already_packed_is_not_copied():
+    array = ak._v2.Array({"x": [1, 2, 3], "y": [[1], [2, 2], [3, 3, 3]]})
+    out, nbytes = ak._v2.operations.packed(
+        array, highlevel=False, return_nbytes_copied=True
+    )
+    assert nbytes == 0
+    assert np.shares_memory(out.content("x").data, array.layout.content("x").data)
+
+
+def test_select_columns():
+    array = ak._v2.Array(
+        [
+            {"a": {"b": 1, "c": [1, 2]}, "d": None, "e": "one"},
+            {"a": {"b": 2, "c": []}, "d": 3, "e": "two"},
+            {"a": {"b": 3, "c": [3]}, "d": 4, "e": "three"},
+        ]
+    )
+
+    out = ak._v2.operations.packed(array, columns="a.c")
+    assert str(out.type) == "3 * {a: {c: var * int64}}"
+    assert out.tolist() == [{"a": {"c": [1, 2]}}, {"a": {"c": []}}, {"a": {"c": [3]}}]
+
+    out = ak._v2.operations.packed(array[1:], columns=["{a.b,d}", "e"])
+    assert out.fields == ["a", "d", "e"]
+    assert out.tolist() == [
+        {"a": {"b": 2}, "d": 3, "e": "two"},
+        {"a": {"b": 3}, "d": 4, "e": "three"},
+    ]
+    assert out.layout.content("e").offsets[0] == 0
+
+    out = ak._v2.operations.packed(array, columns="a.*")
+    assert out.tolist() == ak._v2.operations.packed(array[["a"]]).tolist()
+
+
+def test_only_touched_columns_are_copied():
+    array = ak._v2.Array(
+        {
+            "x": np.arange(100, dtype=np.float64),
+            "y": ak._v2.Array([[1, 2, 3]] * 100),
+            "z": np.arange(100, dtype=np.int32),
+        }
+    )[10:]
+
+    out, nbytes = ak._v2.operations.packed(
+        array, columns=["x", "z"], return_nbytes_copied=True
+    )
+    assert out.fields == ["x", "z"]
+    assert nbytes == 0
+
+    out, nbytes = ak._v2.operations.packed(
+        array, columns="y", return_nbytes_copied=True
+    )
+    assert out.fields == ["y"]
+    assert nbytes == 91 * 8  # rebased offsets; content is a view
+    assert out.tolist() == [{"y": [1, 2, 3]}] * 90
+
+    out, nbytes = ak._v2.operations.packed(
+        array[::-1], columns="x", return_nbytes_copied=True
+    )
+    assert nbytes == 90 * 8
+    assert out.x.tolist() == list(range(99, 9, -1))
+
+
+def test_record():
+    record = ak._v2.Record({"x": 1, "y": [1, 2, 3], "z": 1.1})
+    out = ak._v2.operations.packed(record, columns=["x", "z"])
+    assert isinstance(out, ak._v2.Record)
+    assert out.tolist() == {"x": 1, "z": 1.1}
+
+
+def test_positional_arguments():
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])[1:]
+    out = ak._v2.operations.packed(array, False)
+    assert isinstance(out, ak._v2.contents.ListOffsetArray)
+    assert ak._v2.to_list(out) == [[], [4, 5]]
+
+
+def test_union_members():
+    array = ak._v2.contents.UnionArray(
+        ak._v2.index.Index8(np.array([0, 1, 0], np.int8)),
+        ak._v2.index.Index64(np.array([0, 0, 1], np.int64)),
+        [
+            ak._v2.Array([{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]).layout,
+            ak._v2.Array([{"x": 3, "z": [1]}]).layout,
+        ],
+    )
+
+    out = ak._v2.operations.packed(array, columns=["x", "z"])
+    assert out.tolist() == [{"x": 1}, {"x": 3, "z": [1]}, {"x": 2}]
+    out = ak._v2.operations.packed(array, columns="x")
+    assert out.tolist() == [{"x": 1}, {"x": 3}, {"x": 2}]
+
+    with pytest.raises(ValueError, match="only 1 of the 2 members"):
+        ak._v2.operations.packed(array, columns="y")
@@ -0,0 +1,88 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.fixture
+def lazy_carry_min_fields():
+    original = ak._v2.contents.RecordArray.lazy_carry_min_fields
+    yield
+    ak._v2.contents.RecordArray.lazy_carry_min_fields = original
+
+
+def wide(num_fields):
+    return ak._v2.Array(
+        {f"f{i}": np.arange(10, dtype=np.float64) + 100 * i for i in range(num_fields)}
+    )
+
+
+def test_project_shares_one_index(lazy_carry_min_fields):
+    ak._v2.contents.RecordArray.lazy_carry_min_fields = 8
+    array = wide(10)[np.array([True, False] * 5)]
+    assert isinstance(array.layout, ak._v2.contents.IndexedArray)
+
+    projected = array.layout.project()
+    assert isinstance(projected, ak._v2.contents.RecordArray)
+    assert projected.length == 5
+    indexes = set()
+    for field in projected.fields:
+        content = projected.content(field)
+        assert isinstance(content, ak._v2.contents.IndexedArray)
+        indexes.add(id(content.index))
+    assert len(indexes) == 1
+
+    assert ak._v2.to_list(projected.content("f3")) == [300, 302, 304, 306, 308]
+    assert ak._v2.to_list(projected) == array.tolist()
+
+
+def test_narrow_records_are_eager(lazy_carry_min_fields):
+    ak._v2.contents.RecordArray.lazy_carry_min_fields = 8
+    array = wide(3)[np.array([True, False] * 5)]
+    projected = array.layout.project()
+    for field in projected.fields:
+        assert isinstance(projected.content(field), ak._v2.contents.NumpyArray)
+
+
+def test_policy_disabled(lazy_carry_min_fields):
+    ak._v2.contents.RecordArray.lazy_carry_min_fields = None
+    array = wide(20)[[9, 0, -1]]
+    projected = array.layout.project()
+    for field in projected.fields:
+        assert isinstance(projected.content(field), ak._v2.contents.NumpyArray)
+    assert ak._v2.to_list(projected.content("f1")) == [109, 100, 109]
+
+
+@pytest.mark.parametrize("policy", [None, 1, 8])
+def test_same_results(lazy_carry_min_fields, policy):
+    ak._v2.contents.RecordArray.lazy_carry_min_fields = policy
+    array = wide(10)
+    array["nested"] = ak._v2.zip({"x": array.f0, "y": array.f1 * 2})
+    array["jagged"] = ak._v2.unflatten(np.arange(45), np.arange(10))
+    array["option"] = ak._v2.Array([1, None, 3, None, 5, None, 7, None, 9, None])
+
+    selected = array[array.f0 % 3 != 1]
+    assert ak._v2.with_field(selected, 1, "w").f5.tolist() == [
+        500,
+        502,
+        503,
+        505,
+        506,
+        508,
+        509,
+    ]
+    assert ak._v2.to_list(selected.layout.project()) == selected.tolist()
+    assert selected.nested.y.tolist() == [200, 204, 206, 210, 212, 216, 218]
+    assert selected.option.tolist() == [1, 3, None, None, 7, 9, None]
+    assert selected.jagged[:, :1].tolist() == [[], [1], [3], [10], [15], [28], [36]]
+
+    jagged = ak._v2.unflatten(array, [3, 0, 2, 5])
+    cut = jagged[jagged.f1 > 101]
+    assert ak._v2.with_field(cut, 1, "w").f0.tolist() == [
+        [2],
+        [],
+        [3, 4],
+        [5, 6, 7, 8, 9],
+    ]
+    assert ak._v2.firsts(cut).nested.x.tolist() == [2, None, 3, 5]
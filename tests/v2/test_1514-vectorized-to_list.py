@@ -0,0 +1,111 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_strings():
+    strings = ["one", "", "three", "αβγ", "é", "", "ünïcödé"]
+    array = ak._v2.Array(strings)
+    assert ak._v2.to_list(array) == strings
+    assert ak._v2.to_list(array[1:]) == strings[1:]
+    assert ak._v2.to_list(array[::-1]) == strings[::-1]
+    assert ak._v2.to_list(array[[3, 3, 0]]) == ["αβγ", "αβγ", "one"]
+
+    ascii = ["one", "two", "three"]
+    assert ak._v2.to_list(ak._v2.Array(ascii)[[2, 0]]) == ["three", "one"]
+
+
+def test_strings_not_on_character_boundaries():
+    layout = ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(np.array([0, 1, 2, 4, 6])),
+        ak._v2.contents.NumpyArray(
+            np.frombuffer("αβ".encode() + b"\xff\xfe", dtype=np.uint8),
+            parameters={"__array__": "char"},
+        ),
+        parameters={"__array__": "string"},
+    )
+    assert ak._v2.to_list(layout) == [
+        b"\xce".decode(errors="surrogateescape"),
+        b"\xb1".decode(errors="surrogateescape"),
+        "β",
+        b"\xff\xfe".decode(errors="surrogateescape"),
+    ]
+
+
+def test_bytestrings():
+    array = ak._v2.Array([b"one", b"", b"\xff\x00"])
+    assert ak._v2.to_list(array) == [b"one", b"", b"\xff\x00"]
+
+    regular = ak._v2.to_regular(ak._v2.Array([b"abc", b"def"]), axis=1)
+    assert isinstance(regular.layout, ak._v2.contents.RegularArray)
+    assert ak._v2.to_list(regular) == [b"abc", b"def"]
+
+
+def test_regular():
+    array = ak._v2.to_regular(ak._v2.Array(np.arange(12).reshape(4, 3)))
+    assert ak._v2.to_list(array) == np.arange(12).reshape(4, 3).tolist()
+
+    strings = ak._v2.to_regular(ak._v2.Array(["αβ", "γδ"]), axis=1)
+    assert ak._v2.to_list(strings) == ["αβ", "γδ"]
+
+    empty = ak._v2.contents.RegularArray(
+        ak._v2.contents.NumpyArray(np.arange(5)), 0, zeros_length=3
+    )
+    assert ak._v2.to_list(empty) == [[], [], []]
+
+
+def test_records_and_tuples():
+    array = ak._v2.Array(
+        [{"x": 1, "y": [1.1]}, {"x": 2, "y": []}, {"x": 3, "y": [3.3, 4.4]}]
+    )
+    assert ak._v2.to_list(array[::-1]) == [
+        {"x": 3, "y": [3.3, 4.4]},
+        {"x": 2, "y": []},
+        {"x": 1, "y": [1.1]},
+    ]
+
+    tuples = ak._v2.zip((np.array([1, 2, 3]), np.array([1.1, 2.2, 3.3])))
+    assert ak._v2.to_list(tuples) == [(1, 1.1), (2, 2.2), (3, 3.3)]
+    assert ak._v2.to_json(tuples) == '[{"0":1,"1":1.1},{"0":2,"1":2.2},{"0":3,"1":3.3}]'
+
+    longer = ak._v2.contents.RecordArray(
+        [ak._v2.contents.NumpyArray(np.arange(5))], ["x"], length=2
+    )
+    assert longer._to_list(None, None) == [{"x": 0}, {"x": 1}]
+
+    empty = ak._v2.contents.RecordArray([], [], length=2)
+    assert ak._v2.to_list(empty) == [{}, {}]
+    empty_tuple = ak._v2.contents.RecordArray([], None, length=2)
+    assert ak._v2.to_list(empty_tuple) == [(), ()]
+
+
+def test_options():
+    indexed = ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(np.array([-1, 2, 2, -1, 0, -1])),
+        ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 3.3])),
+    )
+    assert ak._v2.to_list(indexed) == [None, 3.3, 3.3, None, 1.1, None]
+
+    bytemasked = ak._v2.contents.ByteMaskedArray(
+        ak._v2.index.Index8(np.array([1, 0, 1], dtype=np.int8)),
+        ak._v2.contents.NumpyArray(np.array([1, 2, 3, 4])),
+        valid_when=True,
+    )
+    assert ak._v2.to_list(bytemasked) == [1, None, 3]
+
+    bitmasked = ak._v2.contents.BitMaskedArray(
+        ak._v2.index.IndexU8(np.array([0b00000101], dtype=np.uint8)),
+        ak._v2.contents.NumpyArray(np.array([1, 2, 3, 4])),
+        valid_when=True,
+        length=4,
+        lsb_order=True,
+    )
+    assert ak._v2.to_list(bitmasked) == [1, None, 3, None]
+
+
+def test_union():
+    array = ak._v2.Array([1, "two", [3], "four", 5])
+    assert ak._v2.to_list(array) == [1, "two", [3], "four", 5]
+    assert ak._v2.to_list(array[::-1]) == [5, "four", [3], "two", 1]
@@ -0,0 +1,59 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_chunks():
+    array = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5], [6.6], [7.7, 8.8, 9.9]])
+
+    chunks = list(ak._v2.iter_chunks(array, 2))
+    assert all(isinstance(x, ak._v2.Array) for x in chunks)
+    assert [len(x) for x in chunks] == [2, 2, 1]
+    assert [x.tolist() for x in chunks] == [
+        [[1.1, 2.2, 3.3], []],
+        [[4.4, 5.5], [6.6]],
+        [[7.7, 8.8, 9.9]],
+    ]
+
+    assert [len(x) for x in ak._v2.iter_chunks(array, 5)] == [5]
+    assert [len(x) for x in ak._v2.iter_chunks(array, 100)] == [5]
+    assert list(ak._v2.iter_chunks(array[:0], 3)) == []
+
+    layouts = list(ak._v2.iter_chunks(array, 3, highlevel=False))
+    assert all(isinstance(x, ak._v2.contents.Content) for x in layouts)
+    assert layouts[0].content is array.layout.content
+
+
+def test_to_list():
+    array = ak._v2.Array([{"x": i, "y": "a" * i} for i in range(7)])
+    rows = [row for batch in array.iter_batches(3, to_list=True) for row in batch]
+    assert rows == array.tolist()
+    assert [len(x) for x in array.iter_batches(3, to_list=True)] == [3, 3, 1]
+
+
+def test_behavior():
+    class Point(ak._v2.Record):
+        def mag(self):
+            return self.x + self.y
+
+    behavior = {"point": Point}
+    array = ak._v2.Array(
+        [{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 5, "y": 6}],
+        with_name="point",
+        behavior=behavior,
+    )
+    batches = list(array.iter_batches(2))
+    assert batches[0].behavior is behavior
+    assert [x.mag() for x in batches[1]] == [11]
+
+
+def test_bad_size():
+    array = ak._v2.Array([1, 2, 3])
+    with pytest.raises(ValueError):
+        ak._v2.iter_chunks(array, 0)
+    with pytest.raises(ValueError):
+        array.iter_batches(1.5)
+    with pytest.raises(TypeError):
+        ak._v2.iter_chunks(ak._v2.Record({"x": 1}), 1)
@@ -0,0 +1,113 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import bz2
+import io
+import json
+import lzma
+import zlib
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+schema = {
+    "type": "record",
+    "name": "test",
+    "fields": [{"name": "x", "type": "long"}, {"name": "y", "type": "string"}],
+}
+blocks = [
+    [{"x": 1, "y": "one"}, {"x": -2, "y": "two"}, {"x": 300, "y": ""}],
+    [{"x": 4, "y": "four"}],
+    [{"x": 5, "y": "αβγ"}, {"x": -600000, "y": "six"}],
+]
+
+
+def varint(n):
+    n = (n << 1) ^ (n >> 63)
+    out = bytearray()
+    while True:
+        if n > 0x7F:
+            out.append((n & 0x7F) | 0x80)
+            n >>= 7
+        else:
+            out.append(n)
+            return bytes(out)
+
+
+def avro_file(codec, compress):
+    sync = bytes(range(16))
+    out = io.BytesIO()
+    out.write(b"Obj\x01")
+    metadata = {b"avro.schema": json.dumps(schema).encode(), b"avro.codec": codec}
+    out.write(varint(len(metadata)))
+    for key, value in metadata.items():
+        out.write(varint(len(key)) + key + varint(len(value)) + value)
+    out.write(varint(0) + sync)
+
+    for block in blocks:
+        data = b"".join(
+            varint(x["x"]) + varint(len(x["y"].encode())) + x["y"].encode()
+            for x in block
+        )
+        data = compress(data)
+        out.write(varint(len(block)) + varint(len(data)) + data + sync)
+
+    out.seek(0)
+    return out
+
+
+def deflate(data):
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+@pytest.mark.parametrize(
+    "codec,compress",
+    [
+        (b"null", lambda x: x),
+        (b"deflate", deflate),
+        (b"bzip2", bz2.compress),
+        (b"xz", lzma.compress),
+    ],
+)
+@pytest.mark.parametrize("num_threads", [1, 2, None])
+def test_codecs(codec, compress, num_threads):
+    expected = [x for block in blocks for x in block]
+    array = ak._v2.from_avro_file(avro_file(codec, compress), num_threads=num_threads)
+    assert array.tolist() == expected
+
+    array = ak._v2.from_avro_file(
+        avro_file(codec, compress), limit_entries=4, num_threads=num_threads
+    )
+    assert array.tolist() == expected[:4]
+
+
+def test_snappy():
+    snappy = pytest.importorskip("snappy")
+
+    def compress(data):
+        return snappy.compress(data) + zlib.crc32(data).to_bytes(4, "big")
+
+    array = ak._v2.from_avro_file(avro_file(b"snappy", compress), num_threads=2)
+    assert array.tolist() == [x for block in blocks for x in block]
+
+
+def test_zstandard():
+    zstandard = pytest.importorskip("zstandard")
+
+    def compress(data):
+        return zstandard.ZstdCompressor().compress(data)
+
+    array = ak._v2.from_avro_file(avro_file(b"zstandard", compress), num_threads=2)
+    assert array.tolist() == [x for block in blocks for x in block]
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        ak._v2.from_avro_file(avro_file(b"lz4", lambda x: x))
+
+
+def test_positional_arguments():
+    layout = ak._v2.from_avro_file(avro_file(b"null", lambda x: x), False, None, False)
+    assert isinstance(layout, ak._v2.contents.Content)
+    assert ak._v2.to_list(layout) == [x for block in blocks for x in block]
@@ -0,0 +1,128 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import json
+import os
+import zlib
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+DIR = os.path.dirname(__file__)
+if DIR.endswith("/v2") or DIR.endswith("\\v2"):
+    DIR = os.path.dirname(DIR)
+DIR = os.path.abspath(DIR)
+
+schema = {
+    "type": "record",
+    "name": "test",
+    "fields": [
+        {"name": "x", "type": "long"},
+        {"name": "y", "type": {"type": "array", "items": "long"}},
+    ],
+}
+entries = [{"x": i, "y": list(range(1 + i % 3))} for i in range(70)]
+sync = bytes(range(16))
+
+
+def varint(n):
+    n = (n << 1) ^ (n >> 63)
+    out = bytearray()
+    while True:
+        if n > 0x7F:
+            out.append((n & 0x7F) | 0x80)
+            n >>= 7
+        else:
+            out.append(n)
+            return bytes(out)
+
+
+def encode(entry):
+    y = varint(len(entry["y"])) + b"".join(varint(y) for y in entry["y"])
+    return varint(entry["x"]) + y + varint(0)
+
+
+def avro_file(codec=b"null", block_size=7):
+    out = io.BytesIO()
+    out.write(b"Obj\x01")
+    metadata = {b"avro.schema": json.dumps(schema).encode(), b"avro.codec": codec}
+    out.write(varint(len(metadata)))
+    for key, value in metadata.items():
+        out.write(varint(len(key)) + key + varint(len(value)) + value)
+    out.write(varint(0) + sync)
+
+    for start in range(0, len(entries), block_size):
+        block = entries[start : start + block_size]
+        data = b"".join(encode(x) for x in block)
+        if codec == b"deflate":
+            compressor = zlib.compressobj(wbits=-15)
+            data = compressor.compress(data) + compressor.flush()
+        out.write(varint(len(block)) + varint(len(data)) + data + sync)
+
+    out.seek(0)
+    return out
+
+
+def test_whole_file():
+    assert ak._v2.from_avro_file(avro_file()).tolist() == entries
+
+    arrays = list(ak._v2.iterate_avro_file(avro_file(), step_size=20))
+    assert [len(x) for x in arrays] == [21, 21, 21, 7]
+    assert [x for array in arrays for x in array.tolist()] == entries
+
+
+@pytest.mark.parametrize("codec", [b"null", b"deflate"])
+@pytest.mark.parametrize("num_threads", [1, 3])
+@pytest.mark.parametrize(
+    "entry_start,entry_stop",
+    [(0, None), (0, 5), (3, 10), (7, 14), (8, 69), (30, None), (69, None)],
+)
+def test_ranges(codec, num_threads, entry_start, entry_stop):
+    arrays = list(
+        ak._v2.iterate_avro_file(
+            avro_file(codec),
+            step_size=10,
+            entry_start=entry_start,
+            entry_stop=entry_stop,
+            num_threads=num_threads,
+        )
+    )
+    assert all(len(x) >= 10 for x in arrays[:-1])
+    assert [x for array in arrays for x in array.tolist()] == entries[
+        entry_start:entry_stop
+    ]
+
+
+def test_split_among_workers():
+    out = []
+    for start in range(0, 70, 25):
+        for array in ak._v2.iterate_avro_file(
+            avro_file(), step_size=100, entry_start=start, entry_stop=start + 25
+        ):
+            out.extend(array.tolist())
+    assert out == entries
+
+
+def test_empty_ranges():
+    assert list(ak._v2.iterate_avro_file(avro_file(), entry_start=70)) == []
+    assert list(ak._v2.iterate_avro_file(avro_file(), entry_start=100)) == []
+    assert list(ak._v2.iterate_avro_file(avro_file(), 10, 5, 5)) == []
+
+
+def test_bad_sync_marker():
+    file = avro_file()
+    data = bytearray(file.getvalue())
+    data[-1] ^= 0xFF
+    with pytest.raises(ValueError):
+        list(ak._v2.iterate_avro_file(io.BytesIO(bytes(data))))
+
+
+def test_sample_file():
+    filename = os.path.join(DIR, "samples", "record_1_test_data.avro")
+    expected = ak._v2.from_avro_file(filename).tolist()
+    arrays = list(ak._v2.iterate_avro_file(filename, step_size=1))
+    assert [x for array in arrays for x in array.tolist()] == expected
+
+    with pytest.raises(FileNotFoundError):
+        ak._v2.iterate_avro_file(filename + "-does-not-exist")
@@ -0,0 +1,116 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def roundtrip(array, **kwargs):
+    file = io.BytesIO()
+    schema = ak._v2.to_avro_file(array, file, **kwargs)
+    file.seek(0)
+    return schema, ak._v2.from_avro_file(file)
+
+
+def test_primitives():
+    schema, out = roundtrip(np.array([1, -2, 300000000000, -(2**55), 2**55]))
+    assert schema == "long"
+    assert out.tolist() == [1, -2, 300000000000, -(2**55), 2**55]
+
+    schema, out = roundtrip(np.array([1, -2, 3], np.int16))
+    assert schema == "int"
+    assert out.tolist() == [1, -2, 3]
+
+    schema, out = roundtrip(np.array([1.5, -2.25], np.float32))
+    assert schema == "float"
+    assert out.tolist() == [1.5, -2.25]
+
+    schema, out = roundtrip(ak._v2.Array([1.1, 2.2, 3.3]))
+    assert schema == "double"
+    assert out.tolist() == [1.1, 2.2, 3.3]
+
+    schema, out = roundtrip(ak._v2.Array([True, False, True]))
+    assert schema == "boolean"
+    assert out.tolist() == [True, False, True]
+
+
+def test_strings_and_lists():
+    schema, out = roundtrip(ak._v2.Array(["one", "", "αβγ"]))
+    assert schema == "string"
+    assert out.tolist() == ["one", "", "αβγ"]
+
+    schema, out = roundtrip(ak._v2.Array([b"one", b"", b"\xff"]))
+    assert schema == "bytes"
+    assert out.tolist() == [b"one", b"", b"\xff"]
+
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    schema, out = roundtrip(array)
+    assert schema == {"type": "array", "items": "long"}
+    assert out.tolist() == array.tolist()
+
+    schema, out = roundtrip(ak._v2.Array([["a", "bc"], [], ["d"]]))
+    assert out.tolist() == [["a", "bc"], [], ["d"]]
+
+    schema, out = roundtrip(np.arange(6).reshape(3, 2))
+    assert out.tolist() == [[0, 1], [2, 3], [4, 5]]
+
+
+def test_records_and_options():
+    array = ak._v2.Array(
+        [
+            {"x": 1, "y": [1.1, 2.2], "z": {"s": "one"}},
+            {"x": 2, "y": [], "z": {"s": ""}},
+            {"x": 3, "y": [3.3], "z": {"s": "three"}},
+        ]
+    )
+    schema, out = roundtrip(array[[2, 0, 1]])
+    assert schema["type"] == "record"
+    assert [x["name"] for x in schema["fields"]] == ["x", "y", "z"]
+    assert schema["name"] != schema["fields"][2]["type"]["name"]
+    assert out.tolist() == array[[2, 0, 1]].tolist()
+
+    schema, out = roundtrip(ak._v2.Array([1, None, 3]))
+    assert schema == ["null", "long"]
+    assert out.tolist() == [1, None, 3]
+
+    schema, out = roundtrip(ak._v2.Array([{"x": 1}, None, {"x": 3}]))
+    assert out.tolist() == [{"x": 1}, None, {"x": 3}]
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate", "bzip2", "xz"])
+def test_blocks(codec):
+    array = ak._v2.Array([{"x": i, "y": list(range(i % 3))} for i in range(100)])
+    schema, out = roundtrip(array, codec=codec, block_size=7)
+    assert out.tolist() == array.tolist()
+
+    file = io.BytesIO()
+    ak._v2.to_avro_file(array, file, codec=codec, block_size=7)
+    file.seek(0)
+    chunks = list(ak._v2.iterate_avro_file(file, step_size=1, entry_start=10))
+    assert [len(x) for x in chunks][:2] == [4, 7]
+
+
+def test_unions_with_fastavro():
+    fastavro = pytest.importorskip("fastavro")
+    array = ak._v2.Array(
+        [[{"x": [None, 1.5]}], [], None, [{"x": []}], 1, "two", None],
+    )
+    file = io.BytesIO()
+    ak._v2.to_avro_file(array, file, codec="deflate", block_size=3)
+    file.seek(0)
+    assert list(fastavro.reader(file)) == array.tolist()
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        ak._v2.to_avro_file(ak._v2.Array([(1, 2)]), io.BytesIO())
+    with pytest.raises(ValueError):
+        ak._v2.to_avro_file(ak._v2.Array([{"not valid": 1}]), io.BytesIO())
+    with pytest.raises(TypeError):
+        ak._v2.to_avro_file(np.array([1j]), io.BytesIO())
+    with pytest.raises(ValueError):
+        ak._v2.to_avro_file(np.array([2**64 - 1], np.uint64), io.BytesIO())
+    with pytest.raises(ValueError):
+        ak._v2.to_avro_file(np.array([1]), io.BytesIO(), codec="lz4")
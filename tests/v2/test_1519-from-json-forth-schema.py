@@ -0,0 +1,185 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import json
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward._v2.operations import ak_from_json_new
+
+records = [
+    {
+        "x": i,
+        "y": [j * 1.1 for j in range(i % 4)],
+        "z": None if i % 5 == 0 else "αβγ"[: i % 4],
+        "w": {"a": i % 2 == 0},
+    }
+    for i in range(100)
+]
+schema = {
+    "type": "object",
+    "properties": {
+        "x": {"type": "integer"},
+        "y": {"type": "array", "items": {"type": "number"}},
+        "z": {"type": ["string", "null"]},
+        "w": {"type": "object", "properties": {"a": {"type": "boolean"}}},
+    },
+}
+lines = "".join(json.dumps(x) + "\n" for x in records).encode()
+
+
+@pytest.mark.parametrize("buffersize", [7, 100, 65536])
+def test_line_delimited_sources(tmp_path, buffersize):
+    filename = tmp_path / "records.json"
+    filename.write_bytes(lines)
+
+    for source in [lines, lines.decode(), filename, io.BytesIO(lines)]:
+        array = ak._v2.from_json_schema(
+            source, schema, line_delimited=True, buffersize=buffersize
+        )
+        assert array.tolist() == records
+
+    with open(filename) as file:
+        array = ak._v2.from_json_schema(
+            file, schema, line_delimited=True, buffersize=buffersize
+        )
+        assert array.tolist() == records
+
+
+def test_single_document_sources():
+    text = json.dumps(records).encode()
+    array = ak._v2.from_json_schema(
+        io.BytesIO(text), {"type": "array", "items": schema}, buffersize=13
+    )
+    assert array.tolist() == records
+
+    array = ak._v2.from_json_schema(
+        '{"z": null, "extra": [{"a": "]"}, 1e3], "x": 1, "w": {"a": false}, "y": []}',
+        schema,
+    )
+    assert array.tolist() == {"x": 1, "y": [], "z": None, "w": {"a": False}}
+
+
+def test_missing_and_invalid():
+    array = ak._v2.from_json_schema(
+        '{"x": 1, "y": [], "w": {"a": true}}\n', schema, line_delimited=True
+    )
+    assert array.tolist() == [{"x": 1, "y": [], "z": None, "w": {"a": True}}]
+
+    with pytest.raises(ValueError, match="position 41"):
+        ak._v2.from_json_schema(
+            '{"x": 1, "y": [], "w": {"a": true}}\n{"x" 2}\n',
+            schema,
+            line_delimited=True,
+            buffersize=10,
+        )
+    with pytest.raises(ValueError):
+        ak._v2.from_json_schema(b'{"y": [], "w": {"a": true}}', schema)
+    with pytest.raises(ValueError):
+        ak._v2.from_json_schema(b"[1, 2] 3", {"type": "array", "items": schema})
+
+
+def test_property_order():
+    # in schema order, in another order, missing, or spaced differently
+    source = "\n".join(
+        [
+            '{"x": 1, "y": [1.5], "z": "a", "w": {"a": true}}',
+            '{"w": {"a": false}, "z": "b", "y": [], "x": 2}',
+            '{"x": 3, "y": [], "w": {"a": true}}',
+            '{"x": 4, "y": [], "w": {"a": true}, "z": "c"}',
+            '{"x" : 5, "y": [], "z": "d", "w": {"a" :false}}',
+            '{"x": 6, "z": "e", "y": [2.5], "w": {"a": true}}',
+        ]
+    )
+    array = ak._v2.from_json_schema(source, schema, line_delimited=True)
+    assert array.tolist() == [
+        {"x": 1, "y": [1.5], "z": "a", "w": {"a": True}},
+        {"x": 2, "y": [], "z": "b", "w": {"a": False}},
+        {"x": 3, "y": [], "z": None, "w": {"a": True}},
+        {"x": 4, "y": [], "z": "c", "w": {"a": True}},
+        {"x": 5, "y": [], "z": "d", "w": {"a": False}},
+        {"x": 6, "y": [2.5], "z": "e", "w": {"a": True}},
+    ]
+    with pytest.raises(ValueError, match="position 51"):
+        ak._v2.from_json_schema(
+            '{"x": 1, "y": [], "z": null, "w": {"a": true}, "z": "c"}', schema
+        )
+
+    empty = {"type": "object", "properties": {}}
+    array = ak._v2.from_json_schema("{}\n{ }", empty, line_delimited=True)
+    assert array.tolist() == [{}, {}]
+
+
+def test_explicit_schema():
+    array = ak_from_json_new.from_json(
+        '{"x": 1, "y": [1.5]}\n{"x": 2, "y": []}',
+        line_delimited=True,
+        schema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "integer"},
+                "y": {"type": "array", "items": {"type": "number"}},
+            },
+        },
+    )
+    assert array.tolist() == [{"x": 1, "y": [1.5]}, {"x": 2, "y": []}]
+
+
+def test_names_that_look_like_forth_strings():
+    array = ak._v2.from_json_schema(
+        '[{"s": 1, ".": "s", "x": 2}, {".": ".", "s": 3}]',
+        {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "s": {"type": "integer"},
+                    ".": {"type": "string", "enum": ["m", ".", "s"]},
+                },
+                "required": ["s", "."],
+            },
+        },
+    )
+    assert array.tolist() == [{"s": 1, ".": "s"}, {"s": 3, ".": "."}]
+    assert array.layout.content(".").parameter("__array__") == "categorical"
+
+
+def test_surrogate_pairs():
+    strings = ["\U0001F600", "a\U0001F600bα", "\\ud83d\\ude00", "plain"]
+    text = json.dumps(strings)
+    assert "\\ud83d\\ude00" in text
+    array = ak._v2.from_json_schema(
+        text, {"type": "array", "items": {"type": "string"}}
+    )
+    assert array.tolist() == strings
+
+    with pytest.raises(ValueError, match="unpaired UTF-16 surrogate"):
+        ak._v2.from_json_schema(
+            '["\\ud83d x"]', {"type": "array", "items": {"type": "string"}}
+        )
+
+
+def test_positional_arguments():
+    layout = ak._v2.from_json_schema(
+        json.dumps(records), {"type": "array", "items": schema}, False
+    )
+    assert isinstance(layout, ak._v2.contents.Content)
+    assert ak._v2.to_list(layout) == records
+
+    layout = ak_from_json_new.from_json(
+        json.dumps(records),
+        False,
+        None,
+        None,
+        None,
+        None,
+        None,
+        65536,
+        1024,
+        1.5,
+        False,
+    )
+    assert isinstance(layout, ak._v2.contents.Content)
+    assert ak._v2.to_list(layout) == records
@@ -0,0 +1,98 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import itertools
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward._v2._forth import MachineCache
+
+
+def test_acquire_release():
+    cache = MachineCache(maxsize=2)
+    one = cache.acquire("1 2 +")
+    two = cache.acquire("1 2 +")
+    assert one is not two
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 0)
+
+    cache.release(one)
+    cache.release(two)
+    assert len(cache) == 2
+    assert cache.acquire("1 2 +") in (one, two)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 1)
+
+    with cache.machine("1 2 +", output_initial_size=8) as machine:
+        assert machine not in (one, two)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+
+    three = cache.acquire("3 4 +", bits=32)
+    assert isinstance(three, ak.forth.ForthMachine32)
+    cache.release(three)
+    assert len(cache) == 2
+    with cache.machine("1 2 +", output_initial_size=8):
+        pass
+    assert (cache.hits, cache.misses) == (2, 4)
+    with cache.machine("1 2 +"):
+        pass
+    assert (cache.hits, cache.misses) == (2, 5)
+
+    cache.release(cache.acquire("5 6 +", string_buffer_size=2**30))
+    assert len(cache) == 2
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_outputs_survive_reuse():
+    cache = MachineCache()
+    with cache.machine("input x output y int64 x textint-> y") as machine:
+        machine.begin({"x": np.frombuffer(b"12", np.uint8)})
+        machine.resume()
+        first = np.asarray(machine["y"])
+    with cache.machine("input x output y int64 x textint-> y") as machine:
+        machine.begin({"x": np.frombuffer(b"34", np.uint8)})
+        machine.resume()
+        second = np.asarray(machine["y"])
+    assert cache.hits == 1
+    assert first.tolist() == [12]
+    assert second.tolist() == [34]
+
+
+def test_readers():
+    machines = ak._v2._forth.machines
+    array = ak._v2.Array([{"x": i, "y": list(range(i % 3))} for i in range(20)])
+    file = io.BytesIO()
+    ak._v2.to_avro_file(array, file, block_size=3)
+
+    file.seek(0)
+    assert ak._v2.from_avro_file(file).tolist() == array.tolist()
+    hits = machines.hits
+    file.seek(0)
+    assert ak._v2.from_avro_file(file).tolist() == array.tolist()
+    assert machines.hits == hits + 1
+
+    other = io.BytesIO(file.getvalue())
+    file.seek(0)
+    one = ak._v2.iterate_avro_file(file, step_size=4)
+    two = ak._v2.iterate_avro_file(other, step_size=5)
+    one_out, two_out = [], []
+    for x, y in itertools.zip_longest(one, two, fillvalue=ak._v2.Array([])):
+        one_out.extend(x.tolist())
+        two_out.extend(y.tolist())
+    assert one_out == two_out == array.tolist()
+
+    schema = {"type": "array", "items": {"type": "integer"}}
+    assert ak._v2.from_json_schema("[1, 2, 3]", schema).tolist() == [1, 2, 3]
+    hits = machines.hits
+    assert ak._v2.from_json_schema("[4, 5]", schema).tolist() == [4, 5]
+    assert machines.hits == hits + 1
+
+
+def test_empty_avro_file():
+    file = io.BytesIO()
+    ak._v2.to_avro_file(ak._v2.Array([[1, 2]])[:0], file)
+    for _ in range(2):
+        file.seek(0)
+        assert ak._v2.from_avro_file(file).tolist() == []
@@ -0,0 +1,112 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import gc
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numba = pytest.importorskip("numba")
+
+ak._v2.numba.register_and_check()
+
+
+def test_cache():
+    layout = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]]).layout
+
+    @numba.njit
+    def f1(x):
+        return x[2][1]
+
+    one = ak._v2.Array(layout)
+    two = ak._v2.Array(layout)
+    assert f1(one) == f1(two) == 5.5
+    assert one._numbaview is not two._numbaview
+    assert one._numbaview.lookup is two._numbaview.lookup
+    assert one._numbaview.lookup is ak._v2._lookup.Lookup.cached(layout)
+
+    other = ak._v2.Array(layout[::-1])
+    assert f1(other) == 2.2
+    assert other._numbaview.lookup is not one._numbaview.lookup
+
+    size = len(ak._v2._lookup._lookups)
+    del one, two, layout
+    gc.collect()
+    assert len(ak._v2._lookup._lookups) == size - 1
+
+
+def test_projection(monkeypatch):
+    monkeypatch.setattr(ak._v2.numba, "projection", True)
+
+    array = ak._v2.Array(
+        [
+            {
+                "p1521_a": i,
+                "p1521_b": [{"c": i * 1.1, "d": [i] * i}] * (i % 3),
+                "p1521_e": i * 2.2,
+            }
+            for i in range(10)
+        ]
+    )
+
+    @numba.njit
+    def f1(events):
+        out = 0.0
+        for event in events:
+            for x in event.p1521_b:
+                out += x.c
+        return out
+
+    @numba.njit
+    def f2(events):
+        return events[3]
+
+    @numba.njit
+    def f3(events):
+        out = 0.0
+        for event in events:
+            out += event.p1521_e
+        return out
+
+    # only p1521_b and its field c are in the Lookup
+    expected = sum(i * 1.1 * (i % 3) for i in range(10))
+    assert f1(array) == pytest.approx(expected)
+    lookup = array._numbaview.lookup
+    assert lookup.projection == ((1, ((0, None),)),)
+    skipped = [x for x in lookup.positions if isinstance(x, ak._v2.contents.Content)]
+    assert len(skipped) == 3
+
+    # boxed values get the missing fields from the original layout
+    assert f2(array).tolist() == array[3].tolist()
+
+    # a function that reads another field gets a new projection
+    assert f3(array) == pytest.approx(sum(i * 2.2 for i in range(10)))
+    assert array._numbaview.lookup.projection == ((1, ((0, None),)), (2, None))
+    assert f1(array) == pytest.approx(expected)
+
+    monkeypatch.setattr(ak._v2.numba, "projection", False)
+    assert f3(array) == pytest.approx(sum(i * 2.2 for i in range(10)))
+    assert array._numbaview.lookup.projection is None
+
+
+def test_strided_buffers_are_not_cached():
+    base = np.arange(10.0)
+    layout = ak._v2.contents.NumpyArray(base[::2])
+
+    @numba.njit
+    def f1(x):
+        return x[0] + x[1] + x[2] + x[3] + x[4]
+
+    assert f1(ak._v2.Array(layout)) == 20.0
+    base[:] = 100
+    assert f1(ak._v2.Array(layout)) == 500.0
+    assert ak._v2._lookup._lookups.get(layout) is None
+
+    # contiguous buffers are shared with the Lookup, so changes are seen anyway
+    contiguous = ak._v2.contents.NumpyArray(base)
+    assert f1(ak._v2.Array(contiguous)) == 500.0
+    base[:] = 1
+    assert f1(ak._v2.Array(contiguous)) == 5.0
+    assert ak._v2._lookup.Lookup.cached(contiguous) is ak._v2._lookup.Lookup.cached(
+        contiguous
+    )
@@ -0,0 +1,271 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numba = pytest.importorskip("numba")
+
+ak._v2.numba.register_and_check()
+
+LayoutBuilder = ak._v2.numba.LayoutBuilder
+
+
+def test_record():
+    builder = LayoutBuilder(
+        """
+{
+    "class": "RecordArray",
+    "contents": {
+        "one": "float64",
+        "two": {"class": "ListOffsetArray", "offsets": "i32", "content": "int32"}
+    }
+}
+    """,
+        initial=8,
+    )
+
+    # the fields alternate
+    for i in range(100):
+        builder.float64(i * 1.1)  # "one"
+        builder.begin_list()  # "two"
+        for j in range(i % 4):
+            builder.int64(j)
+        builder.end_list()
+
+    assert len(builder) == 100
+    array = builder.snapshot()
+    assert array.layout.form.type == builder.form.type
+    assert str(array.type) == "100 * {one: float64, two: var * int32}"
+    assert array.layout.contents[1].offsets.dtype == np.dtype(np.int32)
+    assert array.tolist() == [
+        {"one": i * 1.1, "two": list(range(i % 4))} for i in range(100)
+    ]
+
+    # a partial record isn't in the snapshot; the builder carries on
+    builder.float64(-1)
+    assert len(builder.snapshot()) == 100
+    builder.begin_list()
+    builder.end_list()
+    assert builder.snapshot()[-1].tolist() == {"one": -1.0, "two": []}
+
+
+@pytest.mark.parametrize(
+    "form",
+    [
+        ak._v2.forms.IndexedOptionForm("i64", ak._v2.forms.NumpyForm("float64")),
+        ak._v2.forms.ByteMaskedForm("i8", ak._v2.forms.NumpyForm("float64"), False),
+        ak._v2.forms.BitMaskedForm(
+            "u8", ak._v2.forms.NumpyForm("float64"), True, False
+        ),
+        ak._v2.forms.BitMaskedForm(
+            "u8", ak._v2.forms.NumpyForm("float64"), False, True
+        ),
+    ],
+)
+def test_option(form):
+    builder = LayoutBuilder(ak._v2.forms.RegularForm(form, 3))
+    expected = []
+    for i in range(7):
+        builder.begin_list()
+        for j in range(3):
+            if (i + j) % 3 == 0:
+                builder.null()
+                expected.append(None)
+            else:
+                builder.float64(i + j * 0.1)
+                expected.append(i + j * 0.1)
+        builder.end_list()
+
+    array = builder.snapshot()
+    assert array.layout.content.form == form
+    assert array.tolist() == [expected[i : i + 3] for i in range(0, 21, 3)]
+
+    builder.begin_list()
+    builder.float64(1)
+    with pytest.raises(ValueError):
+        builder.end_list()
+
+
+def test_list_and_regular():
+    builder = LayoutBuilder(
+        ak._v2.forms.ListForm(
+            "i64", "i64", ak._v2.forms.NumpyForm("int64", inner_shape=(2,))
+        )
+    )
+    builder.begin_list()
+    for i in range(2):
+        builder.begin_list()
+        builder.int64(2 * i + 1)
+        builder.int64(2 * i + 2)
+        builder.end_list()
+    builder.end_list()
+    builder.begin_list()
+    builder.end_list()
+    assert builder.snapshot().tolist() == [[[1, 2], [3, 4]], []]
+
+    with pytest.raises(ValueError):
+        builder.float64(1.1)
+    with pytest.raises(ValueError):
+        builder.end_list()
+
+
+def test_union():
+    builder = LayoutBuilder(
+        ak._v2.forms.UnionForm(
+            "i8",
+            "i64",
+            [
+                ak._v2.forms.NumpyForm("float64"),
+                ak._v2.forms.ListOffsetForm("i64", ak._v2.forms.NumpyForm("bool")),
+            ],
+        )
+    )
+    builder.tag(0)
+    builder.float64(1.1)
+    builder.tag(1)
+    builder.begin_list()
+    builder.boolean(True)
+    builder.boolean(False)
+    builder.end_list()
+    builder.tag(0)
+    builder.float64(2.2)
+    assert builder.snapshot().tolist() == [1.1, [True, False], 2.2]
+
+    with pytest.raises(ValueError):
+        builder.float64(3.3)
+    with pytest.raises(ValueError):
+        builder.tag(2)
+
+
+def test_strings():
+    builder = LayoutBuilder(ak._v2.Array(["one", "two"]).layout.form)
+    builder.string("one")
+    builder.string("")
+    builder.string("αβγ")
+    builder.string("😀")
+    assert builder.snapshot().tolist() == ["one", "", "αβγ", "😀"]
+
+    builder = LayoutBuilder(ak._v2.Array([b"one", b"two"]).layout.form)
+    builder.bytestring(b"one")
+    builder.bytestring(b"\x00\xff")
+    assert builder.snapshot().tolist() == [b"one", b"\x00\xff"]
+
+
+def test_numba():
+    form = ak._v2.forms.ListOffsetForm(
+        "i64",
+        ak._v2.forms.RecordForm(
+            [
+                ak._v2.forms.NumpyForm("float32"),
+                ak._v2.forms.IndexedOptionForm(
+                    "i32",
+                    ak._v2.forms.ListOffsetForm(
+                        "i64",
+                        ak._v2.forms.NumpyForm(
+                            "uint8", parameters={"__array__": "char"}
+                        ),
+                        parameters={"__array__": "string"},
+                    ),
+                ),
+            ],
+            ["x", "y"],
+        ),
+    )
+
+    @numba.njit
+    def fill(builder, n):
+        for i in range(n):
+            builder.begin_list()
+            for j in range(i % 3):
+                builder.float64(i + j * 0.5)
+                if j == 1:
+                    builder.null()
+                else:
+                    builder.string("a" * j)
+            builder.end_list()
+        return len(builder)
+
+    builder = LayoutBuilder(form, initial=8)
+    assert fill(builder, 10) == 10
+    assert fill(builder, 2) == 12
+    expected = [
+        [{"x": i + j * 0.5, "y": None if j == 1 else "a" * j} for j in range(i % 3)]
+        for i in range(10)
+    ]
+    assert builder.snapshot().tolist() == expected + expected[:2]
+
+    @numba.njit
+    def passthrough(builder):
+        builder.begin_list()
+        builder.end_list()
+        return builder
+
+    out = passthrough(builder)
+    assert isinstance(out, LayoutBuilder)
+    assert len(out) == len(builder) == 13
+    assert out.snapshot()[-1].tolist() == []
+
+    @numba.njit
+    def error(builder):
+        builder.int64(1)
+
+    with pytest.raises(ValueError):
+        error(builder)
+
+
+def test_unsupported():
+    with pytest.raises(NotImplementedError):
+        LayoutBuilder(
+            ak._v2.forms.IndexedForm("i64", ak._v2.forms.NumpyForm("float64"))
+        )
+    with pytest.raises(NotImplementedError):
+        LayoutBuilder(ak._v2.forms.NumpyForm("datetime64"))
+
+
+def test_placeholders():
+    form = ak._v2.forms.BitMaskedForm(
+        "u8",
+        ak._v2.forms.RecordForm(
+            [
+                ak._v2.forms.NumpyForm("float64", inner_shape=(2,)),
+                ak._v2.forms.ListOffsetForm("i64", ak._v2.forms.NumpyForm("int64")),
+                ak._v2.forms.UnionForm(
+                    "i8",
+                    "i64",
+                    [ak._v2.forms.NumpyForm("int32"), ak._v2.forms.NumpyForm("bool")],
+                ),
+            ],
+            ["x", "y", "z"],
+        ),
+        True,
+        True,
+    )
+    builder = LayoutBuilder(form, initial=1)
+    expected = []
+    for i in range(20):
+        if i % 3 == 1:
+            builder.null()
+            expected.append(None)
+            continue
+        builder.begin_list()
+        builder.float64(i)
+        builder.float64(-i)
+        builder.end_list()
+        builder.begin_list()
+        for j in range(i % 4):
+            builder.int64(j)
+        builder.end_list()
+        builder.tag(i % 2)
+        if i % 2 == 0:
+            builder.int64(i)
+        else:
+            builder.boolean(True)
+        expected.append(
+            {"x": [i, -i], "y": list(range(i % 4)), "z": i if i % 2 == 0 else True}
+        )
+
+    array = builder.snapshot()
+    assert array.tolist() == expected
+    assert len(array.layout.content) == 20
+    assert len(array.layout.content.contents[0].content) == 40
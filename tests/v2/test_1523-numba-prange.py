@@ -0,0 +1,132 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numba = pytest.importorskip("numba")
+
+ak._v2.numba.register_and_check()
+
+
+def both(function):
+    return numba.njit(function), numba.njit(parallel=True)(function)
+
+
+events = ak._v2.Array(
+    [
+        {
+            "x": i,
+            "y": [i * 0.5] * (i % 4),
+            "z": None if i % 3 == 0 else str(i),
+            "u": None if i % 2 == 0 else [i] * (i % 5),
+            "p": [[j, j + 1] for j in range(i % 3)],
+        }
+        for i in range(1000)
+    ]
+)
+
+
+def test_lists():
+    def kernel(events):
+        out = np.zeros(len(events))
+        for i in numba.prange(len(events)):
+            event = events[i]
+            for y in event.y:
+                out[i] += y
+            for p in event.p:
+                out[i] += p[0] * p[1]
+        return out
+
+    serial, parallel = both(kernel)
+    assert np.array_equal(serial(events), parallel(events))
+    assert parallel(events)[7] == 7 * 0.5 * 3 + 0 * 1
+    assert parallel(events[100:200]).tolist() == serial(events)[100:200].tolist()
+
+
+def test_options_and_strings():
+    def kernel(events):
+        out = np.zeros(len(events), np.int64)
+        for i in numba.prange(len(events)):
+            event = events[i]
+            if event.z is not None:
+                out[i] += len(event.z)
+            if event.u is not None:
+                out[i] += len(event.u)
+        return out
+
+    serial, parallel = both(kernel)
+    expected = [
+        (0 if i % 3 == 0 else len(str(i))) + (i % 5 if i % 2 == 1 else 0)
+        for i in range(1000)
+    ]
+    assert serial(events).tolist() == parallel(events).tolist() == expected
+
+
+def test_reduction():
+    def kernel(events):
+        total = 0.0
+        count = 0
+        for i in numba.prange(len(events)):
+            for y in events.y[i]:
+                total += y
+                count += 1
+        return total, count
+
+    serial, parallel = both(kernel)
+    total, count = parallel(events)
+    assert count == sum(i % 4 for i in range(1000))
+    assert total == pytest.approx(serial(events)[0])
+
+
+def test_iteration_and_slices():
+    def kernel(events):
+        out = np.zeros(len(events) - 1)
+        for i in numba.prange(len(events) - 1):
+            for event in events[i : i + 2]:
+                out[i] += event.x
+        return out
+
+    serial, parallel = both(kernel)
+    assert parallel(events).tolist() == serial(events).tolist()
+    assert parallel(events)[10] == 21
+
+
+def test_constant_and_record():
+    constant = events
+
+    @numba.njit(parallel=True)
+    def from_constant(n):
+        out = np.zeros(n)
+        for i in numba.prange(n):
+            out[i] = constant[i].x + len(constant[i].y)
+        return out
+
+    assert from_constant(10).tolist() == [i + i % 4 for i in range(10)]
+
+    @numba.njit(parallel=True)
+    def from_record(event, n):
+        out = np.zeros(n)
+        for i in numba.prange(n):
+            out[i] = event.x * i + len(event.p)
+        return out
+
+    assert from_record(events[5], 4).tolist() == [2, 7, 12, 17]
+
+
+def test_projection(monkeypatch):
+    monkeypatch.setattr(ak._v2.numba, "projection", True)
+    array = ak._v2.Array(
+        [{"p1523_a": i, "p1523_b": [i * 0.5] * (i % 4)} for i in range(1000)]
+    )
+
+    @numba.njit(parallel=True)
+    def kernel(events):
+        out = np.zeros(len(events))
+        for i in numba.prange(len(events)):
+            for y in events[i].p1523_b:
+                out[i] += y
+        return out
+
+    assert kernel(array).tolist() == [i * 0.5 * (i % 4) for i in range(1000)]
+    assert array._numbaview.lookup.projection == ((1, None),)
@@ -0,0 +1,99 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numba = pytest.importorskip("numba")
+
+
+def test_vectorize():
+    @ak._v2.numba.vectorize
+    def f(x, y):
+        return x * 10 + y
+
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    assert f(array, 1).tolist() == [[11, 21, 31], [], [41, 51]]
+    assert f(array, ak._v2.Array([1, 2, 3])).tolist() == [[11, 21, 31], [], [43, 53]]
+    assert f(array, 0.5).type == ak._v2.types.ArrayType(
+        ak._v2.types.ListType(ak._v2.types.NumpyType("float64")), 3
+    )
+    assert f(np.arange(3), 1).tolist() == [1, 11, 21]
+    assert isinstance(f.ufunc, numba.np.ufunc.dufunc.DUFunc)
+
+    records = ak._v2.Array([{"x": [1, None]}, {"x": []}])
+    assert f(records.x, 2).tolist() == [[12, None], []]
+
+    @ak._v2.numba.vectorize(["float32(float32)", "float64(float64)"])
+    def g(x):
+        return x + 1
+
+    assert g(ak._v2.Array([[1], []])).tolist() == [[2.0], []]
+    assert g(ak._v2.Array([[1], []])).layout.content.dtype == np.dtype(np.float64)
+    single = ak._v2.Array(np.array([1.5], np.float32))
+    assert g(single).layout.dtype == np.dtype(np.float32)
+
+
+def test_guvectorize():
+    @ak._v2.numba.guvectorize("(n)->(n)")
+    def cumsum(x):
+        return np.cumsum(x)
+
+    array = ak._v2.Array([[[1, 2, 3], []], [[4, 5]]])
+    assert cumsum(array).tolist() == [[[1, 3, 6], []], [[4, 9]]]
+    assert str(cumsum(array).type) == "2 * var * var * int64"
+    assert cumsum(array[:, ::-1]).tolist() == [[[], [1, 3, 6]], [[4, 9]]]
+    assert cumsum(np.arange(6).reshape(2, 3)).tolist() == [[0, 1, 3], [3, 7, 12]]
+
+    @ak._v2.numba.guvectorize("(n),()->()")
+    def weighted(x, weight):
+        out = 0.0
+        for y in x:
+            out += y * weight
+        return out
+
+    assert weighted(array, ak._v2.Array([1, 10])).tolist() == [[6, 0], [90]]
+    assert weighted(ak._v2.Array([[1, 2, 3], None, [4, 5]]), 2).tolist() == [
+        12,
+        None,
+        18,
+    ]
+    assert weighted(array, 1, highlevel=False).form == ak._v2.forms.ListOffsetForm(
+        "i64", ak._v2.forms.NumpyForm("float64")
+    )
+
+    @ak._v2.numba.guvectorize("(n),(n)->()")
+    def dot(x, y):
+        return np.sum(x * y)
+
+    lists = ak._v2.Array([[1.0, 2.0], [3.0]])
+    assert dot(lists, lists * 2).tolist() == [10, 18]
+    with pytest.raises(ValueError):
+        dot(lists, ak._v2.Array([[1.0], [2.0, 3.0]]))
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak._v2.numba.guvectorize("()->()")
+    with pytest.raises(ValueError):
+        ak._v2.numba.guvectorize("(n)->(m)")
+    with pytest.raises(ValueError):
+        ak._v2.numba.guvectorize("n->()")
+
+    @ak._v2.numba.guvectorize("(n)->(n)")
+    def shorter(x):
+        return x[1:]
+
+    with pytest.raises(ValueError):
+        shorter(ak._v2.Array([[1, 2, 3]]))
+
+    @ak._v2.numba.guvectorize("(n)->()")
+    def first(x):
+        return x
+
+    with pytest.raises(TypeError):
+        first(ak._v2.Array([[1, 2, 3]]))
+    with pytest.raises(TypeError):
+        first(1)
+    with pytest.raises(ValueError):
+        first(ak._v2.Array([1, 2, 3]))
@@ -0,0 +1,99 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import ctypes
+import shutil
+import subprocess
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+import awkward._v2._lookup  # noqa: E402
+import awkward._v2._connect.cling  # noqa: E402
+
+compiler = shutil.which("g++") or shutil.which("c++")
+
+
+def compile_and_load(tmp_path, header, source):
+    (tmp_path / "header.h").write_text(header)
+    (tmp_path / "source.cpp").write_text('#include "header.h"\n' + source)
+    subprocess.check_call(
+        [
+            compiler,
+            "-std=c++17",
+            "-O2",
+            "-shared",
+            "-fPIC",
+            str(tmp_path / "source.cpp"),
+            "-o",
+            str(tmp_path / "library.so"),
+        ]
+    )
+    return ctypes.CDLL(str(tmp_path / "library.so"))
+
+
+def call(function, array, out):
+    function.restype = ctypes.c_int64
+    function.argtypes = [ctypes.c_ssize_t, ctypes.c_void_p, ctypes.c_void_p]
+    lookup = ak._v2._lookup.Lookup(array.layout)
+    return function(len(array), lookup.arrayptrs.ctypes.data, out.ctypes.data)
+
+
+def test_header():
+    form = ak._v2.forms.from_json(
+        '{"class": "ListOffsetArray", "offsets": "i64", "content": "float64"}'
+    )
+    before = dict(ak._v2._connect.cling.cache)
+    header = ak._v2._connect.cling.generate_header(form)
+    assert "Python.h" not in header
+    assert "ROOT" not in header
+    assert "class ListArray_" in header and "class NumpyArray_float64_" in header
+    assert "extern" not in header.replace('extern "C" int printf', "")
+    assert ak._v2._connect.cling.cache == before
+
+    assert header.count("class ArrayView") == 1
+    assert "process_impl" in ak._v2._connect.cling.generate_header(form, "process")
+    with pytest.raises(ValueError):
+        ak._v2._connect.cling.generate_header(form, "not an identifier")
+
+
+@pytest.mark.skipif(compiler is None, reason="needs a C++ compiler")
+def test_entry_point(tmp_path):
+    array = ak._v2.Array(
+        [
+            {"x": 1.5, "y": [1, 2, 3], "s": "hey", "o": None},
+            {"x": 2.5, "y": [], "s": "", "o": 4},
+            {"x": 3.5, "y": [10], "s": "there", "o": 5},
+        ]
+    )
+    header = ak._v2._connect.cling.generate_header(array.layout.form, "process")
+    library = compile_and_load(
+        tmp_path,
+        header,
+        """
+int64_t process_impl(process_array array, void* args) {
+  double* out = reinterpret_cast<double*>(args);
+  int64_t i = 0;
+  for (auto event : array) {
+    out[i] = event.x();
+    for (auto y : event.y()) {
+      out[i] += y;
+    }
+    out[i] += event.s().size() * 100;
+    if (event.o().has_value()) {
+      out[i] += event.o().value() * 1000;
+    }
+    i++;
+  }
+  return i;
+}
+""",
+    )
+
+    out = np.zeros(3)
+    assert call(library.process, array, out) == 3
+    assert out.tolist() == [307.5, 4002.5, 5513.5]
+
+    out = np.zeros(2)
+    assert call(library.process, array[1:], out) == 2
+    assert out.tolist() == [4002.5, 5513.5]
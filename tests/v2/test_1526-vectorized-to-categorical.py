@@ -0,0 +1,98 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward._v2.behaviors.categorical import (  # noqa: E402
+    _factorize,
+    _factorize_hashable,
+    to_categorical,
+)
+
+
+def test_numbers():
+    array = ak._v2.Array([3.3, 1.1, 3.3, 2.2, 1.1, np.nan, 2.2, np.nan])
+    categorical = to_categorical(array, highlevel=False)
+    assert isinstance(categorical, ak._v2.contents.IndexedArray)
+    assert categorical.index.data.tolist() == [0, 1, 0, 2, 1, 3, 2, 3]
+    assert categorical.content.data.tolist()[:3] == [3.3, 1.1, 2.2]
+    assert np.isnan(categorical.content.data[3])
+
+    array = ak._v2.Array([[5, None, 3], [], [3, 5, 5, None]])
+    categorical = to_categorical(array, highlevel=False)
+    assert isinstance(categorical.content, ak._v2.contents.IndexedOptionArray)
+    assert categorical.content.index.data.tolist() == [0, -1, 1, 1, 0, 0, -1]
+    assert categorical.content.content.data.tolist() == [5, 3]
+    assert ak._v2.operations.to_list(categorical) == array.tolist()
+
+    for data in [
+        np.array([True, False, False, True]),
+        np.array([0, -0.0, 1.5, 0.0]),
+        np.array(["2020-01-01", "2019-01-01", "2020-01-01"], "datetime64[D]"),
+        np.array([], np.int64),
+    ]:
+        mapping, is_first = _factorize(ak._v2.contents.NumpyArray(data))
+        expected = _factorize_hashable(ak._v2.contents.NumpyArray(data))
+        assert mapping.tolist() == expected[0].tolist()
+        assert is_first.tolist() == expected[1].tolist()
+
+
+def test_strings():
+    words = ["", "one", "two", "three", "twO", "é", "x" * 100, "one"]
+    index = np.random.RandomState(12345).randint(0, len(words), 1000)
+    array = ak._v2.Array([words[i] for i in index])
+
+    mapping, is_first = _factorize(array.layout)
+    expected = _factorize_hashable(array.layout)
+    assert mapping.tolist() == expected[0].tolist()
+    assert is_first.tolist() == expected[1].tolist()
+
+    categorical = to_categorical(array[::-3])
+    assert categorical.tolist() == array[::-3].tolist()
+    assert ak._v2.behaviors.categorical.categories(categorical).tolist() == list(
+        dict.fromkeys(array[::-3].tolist())
+    )
+
+    bytestrings = ak._v2.operations.to_regular(
+        ak._v2.Array([b"ab", b"cd", b"ab", None, b"cd"]), axis=1
+    )
+    assert isinstance(
+        to_categorical(bytestrings, highlevel=False).content,
+        ak._v2.contents.RegularArray,
+    )
+    assert to_categorical(bytestrings).tolist() == bytestrings.tolist()
+    assert to_categorical(bytestrings, highlevel=False).index.data.tolist() == [
+        0,
+        1,
+        0,
+        -1,
+        1,
+    ]
+
+
+def test_chunks_and_collisions(monkeypatch):
+    words = ["alpha", "beta", "", "gamma", "beta", "alpha", "delta" * 10]
+    array = ak._v2.Array(words * 20)
+    expected = _factorize_hashable(array.layout)
+
+    monkeypatch.setattr(ak._v2._strings, "chunk_bytes", 7)
+    mapping, is_first = _factorize(array.layout)
+    assert mapping.tolist() == expected[0].tolist()
+    assert is_first.tolist() == expected[1].tolist()
+
+    # if all strings of the same length had the same hash, they'd be checked
+    def colliding(starts, stops, data):
+        return (stops - starts).astype(np.uint64)
+
+    monkeypatch.setattr(ak._v2._strings, "hashes", colliding)
+    mapping, is_first = _factorize(array.layout)
+    assert mapping.tolist() == expected[0].tolist()
+    assert is_first.tolist() == expected[1].tolist()
+
+
+def test_records():
+    array = ak._v2.Array([{"x": 1, "y": "a"}, {"x": 2, "y": "b"}, {"x": 1, "y": "a"}])
+    categorical = to_categorical(array, highlevel=False)
+    assert categorical.index.data.tolist() == [0, 1, 0]
+    assert ak._v2.operations.to_list(categorical) == array.tolist()
@@ -0,0 +1,118 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward._v2.behaviors.categorical import (  # noqa: E402
+    categories,
+    merge_categories,
+    to_categorical,
+)
+
+
+def test_merge_categories():
+    one = to_categorical(ak._v2.Array(["a", "b", "a"]))
+    two = to_categorical(ak._v2.Array(["c", None, "a"]))
+
+    merged_one, merged_two = merge_categories([one, two])
+    assert merged_one.tolist() == one.tolist()
+    assert merged_two.tolist() == two.tolist()
+    assert categories(merged_one).tolist() == ["a", "b", "c"]
+    assert merged_one.layout.content is merged_two.layout.content
+    assert merged_two.layout.index.data.tolist() == [2, -1, 0]
+    assert isinstance(merged_two.layout, ak._v2.contents.IndexedOptionArray)
+
+    nested = to_categorical(ak._v2.Array([[1.1, 2.2], [], [3.3, 1.1]]))
+    flat = to_categorical(ak._v2.Array([3.3, 4.4]))
+    merged_nested, merged_flat = merge_categories([nested, flat], highlevel=False)
+    assert merged_nested.content.content is merged_flat.content
+    assert ak._v2.operations.to_list(merged_nested) == nested.tolist()
+    assert ak._v2.operations.to_list(merged_flat) == [3.3, 4.4]
+
+    with pytest.raises(ValueError):
+        merge_categories([one, ak._v2.Array(["a"])])
+
+
+def test_equal():
+    one = to_categorical(ak._v2.Array(["a", "b", None, "c", "b"]))
+    two = to_categorical(ak._v2.Array(["b", "b", None, "c", "d"]))
+    assert (one == two).tolist() == [False, True, True, True, False]
+    assert (two == one).tolist() == [False, True, True, True, False]
+
+    merged_one, merged_two = merge_categories([one, two])
+    assert (merged_one == merged_two).tolist() == [False, True, True, True, False]
+
+
+def test_concatenate():
+    one = to_categorical(ak._v2.Array(["a", "b", "a"]))
+    two = to_categorical(ak._v2.Array(["b", "c", None]))
+    three = to_categorical(ak._v2.Array(["c", "c"]))
+
+    out = ak._v2.operations.concatenate([one, two, three])
+    assert out.tolist() == ["a", "b", "a", "b", "c", None, "c", "c"]
+    assert ak._v2.operations.is_valid(out)
+    assert categories(out).tolist() == ["a", "b", "c"]
+    assert out.layout.index.data.tolist() == [0, 1, 0, 1, 2, -1, 2, 2]
+
+    out = ak._v2.operations.concatenate([one, three])
+    assert isinstance(out.layout, ak._v2.contents.IndexedArray)
+    assert out.layout.parameter("__array__") == "categorical"
+    assert categories(out).tolist() == ["a", "b", "c"]
+
+    lists = to_categorical(ak._v2.Array([[1, 2], [], [3]]))
+    more = to_categorical(ak._v2.Array([[3, 4, 1]]))
+    out = ak._v2.operations.concatenate([lists, more])
+    assert out.tolist() == [[1, 2], [], [3], [3, 4, 1]]
+    assert ak._v2.operations.is_valid(out)
+    assert categories(out).tolist() == [1, 2, 3, 4]
+
+    # not categorical: concatenated as before
+    plain = ak._v2.Array(["x"])
+    out = ak._v2.operations.concatenate([one, plain])
+    assert out.tolist() == ["a", "b", "a", "x"]
+
+
+def test_negative_index():
+    # any negative index is a missing value, not only -1
+    layout = ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(np.array([0, -2, 1])),
+        ak._v2.contents.NumpyArray(np.array([1.0, 2.0])),
+        parameters={"__array__": "categorical"},
+    )
+    one = ak._v2.Array(layout)
+    two = to_categorical(ak._v2.Array([2.0, None, 3.0]))
+
+    out = ak._v2.operations.concatenate([one, two])
+    assert out.tolist() == [1.0, None, 2.0, 2.0, None, 3.0]
+
+    merged_one, merged_two = merge_categories([one, two])
+    assert merged_one.tolist() == [1.0, None, 2.0]
+    assert merged_two.tolist() == [2.0, None, 3.0]
+
+    assert (one == two).tolist() == [False, True, False]
+    other = ak._v2.Array(
+        ak._v2.contents.IndexedOptionArray(
+            ak._v2.index.Index64(np.array([0, -1, 0])),
+            layout.content,
+            parameters={"__array__": "categorical"},
+        )
+    )
+    assert (one == other).tolist() == [True, True, False]
+
+
+def test_to_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+
+    categorical = ak._v2.contents.IndexedArray(
+        ak._v2.index.Index32(np.array([0, 1, 2, 3], np.int32)),
+        ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 1.1, 3.3])),
+        parameters={"__array__": "categorical"},
+    )
+    out = ak._v2.operations.to_arrow(
+        categorical, categorical_as_dictionary=True, extensionarray=False
+    )
+    assert isinstance(out, pyarrow.DictionaryArray)
+    assert out.dictionary.to_pylist() == [1.1, 2.2, 3.3]
+    assert out.indices.to_pylist() == [0, 1, 0, 2]
+    assert out.indices.type == pyarrow.int32()
@@ -0,0 +1,94 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+words = ["one", "two", "", "three", "on", "one\x00", "été", "tw", "two"]
+
+
+def test_comparisons():
+    left = ak._v2.Array(words)
+    right = ak._v2.Array(words[::-1])
+    for op in ("__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__"):
+        expected = [
+            getattr(x.encode("utf-8"), op)(y.encode("utf-8"))
+            for x, y in zip(words, words[::-1])
+        ]
+        assert getattr(left, op)(right).tolist() == expected
+
+    assert (left < "three").tolist() == [x < "three" for x in words]
+    assert ("three" <= left).tolist() == ["three" <= x for x in words]
+
+    nested = ak._v2.Array([["a", "bc"], [], ["bcd"]])
+    assert (nested > "b").tolist() == [[False, True], [], [True]]
+
+    bytestrings = ak._v2.Array([b"\xff", b"\x00", b""])
+    assert (bytestrings < b"\x01").tolist() == [False, True, True]
+
+
+def test_hash():
+    array = ak._v2.Array(words)
+    hashes = ak._v2.strings_hash(array).tolist()
+    for i, x in enumerate(words):
+        for j, y in enumerate(words):
+            if x == y:
+                assert hashes[i] == hashes[j]
+    assert len(set(hashes)) == len(set(words))
+    assert ak._v2.strings_hash(array[::-1]).tolist() == hashes[::-1]
+
+
+def test_search():
+    array = ak._v2.Array([["one", "two", None], [], ["three", "", "ooo"]])
+    assert ak._v2.strings_startswith(array, "t").tolist() == [
+        [False, True, None],
+        [],
+        [True, False, False],
+    ]
+    assert ak._v2.strings_endswith(array, b"o").tolist() == [
+        [False, True, None],
+        [],
+        [False, False, True],
+    ]
+    assert ak._v2.strings_contains(array, "oo").tolist() == [
+        [False, False, None],
+        [],
+        [False, False, True],
+    ]
+    assert ak._v2.strings_contains(array, "").tolist() == [
+        [True, True, None],
+        [],
+        [True, True, True],
+    ]
+
+    carried = ak._v2.Array(words)[[3, 0, 3, 6]]
+    assert ak._v2.strings_contains(carried, "e").tolist() == [True, True, True, False]
+    assert ak._v2.strings_contains(carried, "é").tolist() == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+    with pytest.raises(TypeError):
+        ak._v2.strings_contains(array, 1)
+
+
+def test_small_chunks(monkeypatch):
+    monkeypatch.setattr(ak._v2._strings, "chunk_bytes", 3)
+    array = ak._v2.Array(words * 3)
+    assert (array == array[::-1]).tolist() == [
+        x == y for x, y in zip(words * 3, (words * 3)[::-1])
+    ]
+    assert (
+        ak._v2.strings_contains(array, "ee").tolist() == ["ee" in x for x in words] * 3
+    )
+    assert (
+        ak._v2.strings_startswith(array, "tw").tolist()
+        == [x.startswith("tw") for x in words] * 3
+    )
+
+    long = ak._v2.Array(["x" * 50 + "a", "x" * 50 + "b", "x" * 50])
+    assert (long < long[::-1]).tolist() == [False, False, True]
+    assert (long[:2] < long[1:]).tolist() == [True, False]
+    assert (long >= "x" * 50).tolist() == [True, True, True]
@@ -0,0 +1,82 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+strings = [
+    "1",
+    "  -22 ",
+    "+333",
+    "00004",
+    "1_000",
+    "-9223372036854775808",
+    "99999999999999999999",
+    "1.5",
+    "",
+    "x",
+]
+
+
+def test_integers():
+    array = ak._v2.Array([strings[:4], [], strings[4:6]])
+    out = ak._v2.strings_astype(array, np.int64)
+    assert out.tolist() == [[1, -22, 333, 4], [], [1000, -9223372036854775808]]
+    assert str(out.type) == "3 * var * int64"
+
+    out = ak._v2.strings_astype(ak._v2.Array(strings), np.int8, errors="none")
+    assert out.tolist() == [1, -22, None, 4, None, None, None, None, None, None]
+    assert str(out.type) == "10 * ?int8"
+
+    out = ak._v2.strings_astype(ak._v2.Array(strings), np.uint64, errors="none")
+    assert out.tolist()[:7] == [1, None, 333, 4, 1000, None, None]
+
+    with pytest.raises(
+        ValueError, match="4 strings to int64, such as b'9+' at index 6"
+    ):
+        ak._v2.strings_astype(ak._v2.Array(strings), np.int64)
+
+
+def test_floats():
+    values = ["1.1", " -2.5e3", ".5", "5.", "1e-400", "-inf", "3.141592653589793238"]
+    out = ak._v2.strings_astype(
+        ak._v2.Array(values + ["1e"]), np.float64, errors="none"
+    )
+    assert out.tolist() == [float(x) for x in values] + [None]
+
+    out = ak._v2.strings_astype(ak._v2.Array([values, ["nan"]]), np.float32)
+    assert out.layout.content.dtype == np.dtype(np.float32)
+    assert out[0].tolist() == np.array([float(x) for x in values], np.float32).tolist()
+    assert np.isnan(out[1, 0])
+
+
+def test_options_and_carries():
+    array = ak._v2.Array(["1", None, "two", "3"])
+    out = ak._v2.strings_astype(array, np.int64, errors="none")
+    assert out.tolist() == [1, None, None, 3]
+    assert isinstance(out.layout, ak._v2.contents.IndexedOptionArray)
+
+    assert ak._v2.strings_astype(array[[3, 0, 3]], np.int64).tolist() == [3, 1, 3]
+    assert ak._v2.strings_astype(ak._v2.Array([b"12", b"3"]), np.float64).tolist() == [
+        12.0,
+        3.0,
+    ]
+
+    with pytest.raises(ValueError):
+        ak._v2.strings_astype(array, np.int64, errors="coerce")
+    with pytest.raises(ValueError):
+        ak._v2.strings_astype(array, np.bool_, errors="none")
+
+
+def test_small_chunks(monkeypatch):
+    monkeypatch.setattr(ak._v2._strings, "chunk_bytes", 4)
+    array = ak._v2.Array([str(x) for x in range(-50, 50)] + ["", "12345678"])
+    out = ak._v2.strings_astype(array, np.int16, errors="none")
+    assert out.tolist() == list(range(-50, 50)) + [None, None]
+
+
+def test_positional_arguments():
+    # highlevel and behavior keep their positions; errors comes after them
+    out = ak._v2.strings_astype(ak._v2.Array(["1", "2"]), np.int64, False, None)
+    assert isinstance(out, ak._v2.contents.Content)
+    assert ak._v2.to_list(out) == [1, 2]
@@ -0,0 +1,108 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pandas = pytest.importorskip("pandas")
+
+
+def rows(df):
+    return [
+        (index if isinstance(index, tuple) else (index,), tuple(row))
+        for index, row in zip(df.index, df.itertuples(index=False))
+    ]
+
+
+def test_inner_and_outer():
+    array = ak._v2.Array(
+        [
+            {"x": [], "y": [4.4, 3.3, 2.2, 1.1], "z": 0},
+            {"x": [1], "y": [3.3, 2.2, 1.1], "z": 1},
+            {"x": [1, 2], "y": [2.2, 1.1], "z": 2},
+            {"x": [1, 2, 3], "y": [1.1], "z": 3},
+            {"x": [1, 2, 3, 4], "y": [], "z": 4},
+        ]
+    )
+    inner = ak._v2.to_pandas(array, how="inner")
+    assert list(inner.columns) == ["x", "y", "z"]
+    assert inner.index.names == ["entry", "subentry"]
+    assert rows(inner) == [
+        ((1, 0), (1, 3.3, 1)),
+        ((2, 0), (1, 2.2, 2)),
+        ((2, 1), (2, 1.1, 2)),
+        ((3, 0), (1, 1.1, 3)),
+    ]
+    assert inner["x"].dtype == np.dtype(np.int64)
+
+    outer = ak._v2.to_pandas(array, how="outer")
+    assert len(outer) == 16
+    assert outer.loc[(0, 3)].tolist()[1:] == [1.1, 0]
+    assert np.isnan(outer.loc[(0, 3), "x"])
+    assert np.isnan(outer.loc[(4, 3), "y"])
+
+    expected = pandas.merge(
+        *ak._v2.to_pandas(array[["x", "y"]], how=None),
+        how="outer",
+        left_index=True,
+        right_index=True,
+    )
+    assert outer[["x", "y"]].equals(expected)
+
+
+def test_different_depths():
+    array = ak._v2.Array(
+        [
+            {"a": [[1, 2], []], "b": 10, "c": [7]},
+            {"a": [], "b": 20, "c": []},
+            {"a": [[3]], "b": 30, "c": [8, 9]},
+        ]
+    )
+    inner = ak._v2.to_pandas(array, how="inner")
+    assert rows(inner) == [
+        ((0, 0, 0), (1, 10, 7)),
+        ((0, 0, 1), (2, 10, 7)),
+        ((2, 0, 0), (3, 30, 8)),
+    ]
+    assert inner.index.names == ["entry", "subentry", "subsubentry"]
+
+    # rows that only exist at a shallower level are kept, with missing deeper
+    # levels, even when later columns are joined to them
+    outer = ak._v2.to_pandas(array, how="outer")
+    index = [tuple(-1 if x != x else int(x) for x in i) for i in outer.index]
+    assert index == [(0, 0, 0), (0, 0, 1), (1, -1, -1), (2, 0, 0), (2, 1, -1)]
+    assert outer["a"].fillna(-1).tolist() == [1, 2, -1, 3, -1]
+    assert outer["b"].fillna(-1).tolist() == [10, 10, 20, 30, -1]
+    assert outer["c"].fillna(-1).tolist() == [7, 7, -1, 8, 9]
+
+    left = ak._v2.to_pandas(array, how="left")
+    assert left["b"].tolist() == [10, 10, 30]
+
+
+def test_columns_and_copies():
+    x = np.arange(5, dtype=np.float64)
+    array = ak._v2.zip(
+        {
+            "x": x,
+            "y": ak._v2.zip({"z": np.arange(5)}),
+            "s": ["a", "b", "c", "d", "e"],
+        }
+    )
+    df = ak._v2.to_pandas(array)
+    assert list(df.columns) == [("x", ""), ("y", "z"), ("s", "")]
+    assert isinstance(df.index, pandas.RangeIndex)
+    assert np.shares_memory(df["x", ""].to_numpy(), x)
+    assert df["s", ""].tolist() == ["a", "b", "c", "d", "e"]
+
+
+def test_arrow_strings():
+    pytest.importorskip("pyarrow")
+    if not hasattr(pandas.arrays, "ArrowExtensionArray"):
+        pytest.skip("needs Pandas 1.5")
+
+    array = ak._v2.Array([{"s": ["one", None], "n": 1}, {"s": ["three"], "n": 2}])
+    df = ak._v2.to_pandas(array, arrow_strings=True)
+    assert isinstance(df["s"].array, pandas.arrays.ArrowExtensionArray)
+    assert df["s"].tolist()[0] == "one"
+    assert df["s"].isna().tolist() == [False, True, False]
+    assert df["n"].tolist() == [1, 1, 2]
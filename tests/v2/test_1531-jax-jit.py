@@ -0,0 +1,70 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+import numpy as np
+import pytest
+
+
+jax = pytest.importorskip("jax")
+jax.config.update("jax_platform_name", "cpu")
+jax.config.update("jax_enable_x64", True)
+
+test_regulararray = ak._v2.Array(
+    [[1.0, 2.0, 3.0], [], [4.0, 5.0], [6.0]], backend="jax"
+)
+test_record = ak._v2.Array(
+    [{"x": [1.0, 2.0], "y": 3.0}, {"x": [], "y": 4.0}, {"x": [5.0], "y": 6.0}],
+    backend="jax",
+)
+
+
+def test_elementwise():
+    traced = []
+
+    @jax.jit
+    def func(x):
+        traced.append(None)
+        return x**2 + 2 * x
+
+    out = func(test_regulararray)
+    assert ak._v2.to_list(out) == [[3.0, 8.0, 15.0], [], [24.0, 35.0], [48.0]]
+
+    # same structure, new values: no retracing
+    other = ak._v2.Array([[0.0, 1.0, 2.0], [], [3.0, 4.0], [5.0]], backend="jax")
+    assert ak._v2.to_list(func(other)) == [[0.0, 3.0, 8.0], [], [15.0, 24.0], [35.0]]
+    assert len(traced) == 1
+
+    # different offsets: traced again
+    other = ak._v2.Array([[1.0], [2.0, 3.0]], backend="jax")
+    assert ak._v2.to_list(func(other)) == [[3.0], [8.0, 15.0]]
+    assert len(traced) == 2
+
+
+def test_reducers():
+    @jax.jit
+    def func(x):
+        return ak._v2.sum(x, axis=1) + ak._v2.prod(x, axis=1)
+
+    assert ak._v2.to_list(func(test_regulararray)) == [12.0, 1.0, 29.0, 12.0]
+
+    @jax.jit
+    def func_max(x):
+        return ak._v2.max(x, axis=1, mask_identity=False)
+
+    assert ak._v2.to_list(func_max(test_regulararray)) == [3.0, -np.inf, 5.0, 6.0]
+
+
+def test_records_and_grad():
+    @jax.jit
+    def func(x):
+        return ak._v2.sum(x.x * x.y, axis=1)
+
+    assert ak._v2.to_list(func(test_record)) == [9.0, 0.0, 30.0]
+
+    value, grad = jax.value_and_grad(lambda x: func(x)[0])(test_record)
+    assert value == 9.0
+    assert ak._v2.to_list(grad) == [
+        {"x": [3.0, 3.0], "y": 3.0},
+        {"x": [], "y": 0.0},
+        {"x": [0.0], "y": 0.0},
+    ]
@@ -0,0 +1,64 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+import numpy as np  # noqa: F401
+import pytest
+
+
+jax = pytest.importorskip("jax")
+jax.config.update("jax_platform_name", "cpu")
+jax.config.update("jax_enable_x64", True)
+
+python = [[1.0, -2.0, 0.0], [], [-3.0, 4.0, -3.0], [5.0], [2.0, 2.0]]
+test_numpy = ak._v2.Array(python)
+test_jax = ak._v2.Array(python, backend="jax")
+
+
+@pytest.mark.parametrize(
+    "reducer",
+    [
+        ak._v2.sum,
+        ak._v2.prod,
+        ak._v2.min,
+        ak._v2.max,
+        ak._v2.argmin,
+        ak._v2.argmax,
+        ak._v2.count,
+        ak._v2.count_nonzero,
+        ak._v2.any,
+        ak._v2.all,
+    ],
+)
+def test_same_as_numpy(reducer):
+    expected = ak._v2.to_list(reducer(test_numpy, axis=1))
+    assert ak._v2.to_list(reducer(test_jax, axis=1)) == expected
+    assert ak._v2.to_list(jax.jit(lambda x: reducer(x, axis=1))(test_jax)) == expected
+
+
+def test_argmin_argmax_axis0():
+    array = ak._v2.Array([[3.0, 1.0, 2.0], [0.0, 5.0], [4.0]], backend="jax")
+    assert ak._v2.to_list(ak._v2.argmin(array, axis=0)) == [1, 0, 0]
+    assert ak._v2.to_list(ak._v2.argmax(array, axis=0)) == [2, 1, 0]
+
+
+def test_prod_grad():
+    def func(x):
+        return ak._v2.sum(ak._v2.prod(x, axis=1))
+
+    grad = jax.grad(func)(test_jax)
+    assert ak._v2.to_list(grad) == [
+        [0.0, 0.0, -2.0],
+        [],
+        [-12.0, 9.0, -12.0],
+        [1.0],
+        [2.0, 2.0],
+    ]
+
+
+def test_argmin_argmax_nan():
+    python = [[np.nan, 1.0, 0.5], [], [1.0, 3.0], [np.nan, np.nan]]
+    array = ak._v2.Array(python, backend="jax")
+    for reducer in [ak._v2.argmin, ak._v2.argmax]:
+        expected = ak._v2.to_list(reducer(ak._v2.Array(python), axis=1))
+        assert expected[0] == 0
+        assert ak._v2.to_list(reducer(array, axis=1)) == expected
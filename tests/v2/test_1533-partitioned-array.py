@@ -0,0 +1,135 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+PartitionedArray = ak._v2.partition.PartitionedArray
+
+python = [[1.1, 2.2], [], [3.3, 4.4, 5.5], [6.6], [], [7.7, 8.8], [9.9], [0.0, -1.1]]
+array = ak._v2.Array(python)
+
+
+def partitioned():
+    return PartitionedArray([array[0:3], array[3:3], array[3:6], array[6:8]])
+
+
+def test_getitem():
+    parts = partitioned()
+    assert parts.numpartitions == 3
+    assert parts.stops == [3, 6, 8]
+    assert len(parts) == 8
+    assert str(parts.type) == "8 * var * float64"
+    assert parts.to_list() == python
+    assert parts.partitionid_index_at(3) == (1, 0)
+
+    for i in range(-8, 8):
+        assert parts[i].tolist() == python[i]
+    with pytest.raises(IndexError):
+        parts[8]
+
+    for start in (None, -20, -3, 0, 2, 3, 5, 8, 20):
+        for stop in (None, -20, -3, 0, 2, 3, 5, 8, 20):
+            for step in (None, 2, 3, -1, -2, -5):
+                out = parts[start:stop:step]
+                assert isinstance(out, PartitionedArray)
+                assert out.to_list() == python[start:stop:step]
+
+    # slices that don't cross a boundary are views of one partition
+    assert parts[3:5].numpartitions == 1
+    assert parts[1:7, 1:].to_list() == array[1:7, 1:].tolist()
+    assert parts[2, -1] == 5.5
+
+    assert parts[[7, 0, 3]].tolist() == array[[7, 0, 3]].tolist()
+    assert (
+        parts[ak._v2.num(array) > 1].to_list() == array[ak._v2.num(array) > 1].tolist()
+    )
+    assert parts[array > 3].to_list() == array[array > 3].tolist()
+
+    # masks that are themselves partitioned, with the same or other stops
+    assert parts[parts > 3].to_list() == array[array > 3].tolist()
+    mask = ak._v2.partition.apply(ak._v2.num, parts) > 1
+    assert isinstance(mask, PartitionedArray)
+    assert parts[mask].to_list() == array[ak._v2.num(array) > 1].tolist()
+    mask = PartitionedArray.from_layout((array > 3).layout, [5, 8])
+    assert parts[mask].to_list() == array[array > 3].tolist()
+    mask = PartitionedArray.from_layout((ak._v2.num(array) > 1).layout, [1, 8])
+    assert parts[mask].to_list() == array[ak._v2.num(array) > 1].tolist()
+    indexes = PartitionedArray.from_layout(ak._v2.Array([7, 0, 3]).layout, [2, 3])
+    assert parts[indexes].tolist() == array[[7, 0, 3]].tolist()
+
+
+def test_sliced_jagged_mask():
+    mask = array > 3
+    assert array[2:6][mask[2:6]].tolist() == [[3.3, 4.4, 5.5], [6.6], [], [7.7, 8.8]]
+
+
+def test_fields_and_repartition():
+    records = ak._v2.zip({"x": array, "y": array * 10})
+    parts = PartitionedArray.from_layout(records.layout, [2, 8])
+    assert parts["y"].to_list() == (array * 10).tolist()
+    assert parts[["x"]].to_list() == records[["x"]].tolist()
+
+    repartitioned = parts.repartition([5, 6, 8])
+    assert repartitioned.stops == [5, 6, 8]
+    assert repartitioned.to_list() == records.tolist()
+    assert repartitioned.partitions[2].length == 2
+    assert ak._v2.to_list(parts.to_content()) == records.tolist()
+
+
+def test_ufuncs_and_apply():
+    with ThreadPoolExecutor(2) as executor:
+        parts = PartitionedArray(partitioned().partitions, executor=executor)
+        out = np.sqrt(np.abs(parts)) + array * 2
+        assert isinstance(out, PartitionedArray)
+        assert out.stops == parts.stops
+        assert out.to_list() == (np.sqrt(np.abs(array)) + array * 2).tolist()
+
+        out = ak._v2.partition.apply(ak._v2.num, parts)
+        assert out.to_list() == [2, 0, 3, 1, 0, 2, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "reducer",
+    [
+        ak._v2.sum,
+        ak._v2.prod,
+        ak._v2.min,
+        ak._v2.max,
+        ak._v2.any,
+        ak._v2.all,
+        ak._v2.count,
+        ak._v2.count_nonzero,
+    ],
+)
+@pytest.mark.parametrize("axis", [None, 0, 1, -1])
+def test_reduce(reducer, axis):
+    with ThreadPoolExecutor(2) as executor:
+        out = ak._v2.partition.reduce(
+            reducer, partitioned(), axis=axis, executor=executor
+        )
+    expected = reducer(array, axis=axis)
+    if axis is None:
+        assert out == pytest.approx(expected)
+    else:
+        assert ak._v2.to_list(out) == pytest.approx(ak._v2.to_list(expected))
+
+    if axis == 0:
+        out = ak._v2.partition.reduce(
+            reducer, partitioned(), axis=0, keepdims=True, mask_identity=True
+        )
+        expected = reducer(array, axis=0, keepdims=True, mask_identity=True)
+        assert str(out.type) == str(expected.type)
+
+
+def test_reduce_positions():
+    for reducer in (ak._v2.argmin, ak._v2.argmax):
+        assert ak._v2.partition.reduce(reducer, partitioned()) == reducer(array)
+        assert (
+            ak._v2.partition.reduce(reducer, partitioned(), axis=1).to_list()
+            == reducer(array, axis=1).tolist()
+        )
+        with pytest.raises(ValueError):
+            ak._v2.partition.reduce(reducer, partitioned(), axis=0)
@@ -0,0 +1,62 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+def test_lists():
+    content = ak._v2.contents.NumpyArray(np.arange(10) * 1.1)
+    listoffsetarray = ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index32(np.array([2, 4, 4, 7], np.int32)), content
+    )
+    listarray = ak._v2.contents.ListArray(
+        ak._v2.index.IndexU32(np.array([5, 0, 9, 3], np.uint32)),
+        ak._v2.index.IndexU32(np.array([7, 3, 9, 5], np.uint32)),
+        content,
+    )
+    regulararray = ak._v2.contents.RegularArray(content, 3)
+    arrays = [listoffsetarray, listarray[:3], regulararray, listoffsetarray[1:]] * 5
+
+    out = ak._v2.concatenate(arrays, highlevel=False)
+    assert isinstance(out, ak._v2.contents.ListArray)
+    assert to_list(out) == sum((to_list(x) for x in arrays), [])
+    assert (
+        ak._v2.concatenate([x.typetracer for x in arrays], highlevel=False).form
+        == out.form
+    )
+
+
+def test_options():
+    content = ak._v2.contents.NumpyArray(np.arange(6))
+    indexedoptionarray = ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(np.array([3, -1, 0, -3, 5])), content
+    )
+    bytemaskedarray = ak._v2.contents.ByteMaskedArray(
+        ak._v2.index.Index8(np.array([1, 0, 0, 1], np.int8)),
+        content,
+        valid_when=False,
+    )
+    arrays = [indexedoptionarray, bytemaskedarray, content[2:], indexedoptionarray]
+
+    out = ak._v2.concatenate(arrays, highlevel=False)
+    assert isinstance(out, ak._v2.contents.IndexedOptionArray)
+    assert to_list(out) == sum((to_list(x) for x in arrays), [])
+
+
+def test_records():
+    records = ak._v2.contents.RecordArray(
+        [
+            ak._v2.contents.NumpyArray(np.arange(5)),
+            ak._v2.Array([[1], [], [2, 3], [4], [5, 6]]).layout,
+        ],
+        ["x", "y"],
+        length=3,
+    )
+    reordered = ak._v2.Array([{"y": [7, 8], "x": 9}]).layout
+    arrays = [records, reordered, records[1:]] * 100
+
+    out = ak._v2.concatenate(arrays)
+    assert out.tolist() == sum((to_list(x) for x in arrays), [])
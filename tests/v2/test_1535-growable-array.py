@@ -0,0 +1,163 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+GrowableArray = ak._v2.growable.GrowableArray
+
+records = ak._v2.Array(
+    [
+        {"x": [1.1, 2.2], "y": 1, "s": "one", "o": None},
+        {"x": [], "y": 2, "s": "two", "o": 3},
+        {"x": [3.3], "y": 3, "s": "three", "o": 4},
+    ]
+)
+
+
+def test_extend_and_snapshot():
+    growable = GrowableArray(records, initial=1)
+    assert len(growable) == 0
+    assert growable.snapshot().tolist() == []
+
+    growable.extend(records)
+    first = growable.snapshot()
+    growable.extend(records[::-1])
+    growable.extend(records[1:2])
+
+    expected = records.tolist() + records.tolist()[::-1] + records.tolist()[1:2]
+    assert len(growable) == 7
+    assert growable.snapshot().tolist() == expected
+    assert growable.snapshot(highlevel=False).form == records.layout.form
+
+    # earlier snapshots are not changed by later appends
+    assert first.tolist() == records.tolist()
+
+
+def test_snapshot_is_a_view():
+    growable = GrowableArray(ak._v2.Array([[1, 2], [3]]), initial=10)
+    growable.extend(ak._v2.Array([[1, 2], [3]]))
+    one = growable.snapshot(highlevel=False)
+    growable.extend(ak._v2.Array([[4]]))
+    two = growable.snapshot(highlevel=False)
+    assert np.shares_memory(one.offsets.data, two.offsets.data)
+    assert np.shares_memory(one.content.data, two.content.data)
+    assert ak._v2.to_list(one) == [[1, 2], [3]]
+    assert ak._v2.to_list(two) == [[1, 2], [3], [4]]
+
+
+def test_append():
+    growable = GrowableArray(records)
+    growable.append({"x": [5], "y": 5, "s": "five", "o": None})
+    growable.append(records[2])
+    growable.append(ak._v2.Record({"s": "six", "o": 6, "x": [], "y": 6}))
+    assert growable.snapshot().tolist() == [
+        {"x": [5.0], "y": 5, "s": "five", "o": None},
+        {"x": [3.3], "y": 3, "s": "three", "o": 4},
+        {"x": [], "y": 6, "s": "six", "o": 6},
+    ]
+
+    lists = GrowableArray(ak._v2.Array([[1.1]]))
+    lists.append(ak._v2.Array([1.1, 2.2]))
+    lists.append(np.array([3.3]))
+    lists.append([])
+    assert lists.snapshot().tolist() == [[1.1, 2.2], [3.3], []]
+
+
+def test_other_forms():
+    regular = GrowableArray(ak._v2.Array(np.zeros((0, 3), np.int64)))
+    regular.extend(np.arange(6).reshape(2, 3))
+    regular.extend(ak._v2.Array([[6, 7, 8]]))
+    assert regular.snapshot().tolist() == [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+    with pytest.raises(ValueError):
+        regular.extend(ak._v2.Array([[1, 2]]))
+
+    listarray = ak._v2.contents.ListArray(
+        ak._v2.index.Index32(np.array([3, 0], np.int32)),
+        ak._v2.index.Index32(np.array([4, 2], np.int32)),
+        ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 3.3, 4.4])),
+    )
+    growable = GrowableArray(listarray)
+    growable.extend(listarray)
+    growable.extend(ak._v2.Array([[5, 6]]))
+    assert isinstance(growable.snapshot(highlevel=False), ak._v2.contents.ListArray)
+    assert growable.snapshot().tolist() == [[4.4], [1.1, 2.2], [5.0, 6.0]]
+
+    masked = ak._v2.mask(ak._v2.Array([[1], [2], [3]]), [True, False, True])
+    growable = GrowableArray(masked)
+    growable.extend(ak._v2.Array([None, None]))
+    growable.extend(masked)
+    growable.extend(ak._v2.Array([None, [4, 5]]))
+    growable.extend(ak._v2.Array([[6]]))
+    growable.append(None)
+    assert isinstance(
+        growable.snapshot(highlevel=False), ak._v2.contents.ByteMaskedArray
+    )
+    assert growable.snapshot().tolist() == [
+        None,
+        None,
+        [1],
+        None,
+        [3],
+        None,
+        [4, 5],
+        [6],
+        None,
+    ]
+
+    tuples = GrowableArray(ak._v2.Array([(1, "a")]))
+    tuples.extend(ak._v2.Array([(2, "b"), (3, "c")]))
+    tuples.append((4, "d"))
+    assert tuples.snapshot().tolist() == [(2, "b"), (3, "c"), (4, "d")]
+
+
+def test_errors():
+    growable = GrowableArray(records)
+    growable.extend(records)
+
+    with pytest.raises(ValueError):
+        growable.extend(ak._v2.Array([{"x": [1.1], "y": 1.5, "s": "a", "o": 1}]))
+    with pytest.raises(ValueError):
+        growable.extend(ak._v2.Array([{"x": [1.1], "y": 1, "s": "a"}]))
+    with pytest.raises(ValueError):
+        growable.extend(ak._v2.Array([{"x": None, "y": 1, "s": "a", "o": 1}]))
+
+    # nothing was appended by the failed calls
+    assert growable.snapshot().tolist() == records.tolist()
+
+    small = GrowableArray(ak._v2.Array(np.array([1, 2], np.int8)))
+    small.extend(np.array([100, -100], np.int64))
+    with pytest.raises(ValueError):
+        small.extend(np.array([1000], np.int64))
+    with pytest.raises(ValueError):
+        small.extend(np.array([1.5]))
+    assert small.snapshot().tolist() == [100, -100]
+
+    with pytest.raises(NotImplementedError):
+        GrowableArray(ak._v2.Array([1, "two"]))
+    with pytest.raises(ValueError):
+        GrowableArray(records, resize=1)
+
+
+def test_categorical():
+    categorical = ak._v2.behaviors.categorical.to_categorical(
+        ak._v2.Array(["one", "two", "one", "three"])
+    )
+    growable = GrowableArray(categorical)
+    growable.extend(categorical)
+    growable.extend(categorical)
+    growable.extend(ak._v2.Array(["four", "two"]))
+
+    out = growable.snapshot()
+    assert ak._v2.operations.is_valid(out)
+    assert out.tolist() == ["one", "two", "one", "three"] * 2 + ["four", "two"]
+    assert out.layout.content.tolist() == ["one", "two", "three", "four"]
+
+    optional = ak._v2.behaviors.categorical.to_categorical(
+        ak._v2.Array([1, None, 2, 1])
+    )
+    growable = GrowableArray(optional)
+    growable.extend(optional)
+    growable.extend(ak._v2.Array([3, None, 2]))
+    assert growable.snapshot().tolist() == [1, None, 2, 1, 3, None, 2]
+    assert growable.snapshot().layout.content.tolist() == [1, 2, 3]